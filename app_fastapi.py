@@ -2,7 +2,13 @@
 
 Endpoints:
 - GET /health
+- POST /admin/bond/append  {"rows": [{"date": "2026-01-05", "series": "FR103", "tenor": "10_year", "price": 105.1, "yield": 6.03}]}
 - POST /query  {"q": "average yield Q1 2023", "csv": "20251215_priceyield.csv"}
+- POST /query/batch  {"dates": ["2025-06-02", ...], "tenors": ["10_year"], "series": [...]} or {"queries": [...]} - NDJSON stream
+- GET /export?start=2020-01-01&end=2025-12-31&tenors=05_year,10_year&format=csv - stream ts (or table=cube) rows
+- GET /curve?on=2025-06-02&years=2,5,7,10&method=nelson_siegel - fitted yield curve
+- GET /quality?tenors=10_year&kind=gap,outlier - load-time data-quality report (gaps, stale runs, outliers, holiday rows)
+- GET /forecast?tenor=10_year&days=5&metric=yield&format=png - ensemble forecast for the next business days with Monte Carlo bands (JSON or fan chart)
 - POST /telegram/webhook - Telegram bot webhook
 - GET /bot/stats - Bot traffic and metrics
 
@@ -10,10 +16,14 @@ This file reuses parse_intent and BondDB from the existing module.
 """
 from typing import Optional, Dict, Any, List
 import re
+import hmac
+import json
+from dataclasses import asdict
 from fastapi import FastAPI, HTTPException, Response, Request
 from fastapi.responses import StreamingResponse, HTMLResponse, JSONResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
 import uvicorn
 import time
@@ -23,10 +33,11 @@ from datetime import date, timedelta
 import os
 import io
 import base64
+import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from dateutil.relativedelta import relativedelta
 try:
     import seaborn as sns
@@ -58,6 +69,13 @@ spec.loader.exec_module(priceyield_mod)
 parse_intent = priceyield_mod.parse_intent
 BondDB = priceyield_mod.BondDB
 Intent = priceyield_mod.Intent
+_HAS_PYARROW = priceyield_mod._HAS_PYARROW
+
+import forecast_pool
+from data_reload import data_cache
+from market_data import get_market_store
+from query_records import StructuralBreakQuery
+from yield_curve import METHODS as CURVE_METHODS, curve_store
 
 # Import metrics
 from utils.metrics import metrics
@@ -80,7 +98,13 @@ async def lifespan(app: FastAPI):
     else:
         print("⚠️  TELEGRAM_BOT_TOKEN not set - Telegram endpoints will return 503", flush=True)
         sys.stdout.flush()
+    # Poll the database files and hot-swap rebuilt BondDB/AuctionDB/market store instances
+    data_cache.start()
+    # Spawn the forecast ensemble's worker processes before the first forecast needs them
+    forecast_pool.warm_up()
     yield
+    data_cache.stop()
+    forecast_pool.shutdown()
 
 
 app = FastAPI(title="Bond Query API", lifespan=lifespan)
@@ -97,9 +121,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Simple in-memory cache of BondDB instances keyed by csv path
-_DB_CACHE: Dict[str, BondDB] = {}
-
+# BondDB instances keyed by csv path, rebuilt in the background when the CSV changes
 def get_db(csv: str) -> BondDB:
     # Resolve CSV relative to the bundled database folder if a plain name was provided
     csv_path = Path(csv)
@@ -108,12 +130,10 @@ def get_db(csv: str) -> BondDB:
         if candidate.exists():
             csv_path = candidate
     key = str(csv_path)
-    if key not in _DB_CACHE:
-        _DB_CACHE[key] = BondDB(str(csv_path))
-    return _DB_CACHE[key]
+    return data_cache.get(f"bond:{key}", lambda: BondDB(key), [key])
 
 
-def parse_structural_break_query(q: str) -> Optional[Dict]:
+def parse_structural_break_query(q: str) -> Optional[StructuralBreakQuery]:
     """Lightweight parser for Chow / structural break queries.
 
     Mirrors telegram_bot.parse_structural_break_query so API and bot stay aligned.
@@ -192,7 +212,7 @@ def parse_structural_break_query(q: str) -> Optional[Dict]:
             if period_res:
                 start_date, end_date = period_res
 
-    return {'tenor': tenor, 'break_date': break_date, 'start_date': start_date, 'end_date': end_date}
+    return StructuralBreakQuery(tenor=tenor, break_date=break_date, start_date=start_date, end_date=end_date)
 
 
 class QueryRequest(BaseModel):
@@ -207,7 +227,13 @@ class QueryResponse(BaseModel):
 
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    status = data_cache.status()
+    return {
+        "status": "ok",
+        "data_version": status["data_version"],
+        "last_reload": status["last_reload"],
+        "data": status["entries"],
+    }
 
 
 @app.get("/debug/env")
@@ -227,7 +253,7 @@ async def debug_env():
 
 
 @app.post("/query", response_model=QueryResponse)
-async def query(req: QueryRequest):
+def query(req: QueryRequest):
     q = req.q
     csv = req.csv
     try:
@@ -240,18 +266,10 @@ async def query(req: QueryRequest):
     # POINT
     if intent.type == "POINT":
         d: date = intent.point_date
-        params = [d.isoformat()]
-        where = "obs_date = ?"
-        if intent.tenor:
-            where += " AND tenor = ?"
-            params.append(intent.tenor)
-        if intent.series:
-            where += " AND series = ?"
-            params.append(intent.series)
-
-        q_sql = f"SELECT series, tenor, price, \"yield\" FROM ts WHERE {where} ORDER BY series LIMIT 500"
-        rows = db.con.execute(q_sql, params).fetchall()
-        rows_list = [dict(series=r[0], tenor=r[1], price=r[2], **{'yield': r[3]}) for r in rows]
+        # binary search in BondDB's per-tenor date index, no SQL
+        rows = db.slice_rows(d, d, [intent.tenor] if intent.tenor else None, intent.series)
+        rows.sort(key=lambda r: r[0])
+        rows_list = [dict(series=r[0], tenor=r[1], price=r[3], **{'yield': r[4]}) for r in rows[:500]]
         return QueryResponse(
             intent={"type": intent.type, "metric": intent.metric, "point_date": d.isoformat(), "series": intent.series, "tenor": intent.tenor},
             result={"type": "point_rows", "rows": rows_list, "count": len(rows_list)},
@@ -273,66 +291,141 @@ async def query(req: QueryRequest):
     raise HTTPException(status_code=400, detail="Unhandled intent type")
 
 
+BATCH_MAX_ITEMS = int(os.environ.get("QUERY_BATCH_MAX_ITEMS", "5000"))
+
+
+class BatchQueryRequest(BaseModel):
+    queries: Optional[List[str]] = None  # natural-language POINT questions
+    dates: Optional[List[str]] = None  # panel: every date x tenor x series
+    tenors: Optional[List[str]] = None
+    series: Optional[List[str]] = None
+    csv: Optional[str] = "20251215_priceyield.csv"
+    stream: Optional[bool] = True
+
+
+def _batch_tenor(tenor: str) -> str:
+    """'10_year', '10 year', '10y' or '10' -> '10_year'."""
+    m = re.fullmatch(r"\s*(\d+)\s*(?:_?years?|y)?\s*", tenor, re.IGNORECASE)
+    if not m:
+        raise ValueError(f"Invalid tenor {tenor!r}")
+    return f"{int(m.group(1)):02d}_year"
+
+
+def _batch_items(req: BatchQueryRequest) -> List[Dict[str, Any]]:
+    """One item per question, then one per (date, tenor, series) of the panel."""
+    items: List[Dict[str, Any]] = []
+    intents: Dict[str, Any] = {}
+    for q in req.queries or []:
+        item: Dict[str, Any] = {"q": q}
+        try:
+            intent = intents.get(q) or parse_intent(q)
+            intents[q] = intent
+        except Exception as e:
+            item["error"] = f"Could not parse intent: {e}"
+        else:
+            if intent.type != "POINT":
+                item["error"] = f"Not a POINT query ({intent.type}); use /query"
+            else:
+                item.update(point_date=intent.point_date, tenor=intent.tenor, series=intent.series)
+        items.append(item)
+    if req.dates:
+        dates = [pd.Timestamp(d).date() for d in req.dates]
+        tenors = [_batch_tenor(t) for t in req.tenors] if req.tenors else [None]
+        series = [s.upper() for s in req.series] if req.series else [None]
+        items += [{"point_date": d, "tenor": t, "series": s} for d in dates for t in tenors for s in series]
+    return items
+
+
+@app.post("/query/batch")
+def query_batch(req: BatchQueryRequest):
+    """Many POINT lookups in one request and one DuckDB query.
+
+    Send natural-language `queries` and/or a panel of `dates` x `tenors` x
+    `series` (omitted tenors/series match all). Results come back in request
+    order as NDJSON, one line per item: {"index", "q"?, "point_date", "tenor",
+    "series", "rows", "count"} or {"index", "q", "error"} for questions that are
+    not POINT queries. stream=false returns {"results": [...]} instead.
+    """
+    try:
+        items = _batch_items(req)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not items:
+        raise HTTPException(status_code=400, detail="Provide queries or dates")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Too many lookups ({len(items)} > {BATCH_MAX_ITEMS})")
+
+    lookups = [i for i, item in enumerate(items) if "error" not in item]
+    cols = get_db(req.csv).lookup_points(
+        [(items[i]["point_date"], items[i]["tenor"], items[i]["series"]) for i in lookups]
+    )
+    bounds = np.searchsorted(cols["key"], np.arange(len(lookups) + 1))
+    names, tenors = cols["series"], cols["tenor"]
+    prices, yields = cols["price"].tolist(), cols["yield"].tolist()
+
+    def results():
+        k = 0
+        for i, item in enumerate(items):
+            if "error" not in item:
+                lo, hi = bounds[k], min(bounds[k + 1], bounds[k] + 500)
+                k += 1
+                rows = [{"series": names[j], "tenor": tenors[j],
+                         "price": None if prices[j] != prices[j] else prices[j],
+                         "yield": None if yields[j] != yields[j] else yields[j]} for j in range(lo, hi)]
+                item = dict(item, point_date=item["point_date"].isoformat(), rows=rows, count=len(rows))
+            yield {"index": i, **item}
+
+    if not req.stream:
+        out = list(results())
+        return {"results": out, "count": len(out)}
+
+    def ndjson(chunk: int = 64):
+        # one send per `chunk` lines: per-send overhead dominates with single lines
+        lines = []
+        for line in results():
+            lines.append(json.dumps(line) + "\n")
+            if len(lines) == chunk:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 # --- Plot helper: returns PNG bytes for a range query ---
+def _new_figure(figsize):
+    """Figure + axes outside pyplot's global state, so plots can render on worker threads."""
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+
 def _plot_range_to_png(db: BondDB, start_date: date, end_date: date, metric: str = 'yield', tenor: Optional[str] = None, tenors: Optional[list] = None, highlight_date: Optional[date] = None) -> bytes:
-    # Query the ts view
-    params = [start_date.isoformat(), end_date.isoformat()]
-    q = 'SELECT obs_date, series, tenor, price, "yield" FROM ts WHERE obs_date BETWEEN ? AND ?'
-
-    # Handle multi-tenor or single tenor
-    if tenors and len(tenors) > 1:
-        placeholders = ','.join(['?'] * len(tenors))
-        q += f' AND tenor IN ({placeholders})'
-        params.extend(tenors)
-    elif tenor:
-        q += ' AND tenor = ?'
-        params.append(tenor)
-
-    q += ' ORDER BY obs_date'
-    df = db.con.execute(q, params).fetchdf()
+    # Determine if multi-tenor plot
+    is_multi_tenor = tenors and len(tenors) > 1
+
+    # Daily per-tenor averages across series, already forward-filled in BondDB's cube
+    plot_tenors = tenors if is_multi_tenor else ([tenor] if tenor else None)
+    cube = db.cube_frame(plot_tenors, start_date, end_date, freq='D')
 
     # No data: return a small captioned placeholder chart
-    if df.empty:
+    if cube.empty or not cube['observed'].any():
         buf = io.BytesIO()
-        fig, ax = plt.subplots(figsize=(6, 3))
+        fig, ax = _new_figure(figsize=(6, 3))
         apply_economist_style(fig, ax)
         ax.text(0.5, 0.6, 'No data', ha='center', va='center', fontsize=12, color=ECONOMIST_COLORS['black'])
         ax.set_xticks([])
         ax.set_yticks([])
         add_economist_caption(fig)
         fig.savefig(buf, format='png', dpi=150, facecolor='white')
-        plt.close(fig)
         buf.seek(0)
         return buf.read()
 
-    df['obs_date'] = pd.to_datetime(df['obs_date'])
-
-    # Determine if multi-tenor plot
-    is_multi_tenor = tenors and len(tenors) > 1
-
-    # per-series reindex + ffill to daily frequency then average across series
-    all_dates = pd.date_range(start_date, end_date, freq='D')
-
     if is_multi_tenor:
-        filled = []
-        for (s, t), g in df.groupby(['series', 'tenor']):
-            g2 = g.set_index('obs_date').reindex(all_dates)
-            g2['series'] = s
-            g2['tenor'] = t
-            g2[['price', 'yield']] = g2[['price', 'yield']].ffill()
-            filled.append(g2.reset_index().rename(columns={'index': 'obs_date'}))
-        filled = pd.concat(filled, ignore_index=True)
-        daily = filled.groupby(['obs_date', 'tenor'])[metric].mean().reset_index()
+        daily = cube[['obs_date', 'tenor', f'{metric}_mean']].rename(columns={f'{metric}_mean': metric})
         daily['tenor_label'] = daily['tenor'].str.replace('_', ' ')
     else:
-        filled = []
-        for s, g in df.groupby('series'):
-            g2 = g.set_index('obs_date').reindex(all_dates)
-            g2['series'] = s
-            g2[['price', 'yield']] = g2[['price', 'yield']].ffill()
-            filled.append(g2.reset_index().rename(columns={'index': 'obs_date'}))
-        filled = pd.concat(filled, ignore_index=True)
-        daily = filled.groupby('obs_date')[metric].mean().reset_index()
+        daily = db.cube_average(cube, metric)
 
     def format_date(d):
         """Convert date to '1 Jan 2023' format"""
@@ -347,7 +440,7 @@ def _plot_range_to_png(db: BondDB, start_date: date, end_date: date, metric: str
     buf = io.BytesIO()
     try:
         if _HAS_SEABORN:
-            fig, ax = plt.subplots(figsize=(10, 6))
+            fig, ax = _new_figure(figsize=(10, 6))
             apply_economist_style(fig, ax)
 
             if is_multi_tenor:
@@ -390,11 +483,10 @@ def _plot_range_to_png(db: BondDB, start_date: date, end_date: date, metric: str
             fig.autofmt_xdate(rotation=0, ha='center')
             add_economist_caption(fig)
             fig.savefig(buf, format='png', dpi=150, facecolor='white')
-            plt.close(fig)
         else:
             raise RuntimeError('seaborn not available')
     except Exception:
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = _new_figure(figsize=(10, 6))
         apply_economist_style(fig, ax)
 
         ax.plot(daily['obs_date'], daily[metric], linewidth=2.5, color=ECONOMIST_COLORS['red'])
@@ -419,14 +511,13 @@ def _plot_range_to_png(db: BondDB, start_date: date, end_date: date, metric: str
         fig.autofmt_xdate(rotation=0, ha='center')
         add_economist_caption(fig)
         fig.savefig(buf, format='png', dpi=150, facecolor='white')
-        plt.close(fig)
 
     buf.seek(0)
     return buf.read()
 
 
 @app.post('/plot')
-async def plot(req: QueryRequest):
+def plot(req: QueryRequest):
     """Return a PNG plot for a range query. Use the same natural language queries that produce a RANGE intent."""
     try:
         intent: Intent = parse_intent(req.q)
@@ -509,17 +600,15 @@ async def chat_endpoint(req: ChatRequest):
     if sb_req:
         try:
             from regression_analysis import structural_break_test, format_structural_break
-            db = get_db(req.csv)
+            db = await run_in_threadpool(get_db, req.csv)
 
             tenor = sb_req['tenor']
-            data_dir = Path(__file__).with_name("database")
-            macro_file = data_dir / "20260102_daily01.csv"
 
             if tenor in ('idrusd', 'indogb', 'vix'):
-                if not macro_file.exists():
-                    raise HTTPException(status_code=500, detail=f"Macro file not found: {macro_file}")
-                df_macro = pd.read_csv(macro_file)
-                df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                try:
+                    df_macro = get_market_store().macro_slice()
+                except FileNotFoundError as e:
+                    raise HTTPException(status_code=500, detail=f"Macro file not found: {e}")
                 if tenor == 'idrusd':
                     series = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                 elif tenor == 'indogb':
@@ -529,26 +618,15 @@ async def chat_endpoint(req: ChatRequest):
                 else:  # vix
                     series = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
             else:
-                res = db.con.execute(
-                    """
-                    SELECT obs_date, AVG("yield") as avg_yield
-                    FROM ts
-                    WHERE tenor = ? AND "yield" IS NOT NULL
-                    GROUP BY obs_date
-                    ORDER BY obs_date
-                    """,
-                    [tenor],
-                ).fetchall()
-                if not res:
+                series = await run_in_threadpool(db.tenor_series, tenor)
+                if series.empty:
                     raise HTTPException(status_code=400, detail="No data for requested tenor")
-                dates = [r[0] for r in res]
-                vals = [r[1] for r in res]
-                series = pd.Series(vals, index=pd.to_datetime(dates))
 
             if len(series) < 100:
                 return JSONResponse({"text": "❌ Insufficient data for structural break test (need ≥100)."}, status_code=400)
 
-            break_res = structural_break_test(
+            break_res = await run_in_threadpool(
+                structural_break_test,
                 series,
                 break_date=sb_req['break_date'],
                 start_date=sb_req['start_date'],
@@ -634,7 +712,7 @@ async def chat_endpoint(req: ChatRequest):
     # Therefore, we strip the persona prefix and let these queries fall through to parse_intent().
     
     # Get database connection early for all query types
-    db = get_db(req.csv)
+    db = await run_in_threadpool(get_db, req.csv)
     
     # Handle frequency aggregation queries (agg 5 year monthly from 2023 to 2024)
     # This must be done BEFORE parse_intent because parse_aggregation_query is more specific
@@ -643,21 +721,11 @@ async def chat_endpoint(req: ChatRequest):
         try:
             from regression_analysis import aggregate_frequency, format_aggregation
             
-            res = db.con.execute(f"""
-                SELECT obs_date, AVG("yield") as avg_yield
-                FROM ts
-                WHERE tenor = ? AND "yield" IS NOT NULL
-                GROUP BY obs_date
-                ORDER BY obs_date
-            """, [agg_req['tenor']]).fetchall()
+            series = await run_in_threadpool(db.tenor_series, agg_req['tenor'])
             
-            if not res or len(res) < 10:
+            if len(series) < 10:
                 raise HTTPException(status_code=400, detail="Insufficient data for aggregation (need ≥10 observations).")
             
-            dates = [r[0] for r in res]
-            vals = [r[1] for r in res]
-            series = pd.Series(vals, index=pd.to_datetime(dates))
-            
             agg_res = aggregate_frequency(series, 
                                          freq=agg_req['frequency'],
                                          start_date=agg_req['start_date'], 
@@ -685,14 +753,9 @@ async def chat_endpoint(req: ChatRequest):
     # POINT
     if intent.type == 'POINT':
         d = intent.point_date
-        params = [d.isoformat()]
-        where = 'obs_date = ?'
-        if intent.tenor:
-            where += ' AND tenor = ?'; params.append(intent.tenor)
-        if intent.series:
-            where += ' AND series = ?'; params.append(intent.series)
-        rows = db.con.execute(f'SELECT series, tenor, price, "yield" FROM ts WHERE {where} ORDER BY series', params).fetchall()
-        rows_list = [dict(series=r[0], tenor=r[1], price=round(r[2], 2) if r[2] is not None else None, **{'yield': round(r[3], 2) if r[3] is not None else None}) for r in rows]
+        rows = await run_in_threadpool(db.slice_rows, d, d, [intent.tenor] if intent.tenor else None, intent.series)
+        rows.sort(key=lambda r: r[0])
+        rows_list = [dict(series=r[0], tenor=r[1], price=round(r[3], 2) if r[3] is not None else None, **{'yield': round(r[4], 2) if r[4] is not None else None}) for r in rows]
         text = f"Found {len(rows_list)} row(s) for {intent.tenor or 'all tenors'} on {d}:"
         return JSONResponse({"text": text, "rows": rows_list})
 
@@ -712,12 +775,12 @@ async def chat_endpoint(req: ChatRequest):
                 # Multiple tenors: aggregate each separately and show comparison
                 agg_results = []
                 for tnr in tenors_to_agg:
-                    val, n = db.aggregate(intent.start_date, intent.end_date, intent.metric, intent.agg, intent.series, tnr)
+                    val, n = await run_in_threadpool(db.aggregate, intent.start_date, intent.end_date, intent.metric, intent.agg, intent.series, tnr)
                     agg_results.append(f"{tnr}: {intent.agg.upper()} = {round(val, 2) if val is not None else 'N/A'} (N={n})")
                 text = f"{intent.agg.upper()} {intent.metric} {intent.start_date} → {intent.end_date}:\n" + "\n".join(agg_results)
             else:
                 # Single tenor or no tenor specified
-                val, n = db.aggregate(intent.start_date, intent.end_date, intent.metric, intent.agg, intent.series, intent.tenor)
+                val, n = await run_in_threadpool(db.aggregate, intent.start_date, intent.end_date, intent.metric, intent.agg, intent.series, intent.tenor)
                 text = f"{intent.agg.upper()} {intent.metric} {intent.start_date} → {intent.end_date} = {round(val, 2) if val is not None else 'N/A'} (N={n})"
             
             # Generate LLM analysis if persona requested
@@ -738,25 +801,17 @@ async def chat_endpoint(req: ChatRequest):
                 highlight_date_obj = intent.highlight_date
                 # Use tenors list if available, otherwise single tenor
                 tenors_to_plot = intent.tenors if intent.tenors else ([intent.tenor] if intent.tenor else None)
-                png = _plot_range_to_png(db, intent.start_date, intent.end_date, metric=intent.metric, tenor=intent.tenor, tenors=tenors_to_plot, highlight_date=highlight_date_obj)
+                png = await run_in_threadpool(_plot_range_to_png, db, intent.start_date, intent.end_date, metric=intent.metric, tenor=intent.tenor, tenors=tenors_to_plot, highlight_date=highlight_date_obj)
                 b64 = base64.b64encode(png).decode('ascii')
                 return JSONResponse({"text": text, "analysis": analysis_text, "image": b64, "image_base64": b64})
             return JSONResponse({"text": text, "analysis": analysis_text})
 
         # No aggregation provided — return all individual rows for the date range
-        params = [intent.start_date.isoformat(), intent.end_date.isoformat()]
-        where = 'obs_date BETWEEN ? AND ?'
-        
         # Support multiple tenors: use intent.tenors if present, otherwise fall back to intent.tenor
         tenors_to_fetch = intent.tenors if intent.tenors else ([intent.tenor] if intent.tenor else None)
-        if tenors_to_fetch:
-            tenor_placeholders = ','.join(['?'] * len(tenors_to_fetch))
-            where += f' AND tenor IN ({tenor_placeholders})'
-            params.extend(tenors_to_fetch)
-        
-        if intent.series:
-            where += ' AND series = ?'; params.append(intent.series)
-        rows = db.con.execute(f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date DESC, series', params).fetchall()
+        rows = await run_in_threadpool(db.slice_rows, intent.start_date, intent.end_date, tenors_to_fetch, intent.series)
+        rows.sort(key=lambda r: r[0])
+        rows.sort(key=lambda r: r[2], reverse=True)  # newest first, series order within a date
         rows_list = [dict(series=r[0], tenor=r[1], date=r[2].isoformat(), price=round(r[3], 2) if r[3] is not None else None, **{'yield': round(r[4], 2) if r[4] is not None else None}) for r in rows]
         
         # Generate descriptive text for analysis (show all tenors if multiple)
@@ -773,7 +828,7 @@ async def chat_endpoint(req: ChatRequest):
             highlight_date_obj = intent.highlight_date
             # Use tenors list if available, otherwise single tenor
             tenors_to_plot = intent.tenors if intent.tenors else ([intent.tenor] if intent.tenor else None)
-            png = _plot_range_to_png(db, intent.start_date, intent.end_date, metric=intent.metric, tenor=intent.tenor, tenors=tenors_to_plot, highlight_date=highlight_date_obj)
+            png = await run_in_threadpool(_plot_range_to_png, db, intent.start_date, intent.end_date, metric=intent.metric, tenor=intent.tenor, tenors=tenors_to_plot, highlight_date=highlight_date_obj)
             b64 = base64.b64encode(png).decode('ascii')
             
             # Generate LLM analysis if persona requested
@@ -1018,5 +1073,276 @@ async def bot_user_stats(user_id: int):
     return metrics.get_user_stats(user_id)
 
 
+@app.get("/curve")
+def yield_curve(on: str, years: str = "1,2,3,5,7,10", method: str = "nelson_siegel",
+                csv: str = "20251215_priceyield.csv"):
+    """Yields at `years` (comma-separated) on the curve fitted for date `on`.
+
+    Uses the latest fitted curve on or before `on` (its date is returned as curve_date).
+    """
+    if method not in CURVE_METHODS:
+        raise HTTPException(status_code=400, detail=f"method must be one of {', '.join(CURVE_METHODS)}")
+    try:
+        points = [float(y) for y in years.split(",") if y.strip()]
+        on_date = pd.Timestamp(on).date()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    store = curve_store(get_db(csv))
+    curve_date = store.curve_date(on_date, method)
+    if curve_date is None:
+        raise HTTPException(status_code=404, detail=f"No yield curve on or before {on_date}")
+    values = store.curve(curve_date, points, method)
+    return {
+        "date": on_date.isoformat(),
+        "curve_date": curve_date.isoformat(),
+        "method": method,
+        "points": [{"years": t, "yield": round(float(v), 4)} for t, v in zip(points, values)],
+    }
+
+
+@app.get("/quality")
+def data_quality(tenors: Optional[str] = None, series: Optional[str] = None, kind: Optional[str] = None,
+                 start: Optional[str] = None, end: Optional[str] = None, events: bool = True,
+                 csv: str = "20251215_priceyield.csv"):
+    """Data-quality report computed when the bond data is loaded (see BondDB._build_quality).
+
+    summary: per series/tenor business-day coverage and counts of gaps, stale runs,
+    outliers and holiday rows. events: the runs themselves, overlapping [start, end];
+    kind filters them (comma-separated: span, gap, stale, outlier, holiday).
+    """
+    kinds = [k.strip() for k in kind.split(",") if k.strip()] if kind else None
+    bad = sorted(set(kinds or ()) - set(priceyield_mod.QUALITY_KINDS))
+    if bad:
+        raise HTTPException(status_code=400, detail=f"unknown kind {', '.join(bad)}; "
+                                                    f"use {', '.join(priceyield_mod.QUALITY_KINDS)}")
+    try:
+        start_date = pd.Timestamp(start).date() if start else None
+        end_date = pd.Timestamp(end).date() if end else None
+        tenor_list = [_batch_tenor(t) for t in tenors.split(",") if t.strip()] if tenors else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    def records(frame):
+        for col in frame.columns:
+            if col.endswith("_date"):
+                frame[col] = pd.to_datetime(frame[col]).dt.strftime("%Y-%m-%d")
+        return json.loads(frame.to_json(orient="records"))
+
+    db = get_db(csv)
+    out = {"summary": records(db.quality_summary(tenor_list, series))}
+    if events:
+        frame = db.quality_events(kinds, start_date, end_date, tenor_list, series)
+        frame["value"] = frame["value"].round(4)
+        out["events"] = records(frame)
+    return out
+
+
+def _plot_forecast_to_png(res: dict, tenor: str, metric: str = "yield") -> bytes:
+    """Fan chart: recent observations, the ensemble average and the Monte Carlo 90% / 50% bands."""
+    fig, ax = _new_figure(figsize=(10, 6))
+    apply_economist_style(fig, ax)
+    obs = res.get("last_obs", [])
+    fc = [f for f in res.get("forecasts", []) if f.get("average") is not None]
+    if obs:
+        ax.plot([pd.Timestamp(d) for d, _ in obs], [v for _, v in obs], linewidth=2.5,
+                color=ECONOMIST_COLORS['blue'], label='Observed')
+    if fc:
+        # Start every forecast line and band at the last observation, so the fan opens from it
+        start = [(pd.Timestamp(obs[-1][0]), obs[-1][1])] if obs else []
+        dates = [d for d, _ in start] + [pd.Timestamp(f["date"]) for f in fc]
+        def series_of(key):
+            return [v for _, v in start] + [(f.get("bands") or {}).get(key, np.nan) for f in fc]
+        for lo, hi, alpha, label in (("p05", "p95", 0.15, "MC 90% band"), ("p25", "p75", 0.3, "MC 50% band")):
+            if all((f.get("bands") or {}).get(lo) is not None for f in fc):
+                ax.fill_between(dates, series_of(lo), series_of(hi), color=ECONOMIST_COLORS['red'],
+                                alpha=alpha, linewidth=0, label=label)
+        ax.plot(dates, [v for _, v in start] + [f["average"] for f in fc], linewidth=2.5, linestyle='--',
+                color=ECONOMIST_COLORS['red'], label='Ensemble average')
+        ax.legend(frameon=False, fontsize=10, loc='best', labelcolor=ECONOMIST_COLORS.get('gray', ECONOMIST_COLORS['grey']))
+    ax.set_title(f"{metric.capitalize()} {tenor.replace('_', ' ')}: next {len(fc)} business days",
+                 fontsize=13, pad=14, loc='left', color=ECONOMIST_COLORS['black'])
+    ax.set_ylabel(f"{metric.capitalize()}{' (%)' if metric == 'yield' else ''}", fontsize=9)
+    from matplotlib.dates import DateFormatter
+    ax.xaxis.set_major_formatter(DateFormatter('%-d %b\n%Y'))
+    fig.autofmt_xdate(rotation=0, ha='center')
+    add_economist_caption(fig)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150, facecolor='white')
+    buf.seek(0)
+    return buf.read()
+
+
+@app.get("/forecast")
+def forecast(tenor: str, days: int = 5, metric: str = "yield", series: Optional[str] = None,
+             history: int = 60, format: str = "json", csv: str = "20251215_priceyield.csv"):
+    """Ensemble forecast for the next `days` business days (priceyield forecast_metric_next_days).
+
+    Each horizon has the per-model forecasts, their average and the Monte Carlo
+    quantile bands. format=png draws them as a fan chart after the last
+    `history` observations.
+    """
+    if metric not in ("yield", "price"):
+        raise HTTPException(status_code=400, detail="metric must be yield or price")
+    if format not in ("json", "png"):
+        raise HTTPException(status_code=400, detail="format must be json or png")
+    if not 1 <= days <= priceyield_mod.FORECAST_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"days must be between 1 and {priceyield_mod.FORECAST_MAX_DAYS}")
+    try:
+        tenor = _batch_tenor(tenor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    res = priceyield_mod.forecast_metric_next_days(get_db(csv), tenor, metric=metric, days=days,
+                                                   last_obs_count=max(history, 1), series=series)
+    if not res["forecasts"]:
+        raise HTTPException(status_code=404, detail=f"No {metric} data for {tenor}")
+    if format == "png":
+        return Response(_plot_forecast_to_png(res, tenor, metric), media_type="image/png")
+    def number(v):
+        # model errors stay strings; NaN is not valid JSON
+        if isinstance(v, (int, float)):
+            return round(float(v), 4) if np.isfinite(v) else None
+        return v
+    return {
+        "tenor": tenor,
+        "metric": metric,
+        "series": series,
+        "last_obs": [{"date": d.isoformat(), metric: number(v)} for d, v in res["last_obs"]],
+        "forecasts": [
+            {
+                "label": f["label"],
+                "date": f["date"].isoformat(),
+                "average": number(f["average"]),
+                "models": {m: number(v) for m, v in f["models"].items() if m not in ("average", "bands")},
+                "bands": {q: number(v) for q, v in (f.get("bands") or {}).items()},
+            }
+            for f in res["forecasts"]
+        ],
+    }
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+def _export_text(chunks, fmt: str):
+    """Encode DataFrame chunks as CSV (one header) or NDJSON, dates as YYYY-MM-DD."""
+    first = True
+    for chunk in chunks:
+        for col in chunk.columns:
+            if chunk[col].dtype.kind == "M":
+                chunk[col] = chunk[col].dt.strftime("%Y-%m-%d")
+        if fmt == "csv":
+            yield chunk.to_csv(index=False, header=first, lineterminator="\n")
+        elif len(chunk):
+            text = chunk.to_json(orient="records", lines=True)
+            yield text if text.endswith("\n") else text + "\n"
+        first = False
+
+
+def _export_arrow(batches):
+    """Encode record batches as an Arrow IPC stream, one write per batch."""
+    import pyarrow as pa
+
+    sink, writer = io.BytesIO(), None
+
+    def take() -> bytes:
+        out = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return out
+
+    for batch in batches:
+        if writer is None:
+            writer = pa.ipc.new_stream(sink, batch.schema)
+        writer.write_batch(batch)
+        yield take()
+    if writer is not None:
+        writer.close()
+        yield take()
+
+
+def _export_arrow_csv(batches):
+    """CSV from record batches with pyarrow's writer (about 10x faster than DataFrame.to_csv)."""
+    import pyarrow.csv as pa_csv
+
+    for i, batch in enumerate(batches):
+        sink = io.BytesIO()
+        pa_csv.write_csv(batch, sink, pa_csv.WriteOptions(include_header=i == 0, quoting_style="needed"))
+        yield sink.getvalue()
+
+
+@app.get("/export")
+def export(start: Optional[str] = None, end: Optional[str] = None, tenors: Optional[str] = None,
+           series: Optional[str] = None, table: str = "ts", format: str = "ndjson",
+           csv: str = "20251215_priceyield.csv"):
+    """Stream `ts` rows (table=ts) or the daily cube (table=cube) for a date range.
+
+    tenors: comma-separated (default all). format: ndjson, csv or arrow (Arrow IPC
+    stream, requires pyarrow). Rows are read from DuckDB in chunks while the
+    response is sent, so multi-year exports are never held in memory whole.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    try:
+        start_date = pd.Timestamp(start).date() if start else None
+        end_date = pd.Timestamp(end).date() if end else None
+        tenor_list = [_batch_tenor(t) for t in tenors.split(",") if t.strip()] if tenors else None
+        arrow = format == "arrow" or (format == "csv" and _HAS_PYARROW)
+        chunks = get_db(csv).export_batches(table, start_date, end_date, tenor_list, series, arrow=arrow)
+        # start the query now so bad parameters fail with a 400, not mid-stream
+        first = next(chunks, None)
+    except (ValueError, ImportError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def rows():
+        if first is not None:
+            yield first
+            yield from chunks
+
+    media_type, ext = EXPORT_FORMATS[format]
+    if format == "arrow":
+        body = _export_arrow(rows())
+    elif arrow:
+        body = _export_arrow_csv(rows())
+    else:
+        body = _export_text(rows(), format)
+    return StreamingResponse(body, media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="bonds_{table}.{ext}"'})
+
+
+class AppendRequest(BaseModel):
+    rows: List[Dict[str, Any]]  # {"date": "YYYY-MM-DD", "series", "tenor", "price", "yield"}
+    csv: Optional[str] = "20251215_priceyield.csv"
+    persist: Optional[bool] = False
+
+
+@app.post("/admin/bond/append")
+def admin_bond_append(req: AppendRequest, request: Request):
+    """Append daily bond observations to the loaded BondDB (requires X-Admin-Token).
+
+    With persist=false the rows live only in this process and are dropped on the
+    next reload of the CSV; persist=true also appends them to the CSV.
+    """
+    token = os.environ.get("ADMIN_API_TOKEN", "")
+    if not token:
+        raise HTTPException(status_code=503, detail="Admin API disabled (ADMIN_API_TOKEN not set)")
+    if not hmac.compare_digest(request.headers.get("x-admin-token", ""), token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    db = get_db(req.csv)
+    try:
+        result = db.append_observations(req.rows, persist=bool(req.persist))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid rows: {e}")
+    # The CSV change is already applied in memory: don't let the poller rebuild it
+    data_version = data_cache.mark_updated(f"bond:{db.csv}")
+    out = asdict(result)
+    out["start_date"] = result.start_date.isoformat() if result.start_date else None
+    out["end_date"] = result.end_date.isoformat() if result.end_date else None
+    out["data_version"] = data_version
+    return out
+
+
 if __name__ == "__main__":
     uvicorn.run("app_fastapi:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
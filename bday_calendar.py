@@ -0,0 +1,96 @@
+"""Indonesian bond-market business-day calendar: Monday-Friday minus INDONESIA_HOLIDAYS.
+
+Built once at import:
+  CALENDAR  numpy busdaycalendar, for the vectorized busday_* functions
+  BDAY      the same calendar as a pandas CustomBusinessDay offset (date_range, asfreq)
+  a bitmap of business days from BITMAP_START to BITMAP_END, so scalar checks are
+  one array index instead of a weekday test plus a set lookup.
+
+Forecast horizons, model step counts, plot grids, the ts_cube `is_bday` column and
+the bot's "markets were closed" notes all use this calendar.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from market_holidays import INDONESIA_HOLIDAYS
+
+WEEKMASK = "1111100"
+HOLIDAYS = np.array(sorted(INDONESIA_HOLIDAYS), dtype="datetime64[D]")
+CALENDAR = np.busdaycalendar(weekmask=WEEKMASK, holidays=HOLIDAYS)
+BDAY = pd.offsets.CustomBusinessDay(weekmask="Mon Tue Wed Thu Fri", holidays=HOLIDAYS)
+
+BITMAP_START = np.datetime64("1990-01-01", "D")
+BITMAP_END = np.datetime64("2100-01-01", "D")
+_BITMAP = np.is_busday(np.arange(BITMAP_START, BITMAP_END), busdaycal=CALENDAR)
+_BITS = _BITMAP.tolist()  # plain bools: indexing a list is faster than numpy for one date
+_START_ORDINAL = date(1990, 1, 1).toordinal()
+
+
+def _days(dates) -> np.ndarray:
+    """dates (date, str, Timestamp, or array-like of them) as datetime64[D]."""
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == "M":
+        return dates.astype("datetime64[D]")
+    if isinstance(dates, (pd.Series, pd.Index)):
+        return pd.to_datetime(dates).to_numpy().astype("datetime64[D]")
+    if isinstance(dates, (list, tuple)):
+        return pd.to_datetime(pd.Index(dates)).to_numpy().astype("datetime64[D]")
+    return np.datetime64(pd.Timestamp(dates).date(), "D")
+
+
+def is_bday(dates):
+    """True where `dates` are business days: a bool for one date, an ndarray for many."""
+    if isinstance(dates, date):  # also datetime / Timestamp
+        i = dates.toordinal() - _START_ORDINAL
+        if 0 <= i < len(_BITS):
+            return _BITS[i]
+        return bool(np.is_busday(np.datetime64(date.fromordinal(dates.toordinal()), "D"), busdaycal=CALENDAR))
+    days = _days(dates)
+    if np.ndim(days) == 0:
+        return bool(np.is_busday(days, busdaycal=CALENDAR))
+    i = (days - BITMAP_START).astype(np.int64)
+    if len(i) and 0 <= i.min() and i.max() < len(_BITMAP):
+        return _BITMAP[i]
+    return np.is_busday(days, busdaycal=CALENDAR)
+
+
+def closed_reason(d) -> str:
+    """Why the market is closed on `d` ("Saturday", "Sunday", "Indonesian public holiday"), or ""."""
+    d = pd.Timestamp(d).date()
+    if d.weekday() >= 5:
+        return d.strftime("%A")
+    return "" if is_bday(d) else "Indonesian public holiday"
+
+
+def bday_count(start, end):
+    """Business days in [start, end) (np.busday_count semantics; negative if end < start)."""
+    counts = np.busday_count(_days(start), _days(end), busdaycal=CALENDAR)
+    return int(counts) if np.ndim(counts) == 0 else counts
+
+
+def next_bdays(start, n: int) -> pd.DatetimeIndex:
+    """The `n` business days after `start`."""
+    first = np.busday_offset(_days(start), 0, roll="backward", busdaycal=CALENDAR)
+    days = np.busday_offset(first, np.arange(1, n + 1), busdaycal=CALENDAR)
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"))
+
+
+def bday_range(start, end) -> pd.DatetimeIndex:
+    """Business days in [start, end], like pd.bdate_range but skipping Indonesian holidays."""
+    days = np.arange(_days(start), _days(end) + 1)
+    return pd.DatetimeIndex(days[is_bday(days)].astype("datetime64[ns]"))
+
+
+def to_bdays(series: pd.Series) -> pd.Series:
+    """`series` (date index) on the business-day grid, last value carried forward.
+
+    The index gets freq=BDAY, so statsmodels steps and dates follow this calendar.
+    Rows on non-business days are dropped.
+    """
+    s = series.copy()
+    s.index = pd.to_datetime(s.index)
+    if s.empty:
+        return s
+    grid = pd.DatetimeIndex(bday_range(s.index.min(), s.index.max()), freq=BDAY)
+    return s[~s.index.duplicated(keep="last")].reindex(grid.union(s.index)).ffill().reindex(grid)
@@ -15,37 +15,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, date
-import os
 from io import BytesIO
 from utils.economist_style import ECONOMIST_COLORS, apply_economist_style, add_economist_caption
+from bday_calendar import bday_range, is_bday
+from market_data import get_market_store
+from market_holidays import INDONESIA_HOLIDAYS
 
 
 class BondMacroPlotter:
     """Create multi-variable plots: bond prices/yields + FX/VIX with Economist styling."""
     
-    # Indonesia public holidays 2023-2026 (when bond markets are closed)
-    INDONESIA_HOLIDAYS = {
-        date(2023, 1, 1), date(2023, 1, 22), date(2023, 2, 18), date(2023, 3, 22),
-        date(2023, 4, 7), date(2023, 4, 22), date(2023, 4, 23), date(2023, 5, 1),
-        date(2023, 5, 18), date(2023, 6, 1), date(2023, 6, 4), date(2023, 6, 29),
-        date(2023, 7, 19), date(2023, 8, 17), date(2023, 9, 28), date(2023, 12, 25),
-        date(2023, 1, 23), date(2023, 3, 23), date(2023, 4, 21), date(2023, 4, 24),
-        date(2023, 4, 25), date(2023, 4, 26), date(2023, 6, 2), date(2023, 12, 26),
-        date(2024, 1, 1), date(2024, 2, 8), date(2024, 2, 10), date(2024, 3, 11),
-        date(2024, 3, 29), date(2024, 3, 31), date(2024, 4, 10), date(2024, 4, 11),
-        date(2024, 5, 1), date(2024, 5, 9), date(2024, 5, 23), date(2024, 6, 1),
-        date(2024, 6, 17), date(2024, 7, 7), date(2024, 8, 17), date(2024, 9, 16),
-        date(2024, 12, 25), date(2024, 2, 9), date(2024, 3, 12), date(2024, 4, 8),
-        date(2024, 4, 9), date(2024, 4, 12), date(2024, 4, 15), date(2024, 5, 10),
-        date(2024, 5, 24), date(2024, 6, 18), date(2024, 12, 26),
-        date(2025, 1, 1), date(2025, 1, 27), date(2025, 1, 29), date(2025, 3, 29),
-        date(2025, 3, 31), date(2025, 4, 1), date(2025, 4, 18), date(2025, 4, 20),
-        date(2025, 5, 1), date(2025, 5, 12), date(2025, 5, 29), date(2025, 6, 1),
-        date(2025, 6, 6), date(2025, 6, 27), date(2025, 8, 17), date(2025, 9, 5),
-        date(2025, 12, 25), date(2025, 1, 28), date(2025, 3, 28), date(2025, 4, 2),
-        date(2025, 4, 3), date(2025, 5, 2), date(2025, 5, 13), date(2025, 5, 30),
-        date(2025, 6, 2), date(2025, 6, 7), date(2025, 6, 28), date(2025, 12, 26),
-    }
+    # Indonesia public holidays (when bond markets are closed)
+    INDONESIA_HOLIDAYS = INDONESIA_HOLIDAYS
 
     def __init__(self, tenor: str, start_date: str, end_date: str, metric: str = 'price'):
         """
@@ -81,36 +62,23 @@ class BondMacroPlotter:
     
     def _is_business_day(self, d: date) -> bool:
         """Check if date is a business day (exclude weekends and Indonesia holidays)."""
-        if d.weekday() >= 5:  # Saturday or Sunday
-            return False
-        if d in self.INDONESIA_HOLIDAYS:
-            return False
-        return True
+        return is_bday(d)
 
     def _load_data(self):
-        """Load bond and macro data from CSV files, interpolate missing values."""
-        db_path = os.path.join(os.path.dirname(__file__), 'database')
-        
-        # Load bond data
-        bond_file = os.path.join(db_path, '20251215_priceyield.csv')
-        if not os.path.exists(bond_file):
-            raise FileNotFoundError(f"Bond data not found: {bond_file}")
-        
-        df_bond = pd.read_csv(bond_file)
-        df_bond['date'] = pd.to_datetime(df_bond['date'], format='%d/%m/%Y').dt.date
-        
-        self.bond_data = df_bond[
-            (df_bond['tenor'] == self.tenor) &
-            (df_bond['date'] >= self.start_date) &
-            (df_bond['date'] <= self.end_date)
-        ].sort_values('date').reset_index(drop=True)
+        """Load bond and macro data from the shared market store, interpolate missing values."""
+        store = get_market_store()
+
+        self.bond_data = store.bond_slice(self.tenor, self.start_date, self.end_date).reset_index(drop=True)
+        self.bond_data['date'] = self.bond_data['date'].dt.date
         
         # Interpolate missing values in bond data
         if len(self.bond_data) > 0:
             df_temp = self.bond_data.copy()
             df_temp['date'] = pd.to_datetime(df_temp['date'])
             df_temp = df_temp.set_index('date')
-            df_temp = df_temp.asfreq('D')  # Daily frequency
+            df_temp = df_temp[~df_temp.index.duplicated(keep='last')]
+            # Business-day grid: holiday placeholder rows are dropped, missing trading days filled
+            df_temp = df_temp.reindex(bday_range(df_temp.index.min(), df_temp.index.max()))
             # Interpolate price and yield linearly
             for col in ['price', 'yield']:
                 if col in df_temp.columns:
@@ -119,19 +87,9 @@ class BondMacroPlotter:
             df_temp['date'] = df_temp['date'].dt.date
             self.bond_data = df_temp[df_temp['date'].notna()].reset_index(drop=True)
         
-        # Load macro data (FX & VIX)
-        macro_file = os.path.join(db_path, '20260102_daily01.csv')
-        if not os.path.exists(macro_file):
-            raise FileNotFoundError(f"Macro data not found: {macro_file}")
-        
-        df_macro = pd.read_csv(macro_file)
-        # Parse date from yyyy/mm/dd format
-        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d').dt.date
-        
-        self.fx_data = df_macro[
-            (df_macro['date'] >= self.start_date) &
-            (df_macro['date'] <= self.end_date)
-        ].sort_values('date').reset_index(drop=True)
+        # Macro data (FX & VIX)
+        self.fx_data = store.macro_slice(self.start_date, self.end_date).reset_index(drop=True)
+        self.fx_data['date'] = self.fx_data['date'].dt.date
         
         # Interpolate missing values in macro data
         if len(self.fx_data) > 0:
@@ -38,6 +38,8 @@ import numpy as np
 from datetime import datetime
 import os
 
+from market_data import get_market_store
+
 
 class ReturnDecomposition:
     """Decompose bond returns into carry, duration, roll-down, and FX components."""
@@ -70,7 +72,7 @@ class ReturnDecomposition:
 
     def _load_data(self):
         """
-        Load bond and FX data from CSV files.
+        Load bond and FX data from the shared market store (market_data.py).
         
         DATABASE PATH CONFIGURATION (VERIFIED):
         ----------------------------------------
@@ -94,39 +96,17 @@ class ReturnDecomposition:
         
         Path type: RELATIVE (OS-agnostic, works on Windows/Mac/Linux)
         """
-        db_path = os.path.join(os.path.dirname(__file__), 'database')
-        
-        # Load bond data
-        bond_file = os.path.join(db_path, '20251215_priceyield.csv')
-        if not os.path.exists(bond_file):
-            raise FileNotFoundError(f"Bond data not found: {bond_file}")
-        
-        df_bond = pd.read_csv(bond_file)
-        df_bond['date'] = pd.to_datetime(df_bond['date'], format='%d/%m/%Y')
-        
-        # Filter by tenor and date range
-        self.bond_data = df_bond[
-            (df_bond['tenor'] == self.tenor) &
-            (df_bond['date'] >= self.start_date) &
-            (df_bond['date'] <= self.end_date)
-        ].sort_values('date').reset_index(drop=True)
+        store = get_market_store()
+
+        # Bond rows for the tenor and date range
+        self.bond_data = store.bond_slice(self.tenor, self.start_date, self.end_date).reset_index(drop=True)
         
         # Forward-fill NaN values in bond data (market closures)
         self.bond_data['price'] = self.bond_data['price'].ffill()
         self.bond_data['yield'] = self.bond_data['yield'].ffill()
         
-        # Load FX data
-        fx_file = os.path.join(db_path, '20260102_daily01.csv')
-        if not os.path.exists(fx_file):
-            raise FileNotFoundError(f"FX data not found: {fx_file}")
-        
-        df_fx = pd.read_csv(fx_file)
-        df_fx['date'] = pd.to_datetime(df_fx['date'], format='%Y/%m/%d')
-        
-        self.fx_data = df_fx[
-            (df_fx['date'] >= self.start_date) &
-            (df_fx['date'] <= self.end_date)
-        ].sort_values('date').reset_index(drop=True)
+        # FX data
+        self.fx_data = store.macro_slice(self.start_date, self.end_date).reset_index(drop=True)
         
         # Forward-fill NaN values in FX data (market closures)
         self.fx_data['idrusd'] = self.fx_data['idrusd'].ffill()
@@ -0,0 +1,208 @@
+"""Hot-reloading cache for objects built from the database files.
+
+BondDB / AuctionDB instances and the shared market store are expensive to build
+but cheap to query, so they are cached per process. This cache also watches the
+files each entry was built from: a daemon thread polls their (mtime, size) every
+DATA_RELOAD_INTERVAL seconds (default 60, 0 disables polling), rebuilds changed
+entries in the background and swaps the new instance in atomically. Callers that
+already hold the old instance keep using it until they finish; new calls get the
+new one. A failed rebuild is logged and the old instance stays in service.
+
+Usage:
+    db = data_cache.get(f"bond:{path}", lambda: BondDB(path), [path])
+    data_cache.status()   # {"data_version": ..., "last_reload": ..., "entries": {...}}
+"""
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_INTERVAL = float(os.environ.get("DATA_RELOAD_INTERVAL", "60"))
+
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def _fingerprint(paths: Iterable[str]) -> Fingerprint:
+    """(path, mtime_ns, size) per file; missing files fingerprint as (-1, -1)."""
+    out = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            out.append((str(p), st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append((str(p), -1, -1))
+    return tuple(out)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    loader: Callable[[], Any]
+    paths: List[str]
+    fingerprint: Fingerprint
+    version: int
+    loaded_at: datetime
+    failed_fingerprint: Optional[Fingerprint] = None
+
+
+class ReloadingCache:
+    """Keyed cache whose entries are rebuilt when their source files change."""
+
+    def __init__(self, interval: float = DEFAULT_RELOAD_INTERVAL):
+        self.interval = interval
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
+        self._version = 0
+        self._last_reload: Optional[datetime] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def data_version(self) -> int:
+        return self._version
+
+    @property
+    def last_reload(self) -> Optional[datetime]:
+        return self._last_reload
+
+    def _build_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._build_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: str, loader: Callable[[], Any], paths: Iterable[str]) -> Any:
+        """Return the cached value for `key`, building it with `loader` on first use."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry.value
+        with self._build_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                paths = [str(p) for p in paths]
+                fp = _fingerprint(paths)
+                entry = self._store(key, loader(), loader, paths, fp, 1)
+        self.start()
+        return entry.value
+
+    def put(self, key: str, value: Any, loader: Callable[[], Any], paths: Iterable[str]) -> None:
+        """Install an already-built value for `key` (replacing any cached one)."""
+        paths = [str(p) for p in paths]
+        old = self._entries.get(key)
+        self._store(key, value, loader, paths, _fingerprint(paths), old.version + 1 if old else 1)
+
+    def _store(self, key: str, value: Any, loader: Callable[[], Any], paths: List[str],
+               fp: Fingerprint, version: int) -> _Entry:
+        now = datetime.now()
+        entry = _Entry(value, loader, paths, fp, version, now)
+        with self._lock:
+            self._entries[key] = entry
+            self._version += 1
+            self._last_reload = now
+        return entry
+
+    def peek(self, key: str) -> Any:
+        """Cached value for `key` or None (never builds)."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def on_reload(self, key: str, callback: Callable[[Any], None]) -> None:
+        """Call `callback(new_value)` after each background swap of `key`."""
+        with self._lock:
+            self._listeners.setdefault(key, []).append(callback)
+
+    def mark_updated(self, key: Optional[str] = None) -> int:
+        """Bump the data version after an in-place update (e.g. appended rows)."""
+        with self._lock:
+            self._version += 1
+            self._last_reload = datetime.now()
+            entry = self._entries.get(key) if key else None
+            if entry is not None:
+                entry.version += 1
+                entry.fingerprint = _fingerprint(entry.paths)
+                entry.loaded_at = self._last_reload
+            return self._version
+
+    def reload(self, key: str, force: bool = False) -> bool:
+        """Rebuild `key` if its files changed (or `force`); return True if swapped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        with self._build_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            fp = _fingerprint(entry.paths)
+            if not force and (fp == entry.fingerprint or fp == entry.failed_fingerprint):
+                return False
+            try:
+                value = entry.loader()
+            except Exception:
+                logger.exception("Reload of %s failed; keeping the previous instance", key)
+                entry.failed_fingerprint = fp
+                return False
+            new = self._store(key, value, entry.loader, entry.paths, fp, entry.version + 1)
+        logger.info("Reloaded %s (version %d)", key, new.version)
+        for callback in list(self._listeners.get(key, ())):
+            try:
+                callback(value)
+            except Exception:
+                logger.exception("Reload listener for %s failed", key)
+        return True
+
+    def check(self) -> List[str]:
+        """One polling pass over all entries; returns the keys that were reloaded."""
+        return [key for key in list(self._entries) if self.reload(key)]
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop `key` (or everything); the next get() rebuilds synchronously."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Data reload poll failed")
+
+    def start(self) -> None:
+        """Start the background poller (no-op if running or interval <= 0)."""
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._poll, name="data-reload", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        """Data version, last reload time and per-entry versions (for /health)."""
+        entries = dict(self._entries)
+        return {
+            "data_version": self._version,
+            "last_reload": self._last_reload.isoformat() if self._last_reload else None,
+            "entries": {
+                key: {"version": e.version, "loaded_at": e.loaded_at.isoformat()}
+                for key, e in entries.items()
+            },
+        }
+
+
+# Process-wide cache shared by the web app, the bot and the market store
+data_cache = ReloadingCache()
@@ -0,0 +1,174 @@
+"""Worker processes for the CPU-bound models of the yield-forecast ensemble.
+
+yield_forecast(method="all") hands its statsmodels / Prophet fits to run_models(),
+which runs them in a shared process pool at the same time, so an ensemble takes
+about as long as its slowest model rather than the sum of all of them. Results
+come back in completion order. A model that misses its timeout is reported as a
+TimeoutError; if it is still running, its pool is retired: later calls start a
+fresh pool, and the old one's workers are terminated (a fit cannot be
+interrupted any other way) once the fits other calls still have in it finish.
+
+FORECAST_WORKERS   worker processes (default min(4, CPUs), or 0 on a single CPU, where
+                   a pool only adds overhead); 0 runs every model inline, without timeouts
+FORECAST_TIMEOUT   per-model timeout in seconds (default 60)
+
+Workers are spawned, not forked (the bot and DuckDB run threads), on first use
+or by warm_up(), and reused afterwards.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+_CPUS = os.cpu_count() or 1
+FORECAST_WORKERS = int(os.environ.get("FORECAST_WORKERS", min(4, _CPUS) if _CPUS > 1 else 0))
+FORECAST_TIMEOUT = float(os.environ.get("FORECAST_TIMEOUT", "60"))
+
+_pool = None
+_pool_lock = threading.Lock()
+# Per pool: futures of every run_models call not yet done, and those of timed-out fits
+_inflight = {}
+_stuck = {}
+
+
+def _current_pool() -> ProcessPoolExecutor:
+    """The shared pool, started if needed (call with _pool_lock held)."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(FORECAST_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    with _pool_lock:
+        return _current_pool()
+
+
+def _drop_pool(pool: ProcessPoolExecutor):
+    """Stop handing out `pool` and shut it down (its queued fits are cancelled)."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _retire_pool(pool: ProcessPoolExecutor, stuck):
+    """Stop handing out `pool`; terminate it once every fit in it but the `stuck` ones is done."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+        reaping = pool in _stuck
+        _stuck.setdefault(pool, set()).update(stuck)
+    if not reaping:
+        threading.Thread(target=_reap, args=(pool,), name="forecast-pool-reaper", daemon=True).start()
+
+
+def _reap(pool: ProcessPoolExecutor):
+    # No call submits to a retired pool, so once the others are done only stuck fits are left
+    while True:
+        with _pool_lock:
+            others = [f for f in list(_inflight.get(pool, ())) if not f.done() and f not in _stuck[pool]]
+        if not others:
+            break
+        wait(others, timeout=1.0)
+    # ProcessPoolExecutor has no public way to stop a running task; without its
+    # process table the stuck workers exit when their fit returns
+    for proc in list((getattr(pool, "_processes", None) or {}).values()):
+        proc.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+    with _pool_lock:
+        _inflight.pop(pool, None)
+        _stuck.pop(pool, None)
+
+
+def _ready():
+    import yield_forecast_models  # noqa: F401  (statsmodels / Prophet imports are the slow part of a spawn)
+    return True
+
+
+def warm_up():
+    """Start the workers and their model imports in the background, so the first forecast doesn't wait."""
+    if FORECAST_WORKERS > 0:
+        pool = _get_pool()
+        for _ in range(FORECAST_WORKERS):
+            pool.submit(_ready)
+
+
+def shutdown():
+    """Stop the worker processes (they are started again on the next run_models)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        _drop_pool(pool)
+
+
+def _call(fn, args, kwargs):
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        return e
+
+
+def _timeout_for(name, timeout):
+    if isinstance(timeout, dict):
+        return timeout.get(name, FORECAST_TIMEOUT)
+    return FORECAST_TIMEOUT if timeout is None else timeout
+
+
+def run_models(jobs: dict, timeout=None):
+    """Start {name: (fn, args, kwargs)} now; return an iterator of (name, result) in completion order.
+
+    `fn` must be a module-level function (it is pickled to a worker). result is
+    fn's return value or the exception it raised; TimeoutError if it did not
+    finish within its timeout (seconds from submission; a float for every model
+    or a {name: seconds} dict, default FORECAST_TIMEOUT).
+    """
+    if FORECAST_WORKERS <= 0 or not jobs:
+        return ((name, _call(fn, args, kwargs)) for name, (fn, args, kwargs) in jobs.items())
+    start = time.monotonic()
+    with _pool_lock:
+        pool = _current_pool()
+        try:
+            futures = {pool.submit(fn, *args, **kwargs): name for name, (fn, args, kwargs) in jobs.items()}
+        except (BrokenProcessPool, RuntimeError):
+            futures = None
+        else:
+            running = _inflight.setdefault(pool, set())
+            running.update(futures)
+    if futures is None:
+        _drop_pool(pool)
+        return run_models(jobs, timeout)
+    for f in futures:
+        f.add_done_callback(running.discard)
+    deadlines = {f: start + _timeout_for(name, timeout) for f, name in futures.items()}
+    return _collect(pool, futures, deadlines, timeout)
+
+
+def _collect(pool, futures, deadlines, timeout):
+    pending = set(futures)
+    stuck = set()
+    while pending:
+        done, pending = wait(pending, timeout=max(min(deadlines[f] for f in pending) - time.monotonic(), 0),
+                             return_when=FIRST_COMPLETED)
+        for f in done:
+            try:
+                yield futures[f], f.result()
+            except BrokenProcessPool as e:
+                # a worker died (crashed or was terminated)
+                _drop_pool(pool)
+                yield futures[f], e
+            except Exception as e:
+                yield futures[f], e
+        now = time.monotonic()
+        for f in [f for f in pending if deadlines[f] <= now]:
+            pending.discard(f)
+            if not f.cancel():
+                stuck.add(f)
+            name = futures[f]
+            yield name, TimeoutError(f"{name} timed out after {_timeout_for(name, timeout):g}s")
+    if stuck:
+        _retire_pool(pool, stuck)
@@ -12,30 +12,24 @@ Usage:
 """
 
 import pandas as pd
-import os
 from datetime import datetime, date
 from typing import Optional, List, Dict
 
+from market_data import get_market_store
+
 
 class MacroDataFormatter:
     """Format macroeconomic data as economist-style tables."""
     
     def __init__(self):
         """Initialize data loader."""
-        self.db_path = os.path.join(os.path.dirname(__file__), 'database')
-        self.macro_data = None
-        self._load_macro_data()
+        self.store = get_market_store()
     
-    def _load_macro_data(self):
-        """Load macroeconomic data from CSV."""
-        macro_file = os.path.join(self.db_path, '20260102_daily01.csv')
-        if not os.path.exists(macro_file):
-            raise FileNotFoundError(f"Macro data not found: {macro_file}")
-        
-        df = pd.read_csv(macro_file)
-        # Parse date from yyyy/mm/dd format
-        df['date'] = pd.to_datetime(df['date'], format='%Y/%m/%d').dt.date
-        self.macro_data = df.sort_values('date').reset_index(drop=True)
+    def _macro_range(self, start: date, end: date) -> pd.DataFrame:
+        """Macro rows with start <= date <= end, dates as datetime.date."""
+        df = self.store.macro_slice(start, end).reset_index(drop=True)
+        df['date'] = df['date'].dt.date
+        return df
     
     def _parse_date(self, date_str: str) -> date:
         """Parse YYYY-MM-DD to date."""
@@ -226,10 +220,7 @@ class MacroDataFormatter:
         start = self._parse_date(start_date)
         end = self._parse_date(end_date)
         
-        df = self.macro_data[
-            (self.macro_data['date'] >= start) &
-            (self.macro_data['date'] <= end)
-        ].copy()
+        df = self._macro_range(start, end)
         
         if df.empty:
             return "⚠️ No IDR/USD data found for the specified period."
@@ -256,10 +247,7 @@ class MacroDataFormatter:
         start = self._parse_date(start_date)
         end = self._parse_date(end_date)
         
-        df = self.macro_data[
-            (self.macro_data['date'] >= start) &
-            (self.macro_data['date'] <= end)
-        ].copy()
+        df = self._macro_range(start, end)
         
         if df.empty:
             return "⚠️ No VIX data found for the specified period."
@@ -286,10 +274,7 @@ class MacroDataFormatter:
         start = self._parse_date(start_date)
         end = self._parse_date(end_date)
         
-        df = self.macro_data[
-            (self.macro_data['date'] >= start) &
-            (self.macro_data['date'] <= end)
-        ].copy()
+        df = self._macro_range(start, end)
         
         if df.empty:
             return "⚠️ No macro data found for the specified period."
@@ -350,10 +335,7 @@ class MacroDataFormatter:
         series_normalized = list(dict.fromkeys(series_normalized))
         
         # Get data
-        df = self.macro_data[
-            (self.macro_data['date'] >= start) &
-            (self.macro_data['date'] <= end)
-        ].copy()
+        df = self._macro_range(start, end)
         
         if df.empty:
             return "⚠️ No macro data found for the specified period."
@@ -0,0 +1,206 @@
+"""Process-wide in-memory market data store.
+
+Loads the bond price/yield, macro (IDR/USD, VIX) and auction frames once per
+process (from the market snapshot when fresh, else the CSVs; see
+market_snapshot.py) and serves date-range / tenor slices as positional views
+instead of re-reading and re-parsing the CSVs on every request.
+
+Frames are sorted once at load time so slices are contiguous row ranges found
+with `searchsorted`; the returned DataFrames are `iloc` slices that share memory
+with the store (pandas copy-on-write copies only if a caller writes to them).
+Treat the store's frames as read-only.
+
+The store is cached in data_reload.data_cache and hot-reloaded when any of the
+source CSVs changes; hold on to the returned store only for one request.
+
+Usage:
+    store = get_market_store()
+    bond = store.bond_slice('10_year', '2024-01-01', '2024-12-31')
+    macro = store.macro_slice('2024-01-01', '2024-12-31')
+    store.auction_rollups.months[(2024, 3)]   # precomputed auction aggregates
+"""
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_reload import data_cache
+from market_snapshot import SOURCES, read_frame
+
+
+def _to_datetime64(value) -> Optional[np.datetime64]:
+    if value is None:
+        return None
+    return np.datetime64(pd.Timestamp(value), "us")
+
+
+class AuctionRollups:
+    """Month / quarter / year auction aggregates computed once from the auction frame.
+
+    Amounts are in Rp trillions as stored in auction_database.csv; missing
+    incoming/awarded/bid-to-cover values count as 0, as in the bot's tables.
+
+    months[(year, month)], quarters[(year, quarter)], years[year]: period dicts in
+    the bot's standard shape ('monthly', 'total_incoming', 'total_awarded',
+    'avg_bid_to_cover'). incoming_by_year[year]: (month, raw incoming_trillions)
+    per row, NaN kept (used by the demand forecast).
+    Treat the dicts as read-only; copy before modifying.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        df = frame[frame["auction_year"].notna() & frame["auction_month"].notna()]
+        year = df["auction_year"].astype(int).to_numpy()
+        month = df["auction_month"].astype(int).to_numpy()
+        rows = pd.DataFrame({
+            "year": year,
+            "month": month,
+            "quarter": (month - 1) // 3 + 1,
+            "incoming": df["incoming_trillions"].fillna(0.0).to_numpy(),
+            "awarded": df["awarded_trillions"].fillna(0.0).to_numpy(),
+            "btc": df["bid_to_cover"].fillna(0.0).to_numpy(),
+        })
+
+        by_month = rows.groupby(["year", "month"], sort=True).agg(
+            incoming=("incoming", "sum"), awarded=("awarded", "sum"), btc=("btc", "mean"))
+        self.months: Dict[Tuple[int, int], Dict] = {}
+        for (y, m), r in zip(by_month.index, by_month.itertuples(index=False)):
+            self.months[(int(y), int(m))] = {
+                "type": "month",
+                "year": int(y),
+                "month": int(m),
+                "monthly": [{"month": int(m), "incoming": r.incoming, "awarded": r.awarded, "bid_to_cover": r.btc}],
+                "total_incoming": r.incoming,
+                "total_awarded": r.awarded,
+                "avg_bid_to_cover": r.btc,
+            }
+
+        # Quarters list every source row; years list one entry per month
+        self.quarters: Dict[Tuple[int, int], Dict] = {}
+        for (y, q), g in rows.groupby(["year", "quarter"], sort=True):
+            monthly = [{"month": int(m), "incoming": i, "awarded": a, "bid_to_cover": b}
+                       for m, i, a, b in zip(g["month"], g["incoming"], g["awarded"], g["btc"])]
+            self.quarters[(int(y), int(q))] = {
+                "year": int(y),
+                "quarter": int(q),
+                "monthly": monthly,
+                "total_incoming": sum(x["incoming"] for x in monthly),
+                "total_awarded": sum(x["awarded"] for x in monthly),
+                "avg_bid_to_cover": sum(x["bid_to_cover"] for x in monthly) / len(monthly),
+            }
+
+        self.years: Dict[int, Dict] = {}
+        for y, btc in rows.groupby("year", sort=True)["btc"]:
+            monthly = [self.months[(int(y), m)]["monthly"][0] for m in range(1, 13) if (int(y), m) in self.months]
+            self.years[int(y)] = {
+                "type": "year",
+                "year": int(y),
+                "monthly": monthly,
+                "total_incoming": sum(x["incoming"] for x in monthly),
+                "total_awarded": sum(x["awarded"] for x in monthly),
+                "avg_bid_to_cover": sum(btc) / len(btc),
+            }
+
+        self.incoming_by_year: Dict[int, List[Tuple[int, float]]] = {}
+        for y, m, v in zip(year.tolist(), month.tolist(), df["incoming_trillions"].tolist()):
+            self.incoming_by_year.setdefault(y, []).append((m, v))
+
+
+class MarketDataStore:
+    """Bond, macro and auction frames loaded once and sliced without copying."""
+
+    def __init__(self, bond_csv: Optional[str] = None, macro_csv: Optional[str] = None,
+                 auction_csv: Optional[str] = None):
+        bond = read_frame("bond", bond_csv)
+        self._bond = bond.sort_values(["tenor", "date"], kind="mergesort").reset_index(drop=True)
+        self._bond_dates = self._bond["date"].to_numpy(dtype="datetime64[us]")
+        # Contiguous [start, stop) row range per tenor
+        self._tenor_bounds: Dict[str, Tuple[int, int]] = {}
+        tenors = self._bond["tenor"].to_numpy()
+        if len(tenors):
+            change = np.flatnonzero(tenors[1:] != tenors[:-1]) + 1
+            starts = np.concatenate(([0], change))
+            stops = np.concatenate((change, [len(tenors)]))
+            for a, b in zip(starts, stops):
+                self._tenor_bounds[str(tenors[a])] = (int(a), int(b))
+
+        macro = read_frame("macro", macro_csv)
+        self._macro = macro.sort_values("date", kind="mergesort").reset_index(drop=True)
+        self._macro_dates = self._macro["date"].to_numpy(dtype="datetime64[us]")
+
+        self._auction = read_frame("auction", auction_csv)
+        self._auction_rollups: Optional[AuctionRollups] = None
+        self._rollup_lock = threading.Lock()
+        self.loaded_at = datetime.now()
+
+    @staticmethod
+    def _bounds(dates: np.ndarray, lo: int, hi: int, start, end) -> Tuple[int, int]:
+        """Narrow the sorted range [lo, hi) of `dates` to start <= date <= end."""
+        s = _to_datetime64(start)
+        e = _to_datetime64(end)
+        a = lo if s is None else lo + int(np.searchsorted(dates[lo:hi], s, side="left"))
+        b = hi if e is None else lo + int(np.searchsorted(dates[lo:hi], e, side="right"))
+        return a, max(a, b)
+
+    @property
+    def tenors(self):
+        return list(self._tenor_bounds)
+
+    def bond_slice(self, tenor: Optional[str] = None, start=None, end=None) -> pd.DataFrame:
+        """Bond rows for `tenor` (all tenors if None) with start <= date <= end, sorted by date."""
+        if tenor is None:
+            parts = [self.bond_slice(t, start, end) for t in self._tenor_bounds]
+            if not parts:
+                return self._bond.iloc[0:0]
+            return pd.concat(parts).sort_values("date", kind="mergesort")
+        lo, hi = self._tenor_bounds.get(tenor, (0, 0))
+        a, b = self._bounds(self._bond_dates, lo, hi, start, end)
+        return self._bond.iloc[a:b]
+
+    def macro_slice(self, start=None, end=None) -> pd.DataFrame:
+        """Macro rows (date, idrusd, vix_index) with start <= date <= end."""
+        a, b = self._bounds(self._macro_dates, 0, len(self._macro_dates), start, end)
+        return self._macro.iloc[a:b]
+
+    def macro_series(self, column: str, start=None, end=None) -> pd.Series:
+        """Single macro column indexed by date (raises KeyError for unknown columns)."""
+        df = self.macro_slice(start, end)
+        return pd.Series(df[column].to_numpy(), index=df["date"].to_numpy(), name=column)
+
+    def auction_frame(self) -> pd.DataFrame:
+        """The unified auction history/forecast frame (auction_database.csv)."""
+        return self._auction.iloc[:]
+
+    @property
+    def auction_rollups(self) -> AuctionRollups:
+        """Month/quarter/year auction aggregates, built on first use."""
+        if self._auction_rollups is None:
+            with self._rollup_lock:
+                if self._auction_rollups is None:
+                    self._auction_rollups = AuctionRollups(self._auction)
+        return self._auction_rollups
+
+
+_STORE_KEY = "market_store"
+
+
+def _source_paths():
+    return [str(p) for p in SOURCES.values()]
+
+
+def get_market_store() -> MarketDataStore:
+    """Return the process-wide store, loading it on first use.
+
+    The store lives in the shared reloading cache (data_reload.py), so it is
+    rebuilt in the background and swapped in when any source CSV changes.
+    """
+    return data_cache.get(_STORE_KEY, MarketDataStore, _source_paths())
+
+
+def reset_market_store(store: Optional[MarketDataStore] = None) -> None:
+    """Replace the process-wide store (None forces a reload on next access)."""
+    if store is None:
+        data_cache.invalidate(_STORE_KEY)
+    else:
+        data_cache.put(_STORE_KEY, store, MarketDataStore, _source_paths())
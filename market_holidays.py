@@ -0,0 +1,122 @@
+"""Indonesian market holidays (bond market closed) used by the business-day checks."""
+from datetime import date
+
+# Major Indonesian public holidays 2023-2026 (when bond markets are closed)
+# Source: Bank Indonesia official holidays (SKB Tiga Menteri decrees)
+INDONESIA_HOLIDAYS = frozenset({
+    # 2023 - Official list from SKB Tiga Menteri (Government Decree)
+    # National Holidays (15 days)
+    date(2023, 1, 1),   # Tahun Baru 2023 Masehi (New Year)
+    date(2023, 1, 22),  # Tahun Baru Imlek 2574 Kongzili (Chinese New Year)
+    date(2023, 2, 18),  # Isra Mikraj Nabi Muhammad SAW
+    date(2023, 3, 22),  # Hari Suci Nyepi Tahun Baru Saka 1945
+    date(2023, 4, 7),   # Wafat Isa Almasih (Good Friday)
+    date(2023, 4, 22),  # Hari Raya Idul Fitri 1444 H
+    date(2023, 4, 23),  # Hari Raya Idul Fitri 1444 H
+    date(2023, 5, 1),   # Hari Buruh Internasional (Labor Day)
+    date(2023, 5, 18),  # Kenaikan Isa Almasih (Ascension Day)
+    date(2023, 6, 1),   # Hari Lahir Pancasila
+    date(2023, 6, 4),   # Hari Raya Waisak 2567 BE (Vesak Day)
+    date(2023, 6, 29),  # Hari Raya Idul Adha 1444 H
+    date(2023, 7, 19),  # Tahun Baru Islam 1445 H (Islamic New Year)
+    date(2023, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
+    date(2023, 9, 28),  # Maulid Nabi Muhammad SAW (Mawlid)
+    date(2023, 12, 25), # Hari Raya Natal (Christmas)
+    # Joint Leave Days - Cuti Bersama (8 days)
+    date(2023, 1, 23),  # Cuti Bersama Tahun Baru Imlek 2574 Kongzili
+    date(2023, 3, 23),  # Cuti Bersama Hari Suci Nyepi Tahun Baru Saka 1945
+    date(2023, 4, 21),  # Cuti Bersama Idul Fitri 1444 H
+    date(2023, 4, 24),  # Cuti Bersama Idul Fitri 1444 H
+    date(2023, 4, 25),  # Cuti Bersama Idul Fitri 1444 H
+    date(2023, 4, 26),  # Cuti Bersama Idul Fitri 1444 H
+    date(2023, 6, 2),   # Cuti Bersama Hari Raya Waisak 2567 BE
+    date(2023, 12, 26), # Cuti Bersama Hari Raya Natal
+    # 2024 - Official list from SKB Tiga Menteri (Government Decree)
+    # National Holidays (17 days)
+    date(2024, 1, 1),   # Tahun Baru 2024 Masehi (New Year)
+    date(2024, 2, 8),   # Isra Mikraj Nabi Muhammad SAW
+    date(2024, 2, 10),  # Tahun Baru Imlek 2575 Kongzili (Chinese New Year)
+    date(2024, 3, 11),  # Hari Suci Nyepi Tahun Baru Saka 1946
+    date(2024, 3, 29),  # Wafat Isa Almasih (Good Friday)
+    date(2024, 3, 31),  # Hari Paskah (Easter)
+    date(2024, 4, 10),  # Hari Raya Idul Fitri 1445H
+    date(2024, 4, 11),  # Hari Raya Idul Fitri 1445H
+    date(2024, 5, 1),   # Hari Buruh Internasional (Labor Day)
+    date(2024, 5, 9),   # Kenaikan Yesus Kristus (Ascension Day)
+    date(2024, 5, 23),  # Hari Raya Waisak 2568 BE (Vesak Day)
+    date(2024, 6, 1),   # Hari Lahir Pancasila
+    date(2024, 6, 17),  # Hari Raya Idul Adha 1445H
+    date(2024, 7, 7),   # Tahun Baru Islam 1446H (Islamic New Year)
+    date(2024, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
+    date(2024, 9, 16),  # Maulid Nabi Muhammad SAW (Mawlid)
+    date(2024, 12, 25), # Hari Raya Natal (Christmas)
+    # Joint Leave Days - Cuti Bersama (10 days)
+    date(2024, 2, 9),   # Cuti Bersama Tahun Baru Imlek 2575 Kongzili
+    date(2024, 3, 12),  # Cuti Bersama Hari Suci Nyepi Tahun Baru Saka 1946
+    date(2024, 4, 8),   # Cuti Bersama Idul Fitri 1445H
+    date(2024, 4, 9),   # Cuti Bersama Idul Fitri 1445H
+    date(2024, 4, 12),  # Cuti Bersama Idul Fitri 1445H
+    date(2024, 4, 15),  # Cuti Bersama Idul Fitri 1445H
+    date(2024, 5, 10),  # Cuti Bersama Kenaikan Yesus Kristus
+    date(2024, 5, 24),  # Cuti Bersama Hari Raya Waisak 2568 BE
+    date(2024, 6, 18),  # Cuti Bersama Idul Adha 1445H
+    date(2024, 12, 26), # Cuti Bersama Hari Raya Natal
+    # 2025 - Official list from SKB Tiga Menteri (Government Decree)
+    # National Holidays (17 days)
+    date(2025, 1, 1),   # Tahun Baru 2025 Masehi (New Year)
+    date(2025, 1, 27),  # Isra Mikraj Nabi Muhammad SAW
+    date(2025, 1, 29),  # Tahun Baru Imlek 2576 Kongzili (Chinese New Year)
+    date(2025, 3, 29),  # Hari Suci Nyepi (Tahun Baru Saka 1947)
+    date(2025, 3, 31),  # Idul Fitri 1446 Hijriah
+    date(2025, 4, 1),   # Idul Fitri 1446 Hijriah
+    date(2025, 4, 18),  # Wafat Yesus Kristus (Good Friday)
+    date(2025, 4, 20),  # Kebangkitan Yesus Kristus (Paskah/Easter)
+    date(2025, 5, 1),   # Hari Buruh Internasional (Labor Day)
+    date(2025, 5, 12),  # Hari Raya Waisak 2569 BE (Vesak Day)
+    date(2025, 5, 29),  # Kenaikan Yesus Kristus (Ascension Day)
+    date(2025, 6, 1),   # Hari Lahir Pancasila
+    date(2025, 6, 6),   # Idul Adha 1446 Hijriah
+    date(2025, 6, 27),  # 1 Muharam Tahun Baru Islam 1447 Hijriah
+    date(2025, 8, 17),  # Proklamasi Kemerdekaan (Independence Day)
+    date(2025, 9, 5),   # Maulid Nabi Muhammad SAW (Mawlid)
+    date(2025, 12, 25), # Kelahiran Yesus Kristus (Hari Natal/Christmas)
+    # Joint Leave Days - Cuti Bersama (10 days)
+    date(2025, 1, 28),  # Cuti Bersama Tahun Baru Imlek 2576 Kongzili
+    date(2025, 3, 28),  # Cuti Bersama Hari Suci Nyepi
+    date(2025, 4, 2),   # Cuti Bersama Idul Fitri 1446 Hijriah
+    date(2025, 4, 3),   # Cuti Bersama Idul Fitri 1446 Hijriah
+    date(2025, 4, 4),   # Cuti Bersama Idul Fitri 1446 Hijriah
+    date(2025, 4, 7),   # Cuti Bersama Idul Fitri 1446 Hijriah
+    date(2025, 5, 13),  # Cuti Bersama Hari Raya Waisak 2569 BE
+    date(2025, 5, 30),  # Cuti Bersama Kenaikan Yesus Kristus
+    date(2025, 6, 9),   # Cuti Bersama Idul Adha 1446 Hijriah
+    date(2025, 12, 26), # Cuti Bersama Kelahiran Yesus Kristus (Hari Natal)
+    # 2026 - Official list from SKB Tiga Menteri (Government Decree)
+    # National Holidays (17 days)
+    date(2026, 1, 1),   # Tahun Baru Masehi (New Year)
+    date(2026, 1, 16),  # Isra & Mi'raj Nabi Muhammad SAW
+    date(2026, 2, 17),  # Tahun Baru Imlek 2577 Kongzili (Chinese New Year)
+    date(2026, 3, 19),  # Hari Suci Nyepi
+    date(2026, 3, 21),  # Hari Raya Idul Fitri 1447 H
+    date(2026, 3, 22),  # Hari Raya Idul Fitri 1447 H
+    date(2026, 4, 3),   # Wafat Yesus Kristus (Good Friday)
+    date(2026, 4, 5),   # Paskah (Easter)
+    date(2026, 5, 1),   # Hari Buruh Internasional (Labor Day)
+    date(2026, 5, 14),  # Kenaikan Yesus Kristus (Ascension Day)
+    date(2026, 5, 27),  # Idul Adha 1447 H
+    date(2026, 5, 31),  # Hari Raya Waisak 2570 BE (Vesak Day)
+    date(2026, 6, 1),   # Hari Lahir Pancasila
+    date(2026, 6, 16),  # Tahun Baru Islam 1448 H (Islamic New Year)
+    date(2026, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
+    date(2026, 8, 25),  # Maulid Nabi Muhammad SAW (Mawlid)
+    date(2026, 12, 25), # Hari Raya Natal (Christmas)
+    # Joint Leave Days - Cuti Bersama (8 days)
+    date(2026, 2, 16),  # Cuti Bersama Tahun Baru Imlek
+    date(2026, 3, 18),  # Cuti Bersama Hari Suci Nyepi
+    date(2026, 3, 20),  # Cuti Bersama Idul Fitri 1447 H
+    date(2026, 3, 23),  # Cuti Bersama Idul Fitri 1447 H
+    date(2026, 3, 24),  # Cuti Bersama Idul Fitri 1447 H
+    date(2026, 5, 15),  # Cuti Bersama Kenaikan Yesus Kristus
+    date(2026, 5, 28),  # Cuti Bersama Idul Adha 1447 H
+    date(2026, 12, 24), # Cuti Bersama Natal
+})
@@ -0,0 +1,209 @@
+"""Typed, versioned on-disk snapshot of the market CSVs.
+
+Compiles the price/yield, macro (FX/VIX) and auction CSVs into a single DuckDB
+database file so processes can skip CSV parsing (and the LOCF build) at cold start.
+Each source is recorded with its size, mtime and SHA-256; a snapshot is only used
+for a CSV whose contents still match, otherwise callers fall back to the CSV.
+
+Build (run at deploy time, after the CSVs are in place):
+    python market_snapshot.py build
+
+Tables in the snapshot:
+    ts_raw, ts       BondDB-ready tables (see priceyield_20251223.BondDB)
+    ts_cube          BondDB per-tenor daily aggregate cube
+    bond_static      BondDB per-series coupon and maturity_date
+    auction_raw      AuctionDB-ready raw auction table
+    bond             price/yield CSV with parsed date and maturity_date columns
+    macro            macro CSV (date, idrusd, vix_index)
+    auction          auction_database.csv
+    snapshot_meta    format version, build time and per-source fingerprints
+"""
+import hashlib
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import duckdb
+import pandas as pd
+
+SNAPSHOT_FORMAT_VERSION = 4
+
+_ROOT = Path(__file__).resolve().parent
+DEFAULT_SNAPSHOT_PATH = Path(
+    os.environ.get("MARKET_SNAPSHOT_PATH", _ROOT / "database" / "snapshot" / "market.duckdb")
+)
+
+# Source CSVs compiled into the snapshot, keyed by kind
+SOURCES: Dict[str, Path] = {
+    "bond": _ROOT / "database" / "20251215_priceyield.csv",
+    "macro": _ROOT / "database" / "20260102_daily01.csv",
+    "auction": _ROOT / "database" / "auction_database.csv",
+}
+
+# Date formats used by each source CSV
+_DATE_FORMATS = {
+    "bond": {"date": "%d/%m/%Y", "maturity_date": "%d/%m/%Y"},
+    "macro": {"date": "%Y/%m/%d"},
+    "auction": {"date": "%Y-%m-%d"},
+}
+
+_lock = threading.Lock()
+_meta_cache: Dict[str, tuple] = {}
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _fingerprint(path: Path) -> Dict[str, object]:
+    st = path.stat()
+    return {"size": st.st_size, "mtime": st.st_mtime, "sha256": _sha256(path)}
+
+
+def read_csv_frame(kind: str, csv: Optional[str] = None) -> pd.DataFrame:
+    """Parse a source CSV into the typed frame stored in the snapshot."""
+    path = Path(csv) if csv else SOURCES[kind]
+    df = pd.read_csv(path)
+    for col, fmt in _DATE_FORMATS[kind].items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=fmt)
+    return df
+
+
+def build_snapshot(out: Optional[str] = None, sources: Optional[Dict[str, str]] = None) -> Path:
+    """Compile the source CSVs into a snapshot file and return its path.
+
+    The file is written next to the target and atomically renamed into place, so
+    processes holding the previous snapshot open keep reading a consistent copy.
+    """
+    from priceyield_20251223 import BondDB
+
+    out_path = Path(out) if out else DEFAULT_SNAPSHOT_PATH
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    srcs = {k: Path(v) for k, v in {**SOURCES, **(sources or {})}.items()}
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    # BondDB-ready tables: reuse BondDB's own parsing and LOCF build
+    db = BondDB(str(srcs["bond"]), snapshot=None)
+    db.con.execute(f"ATTACH '{tmp_path}' AS snap")
+    db.con.execute("CREATE TABLE snap.ts_raw AS SELECT * FROM ts_raw ORDER BY series, tenor, obs_date")
+    db.con.execute("CREATE TABLE snap.ts AS SELECT * FROM ts")
+    db.con.execute("CREATE TABLE snap.ts_cube AS SELECT * FROM ts_cube")
+    db.con.execute("CREATE TABLE snap.bond_static AS SELECT * FROM bond_static")
+    # AuctionDB-ready raw table (DuckDB's own CSV parse, same as AuctionDB's CSV path)
+    db.con.execute(
+        f"CREATE TABLE snap.auction_raw AS SELECT * FROM read_csv_auto('{srcs['auction']}', header=True)"
+    )
+    for kind in ("bond", "macro", "auction"):
+        frame = read_csv_frame(kind, str(srcs[kind]))
+        db.con.register("_frame", frame)
+        db.con.execute(f"CREATE TABLE snap.{kind} AS SELECT * FROM _frame")
+        db.con.unregister("_frame")
+
+    meta = [("format_version", str(SNAPSHOT_FORMAT_VERSION)), ("built_at", datetime.now().isoformat())]
+    for kind, path in srcs.items():
+        fp = _fingerprint(path)
+        meta += [
+            (f"{kind}.name", path.name),
+            (f"{kind}.size", str(fp["size"])),
+            (f"{kind}.mtime", repr(fp["mtime"])),
+            (f"{kind}.sha256", fp["sha256"]),
+        ]
+    db.con.execute("CREATE TABLE snap.snapshot_meta (key VARCHAR, value VARCHAR)")
+    db.con.executemany("INSERT INTO snap.snapshot_meta VALUES (?, ?)", meta)
+    db.con.execute("DETACH snap")
+    db.close()
+
+    os.replace(tmp_path, out_path)
+    with _lock:
+        _meta_cache.clear()
+    return out_path
+
+
+def _read_meta(snapshot: Path) -> Optional[Dict[str, str]]:
+    """Read snapshot_meta, memoized on the snapshot file's (mtime, size)."""
+    try:
+        st = snapshot.stat()
+    except OSError:
+        return None
+    key = str(snapshot)
+    stamp = (st.st_mtime, st.st_size)
+    with _lock:
+        cached = _meta_cache.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+    try:
+        con = duckdb.connect(str(snapshot), read_only=True)
+        try:
+            meta = dict(con.execute("SELECT key, value FROM snapshot_meta").fetchall())
+        finally:
+            con.close()
+    except Exception:
+        return None
+    with _lock:
+        _meta_cache[key] = (stamp, meta)
+    return meta
+
+
+def snapshot_for(kind: str, csv: Optional[str] = None, snapshot: Optional[str] = None) -> Optional[Path]:
+    """Return the snapshot path if it holds an up-to-date copy of `csv`, else None.
+
+    Staleness check: format version must match; a matching size and mtime is
+    accepted directly, otherwise the CSV's SHA-256 is compared (covers files whose
+    mtime changed on checkout/copy without a content change).
+    """
+    snap_path = Path(snapshot) if snapshot else DEFAULT_SNAPSHOT_PATH
+    csv_path = Path(csv) if csv else SOURCES[kind]
+    meta = _read_meta(snap_path)
+    if not meta or meta.get("format_version") != str(SNAPSHOT_FORMAT_VERSION):
+        return None
+    if f"{kind}.sha256" not in meta:
+        return None
+    try:
+        st = csv_path.stat()
+    except OSError:
+        return None
+    if str(st.st_size) != meta[f"{kind}.size"]:
+        return None
+    if repr(st.st_mtime) == meta[f"{kind}.mtime"]:
+        return snap_path
+    return snap_path if _sha256(csv_path) == meta[f"{kind}.sha256"] else None
+
+
+def read_frame(kind: str, csv: Optional[str] = None, snapshot: Optional[str] = None) -> pd.DataFrame:
+    """Load a typed source frame from the snapshot, falling back to parsing the CSV."""
+    snap_path = snapshot_for(kind, csv, snapshot)
+    if snap_path is not None:
+        try:
+            con = duckdb.connect(str(snap_path), read_only=True)
+            try:
+                return con.execute(f"SELECT * FROM {kind}").df()
+            finally:
+                con.close()
+        except Exception:
+            pass
+    return read_csv_frame(kind, csv)
+
+
+if __name__ == "__main__":
+    import sys
+
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if cmd == "build":
+        target = sys.argv[2] if len(sys.argv) > 2 else None
+        path = build_snapshot(target)
+        print(f"Snapshot written: {path}")
+    elif cmd == "check":
+        for k in SOURCES:
+            print(f"{k:<8} {'fresh' if snapshot_for(k) else 'stale/missing'}")
+    else:
+        print("usage: python market_snapshot.py [build [PATH] | check]")
+        sys.exit(2)
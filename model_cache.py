@@ -0,0 +1,115 @@
+"""Cache of fitted forecast models, keyed by a fingerprint of the input series.
+
+Every forecast request refits ARIMA / ETS / VAR / Prophet on the same last-240
+observations until new data arrives. yield_forecast_path looks each fit up here
+first: the key is the model, its kwargs and a fingerprint of the series (a hash
+of its values plus the index end and length), so an append or a different
+window is a different key and stale fits are never reused.
+
+Fits are stored pickled:
+  memory  a QueryCache named "forecast_models" (LRU, TTL and byte budget; its
+          counters show up in cache_stats() / /bot/stats)
+  disk    optional: MODEL_CACHE_DIR, one <key>.pkl file per fit, shared by every
+          process (pool workers, API and bot), pruned oldest-first past
+          MODEL_CACHE_DISK_MAX_BYTES. Only point it at a private directory:
+          the files are unpickled.
+
+MODEL_CACHE_TTL        seconds a fit stays in memory (default 86400; 0 disables the cache)
+MODEL_CACHE_MAX_BYTES  memory budget (default 64 MiB)
+"""
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from query_cache import QueryCache
+
+# Bump when a model's fit changes shape, so old disk entries are ignored
+MODEL_CACHE_VERSION = 1
+
+MODEL_CACHE_DIR = os.environ.get("MODEL_CACHE_DIR")
+MODEL_CACHE_DISK_MAX_BYTES = int(os.environ.get("MODEL_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+_memory = QueryCache(
+    "forecast_models",
+    max_bytes=int(os.environ.get("MODEL_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    max_entries=1024,
+    ttl=float(os.environ.get("MODEL_CACHE_TTL", "86400")),
+)
+_disk_lock = threading.Lock()
+
+
+def series_fingerprint(series: pd.Series) -> str:
+    """Hash of the series values, index end and length."""
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(series.to_numpy(dtype=np.float64)).tobytes())
+    h.update(f"|{pd.Timestamp(series.index[-1]).isoformat() if len(series) else ''}|{len(series)}".encode())
+    return h.hexdigest()
+
+
+def model_key(model: str, fingerprint: str, kwargs: Optional[dict] = None) -> str:
+    raw = f"{MODEL_CACHE_VERSION}|{model}|{sorted((kwargs or {}).items())!r}|{fingerprint}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _disk_path(key: str) -> Optional[Path]:
+    return Path(MODEL_CACHE_DIR) / f"{key}.pkl" if MODEL_CACHE_DIR else None
+
+
+def get(key: str) -> Optional[Any]:
+    """The cached fit for `key` (memory, then disk), or None."""
+    if not _memory.enabled:
+        return None
+    hit, blob = _memory.get(key)
+    if hit:
+        return pickle.loads(blob)
+    path = _disk_path(key)
+    if path is None or not path.exists():
+        return None
+    try:
+        blob = path.read_bytes()
+        fit = pickle.loads(blob)
+    except Exception:
+        # truncated, or written by an incompatible library version: treat as a miss
+        path.unlink(missing_ok=True)
+        return None
+    _memory.put(key, blob)
+    return fit
+
+
+def put(key: str, blob: bytes) -> None:
+    """Store a pickled fit in memory and, with MODEL_CACHE_DIR set, on disk."""
+    if not _memory.enabled:
+        return
+    _memory.put(key, blob)
+    path = _disk_path(key)
+    if path is None:
+        return
+    with _disk_lock:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, path)  # readers in other processes never see a partial file
+            _prune(path.parent)
+        except OSError:
+            pass
+
+
+def _prune(directory: Path) -> None:
+    files = sorted(directory.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in files)
+    while files and total > MODEL_CACHE_DISK_MAX_BYTES:
+        oldest = files.pop(0)
+        total -= oldest.stat().st_size
+        oldest.unlink(missing_ok=True)
+
+
+def clear() -> None:
+    """Drop the in-memory tier (the disk tier is left alone)."""
+    _memory.clear()
@@ -1,9 +1,14 @@
 # priceyield_20251223.py
 # FINAL – bug-fixed intent parsing + tenor + interpolation
 
+import hashlib
+import os
 import re
+import sys
+import threading
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
+from pathlib import Path
 from typing import Optional, Literal
 
 import duckdb
@@ -13,8 +18,21 @@ import typer
 from rich import print
 from rich.panel import Panel
 from rich.console import Console
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401  (optional: BondDB.fetch_arrow, export_batches(arrow=True))
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+import forecast_pool
+import market_snapshot
+import model_cache
+from bday_calendar import HOLIDAYS, next_bdays
+from query_cache import QueryCache
+
 # -----------------------------
 # CLI setup
 # -----------------------------
@@ -27,8 +45,13 @@ CSV_PATH_DEFAULT = "database/20251215_priceyield.csv"
 # -----------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Intent:
+    """A parsed bond/auction question.
+
+    Slotted (no per-instance __dict__), and the parse_* helpers intern the tenor
+    and series strings, so a corpus of parsed intents shares one copy of each.
+    """
     type: str
     metric: str
     series: Optional[str]
@@ -80,13 +103,17 @@ def parse_metric(text: str):
     # Default to yield for bond queries (industry standard); only use price if explicitly requested
     return "price" if "price" in text_lower else "yield"
 
+def tenor_name(years) -> str:
+    """Canonical (interned) tenor label: 5 -> '05_year'."""
+    return sys.intern(f"{int(years):02d}_year")
+
 def parse_series(text: str):
     m = SERIES_RE.search(text)
-    return m.group(0).upper() if m else None
+    return sys.intern(m.group(0).upper()) if m else None
 
 def parse_tenor(text: str):
     m = TENOR_RE.search(text)
-    return f"{int(m.group(1)):02d}_year" if m else None
+    return tenor_name(m.group(1)) if m else None
 
 def parse_tenors(text: str):
     """Extract all tenors mentioned in text (e.g., '5 year and 10 year' -> ['05_year', '10_year']
@@ -96,14 +123,14 @@ def parse_tenors(text: str):
     and_pattern = re.compile(r"\b(\d+)\s+and\s+(\d+)\s*years?\b", re.IGNORECASE)
     and_match = and_pattern.search(text)
     if and_match:
-        tenor1 = f"{int(and_match.group(1)):02d}_year"
-        tenor2 = f"{int(and_match.group(2)):02d}_year"
+        tenor1 = tenor_name(and_match.group(1))
+        tenor2 = tenor_name(and_match.group(2))
         return [tenor1, tenor2]
     
     # Fallback to original regex findall for other patterns
     matches = TENOR_RE.findall(text)
     if matches:
-        return [f"{int(m):02d}_year" for m in matches]
+        return [tenor_name(m) for m in matches]
     return None
 
 def parse_agg(text: str):
@@ -401,53 +428,1283 @@ def parse_intent(text: str) -> Intent:
 # -----------------------------
 # DuckDB backend
 # -----------------------------
+class ConnectionPool:
+    """One in-memory DuckDB database shared through per-thread cursors.
+
+    A DuckDB connection must not be used from several threads at once, but
+    cursors (extra connections to the same database) are cheap and run queries
+    in parallel. `cursor()` hands each thread its own cursor, created on first use.
+    Temporary tables and registered frames are per cursor, so shared tables must
+    be created as regular tables.
+    """
+
+    def __init__(self, database: str = ":memory:", config: Optional[dict] = None):
+        self._root = duckdb.connect(database, config=config or {})
+        self._local = threading.local()
+
+    def cursor(self):
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            cur = self._root.cursor()
+            self._local.cursor = cur
+        return cur
+
+    def new_cursor(self):
+        """A cursor owned by the caller, for results consumed across threads (e.g. streamed)."""
+        return self._root.cursor()
+
+    def close(self):
+        self._root.close()
+
+
+def _numpy_columns(columns: dict) -> dict:
+    """Normalize DuckDB `fetchnumpy()` output: masked NULLs become NaN / NaT / None, arrays read-only."""
+    out = {}
+    for name, arr in columns.items():
+        if isinstance(arr, np.ma.MaskedArray):
+            if not arr.mask.any():
+                arr = arr.data
+            elif arr.dtype.kind in "fiu":
+                arr = arr.astype(np.float64).filled(np.nan)
+            elif arr.dtype.kind == "M":
+                arr = arr.filled(np.datetime64("NaT"))
+            else:
+                arr = arr.astype(object).filled(None)
+        arr.flags.writeable = False
+        out[name] = arr
+    return out
+
+
+@dataclass
+class AppendResult:
+    """Summary of a BondDB.append_observations() call.
+
+    LOCF means an observation on `start_date` can change `ts` on every later date of
+    its series, so cached results are stale iff they cover dates >= start_date for
+    one of the affected series/tenors (see `touches`).
+    """
+    rows: int
+    series: list
+    tenors: list
+    start_date: Optional[date]
+    end_date: Optional[date]
+    data_version: int
+    replaced: int = 0
+
+    def touches(self, start=None, end=None, series=None, tenor=None) -> bool:
+        """True if a cached result over [start, end] (optionally for one series/tenor) may be stale."""
+        if not self.rows:
+            return False
+        if series and series.upper() not in self.series:
+            return False
+        if tenor and tenor not in self.tenors:
+            return False
+        return end is None or end >= self.start_date
+
+
+# export_batches() tables: name -> (relation, columns, order)
+EXPORT_TABLES = {
+    "ts": ("ts", 'obs_date, series, tenor, price, "yield"', "tenor, obs_date, series"),
+    "cube": ("ts_cube", "*", "tenor, obs_date"),
+}
+
+_BAR_UNITS = {"m": 1, "min": 1, "minute": 1, "h": 60, "hour": 60, "d": 1440, "day": 1440}
+
+
+def bar_minutes(freq) -> int:
+    """Bar length in minutes for "1min", "5m", "1h", "4h", "1d", "daily", ... (or an int)."""
+    if isinstance(freq, int):
+        minutes = freq
+    else:
+        text = {"hourly": "1h", "daily": "1d"}.get(str(freq).strip().lower(), str(freq).strip().lower())
+        m = re.fullmatch(r"(\d*)\s*(m|min|minute|h|hour|d|day)s?", text)
+        if not m:
+            raise ValueError(f"Unknown bar frequency {freq!r}; use e.g. 1min, 15min, 1h or 1d")
+        minutes = int(m.group(1) or 1) * _BAR_UNITS[m.group(2)]
+    if minutes <= 0 or (1440 % minutes and minutes % 1440):
+        raise ValueError(f"Bar frequency {freq!r} must divide a day or be whole days")
+    return minutes
+
+
+def _source_relation(source: str) -> str:
+    """DuckDB table function reading a bond source: CSV, Parquet file or Parquet directory."""
+    path = Path(source)
+    if path.is_dir():
+        return f"read_parquet('{path.as_posix()}/**/*.parquet', hive_partitioning=true, union_by_name=true)"
+    if path.suffix.lower() == ".parquet":
+        return f"read_parquet('{path.as_posix()}')"
+    return f"read_csv_auto('{path.as_posix()}', header=True)"
+
+
+def _source_fingerprint(source: str) -> str:
+    """Size/mtime fingerprint of a source file, or of every Parquet file under a directory."""
+    path = Path(source)
+    files = sorted(path.rglob("*.parquet")) if path.is_dir() else [path]
+    h = hashlib.sha1()
+    for f in files:
+        st = f.stat()
+        h.update(f"{f.relative_to(path) if path.is_dir() else f.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()
+
+
+
+def _parse_dates(values: pd.Series, column: str) -> pd.Series:
+    """ISO or DD/MM/YYYY (the CSV's own layout) dates -> datetime.date; missing values stay missing.
+
+    Raises ValueError naming `column` for a value in neither format.
+    """
+    parsed = pd.to_datetime(values, format="ISO8601", errors="coerce")
+    parsed = parsed.fillna(pd.to_datetime(values, format="%d/%m/%Y", errors="coerce"))
+    bad = parsed.isna() & values.notna()
+    if bad.any():
+        raise ValueError(f"append_observations: invalid {column} {values[bad].iloc[0]!r}")
+    return parsed.dt.date
+
+# ts_quality thresholds (see BondDB._build_quality)
+QUALITY_KINDS = ("span", "gap", "stale", "outlier", "holiday")
+QUALITY_STALE_MIN = 3  # observations repeating one price/yield
+QUALITY_OUTLIER_WINDOW = 60  # previous daily changes the z-score is measured against
+QUALITY_OUTLIER_MIN_OBS = 20
+QUALITY_OUTLIER_Z = 5.0
+
+
 class BondDB:
-    def __init__(self, csv):
-        self.con = duckdb.connect(":memory:")
-        # Load raw timeseries
+    """Bond price/yield observations in DuckDB: ts_raw, the LOCF view ts, ts_cube, bond_static and ts_quality.
+
+    By default the tables live in an in-memory database. Out-of-core mode keeps them
+    in a DuckDB file instead (`database=`, or one file per source under BOND_DB_DIR):
+    DuckDB then pages table data through a buffer pool capped at `memory_limit`
+    (BOND_DB_MEMORY_LIMIT) and spills large sorts/windows to disk, so histories far
+    larger than RAM keep the same API. The file is built once per source version
+    and reopened without re-reading the source; rows are stored in (tenor, obs_date)
+    order so date-range queries skip row groups via their min/max zone maps, and
+    `slice` queries the table instead of keeping a per-tenor index in memory.
+    Appended rows are kept in the file until the source changes.
+    """
+
+    def __init__(self, csv, snapshot: Optional[str] = "auto", database: Optional[str] = None,
+                 memory_limit: Optional[str] = None, ticks: Optional[str] = None):
+        """Load `csv` into DuckDB.
+
+        csv: the price/yield CSV, or a Parquet file or (hive-partitioned) directory of
+        Parquet files with the same columns.
+        snapshot: "auto" queries the default market snapshot (see market_snapshot.py) in
+        place, read-only, when it holds an up-to-date copy of `csv`; a path uses that
+        snapshot file; None always parses the CSV. Ignored in out-of-core mode.
+        database: DuckDB file for out-of-core mode; ":memory:" forces in-memory even if
+        BOND_DB_DIR is set.
+        memory_limit: DuckDB memory limit, e.g. "512MB" (default BOND_DB_MEMORY_LIMIT).
+        ticks: intraday observations (CSV / Parquet with timestamp, series, tenor, price,
+        yield and optional volume columns) for `bars`; default BOND_TICKS_PATH.
+        """
+        self.csv = str(csv)
+        ticks = ticks or os.environ.get("BOND_TICKS_PATH")
+        self.ticks = str(ticks) if ticks else None
+        self.data_version = 0
+        self._query_cache = QueryCache("bond")
+        self._append_listeners = []
+        if database is None and os.environ.get("BOND_DB_DIR"):
+            database = self._database_file(os.environ["BOND_DB_DIR"], self.csv, self._fingerprint())
+        self.database = None if database in (None, ":memory:") else str(database)
+        memory_limit = memory_limit or os.environ.get("BOND_DB_MEMORY_LIMIT")
+        self._pool = ConnectionPool(self.database or ":memory:",
+                                    {"memory_limit": memory_limit} if memory_limit else None)
+        self._write_lock = threading.Lock()
+        self._slices = {}
+        self._tenors = None
+        self._bar_tables = set()
+        self._snapshot_views = False
+        if self.out_of_core:
+            fingerprint = self._fingerprint()
+            if self._open_database(fingerprint):
+                tables = {r[0] for r in self.con.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+                self._bar_tables = {t for t in tables if re.fullmatch(r"bars_\d+m", t)}
+                if "ts_quality" not in tables:  # file built before the quality report existed
+                    self._load_holidays()
+                    self._build_quality()
+                    self.con.execute("CHECKPOINT")
+            else:
+                self._load_source()
+                self._load_ticks()
+                self.con.execute("CREATE OR REPLACE TABLE bond_source AS SELECT ? AS source, ? AS fingerprint",
+                                 [self.csv, fingerprint])
+                self.con.execute("CHECKPOINT")
+            return
+        snap = None
+        if snapshot:
+            snap = market_snapshot.snapshot_for("bond", csv, None if snapshot == "auto" else snapshot)
+        if snap is None or not self._load_snapshot(snap):
+            self._load_source()
+        else:
+            self._load_holidays()
+            self._build_quality()
+        self._load_ticks()
+
+    def _fingerprint(self) -> str:
+        fingerprint = _source_fingerprint(self.csv)
+        return f"{fingerprint}+{_source_fingerprint(self.ticks)}" if self.ticks else fingerprint
+
+    @property
+    def out_of_core(self) -> bool:
+        return self.database is not None
+
+    @staticmethod
+    def _database_file(directory: str, source: str, fingerprint: str) -> str:
+        """Out-of-core file for `source` under `directory`, named after the sources' current version.
+
+        A changed source gets a new file, so a reload never rebuilds a file that the
+        previous BondDB instance is still reading; files of older versions are removed.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = Path(source).stem
+        path = directory / f"{stem}-{hashlib.sha1(fingerprint.encode()).hexdigest()[:12]}.duckdb"
+        for old in directory.glob(f"{stem}-*.duckdb"):
+            if old != path:
+                try:
+                    old.unlink()
+                    Path(f"{old}.wal").unlink(missing_ok=True)
+                except OSError:
+                    pass
+        return str(path)
+
+    def _open_database(self, fingerprint: str) -> bool:
+        """True if the out-of-core file already holds the tables built from this source version."""
+        try:
+            row = self.con.execute("SELECT source, fingerprint FROM bond_source").fetchone()
+        except duckdb.CatalogException:
+            return False
+        return row == (self.csv, fingerprint)
+
+    def _load_source(self):
+        """Build ts_raw, bond_static, ts, ts_cube and ts_quality from the source file(s)."""
+        self._load_holidays()
+        relation = _source_relation(self.csv)
+        # Parse a CSV a single time, then derive the typed tables from it; Parquet is
+        # columnar and typed, so it is scanned in place
+        kind = "TABLE" if relation.startswith("read_csv") else "VIEW"
+        self.con.execute(f"CREATE OR REPLACE {kind} _csv AS SELECT * FROM {relation}")
+        try:
+            self.con.execute("""
+                CREATE OR REPLACE TABLE ts_raw AS
+                SELECT
+                    COALESCE(TRY_CAST(date AS DATE),
+                             STRPTIME(CAST(date AS VARCHAR),'%d/%m/%Y')::DATE) AS obs_date,
+                    UPPER(series) AS series,
+                    tenor,
+                    TRY_CAST(price AS DOUBLE) AS price,
+                    TRY_CAST("yield" AS DOUBLE) AS "yield"
+                FROM _csv
+            """)
+            self._build_static()
+        finally:
+            self.con.execute(f"DROP {kind} _csv")
+        self._build_ts()
+        self._build_cube()
+        self._build_quality()
+
+    @property
+    def con(self):
+        """The calling thread's cursor on this BondDB's database."""
+        return self._pool.cursor()
+
+    def close(self):
+        self._pool.close()
+
+    def _load_holidays(self):
+        """Materialize `bond_holidays` from bday_calendar, for business-day tests in SQL."""
+        self.con.execute("CREATE OR REPLACE TABLE bond_holidays (holiday DATE PRIMARY KEY)")
+        self.con.executemany("INSERT INTO bond_holidays VALUES (?)", [[d.item()] for d in HOLIDAYS])
+
+    def _build_static(self):
+        """Materialize `bond_static`: latest coupon and maturity_date per series, from `_csv`."""
+        cols = {row[0] for row in self.con.execute("DESCRIBE _csv").fetchall()}
+        coupon = "TRY_CAST(coupon AS DOUBLE)" if "coupon" in cols else "NULL::DOUBLE"
+        maturity = ("COALESCE(TRY_CAST(maturity_date AS DATE), "
+                    "TRY_STRPTIME(CAST(maturity_date AS VARCHAR), '%d/%m/%Y')::DATE)"
+                    if "maturity_date" in cols else "NULL::DATE")
         self.con.execute(f"""
-            CREATE VIEW ts_raw AS
-            SELECT
-                COALESCE(TRY_CAST(date AS DATE),
-                         STRPTIME(CAST(date AS VARCHAR),'%d/%m/%Y')::DATE) AS obs_date,
-                UPPER(series) AS series,
-                tenor,
-                TRY_CAST(price AS DOUBLE) AS price,
-                TRY_CAST("yield" AS DOUBLE) AS "yield"
-            FROM read_csv_auto('{csv}', header=True)
+            CREATE OR REPLACE TABLE bond_static AS
+            SELECT series, tenor,
+                   arg_max(coupon, obs_date) FILTER (WHERE coupon IS NOT NULL) AS coupon,
+                   arg_max(maturity_date, obs_date) FILTER (WHERE maturity_date IS NOT NULL) AS maturity_date
+            FROM (
+                SELECT COALESCE(TRY_CAST(date AS DATE),
+                                STRPTIME(CAST(date AS VARCHAR),'%d/%m/%Y')::DATE) AS obs_date,
+                       UPPER(series) AS series, tenor, {coupon} AS coupon, {maturity} AS maturity_date
+                FROM _csv
+            )
+            GROUP BY series, tenor
+            ORDER BY series
         """)
 
-        # Create a view that selects the last-known price/yield per series as of each observed date.
-        # Use correlated subqueries to pick the most recent non-null value <= the date (correct LOCF behavior).
+    _SNAPSHOT_TABLES = ("ts_raw", "ts", "ts_cube", "bond_static")
+
+    def _load_snapshot(self, path) -> bool:
+        """Serve the prebuilt ts_raw/ts/ts_cube/bond_static tables from a snapshot file; False on failure.
+
+        The file is attached read-only and each table is a view over it, so loading
+        copies no data: DuckDB pages blocks in as queries touch them. The first
+        append copies the tables into memory (see `_materialize_snapshot`).
+        """
+        try:
+            self.con.execute(f"ATTACH '{path}' AS snap (READ_ONLY)")
+            for table in self._SNAPSHOT_TABLES:
+                self.con.execute(f"CREATE OR REPLACE VIEW {table} AS SELECT * FROM snap.{table}")
+            self._snapshot_views = True
+            return True
+        except Exception:
+            for table in self._SNAPSHOT_TABLES:
+                self.con.execute(f"DROP VIEW IF EXISTS {table}")
+            try:
+                self.con.execute("DETACH snap")
+            except Exception:
+                pass
+            return False
+
+    def _materialize_snapshot(self):
+        """Replace the snapshot views with in-memory tables, so they can take appended rows."""
+        if not self._snapshot_views:
+            return
+        con = self.con
+        con.execute("BEGIN TRANSACTION")
+        try:
+            for table in self._SNAPSHOT_TABLES:
+                con.execute(f"DROP VIEW {table}")
+                con.execute(f"CREATE TABLE {table} AS SELECT * FROM snap.{table}")
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("DETACH snap")
+        self._snapshot_views = False
+
+    def _build_ts(self):
+        """Materialize `ts`: last-known price/yield per series as of each observed date.
+
+        LOCF is computed once with window functions (LAST_VALUE ... IGNORE NULLS over a
+        RANGE frame, so same-day peers share one value) instead of correlated subqueries,
+        and rows are stored in (series, tenor, obs_date) order for zone-map pruning.
+        """
+        self.con.execute(f"""
+            CREATE OR REPLACE TABLE ts AS
+            SELECT obs_date, series, tenor, price, "yield"
+            FROM (
+                SELECT
+                    obs_date,
+                    series,
+                    tenor,
+                    LAST_VALUE(price IGNORE NULLS) OVER w AS price,
+                    LAST_VALUE("yield" IGNORE NULLS) OVER w AS "yield",
+                    ROW_NUMBER() OVER (PARTITION BY obs_date, series, tenor) AS rn
+                FROM ts_raw
+                WINDOW w AS (
+                    PARTITION BY series ORDER BY obs_date
+                    RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                )
+            )
+            WHERE rn = 1
+            ORDER BY {self._ts_order}
+        """)
+
+    @property
+    def _ts_order(self) -> str:
+        # per-series reads dominate in memory; out of core, date ranges must prune row groups
+        return "tenor, obs_date, series" if self.out_of_core else "series, tenor, obs_date"
+
+    def append_observations(self, rows, persist: bool = False) -> AppendResult:
+        """Insert new (date, series, tenor, price, yield) observations into the loaded tables.
+
+        `rows` is a DataFrame or an iterable of dicts with ISO / date `date` values;
+        optional cusip, coupon and maturity_date are only used when persisting. An
+        existing (date, series, tenor) row is replaced. Only the affected series are
+        re-forward-filled, from their earliest new date onward, and only cached
+        results whose date range reaches that date are dropped.
+
+        persist: also append the rows to the source CSV (see `_persist_rows`).
+        """
+        if persist and not _source_relation(self.csv).startswith("read_csv"):
+            raise ValueError("append_observations: persist=True needs a CSV source")
+        frame = rows.copy() if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        missing = {"date", "series", "tenor"} - set(frame.columns)
+        if missing:
+            raise ValueError(f"append_observations: missing columns {sorted(missing)}")
+        if frame.empty:
+            return AppendResult(0, [], [], None, None, self.data_version)
+        frame["obs_date"] = _parse_dates(frame["date"], "date")
+        frame["series"] = frame["series"].astype(str).str.upper()
+        frame["tenor"] = frame["tenor"].astype(str)
+        for col in ("price", "yield"):
+            frame[col] = pd.to_numeric(frame[col], errors="coerce") if col in frame else float("nan")
+        frame = frame.drop_duplicates(["obs_date", "series", "tenor"], keep="last")
+        new = frame[["obs_date", "series", "tenor", "price", "yield"]]
+        # parsed up front: a bad coupon / maturity must fail before anything is written
+        static = self._static_rows(frame)
+
+        with self._write_lock:
+            self._materialize_snapshot()
+            replaced = self._apply_append(new, static)
+            for tenor in new["tenor"].unique():
+                self._slices.pop(tenor, None)
+            self._tenors = None
+
+        self.data_version += 1
+        result = AppendResult(
+            rows=len(new),
+            series=sorted(new["series"].unique()),
+            tenors=sorted(new["tenor"].unique()),
+            start_date=min(new["obs_date"]),
+            end_date=max(new["obs_date"]),
+            data_version=self.data_version,
+            replaced=replaced,
+        )
+        self._query_cache.invalidate(result.touches)
+        if persist:
+            self._persist_rows(frame, rewrite=replaced > 0)
+        for callback in list(self._append_listeners):
+            callback(result)
+        return result
+
+    def _apply_append(self, new: pd.DataFrame, static: Optional[pd.DataFrame] = None) -> int:
+        """Upsert `new` into ts_raw, refresh ts/ts_cube and merge `static` into bond_static
+        in one transaction; returns replaced rows."""
+        con = self.con
+        con.register("_append", new)
+        if static is not None:
+            con.register("_static", static)
+        try:
+            con.execute("BEGIN TRANSACTION")
+            try:
+                replaced = con.execute("""
+                    DELETE FROM ts_raw USING _append a
+                    WHERE ts_raw.obs_date = a.obs_date AND ts_raw.series = a.series AND ts_raw.tenor = a.tenor
+                """).fetchone()[0]
+                con.execute("""
+                    INSERT INTO ts_raw
+                    SELECT CAST(obs_date AS DATE), series, tenor, CAST(price AS DOUBLE), CAST("yield" AS DOUBLE)
+                    FROM _append
+                """)
+                self._extend_ts()
+                self._build_cube(sorted(new["tenor"].unique()))
+                self._build_quality(sorted(new["series"].unique()))
+                if static is not None:
+                    self._merge_static()
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+        finally:
+            con.unregister("_append")
+            if static is not None:
+                con.unregister("_static")
+        return replaced
+
+    @staticmethod
+    def _static_rows(frame: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Coupon / maturity_date given with appended rows (e.g. for a new series), parsed; None if none.
+
+        Raises ValueError for a coupon or maturity_date that does not parse.
+        """
+        cols = [c for c in ("coupon", "maturity_date") if c in frame.columns]
+        if not cols:
+            return None
+        static = frame[["series", "tenor", *cols]].copy()
+        static = static[static[cols].notna().any(axis=1)]
+        if static.empty:
+            return None
+        static = static.drop_duplicates(["series", "tenor"], keep="last")
+        coupon = float("nan")
+        if "coupon" in static:
+            coupon = pd.to_numeric(static["coupon"], errors="coerce")
+            bad = coupon.isna() & static["coupon"].notna()
+            if bad.any():
+                raise ValueError(f"append_observations: invalid coupon {static['coupon'][bad].iloc[0]!r}")
+        maturity = _parse_dates(static["maturity_date"], "maturity_date") if "maturity_date" in static else None
+        return pd.DataFrame({
+            "series": static["series"],
+            "tenor": static["tenor"],
+            "coupon": coupon,
+            "maturity_date": maturity,
+        })
+
+    def _merge_static(self):
+        """Merge the registered `_static` rows into bond_static, keeping known values they leave empty."""
+        con = self.con
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE _static_merged AS
+            SELECT s.series, s.tenor,
+                   COALESCE(CAST(s.coupon AS DOUBLE), b.coupon) AS coupon,
+                   COALESCE(CAST(s.maturity_date AS DATE), b.maturity_date) AS maturity_date
+            FROM _static s LEFT JOIN bond_static b ON b.series = s.series AND b.tenor = s.tenor
+        """)
+        con.execute("""
+            DELETE FROM bond_static USING _static_merged m
+            WHERE bond_static.series = m.series AND bond_static.tenor = m.tenor
+        """)
+        con.execute("INSERT INTO bond_static SELECT * FROM _static_merged")
+        con.execute("DROP TABLE _static_merged")
+
+    def _extend_ts(self):
+        """Recompute `ts` for the series in `_append`, from each one's earliest new date.
+
+        The last `ts` row before that date seeds the forward fill, so rows before it
+        (and all other series) are left untouched.
+        """
+        self.con.execute("""
+            CREATE OR REPLACE TEMP TABLE _affected AS
+            SELECT series, MIN(CAST(obs_date AS DATE)) AS start_date FROM _append GROUP BY series
+        """)
+        self.con.execute("""
+            CREATE OR REPLACE TEMP TABLE _seed AS
+            SELECT t.series, arg_max(t.price, t.obs_date) AS price, arg_max(t."yield", t.obs_date) AS "yield"
+            FROM ts t JOIN _affected a ON t.series = a.series AND t.obs_date < a.start_date
+            GROUP BY t.series
+        """)
+        self.con.execute("""
+            DELETE FROM ts USING _affected a
+            WHERE ts.series = a.series AND ts.obs_date >= a.start_date
+        """)
+        order = ", ".join(f"x.{col.strip()}" for col in self._ts_order.split(","))
         self.con.execute(f"""
-            CREATE VIEW ts AS
-            SELECT
-                tr.obs_date,
-                tr.series,
-                tr.tenor,
-                (
-                  SELECT r.price
-                  FROM ts_raw r
-                  WHERE r.series = tr.series
-                    AND r.obs_date <= tr.obs_date
-                    AND r.price IS NOT NULL
-                  ORDER BY r.obs_date DESC
-                  LIMIT 1
-                ) AS price,
-                (
-                  SELECT r."yield"
-                  FROM ts_raw r
-                  WHERE r.series = tr.series
-                    AND r.obs_date <= tr.obs_date
-                    AND r."yield" IS NOT NULL
-                  ORDER BY r.obs_date DESC
-                  LIMIT 1
-                ) AS "yield"
+            INSERT INTO ts
+            SELECT x.obs_date, x.series, x.tenor,
+                   COALESCE(x.price, s.price), COALESCE(x."yield", s."yield")
             FROM (
-              SELECT DISTINCT obs_date, series, tenor FROM ts_raw
-            ) tr
-            ORDER BY tr.series, tr.obs_date
+                SELECT
+                    r.obs_date,
+                    r.series,
+                    r.tenor,
+                    LAST_VALUE(r.price IGNORE NULLS) OVER w AS price,
+                    LAST_VALUE(r."yield" IGNORE NULLS) OVER w AS "yield",
+                    ROW_NUMBER() OVER (PARTITION BY r.obs_date, r.series, r.tenor) AS rn
+                FROM ts_raw r JOIN _affected a ON r.series = a.series AND r.obs_date >= a.start_date
+                WINDOW w AS (
+                    PARTITION BY r.series ORDER BY r.obs_date
+                    RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                )
+            ) x LEFT JOIN _seed s ON x.series = s.series
+            WHERE x.rn = 1
+            ORDER BY {order}
+        """)
+        self.con.execute("DROP TABLE _affected")
+        self.con.execute("DROP TABLE _seed")
+
+    def _persist_rows(self, frame: pd.DataFrame, rewrite: bool = False):
+        """Append rows to the source CSV in its own layout.
+
+        Keeps the file's column order, DD/MM/YYYY dates and line terminator, and
+        whether it ends with a trailing newline. With `rewrite`, existing lines for
+        the same (date, series, tenor) are dropped first (the file is rewritten).
+        """
+        with open(self.csv, "rb") as fh:
+            header = fh.readline()
+            fh.seek(0, 2)
+            size = fh.tell()
+            fh.seek(max(size - 1, 0))
+            last = fh.read(1)
+        eol = "\r\n" if header.endswith(b"\r\n") else "\n"
+        columns = header.decode("utf-8-sig").strip().split(",")
+
+        # Bond attributes not given for a row are copied from the series' latest CSV line
+        static = [c for c in ("cusip", "coupon", "maturity_date") if c in columns]
+        old = None
+        if rewrite or any(c not in frame or frame[c].isna().any() for c in static):
+            old = pd.read_csv(self.csv, dtype=str, keep_default_na=False)
+            latest = (old.assign(series=old["series"].str.upper())
+                      .drop_duplicates("series", keep="last").set_index("series"))
+            frame = frame.copy()
+            for c in static:
+                fill = frame["series"].map(latest[c])
+                frame[c] = frame[c].where(frame[c].notna(), fill) if c in frame else fill
+
+        def fmt(col, row):
+            value = row.get("obs_date" if col == "date" else col)
+            if value is None or (not isinstance(value, str) and pd.isna(value)):
+                return ""
+            if col in ("date", "maturity_date") and not (isinstance(value, str) and "/" in value):
+                return pd.Timestamp(value).strftime("%d/%m/%Y")
+            return str(value)
+
+        lines = [",".join(fmt(c, row) for c in columns) for row in frame.to_dict("records")]
+        if rewrite:
+            keys = set(zip(frame["obs_date"].map(lambda d: d.strftime("%d/%m/%Y")),
+                           frame["series"], frame["tenor"]))
+            keep = [k not in keys for k in zip(old["date"], old["series"].str.upper(), old["tenor"])]
+            lines = [",".join(r) for r in old[keep].itertuples(index=False, name=None)] + lines
+            text = eol.join([",".join(columns)] + lines)
+            text += eol if last == b"\n" else ""
+            with open(self.csv, "w", newline="") as fh:
+                fh.write(text)
+            return
+        text = eol.join(lines)
+        text = (eol + text) if last not in (b"\n", b"") else (text + eol)
+        with open(self.csv, "a", newline="") as fh:
+            fh.write(text)
+
+    def on_append(self, callback):
+        """Register `callback(AppendResult)` to run after each append (e.g. to drop cached results)."""
+        self._append_listeners.append(callback)
+
+    def _build_cube(self, tenors=None):
+        """Materialize `ts_cube`: per-tenor daily aggregates of price and yield across series.
+
+        One row per (tenor, calendar day) from the tenor's first to last observation.
+        <metric>_mean/_min/_max are forward-filled from the last observed day and
+        <metric>_count is the number of series observed that day (0 on filled days);
+        `observed` marks days present in ts and `is_bday` business days (bday_calendar:
+        Monday-Friday except Indonesian market holidays).
+        tenors: rebuild only these tenors (used after an append).
+        """
+        stats = []
+        filled = []
+        for m, col in (("price", "price"), ("yield", '"yield"')):
+            stats += [f"AVG({col}) AS {m}_mean", f"MIN({col}) AS {m}_min",
+                      f"MAX({col}) AS {m}_max", f"COUNT({col}) AS {m}_count"]
+            filled += [f"LAST_VALUE(o.{m}_{st} IGNORE NULLS) OVER w AS {m}_{st}" for st in ("mean", "min", "max")]
+            filled.append(f"COALESCE(o.{m}_count, 0) AS {m}_count")
+        params = list(tenors) if tenors else []
+        where = f"WHERE tenor IN ({','.join('?' * len(params))})" if params else ""
+        body = f"""
+            WITH obs AS (
+                SELECT tenor, obs_date, {', '.join(stats)}
+                FROM ts {where}
+                GROUP BY tenor, obs_date
+            ),
+            bounds AS (SELECT tenor, MIN(obs_date) AS lo, MAX(obs_date) AS hi FROM obs GROUP BY tenor),
+            days AS (
+                SELECT b.tenor, CAST(g.d AS DATE) AS obs_date
+                FROM bounds b,
+                     generate_series(CAST(b.lo AS TIMESTAMP), CAST(b.hi AS TIMESTAMP), INTERVAL 1 DAY) AS g(d)
+            )
+            SELECT d.tenor, d.obs_date,
+                   o.obs_date IS NOT NULL AS observed,
+                   ISODOW(d.obs_date) < 6 AND d.obs_date NOT IN (SELECT holiday FROM bond_holidays) AS is_bday,
+                   {', '.join(filled)}
+            FROM days d LEFT JOIN obs o ON o.tenor = d.tenor AND o.obs_date = d.obs_date
+            WINDOW w AS (PARTITION BY d.tenor ORDER BY d.obs_date ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+            ORDER BY d.tenor, d.obs_date
+        """
+        if params:
+            self.con.execute(f"DELETE FROM ts_cube {where}", params)
+            self.con.execute(f"INSERT INTO ts_cube {body}", params)
+        else:
+            self.con.execute(f"CREATE OR REPLACE TABLE ts_cube AS {body}")
+
+    def _build_quality(self, series=None):
+        """Materialize `ts_quality`: data-quality events per (series, tenor), from ts_raw.
+
+        One row per event, with [start_date, end_date] inclusive and `n` days or
+        observations in it:
+          span     first..last observation; n = business days in it, value = share observed
+          gap      run of business days with no row or a NULL price/yield (ts forward-fills
+                   these, ts_cube and the plots fill/interpolate them); value NULL
+          stale    run of >= QUALITY_STALE_MIN observations repeating the same price and yield;
+                   value = the repeated yield
+          outlier  a yield change more than QUALITY_OUTLIER_Z standard deviations from the
+                   changes over the previous QUALITY_OUTLIER_WINDOW rows; value = the z-score
+          holiday  run of weekend / Indonesian market holiday rows in the source; value 0 for
+                   placeholder rows without price/yield (ts forward-fills them), 1 for priced rows
+        Business days follow bday_calendar (table bond_holidays).
+        Each row of ts_raw is tagged with its business-day index, so all kinds come from
+        two window passes over the observations (no per-series calendar is expanded):
+        a gap is a jump of more than one business day between priced rows.
+        series: rebuild only these series (used after an append).
+        """
+        params = list(series) if series else []
+        where = f"WHERE series IN ({','.join('?' * len(params))})" if params else ""
+        body = f"""
+            WITH obs AS (
+                SELECT series, tenor, obs_date, FIRST(price) AS price, FIRST("yield") AS y
+                FROM ts_raw {where}
+                GROUP BY series, tenor, obs_date
+            ),
+            cal AS (
+                -- bidx: business days up to and including `day`
+                SELECT day, bday, SUM(CAST(bday AS INTEGER)) OVER (ORDER BY day) AS bidx
+                FROM (
+                    SELECT CAST(g.d AS DATE) AS day, ISODOW(g.d) < 6 AND h.holiday IS NULL AS bday
+                    FROM (SELECT MIN(obs_date) AS lo, MAX(obs_date) AS hi FROM obs) b,
+                         generate_series(CAST(b.lo AS TIMESTAMP), CAST(b.hi AS TIMESTAMP), INTERVAL 1 DAY) AS g(d)
+                    LEFT JOIN bond_holidays h ON h.holiday = CAST(g.d AS DATE)
+                )
+            ),
+            marked AS (
+                SELECT o.*, c.bday, c.bidx,
+                       o.price IS NULL OR o.y IS NULL AS missing,
+                       LAST_VALUE(CASE WHEN c.bday AND o.price IS NOT NULL AND o.y IS NOT NULL THEN c.bidx END
+                                  IGNORE NULLS) OVER prior AS prev_bidx,
+                       LAST_VALUE(CASE WHEN o.price IS NOT NULL AND o.y IS NOT NULL THEN o.price END
+                                  IGNORE NULLS) OVER prior AS prev_price,
+                       LAST_VALUE(CASE WHEN o.price IS NOT NULL AND o.y IS NOT NULL THEN o.y END
+                                  IGNORE NULLS) OVER prior AS prev_y,
+                       FIRST_VALUE(CASE WHEN c.bday THEN c.bidx ELSE c.bidx + 1 END) OVER s AS first_bidx,
+                       LEAD(o.obs_date) OVER s IS NULL AS is_last
+                FROM obs o JOIN cal c ON c.day = o.obs_date
+                WINDOW s AS (PARTITION BY o.series, o.tenor ORDER BY o.obs_date),
+                       prior AS (PARTITION BY o.series, o.tenor ORDER BY o.obs_date
+                                 ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING)
+            ),
+            rows AS (
+                SELECT *,
+                       SUM(CASE WHEN NOT missing AND (prev_y IS NULL OR y <> prev_y OR price <> prev_price)
+                                THEN 1 ELSE 0 END) OVER s AS run,
+                       (dy - AVG(dy) OVER p) / NULLIF(STDDEV_SAMP(dy) OVER p, 0) AS z,
+                       COUNT(dy) OVER p AS k
+                FROM (SELECT *, CASE WHEN NOT missing THEN y - prev_y END AS dy FROM marked)
+                WINDOW s AS (PARTITION BY series, tenor ORDER BY obs_date),
+                       p AS (PARTITION BY series, tenor ORDER BY obs_date
+                             ROWS BETWEEN {QUALITY_OUTLIER_WINDOW} PRECEDING AND 1 PRECEDING)
+            ),
+            gaps AS (
+                -- business days strictly between consecutive priced business-day rows, and
+                -- from the last one to the end of the series
+                SELECT series, tenor, COALESCE(prev_bidx + 1, first_bidx) AS lo,
+                       CASE WHEN bday AND NOT missing THEN bidx - 1 ELSE bidx END AS hi
+                FROM rows
+                WHERE (bday AND NOT missing) OR is_last
+            )
+            SELECT series, tenor, 'span' AS kind, MIN(obs_date) AS start_date, MAX(obs_date) AS end_date,
+                   MAX(bidx) - MIN(first_bidx) + 1 AS n,
+                   COUNT(*) FILTER (WHERE bday AND NOT missing) / NULLIF(MAX(bidx) - MIN(first_bidx) + 1, 0) AS value
+            FROM rows GROUP BY series, tenor
+            UNION ALL
+            SELECT g.series, g.tenor, 'gap', a.day, b.day, g.hi - g.lo + 1, NULL
+            FROM gaps g
+            JOIN cal a ON a.bday AND a.bidx = g.lo
+            JOIN cal b ON b.bday AND b.bidx = g.hi
+            WHERE g.lo <= g.hi
+            UNION ALL
+            SELECT series, tenor, 'stale', MIN(obs_date), MAX(obs_date), COUNT(*), ANY_VALUE(y)
+            FROM rows WHERE NOT missing
+            GROUP BY series, tenor, run HAVING COUNT(*) >= {QUALITY_STALE_MIN}
+            UNION ALL
+            SELECT series, tenor, 'outlier', obs_date, obs_date, 1, z
+            FROM rows WHERE ABS(z) > {QUALITY_OUTLIER_Z} AND k >= {QUALITY_OUTLIER_MIN_OBS}
+            UNION ALL
+            SELECT series, tenor, 'holiday', MIN(obs_date), MAX(obs_date), COUNT(*),
+                   CASE WHEN missing THEN 0.0 ELSE 1.0 END
+            FROM (SELECT series, tenor, obs_date, missing,
+                         obs_date - CAST(ROW_NUMBER() OVER (PARTITION BY series, tenor, missing ORDER BY obs_date)
+                                         AS INTEGER) AS grp
+                  FROM rows WHERE NOT bday)
+            GROUP BY series, tenor, missing, grp
+            ORDER BY series, tenor, start_date, kind
+        """
+        if params:
+            self.con.execute(f"DELETE FROM ts_quality {where}", params)
+            self.con.execute(f"INSERT INTO ts_quality {body}", params)
+        else:
+            self.con.execute(f"CREATE OR REPLACE TABLE ts_quality AS {body}")
+
+    def quality_events(self, kinds=None, start=None, end=None, tenors=None, series: Optional[str] = None) -> pd.DataFrame:
+        """Rows of `ts_quality` whose [start_date, end_date] overlaps [start, end]."""
+        conds, params = [], []
+        if kinds:
+            conds.append(f"kind IN ({','.join('?' * len(kinds))})")
+            params += list(kinds)
+        if start:
+            conds.append("end_date >= ?")
+            params.append(start)
+        if end:
+            conds.append("start_date <= ?")
+            params.append(end)
+        if tenors:
+            conds.append(f"tenor IN ({','.join('?' * len(tenors))})")
+            params += list(tenors)
+        if series:
+            conds.append("series = ?")
+            params.append(series.upper())
+        where = f"WHERE {' AND '.join(conds)}" if conds else ""
+        return self.con.execute(
+            f"SELECT * FROM ts_quality {where} ORDER BY series, tenor, start_date, kind", params
+        ).fetchdf()
+
+    def quality_summary(self, tenors=None, series: Optional[str] = None) -> pd.DataFrame:
+        """One row per (series, tenor): coverage of business days and counts of each event kind."""
+        events = self.quality_events(tenors=tenors, series=series)
+        spans = events[events["kind"] == "span"].set_index(["series", "tenor"])
+        out = pd.DataFrame({
+            "first_date": spans["start_date"],
+            "last_date": spans["end_date"],
+            "bdays": spans["n"],
+            "coverage": spans["value"].round(4),
+        })
+        other = events[events["kind"] != "span"]
+        for kind in QUALITY_KINDS[1:]:
+            rows = other[other["kind"] == kind].groupby(["series", "tenor"])["n"]
+            out[f"{kind}_events"] = rows.size()
+            out[f"{kind}_days"] = rows.sum()
+        counts = [c for c in out.columns if c.endswith(("_events", "_days"))]
+        out[counts] = out[counts].fillna(0).astype(int)
+        return out.reset_index()
+
+    def flag_quality(self, frame: pd.DataFrame, date_col: str = "obs_date") -> pd.DataFrame:
+        """Add imputed/stale/outlier boolean columns to rows of `frame` with series, tenor and `date_col`.
+
+        `imputed` marks days without a priced source row (gaps and holiday placeholders):
+        their `ts` values are forward-filled. `stale` marks repeats after a value's first day.
+        """
+        con = self.con
+        keys = pd.DataFrame({"i": np.arange(len(frame)), "series": frame["series"].to_numpy(),
+                             "tenor": frame["tenor"].to_numpy(), "d": frame[date_col].to_numpy()})
+        con.register("_keys", keys)
+        try:
+            flags = con.execute("""
+                SELECT k.i,
+                       BOOL_OR(q.kind = 'gap' OR (q.kind = 'holiday' AND q.value = 0)) AS imputed,
+                       BOOL_OR(q.kind = 'stale' AND k.d > q.start_date) AS stale,
+                       BOOL_OR(q.kind = 'outlier') AS outlier
+                FROM _keys k
+                JOIN ts_quality q ON q.series = k.series AND q.tenor = k.tenor
+                     AND CAST(k.d AS DATE) BETWEEN q.start_date AND q.end_date
+                     AND q.kind IN ('gap', 'stale', 'outlier', 'holiday')
+                GROUP BY k.i
+            """).fetchdf()
+        finally:
+            con.unregister("_keys")
+        out = frame.copy()
+        for col in ("imputed", "stale", "outlier"):
+            flag = np.zeros(len(frame), dtype=bool)
+            flag[flags["i"].to_numpy(dtype=np.int64)] = flags[col].fillna(False).to_numpy(dtype=bool)
+            out[col] = flag
+        return out
+
+    def cube_frame(self, tenors=None, start=None, end=None, freq: str = "D") -> pd.DataFrame:
+        """Rows of `ts_cube` ordered by (tenor, obs_date), with a datetime64 obs_date.
+
+        freq: "D" every calendar day, "B" business days (bday_calendar), "obs" observed days only.
+        """
+        cond, params = [], []
+        if tenors:
+            cond.append(f"tenor IN ({','.join('?' * len(tenors))})")
+            params.extend(tenors)
+        if start is not None:
+            cond.append("obs_date >= ?")
+            params.append(start)
+        if end is not None:
+            cond.append("obs_date <= ?")
+            params.append(end)
+        if freq == "B":
+            cond.append("is_bday")
+        elif freq == "obs":
+            cond.append("observed")
+        elif freq != "D":
+            raise ValueError(f"Unknown cube frequency: {freq}")
+        where = ("WHERE " + " AND ".join(cond)) if cond else ""
+        sql = f"SELECT * FROM ts_cube {where} ORDER BY tenor, obs_date"
+
+        def load():
+            df = self.con.execute(sql, params).fetchdf()
+            df["obs_date"] = pd.to_datetime(df["obs_date"])
+            return df
+
+        tenor = tenors[0] if tenors and len(tenors) == 1 else None
+        return self._query_cache.get_or_compute(sql, params, load, scope=(start, end, None, tenor))
+
+    @staticmethod
+    def cube_average(cube: pd.DataFrame, metric: str = "yield") -> pd.DataFrame:
+        """Per-day average of `metric` across the tenors of a `cube_frame`, weighted by series count.
+
+        Filled days have a count of 0, so each tenor carries the count of its last observed
+        day (the first one for leading filled days). This gives the mean over all series
+        rows, as when every series was forward-filled on its own.
+        """
+        mean = cube[f"{metric}_mean"]
+        count = cube[f"{metric}_count"].where(cube[f"{metric}_count"] > 0)
+        weight = count.groupby(cube["tenor"]).transform(lambda c: c.ffill().bfill()).fillna(1)
+        weight = weight.where(mean.notna(), 0.0)
+        frame = pd.DataFrame({"obs_date": cube["obs_date"], "total": mean.fillna(0) * weight, "weight": weight})
+        daily = frame.groupby("obs_date")[["total", "weight"]].sum()
+        return (daily["total"] / daily["weight"].where(daily["weight"] > 0)).rename(metric).reset_index()
+
+    def tenor_series(self, tenor: str, metric: str = "yield", stat: str = "mean",
+                     start=None, end=None, freq: str = "obs") -> pd.Series:
+        """One cube column for `tenor` as a date-indexed Series without NaNs.
+
+        With freq="obs" only days on which `metric` was observed are returned, i.e. the
+        same values as averaging ts across series per observed date.
+        """
+        if metric not in ("price", "yield") or stat not in ("mean", "min", "max", "count"):
+            raise ValueError(f"Unknown cube column: {metric}_{stat}")
+        if freq not in ("D", "B", "obs"):
+            raise ValueError(f"Unknown cube frequency: {freq}")
+        cond, params = ["tenor = ?"], [tenor]
+        if start is not None:
+            cond.append("obs_date >= ?")
+            params.append(start)
+        if end is not None:
+            cond.append("obs_date <= ?")
+            params.append(end)
+        if freq == "B":
+            cond.append("is_bday")
+        elif freq == "obs":
+            cond.append(f"{metric}_count > 0")
+        sql = f"SELECT obs_date, {metric}_{stat} FROM ts_cube WHERE {' AND '.join(cond)} ORDER BY obs_date"
+        return self.fetch_series(sql, params, scope=(start, end, None, tenor)).dropna()
+
+    def fetchall(self, sql: str, params=None, scope=None) -> list:
+        """`con.execute(sql, params).fetchall()` through the query result cache.
+
+        Only for read-only queries. scope: (start, end, series, tenor) covered by the
+        query, so appends outside it keep the entry; None drops it on any append.
+        """
+        params = list(params or [])
+        return self._query_cache.get_or_compute(
+            sql, params, lambda: self.con.execute(sql, params).fetchall(), scope=scope
+        )
+
+    def fetch_numpy(self, sql: str, params=None, scope=None) -> dict:
+        """Column name -> NumPy array for a read-only query, through the query result cache.
+
+        DATE columns arrive as datetime64 and NULLs in numeric columns as NaN, so no
+        Python object is created per row. The arrays are shared with the cache and
+        therefore read-only.
+        """
+        params = list(params or [])
+
+        def load():
+            return _numpy_columns(self.con.execute(sql, params).fetchnumpy())
+
+        return self._query_cache.get_or_compute(sql, params, load, scope=scope)
+
+    def fetch_series(self, sql: str, params=None, scope=None, name=None) -> pd.Series:
+        """Series from a two-column (date, value) query, indexed by a DatetimeIndex."""
+        dates, values = list(self.fetch_numpy(sql, params, scope).values())[:2]
+        return pd.Series(values, index=pd.DatetimeIndex(dates), name=name, copy=True)
+
+    def fetch_arrow(self, sql: str, params=None, scope=None):
+        """pyarrow.Table for a read-only query (requires pyarrow), through the query result cache."""
+        if not _HAS_PYARROW:
+            raise ImportError("BondDB.fetch_arrow requires pyarrow (pip install pyarrow)")
+        params = list(params or [])
+
+        def load():
+            res = self.con.execute(sql, params)
+            to_arrow = getattr(res, "to_arrow_table", None) or res.fetch_arrow_table
+            return to_arrow()
+
+        return self._query_cache.get_or_compute(sql, params, load, scope=scope)
+
+    def _tenor_columns(self, tenor: str) -> dict:
+        """obs_date / series / price / yield arrays of `ts` for one tenor, sorted by (obs_date, series).
+
+        Built on first use and kept until an append touches the tenor. Building
+        holds the write lock so an index is never built from pre-append data after
+        the append dropped it.
+        """
+        cols = self._slices.get(tenor)
+        if cols is None:
+            with self._write_lock:
+                cols = self._slices.get(tenor)
+                if cols is None:
+                    cols = _numpy_columns(self.con.execute(
+                        'SELECT obs_date, series, price, "yield" FROM ts WHERE tenor = ? ORDER BY obs_date, series',
+                        [tenor],
+                    ).fetchnumpy())
+                    cols["obs_date"] = cols["obs_date"].astype("datetime64[D]")
+                    cols["obs_date"].flags.writeable = False
+                    self._slices[tenor] = cols
+        return cols
+
+    @property
+    def tenors(self) -> list:
+        """Sorted tenors present in `ts`."""
+        tenors = self._tenors
+        if tenors is None:
+            tenors = [r[0] for r in self.con.execute("SELECT DISTINCT tenor FROM ts ORDER BY tenor").fetchall()]
+            self._tenors = tenors
+        return tenors
+
+    def slice(self, tenor: str, start=None, end=None) -> dict:
+        """Rows of `ts` for `tenor` with start <= obs_date <= end, without SQL.
+
+        Returns obs_date (datetime64[D]), series, price and yield arrays in
+        (obs_date, series) order. They are read-only views into a per-tenor index,
+        located with two binary searches, so the cost is O(log n) regardless of the
+        window size. In out-of-core mode this is a range query instead (new arrays).
+        """
+        if self.out_of_core:
+            return self._query_slice(tenor, start, end)
+        cols = self._tenor_columns(tenor)
+        dates = cols["obs_date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start, "D"), side="left"))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(end, "D"), side="right"))
+        return {name: arr[lo:hi] for name, arr in cols.items()}
+
+    def _query_slice(self, tenor: str, start=None, end=None) -> dict:
+        """`slice` for out-of-core mode: a range query pruned by ts's (tenor, obs_date) order."""
+        cols = dict(self.fetch_numpy(
+            'SELECT obs_date, series, price, "yield" FROM ts WHERE tenor = ? '
+            "AND obs_date BETWEEN COALESCE(CAST(? AS DATE), DATE '0001-01-01') "
+            "AND COALESCE(CAST(? AS DATE), DATE '9999-12-31') "
+            "ORDER BY obs_date, series",
+            [tenor, start, end], scope=(start, end, None, tenor),
+        ))
+        cols["obs_date"] = cols["obs_date"].astype("datetime64[D]")
+        return cols
+
+    def slice_rows(self, start=None, end=None, tenors=None, series: Optional[str] = None) -> list:
+        """(series, tenor, obs_date, price, yield) tuples from `slice`, as `fetchall` would return them.
+
+        Ordered by tenor, obs_date, series; dates are `date` objects and missing
+        values None. tenors: list of tenors (default all); series: one series.
+        """
+        rows = []
+        for tenor in (tenors or self.tenors):
+            cols = self.slice(tenor, start, end)
+            names = cols["series"]
+            keep = slice(None) if series is None else names == series.upper()
+            for s, d, p, y in zip(names[keep], cols["obs_date"][keep].astype(object),
+                                  cols["price"][keep].tolist(), cols["yield"][keep].tolist()):
+                rows.append((s, tenor, d, None if p != p else p, None if y != y else y))
+        return rows
+
+    def lookup_points(self, keys) -> dict:
+        """Rows of `ts` for many POINT lookups in one set-based query.
+
+        keys: sequence of (obs_date, tenor, series); a None tenor or series matches
+        any. The keys are unnested into a relation and joined to `ts` on obs_date,
+        so n lookups cost one scan/hash join instead of n queries. Returns the
+        `fetch_numpy` columns key (index into `keys`), obs_date, series, tenor,
+        price and yield, ordered by key, series, tenor.
+        """
+        keys = list(keys)
+        if not keys:
+            return {name: np.array([]) for name in ("key", "obs_date", "series", "tenor", "price", "yield")}
+        dates, tenors, series = (list(col) for col in zip(*keys))
+        series = [s.upper() if s else None for s in series]
+        sql = """
+            WITH q AS (
+                SELECT UNNEST(?::INTEGER[]) AS key, UNNEST(?::DATE[]) AS obs_date,
+                       UNNEST(?::VARCHAR[]) AS tenor, UNNEST(?::VARCHAR[]) AS series
+            )
+            SELECT q.key, t.obs_date, t.series, t.tenor, t.price, t."yield"
+            FROM q JOIN ts t ON t.obs_date = q.obs_date
+             AND (q.tenor IS NULL OR t.tenor = q.tenor)
+             AND (q.series IS NULL OR t.series = q.series)
+            ORDER BY q.key, t.series, t.tenor
+        """
+        return self.fetch_numpy(sql, [list(range(len(keys))), dates, tenors, series],
+                                scope=(min(dates), max(dates), None, None))
+
+    def export_batches(self, table: str = "ts", start=None, end=None, tenors=None,
+                       series: Optional[str] = None, batch_rows: int = 65536, arrow: bool = False):
+        """Generator over `ts` (or the daily cube, table="cube") rows in chunks of `batch_rows`.
+
+        Rows are ordered by tenor, obs_date (and series for ts). The query runs on
+        a dedicated cursor and DuckDB's streaming result is pulled one chunk at a
+        time, so memory stays bounded by a chunk however long the range. Yields
+        DataFrames, or pyarrow.RecordBatch with arrow=True (requires pyarrow); an
+        empty range yields one empty chunk carrying the columns.
+        """
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"Unknown export table {table!r}; expected one of {', '.join(EXPORT_TABLES)}")
+        if arrow and not _HAS_PYARROW:
+            raise ImportError("BondDB.export_batches(arrow=True) requires pyarrow (pip install pyarrow)")
+        name, columns, order = EXPORT_TABLES[table]
+        cond, params = [], []
+        if tenors:
+            cond.append(f"tenor IN ({','.join('?' * len(tenors))})")
+            params.extend(tenors)
+        if series:
+            if table != "ts":
+                raise ValueError("series filter applies to table='ts' only")
+            cond.append("series = ?")
+            params.append(series.upper())
+        if start is not None:
+            cond.append("obs_date >= ?")
+            params.append(start)
+        if end is not None:
+            cond.append("obs_date <= ?")
+            params.append(end)
+        where = ("WHERE " + " AND ".join(cond)) if cond else ""
+        cur = self._pool.new_cursor()
+        try:
+            res = cur.execute(f"SELECT {columns} FROM {name} {where} ORDER BY {order}", params)
+            if arrow:
+                to_reader = getattr(res, "to_arrow_reader", None) or res.fetch_record_batch
+                reader = to_reader(batch_rows)
+                empty = True
+                for batch in reader:
+                    empty = False
+                    yield batch
+                if empty:  # keep the schema for empty ranges
+                    yield pyarrow.RecordBatch.from_pylist([], schema=reader.schema)
+                return
+            vectors = max(1, batch_rows // 2048)  # DuckDB vectors are 2048 rows
+            first = True
+            while True:
+                chunk = res.fetch_df_chunk(vectors)
+                if chunk.empty and not first:
+                    return
+                yield chunk
+                if chunk.empty:
+                    return
+                first = False
+        finally:
+            cur.close()
+
+    # -- intraday ticks and bars -------------------------------------------
+
+    def _load_ticks(self):
+        """Create `ticks` (obs_ts, series, tenor, price, yield, volume), filled from `self.ticks` if set."""
+        self.con.execute("""
+            CREATE OR REPLACE TABLE ticks (
+                obs_ts TIMESTAMP, series VARCHAR, tenor VARCHAR,
+                price DOUBLE, "yield" DOUBLE, volume DOUBLE
+            )
         """)
+        if not self.ticks:
+            return
+        relation = _source_relation(self.ticks)
+        cols = {row[0] for row in self.con.execute(f"DESCRIBE SELECT * FROM {relation}").fetchall()}
+        volume = "TRY_CAST(volume AS DOUBLE)" if "volume" in cols else "NULL"
+        self.con.execute(f"""
+            INSERT INTO ticks
+            SELECT CAST("timestamp" AS TIMESTAMP), UPPER(series), tenor,
+                   TRY_CAST(price AS DOUBLE), TRY_CAST("yield" AS DOUBLE), {volume}
+            FROM {relation}
+            ORDER BY 1
+        """)
+
+    def append_ticks(self, rows) -> int:
+        """Insert intraday observations (timestamp, series, tenor, price, yield[, volume]).
+
+        Cached bar tables are recomputed for the affected series from the bar holding
+        each one's earliest new tick. Returns the number of rows inserted.
+        """
+        frame = rows.copy() if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        missing = {"timestamp", "series", "tenor"} - set(frame.columns)
+        if missing:
+            raise ValueError(f"append_ticks: missing columns {sorted(missing)}")
+        if frame.empty:
+            return 0
+        new = pd.DataFrame({
+            "obs_ts": pd.to_datetime(frame["timestamp"], format="ISO8601"),
+            "series": frame["series"].astype(str).str.upper(),
+            "tenor": frame["tenor"].astype(str),
+        })
+        for col in ("price", "yield", "volume"):
+            new[col] = pd.to_numeric(frame[col], errors="coerce") if col in frame else float("nan")
+        con = self.con
+        with self._write_lock:
+            con.register("_ticks", new)
+            try:
+                con.execute("BEGIN TRANSACTION")
+                try:
+                    con.execute('INSERT INTO ticks SELECT obs_ts, series, tenor, price, "yield", volume FROM _ticks')
+                    for table in sorted(self._bar_tables, key=lambda t: int(t[5:-1])):
+                        self._refresh_bars(table)
+                    con.execute("COMMIT")
+                except Exception:
+                    con.execute("ROLLBACK")
+                    raise
+            finally:
+                con.unregister("_ticks")
+        self._query_cache.invalidate(lambda *scope: False)  # bars() results are unscoped
+        return len(new)
+
+    def _bar_select(self, minutes: int, where: str = "") -> str:
+        """SELECT producing `minutes` bars: from ticks for 1-minute bars, else from the 1-minute bars.
+
+        OHLC per metric; <metric>_avg is the volume-weighted mean (ticks without volume
+        weigh 1) and <metric>_weight its total weight, so coarser bars re-aggregate
+        exactly.
+        """
+        bucket = f"time_bucket(INTERVAL '{minutes} minutes', {{t}})"
+        cols = []
+        if minutes == 1:
+            t, src = "obs_ts", "ticks"
+            cols += ["COUNT(*) AS ticks", "SUM(volume) AS volume"]
+            for m, c in (("price", "price"), ("yield", '"yield"')):
+                w = "COALESCE(volume, 1)"
+                cols += [f"arg_min({c}, obs_ts) FILTER (WHERE {c} IS NOT NULL) AS {m}_open",
+                         f"MAX({c}) AS {m}_high", f"MIN({c}) AS {m}_low",
+                         f"arg_max({c}, obs_ts) FILTER (WHERE {c} IS NOT NULL) AS {m}_close",
+                         f"SUM({c} * {w}) / NULLIF(SUM({w}) FILTER (WHERE {c} IS NOT NULL), 0) AS {m}_avg",
+                         f"SUM({w}) FILTER (WHERE {c} IS NOT NULL) AS {m}_weight"]
+        else:
+            t, src = "bar_start", "bars_1m"
+            cols += ["CAST(SUM(ticks) AS BIGINT) AS ticks", "SUM(volume) AS volume"]
+            for m in ("price", "yield"):
+                cols += [f"arg_min({m}_open, bar_start) FILTER (WHERE {m}_open IS NOT NULL) AS {m}_open",
+                         f"MAX({m}_high) AS {m}_high", f"MIN({m}_low) AS {m}_low",
+                         f"arg_max({m}_close, bar_start) FILTER (WHERE {m}_close IS NOT NULL) AS {m}_close",
+                         f"SUM({m}_avg * {m}_weight) / NULLIF(SUM({m}_weight), 0) AS {m}_avg",
+                         f"SUM({m}_weight) AS {m}_weight"]
+        return f"""
+            SELECT {bucket.format(t=t)} AS bar_start, series, tenor, {', '.join(cols)}
+            FROM {src} {where}
+            GROUP BY ALL
+        """
+
+    def _bar_table(self, minutes: int) -> str:
+        """Name of the cached `bars_<minutes>m` table, built on first use."""
+        table = f"bars_{minutes}m"
+        if table not in self._bar_tables:
+            if minutes != 1:
+                self._bar_table(1)
+            with self._write_lock:
+                if table not in self._bar_tables:
+                    self.con.execute(
+                        f"CREATE OR REPLACE TABLE {table} AS {self._bar_select(minutes)} ORDER BY series, bar_start"
+                    )
+                    self._bar_tables.add(table)
+        return table
+
+    def bars(self, freq="1h", tenor: Optional[str] = None, series: Optional[str] = None,
+             start=None, end=None, metric: Optional[str] = None) -> pd.DataFrame:
+        """Intraday bars per series from `ticks`, computed and cached in DuckDB.
+
+        freq: "1min", "15min", "1h", "1d", ... (see `bar_minutes`). start/end bound
+        bar_start; a date `end` includes that whole day. Columns: bar_start, series,
+        tenor, ticks, volume and <metric>_open/_high/_low/_close/_avg for price and
+        yield, or open/high/low/close/avg when `metric` is given.
+        """
+        table = self._bar_table(bar_minutes(freq))
+        cond, params = [], []
+        if tenor:
+            cond.append("tenor = ?")
+            params.append(tenor)
+        if series:
+            cond.append("series = ?")
+            params.append(series.upper())
+        if start is not None:
+            cond.append("bar_start >= ?")
+            params.append(pd.Timestamp(start).to_pydatetime())
+        if end is not None:
+            end_ts = pd.Timestamp(end)
+            if end_ts == end_ts.normalize() and not isinstance(end, datetime):
+                end_ts += pd.Timedelta(days=1)
+                cond.append("bar_start < ?")
+            else:
+                cond.append("bar_start <= ?")
+            params.append(end_ts.to_pydatetime())
+        metrics = [metric] if metric else ["price", "yield"]
+        cols = [f"{m}_{c}" + (f" AS {c}" if metric else "")
+                for m in metrics for c in ("open", "high", "low", "close", "avg")]
+        sql = (f"SELECT bar_start, series, tenor, ticks, volume, {', '.join(cols)} FROM {table} "
+               f"{'WHERE ' + ' AND '.join(cond) if cond else ''} ORDER BY series, bar_start")
+        return pd.DataFrame(self.fetch_numpy(sql, params))
+
+    def _refresh_bars(self, table: str):
+        """Recompute `table` rows of the series in `_ticks` from the bar of their earliest new tick."""
+        minutes = int(table[5:-1])
+        self.con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE _bar_from AS
+            SELECT series, tenor, time_bucket(INTERVAL '{minutes} minutes', MIN(obs_ts)) AS start_ts
+            FROM _ticks GROUP BY series, tenor
+        """)
+        self.con.execute(f"""
+            DELETE FROM {table} USING _bar_from f
+            WHERE {table}.series = f.series AND {table}.tenor = f.tenor AND {table}.bar_start >= f.start_ts
+        """)
+        t = "obs_ts" if minutes == 1 else "bar_start"
+        where = (f"WHERE EXISTS (SELECT 1 FROM _bar_from f WHERE f.series = {{src}}.series "
+                 f"AND f.tenor = {{src}}.tenor AND {{src}}.{t} >= f.start_ts)")
+        src = "ticks" if minutes == 1 else "bars_1m"
+        self.con.execute(f"INSERT INTO {table} {self._bar_select(minutes, where.format(src=src))}")
+        self.con.execute("DROP TABLE _bar_from")
 
     def aggregate(self, s, e, metric, agg, series, tenor):
         cond, params = [], [s.isoformat(), e.isoformat()]
@@ -461,7 +1718,9 @@ class BondDB:
             WHERE obs_date BETWEEN ? AND ?
             {("AND "+where) if where else ""}
         """
-        return self.con.execute(q, params).fetchone()
+        return self._query_cache.get_or_compute(
+            q, params, lambda: self.con.execute(q, params).fetchone(), scope=(s, e, series, tenor)
+        )
 
     def coverage(self):
         """Return (min_date, max_date) coverage of ts_raw, or (None, None) if empty."""
@@ -473,20 +1732,52 @@ class BondDB:
         except Exception:
             return (None, None)
 
+    def tick_coverage(self):
+        """Return (min_ts, max_ts) coverage of intraday ticks, or (None, None) if there are none."""
+        try:
+            row = self.con.execute("SELECT MIN(obs_ts), MAX(obs_ts) FROM ticks").fetchone()
+            if not row:
+                return (None, None)
+            return row[0], row[1]
+        except Exception:
+            return (None, None)
+
 
 # -----------------------------
 # Auction Forecast DB
 # -----------------------------
 class AuctionDB:
-    def __init__(self, csv):
-        self.con = duckdb.connect(":memory:")
+    # Row layout returned by query_forecast / get_periods
+    _COLUMNS = ['date', 'auction_month', 'auction_year', 'bi_rate', 'inflation_rate',
+                'incoming_billions', 'awarded_billions', 'bid_to_cover', 'number_series',
+                'yield01_ibpa', 'yield05_ibpa', 'yield10_ibpa']
+    _SELECT_COLUMNS = "forecast_date AS date, " + ", ".join(_COLUMNS[1:])
+
+    def __init__(self, csv, snapshot: Optional[str] = "auto"):
+        self._pool = ConnectionPool()
+        self._query_cache = QueryCache("auction")
         # Load unified auction database (2010-2025 historical + 2026 forecast)
         # Structure: date, auction_month, auction_year, incoming_trillions, awarded_trillions, bid_to_cover, 
         #            Random Forest, Gradient Boosting, AdaBoost, Stepwise Regression (all in Rp Trillions)
-        self.con.execute(f"""
-            CREATE TEMPORARY VIEW raw_auction AS
-            SELECT * FROM read_csv_auto('{csv}', header=True)
-        """)
+        snap = None
+        if snapshot:
+            snap = market_snapshot.snapshot_for("auction", csv, None if snapshot == "auto" else snapshot)
+        if snap is not None:
+            # Queried in place from the read-only snapshot; a corrupt or locked file falls back to the CSV
+            try:
+                self.con.execute(f"ATTACH '{snap}' AS snap (READ_ONLY)")
+                self.con.execute("CREATE VIEW raw_auction AS SELECT * FROM snap.auction_raw")
+            except Exception:
+                try:
+                    self.con.execute("DETACH snap")
+                except Exception:
+                    pass
+                snap = None
+        if snap is None:
+            self.con.execute(f"""
+                CREATE VIEW raw_auction AS
+                SELECT * FROM read_csv_auto('{csv}', header=True)
+            """)
 
         # Detect schema to support both legacy (incoming_trillions) and new ensemble forecast files
         cols = [row[1] for row in self.con.execute("PRAGMA table_info('raw_auction')").fetchall()]
@@ -539,41 +1830,64 @@ class AuctionDB:
         else:
             raise RuntimeError("Unrecognized auction forecast schema; expected incoming_trillions or Ensemble Mean (Rp T)")
 
+        self._monthly = self._build_monthly_index()
+
+    @property
+    def con(self):
+        """The calling thread's cursor on this AuctionDB's database."""
+        return self._pool.cursor()
+
+    def close(self):
+        self._pool.close()
+
+    def _build_monthly_index(self) -> pd.DataFrame:
+        """All auction rows (history and forecasts) indexed by (auction_year, auction_month)."""
+        df = self.con.execute(f"""
+            SELECT {self._SELECT_COLUMNS}
+            FROM auction_forecast
+            WHERE auction_year IS NOT NULL AND auction_month IS NOT NULL
+            ORDER BY forecast_date
+        """).fetchdf()
+        df["date"] = df["date"].dt.date
+        # NULL -> None (not NaN) so rows match query_forecast's output
+        df = df.astype(object).where(df.notna(), None)
+        df.index = pd.MultiIndex.from_arrays(
+            [df["auction_year"].astype(int), df["auction_month"].astype(int)], names=["year", "month"]
+        )
+        return df
+
+    def get_periods(self, periods) -> list:
+        """Rows for every requested (year, month), in date order, in one lookup.
+
+        Same row dicts as `query_forecast`; months without data are simply absent.
+        """
+        keys = pd.MultiIndex.from_tuples([(int(y), int(m)) for y, m in periods], names=["year", "month"])
+        if keys.empty:
+            return []
+        return self._monthly[self._monthly.index.isin(keys)].to_dict("records")
+
     def query_forecast(self, intent: Intent):
         """Query auction forecasts based on intent."""
-        where_parts = []
+        where_parts, params = [], []
 
         if intent.start_date and intent.end_date:
-            where_parts.append(f"forecast_date BETWEEN '{intent.start_date}' AND '{intent.end_date}'")
+            where_parts.append("forecast_date BETWEEN ? AND ?")
+            params.extend([intent.start_date, intent.end_date])
         elif intent.start_date:
-            where_parts.append(f"forecast_date >= '{intent.start_date}'")
+            where_parts.append("forecast_date >= ?")
+            params.append(intent.start_date)
 
         where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
 
         query = f"""
-            SELECT
-                forecast_date AS date,
-                auction_month,
-                auction_year,
-                bi_rate,
-                inflation_rate,
-                incoming_billions,
-                awarded_billions,
-                bid_to_cover,
-                number_series,
-                yield01_ibpa,
-                yield05_ibpa,
-                yield10_ibpa
+            SELECT {self._SELECT_COLUMNS}
             FROM auction_forecast
             {where_clause}
             ORDER BY forecast_date
         """
 
-        result = self.con.execute(query).fetchall()
-        columns = ['date', 'auction_month', 'auction_year', 'bi_rate', 'inflation_rate',
-                   'incoming_billions', 'awarded_billions', 'bid_to_cover', 'number_series',
-                   'yield01_ibpa', 'yield05_ibpa', 'yield10_ibpa']
-        return [dict(zip(columns, row)) for row in result]
+        result = self._query_cache.get_or_compute(query, params, lambda: self.con.execute(query, params).fetchall())
+        return [dict(zip(self._COLUMNS, row)) for row in result]
 
     def coverage(self):
         """Return (min_date, max_date) coverage of auction_forecast, or (None, None) if empty."""
@@ -594,62 +1908,65 @@ from yield_forecast_models import (
     forecast_monte_carlo,
     forecast_ma5,
     forecast_var,
+    monte_carlo_path,
+    fit_and_forecast,
+    FITTED_MODELS,
+    PATH_MODELS,
 )
 
-def yield_forecast(series: pd.Series, forecast_date: date, method: str = "all", **kwargs):
+# Observations the forecast models are fitted on (the most recent ones)
+FORECAST_WINDOW = 240
+# New observations to look back across for a cached fit to warm-start from
+WARM_START_LOOKBACK = 5
+# Longest "next N days" forecast (business days)
+FORECAST_MAX_DAYS = int(os.environ.get("FORECAST_MAX_DAYS", "60"))
+
+def _model_plan(series: pd.Series):
+    """({model: skip reason}, models to run) for method='all' on `series`."""
+    results = {}
+    # Require minimum history for certain models; with 240 obs we allow Prophet and keep deep nets if enough data
+    model_plan = ["arima", "ets", "random_walk", "monte_carlo", "ma5", "var"]
+    if len(series) >= 90:
+        model_plan.append("prophet")
+    else:
+        results["prophet"] = "skipped: need >=90 obs"
+
+    if len(series) >= 150:
+        model_plan.extend(["gru"])
+    else:
+        results["gru"] = "skipped: need >=150 obs"
+    return results, model_plan
+
+def _ensemble_average(vals):
+    """Mean of the model forecasts after dropping negatives and MAD outliers, or None."""
+    if not vals:
+        return None
+    ser = pd.Series(vals)
+    ser = ser[ser >= 0]
+    if ser.empty:
+        return None
+    med = ser.median()
+    mad = (ser - med).abs().median()
+    if mad == 0:
+        filtered = ser.tolist()
+    else:
+        filtered = ser[abs(ser - med) <= 3 * mad].tolist()
+    chosen = filtered if filtered else ser.tolist()
+    return sum(chosen) / len(chosen)
+
+def yield_forecast(series: pd.Series, forecast_date: date, method: str = "all", timeout=None, **kwargs):
     """
     Forecast yield using selected method.
     method: 'arima', 'ets', 'prophet', 'gru'
     series: pandas Series with datetime index
     forecast_date: target date for forecast
+    timeout: per-model seconds for method='all' (float or {model: seconds}, see forecast_pool)
     kwargs: model-specific parameters
     """
-    # Limit to the most recent 240 observations for forecasting stability
-    series = series.tail(240)
     if method == "all":
-        results = {}
-        vals = []
-        # Require minimum history for certain models; with 240 obs we allow Prophet and keep deep nets if enough data
-        model_plan = ["arima", "ets", "random_walk", "monte_carlo", "ma5", "var"]
-        if len(series) >= 90:
-            model_plan.append("prophet")
-        else:
-            results["prophet"] = "skipped: need >=90 obs"
-
-        if len(series) >= 150:
-            model_plan.extend(["gru"])
-        else:
-            results["gru"] = "skipped: need >=150 obs"
-
-        for m in model_plan:
-            try:
-                res = yield_forecast(series, forecast_date, method=m, **kwargs)
-                # ARIMA returns (forecast, conf_int), others just forecast
-                val = res[0] if isinstance(res, tuple) else res
-                results[m] = val
-                if isinstance(val, (int, float)):
-                    vals.append(val)
-            except Exception as e:
-                results[m] = str(e)
-
-        if vals:
-            # Remove negative and MAD outlier forecasts before averaging
-            ser = pd.Series(vals)
-            ser = ser[ser >= 0]
-            if not ser.empty:
-                med = ser.median()
-                mad = (ser - med).abs().median()
-                if mad == 0:
-                    filtered = ser.tolist()
-                else:
-                    filtered = ser[abs(ser - med) <= 3 * mad].tolist()
-                chosen = filtered if filtered else ser.tolist()
-                results["average"] = sum(chosen) / len(chosen)
-            else:
-                results["average"] = None
-        else:
-            results["average"] = None
-        return results
+        return yield_forecast_path(series, [forecast_date], method="all", timeout=timeout, **kwargs)[0]
+    # Limit to the most recent FORECAST_WINDOW observations for forecasting stability
+    series = series.tail(FORECAST_WINDOW)
     if method == "arima":
         return forecast_arima(series, forecast_date, **kwargs)
     elif method == "ets":
@@ -667,70 +1984,137 @@ def yield_forecast(series: pd.Series, forecast_date: date, method: str = "all",
     else:
         raise ValueError(f"Unknown method: {method}")
 
+def _previous_fit(model, history, kwargs):
+    """Cached fit of `model` on the window before the last 1..WARM_START_LOOKBACK observations, or None."""
+    for k in range(1, min(WARM_START_LOOKBACK, len(history) - 1) + 1):
+        window = history.iloc[:-k].tail(FORECAST_WINDOW)
+        fit = model_cache.get(model_cache.model_key(model, model_cache.series_fingerprint(window), kwargs))
+        if fit is not None:
+            return fit
+    return None
+
+def _cached_fit_paths(series, forecast_dates, models, kwargs, history=None, timeout=None, errors=False) -> dict:
+    """{model: path} for FITTED_MODELS `models`, reusing cached fits and caching new ones.
+
+    A missing fit warm-starts from the cached fit of an earlier window of
+    `history` (the series before windowing) when there is one. Missing fits run
+    through forecast_pool. With errors=True a failed model maps to
+    [exception] * len(forecast_dates); otherwise the exception is raised.
+    """
+    fingerprint = model_cache.series_fingerprint(series)
+    keys = {m: model_cache.model_key(m, fingerprint, kwargs) for m in models}
+    paths, jobs = {}, {}
+    for m in models:
+        fit = model_cache.get(keys[m])
+        if fit is None:
+            prev = _previous_fit(m, history if history is not None else series, kwargs)
+            jobs[m] = (fit_and_forecast, (m, series, forecast_dates), {**kwargs, "prev": prev})
+        else:
+            paths[m] = FITTED_MODELS[m][1](fit, series, forecast_dates)
+    for m, res in forecast_pool.run_models(jobs, timeout):
+        if isinstance(res, Exception):
+            if not errors:
+                raise res
+            paths[m] = [res] * len(forecast_dates)
+        else:
+            blob, paths[m] = res
+            model_cache.put(keys[m], blob)
+    return paths
+
+def yield_forecast_path(series: pd.Series, forecast_dates, method: str = "all", timeout=None, **kwargs) -> list:
+    """yield_forecast for several target dates, fitting each model once.
+
+    Returns one result per date, equal to yield_forecast(series, d, method) for
+    each d. Models in PATH_MODELS fit once and read every horizon off that fit;
+    the rest are cheap and run per date. Fits are cached by series fingerprint
+    (model_cache), so a repeated request on unchanged data skips fitting, and
+    after new observations the fit warm-starts from the previous window's
+    (yield_forecast_models.refit_model). For
+    method='all' missing fits run in parallel worker processes (forecast_pool)
+    while the cheap models run here; a model that misses its timeout is
+    reported as an error string. Its results also carry "bands": the Monte
+    Carlo quantiles for that date ({"p05": ..., "p95": ...}, see MC_QUANTILES).
+    """
+    forecast_dates = list(forecast_dates)
+    history, series = series, series.tail(FORECAST_WINDOW)
+    if method != "all":
+        if method in PATH_MODELS:
+            return _cached_fit_paths(series, forecast_dates, [method], kwargs, history=history)[method]
+        if method == "monte_carlo":
+            return [mean for mean, _ in monte_carlo_path(series, forecast_dates, quantiles=(), **kwargs)]
+        return [yield_forecast(series, d, method=method, **kwargs) for d in forecast_dates]
+
+    skipped, model_plan = _model_plan(series)
+    # Fits come from model_cache when this window was seen before; the rest run (warm-started
+    # where possible) in worker processes
+    paths = _cached_fit_paths(series, forecast_dates, [m for m in model_plan if m in PATH_MODELS], kwargs,
+                              history=history, timeout=timeout, errors=True)
+    for m in model_plan:
+        if m not in PATH_MODELS:
+            try:
+                if m == "monte_carlo":
+                    # (mean, quantile bands) per date, from one simulation
+                    paths[m] = monte_carlo_path(series, forecast_dates, **kwargs)
+                else:
+                    paths[m] = yield_forecast_path(series, forecast_dates, method=m, **kwargs)
+            except Exception as e:
+                paths[m] = [e] * len(forecast_dates)
+    out = []
+    for i in range(len(forecast_dates)):
+        results = dict(skipped)
+        vals = []
+        for m in model_plan:
+            res = paths[m][i]
+            if isinstance(res, Exception):
+                results[m] = str(res)
+                continue
+            val = res[0] if isinstance(res, tuple) else res
+            results[m] = val
+            if isinstance(val, (int, float)):
+                vals.append(val)
+            if m == "monte_carlo":
+                results["bands"] = res[1]
+        results["average"] = _ensemble_average(vals)
+        out.append(results)
+    return out
+
 def get_yield_series(db: BondDB, series: Optional[str], tenor: str) -> pd.Series:
     """Fetch yield series for a tenor. If series is None, aggregate across all series for that tenor."""
-    if series:
-        q = "SELECT obs_date, \"yield\" FROM ts WHERE series=? AND tenor=? ORDER BY obs_date"
-        rows = db.con.execute(q, [series, tenor]).fetchall()
-    else:
-        # Aggregate by tenor only; average across all series per date to ignore series dimension
-        q = """
-            SELECT obs_date, AVG("yield") AS "yield"
-            FROM ts
-            WHERE tenor=?
-            GROUP BY obs_date
-            ORDER BY obs_date
-        """
-        rows = db.con.execute(q, [tenor]).fetchall()
-    dates = [r[0] for r in rows]
-    yields = [r[1] for r in rows]
-    s = pd.Series(yields, index=pd.to_datetime(dates))
-    s = s.dropna()
-    return s
+    return get_metric_series(db, series, tenor, "yield")
 
 def get_metric_series(db: BondDB, series: Optional[str], tenor: str, metric: str = "yield") -> pd.Series:
     """Fetch price or yield series for a tenor. If series is None, aggregate across all series for that tenor."""
-    metric_col = '"yield"' if metric == "yield" else "price"
-    if series:
-        q = f"SELECT obs_date, {metric_col} FROM ts WHERE series=? AND tenor=? ORDER BY obs_date"
-        rows = db.con.execute(q, [series, tenor]).fetchall()
-    else:
-        # Aggregate by tenor only; average across all series per date to ignore series dimension
-        q = f"""
-            SELECT obs_date, AVG({metric_col}) AS metric_val
-            FROM ts
-            WHERE tenor=?
-            GROUP BY obs_date
-            ORDER BY obs_date
-        """
-        rows = db.con.execute(q, [tenor]).fetchall()
-    dates = [r[0] for r in rows]
-    values = [r[1] for r in rows]
-    s = pd.Series(values, index=pd.to_datetime(dates))
-    s = s.dropna()
-    return s
+    metric = "yield" if metric == "yield" else "price"
+    if not series:
+        # Aggregate by tenor only: precomputed average across all series per observed date
+        return db.tenor_series(tenor, metric)
+    q = f'SELECT obs_date, "{metric}" FROM ts WHERE series=? AND tenor=? ORDER BY obs_date'
+    return db.fetch_series(q, [series, tenor], scope=(None, None, series, tenor)).dropna()
+
 def forecast_tenor_next_days(db: BondDB, tenor: str, days: int = 3, last_obs_count: int = 5, series: Optional[str] = None):
         """Return latest observations and forecasts for the next consecutive BUSINESS days for a tenor.
         Ignores series when series=None by averaging across all series per date.
         Output:
             {
                 'last_obs': [(date, value), ...],
-                'forecasts': [{'date': date, 'average': avg, 'models': results_dict}, ...]
+                'forecasts': [{'date': date, 'average': avg, 'models': results_dict, 'bands': {'p05': ..., 'p95': ...}}, ...]
             }
         """
+        if days > FORECAST_MAX_DAYS:
+                raise ValueError(f"days must be at most {FORECAST_MAX_DAYS}")
         s = get_yield_series(db, series, tenor)
         if s.empty:
                 return {'last_obs': [], 'forecasts': []}
         last_obs = list(zip(s.tail(last_obs_count).index.date.tolist(), s.tail(last_obs_count).tolist()))
         last_date = s.index.max().date()
-        # Generate next business-day dates (skip weekends)
-        start_bday = pd.to_datetime(last_date) + pd.offsets.BDay(1)
-        bdays = pd.bdate_range(start=start_bday, periods=days)
+        # Next business days (weekends and Indonesian market holidays skipped)
+        bdays = next_bdays(last_date, days)
+        targets = [d.date() for d in bdays]
+        # One fit per model for the whole T+1..T+N path
         out = []
-        for idx, target_ts in enumerate(bdays, start=1):
-            target = target_ts.date()
-            res = yield_forecast(s, target, method='all')
-            out.append({'label': f"T+{idx}", 'date': target, 'average': res.get('average'), 'models': res})
+        for idx, (target, res) in enumerate(zip(targets, yield_forecast_path(s, targets, method='all')), start=1):
+            out.append({'label': f"T+{idx}", 'date': target, 'average': res.get('average'), 'models': res,
+                        'bands': res.get('bands')})
         return {'last_obs': last_obs, 'forecasts': out}
 
 def forecast_metric_next_days(db: BondDB, tenor: str, metric: str = "yield", days: int = 3, last_obs_count: int = 5, series: Optional[str] = None):
@@ -740,22 +2124,24 @@ def forecast_metric_next_days(db: BondDB, tenor: str, metric: str = "yield", day
     Output:
         {
             'last_obs': [(date, value), ...],
-            'forecasts': [{'date': date, 'average': avg, 'models': results_dict}, ...]
+            'forecasts': [{'date': date, 'average': avg, 'models': results_dict, 'bands': {'p05': ..., 'p95': ...}}, ...]
         }
     """
+    if days > FORECAST_MAX_DAYS:
+        raise ValueError(f"days must be at most {FORECAST_MAX_DAYS}")
     s = get_metric_series(db, series, tenor, metric=metric)
     if s.empty:
         return {'last_obs': [], 'forecasts': []}
     last_obs = list(zip(s.tail(last_obs_count).index.date.tolist(), s.tail(last_obs_count).tolist()))
     last_date = s.index.max().date()
-    # Generate next business-day dates (skip weekends)
-    start_bday = pd.to_datetime(last_date) + pd.offsets.BDay(1)
-    bdays = pd.bdate_range(start=start_bday, periods=days)
+    # Next business days (weekends and Indonesian market holidays skipped)
+    bdays = next_bdays(last_date, days)
+    targets = [d.date() for d in bdays]
+    # One fit per model for the whole T+1..T+N path
     out = []
-    for idx, target_ts in enumerate(bdays, start=1):
-        target = target_ts.date()
-        res = yield_forecast(s, target, method='all')
-        out.append({'label': f"T+{idx}", 'date': target, 'average': res.get('average'), 'models': res})
+    for idx, (target, res) in enumerate(zip(targets, yield_forecast_path(s, targets, method='all')), start=1):
+        out.append({'label': f"T+{idx}", 'date': target, 'average': res.get('average'), 'models': res,
+                    'bands': res.get('bands')})
     return {'last_obs': last_obs, 'forecasts': out}
 # Example usage in pipeline:
 # series = 'FR100'
@@ -0,0 +1,214 @@
+"""LRU + TTL cache for database query results.
+
+Telegram and API users ask the same questions over and over ("yield 10 year
+2024", "average yield Q1 2023"), and each one used to re-run the same DuckDB
+query. BondDB and AuctionDB keep a QueryCache keyed on the whitespace-normalized
+SQL text and its bound parameters.
+
+The cache is bounded by the estimated size of the cached results
+(QUERY_CACHE_MAX_BYTES, default 32 MiB per database) as well as by entry count,
+and entries expire after QUERY_CACHE_TTL seconds (default 600, 0 disables
+caching). Each entry may carry a `scope` (start, end, series, tenor) so that an
+append only drops the results it can affect; unscoped entries are dropped on any
+change. A reload builds a new database instance with an empty cache.
+
+Hit/miss counters are kept per cache name for the lifetime of the process and
+are reported by `cache_stats()` (surfaced through /bot/stats).
+"""
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = int(os.environ.get("QUERY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+DEFAULT_MAX_ENTRIES = int(os.environ.get("QUERY_CACHE_MAX_ENTRIES", "1024"))
+DEFAULT_TTL = float(os.environ.get("QUERY_CACHE_TTL", "600"))
+
+Scope = Tuple[Any, Any, Optional[str], Optional[str]]
+
+_caches: "weakref.WeakSet[QueryCache]" = weakref.WeakSet()
+_counters: Dict[str, Dict[str, int]] = {}
+_counters_lock = threading.Lock()
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same query written differently shares a key."""
+    return " ".join(sql.split())
+
+
+def make_key(sql: str, params: Optional[Sequence] = None) -> Tuple[str, Tuple]:
+    return normalize_sql(sql), tuple(tuple(p) if isinstance(p, list) else p for p in (params or ()))
+
+
+def result_bytes(value: Any) -> int:
+    """Approximate in-memory size of a query result (DataFrame, arrays, rows, scalars)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray) and value.dtype == object:
+        # nbytes only counts the pointers, not the Python objects they refer to
+        return value.nbytes + sum(sys.getsizeof(v) for v in value.ravel())
+    nbytes = getattr(value, "nbytes", None)  # numpy arrays, pyarrow tables
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(result_bytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(result_bytes(k) + result_bytes(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _detach(value: Any) -> Any:
+    """Copy containers on the way out so callers cannot mutate the cached result."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _count(name: str, field: str, n: int = 1) -> None:
+    with _counters_lock:
+        counters = _counters.setdefault(name, {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0})
+        counters[field] += n
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a TTL and a byte budget."""
+
+    def __init__(self, name: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (value, nbytes, expires_at, scope)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float, Optional[Scope]]]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _caches.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, value) on a live hit, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        _count(self.name, "misses" if entry is None else "hits")
+        return (False, None) if entry is None else (True, _detach(entry[0]))
+
+    def put(self, key: Hashable, value: Any, scope: Optional[Scope] = None, generation: Optional[int] = None) -> None:
+        """Store `value`; skipped if it alone exceeds the budget or the cache was invalidated since `generation`."""
+        if not self.enabled:
+            return
+        nbytes = result_bytes(value)
+        if nbytes > self.max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, nbytes, time.monotonic() + self.ttl, scope)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            _count(self.name, "evictions", evicted)
+
+    def get_or_compute(self, sql: str, params: Optional[Sequence], compute: Callable[[], Any],
+                       scope: Optional[Scope] = None) -> Any:
+        """Cached result of `compute()` for (sql, params)."""
+        if not self.enabled:
+            return compute()
+        key = make_key(sql, params)
+        hit, value = self.get(key)
+        if hit:
+            return value
+        generation = self._generation
+        value = compute()
+        self.put(key, value, scope, generation)
+        return _detach(value)
+
+    def invalidate(self, touches: Optional[Callable[..., bool]] = None) -> int:
+        """Drop everything, or (given `touches(start, end, series, tenor)`) the affected entries.
+
+        Entries cached without a scope are always dropped. Returns the number dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            if touches is None:
+                keys = list(self._entries)
+            else:
+                keys = [k for k, e in self._entries.items() if e[3] is None or touches(*e[3])]
+            for key in keys:
+                self._drop(key)
+        if keys:
+            _count(self.name, "invalidations", len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Process-wide counters per cache name plus the size of the live caches."""
+    with _counters_lock:
+        out = {name: dict(c) for name, c in _counters.items()}
+    for cache in list(_caches):
+        s = out.setdefault(cache.name, {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0})
+        s["entries"] = s.get("entries", 0) + len(cache)
+        s["bytes"] = s.get("bytes", 0) + cache.nbytes
+    for s in out.values():
+        total = s["hits"] + s["misses"]
+        s["hit_rate"] = round(s["hits"] / total, 4) if total else None
+        s.setdefault("entries", 0)
+        s.setdefault("bytes", 0)
+    return out
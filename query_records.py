@@ -0,0 +1,210 @@
+"""Slotted, typed results of the bot's query parsers (telegram_bot's parse_*_query).
+
+The parsers used to return ad-hoc dicts. Each now returns a QueryRecord
+subclass: fields live in __slots__ (no per-instance dict, no repeated key
+strings) and string values are interned, so a corpus of parsed queries shares
+one copy of '10_year', 'yield', ... The records still read like the dicts they
+replace — req['tenor'], req.get('periods'), 'periods' in req, dict(req) and
+comparison with a dict all work — so callers did not change.
+
+A field that the parser did not set is absent, exactly like a missing key.
+"""
+import sys
+from collections.abc import Mapping
+from datetime import date
+from typing import List, Optional, Tuple
+
+
+class QueryRecord(Mapping):
+    """Base class: subclasses list their fields in __slots__ (and annotate them)."""
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for klass in reversed(cls.__mro__)
+                            for name in klass.__dict__.get("__slots__", ()))
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            if type(value) is str:
+                value = sys.intern(value)
+            elif type(value) is list and value and all(type(v) is str for v in value):
+                value = [sys.intern(v) for v in value]
+            setattr(self, name, value)  # AttributeError for a name not in __slots__
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return (name for name in self._fields if hasattr(self, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+# -- auctions -----------------------------------------------------------------
+
+class AuctionPeriod(QueryRecord):
+    __slots__ = ("type", "quarter", "month", "year")
+    type: str  # 'month' | 'quarter' | 'year'
+    quarter: int
+    month: int
+    year: int
+
+
+class AuctionTableQuery(QueryRecord):
+    __slots__ = ("metrics", "periods")
+    metrics: List[str]
+    periods: List[AuctionPeriod]
+
+
+# -- bond tables, plots and bars ---------------------------------------------
+
+class DatePeriod(QueryRecord):
+    __slots__ = ("label", "start_date", "end_date")
+    label: str
+    start_date: date
+    end_date: date
+
+
+class BondTableQuery(QueryRecord):
+    __slots__ = ("metrics", "tenors", "start_date", "end_date", "periods")
+    metrics: List[str]
+    tenors: List[str]
+    start_date: date
+    end_date: date
+    periods: List[DatePeriod]  # only for 'X vs Y' comparisons
+
+
+class BondPlotQuery(QueryRecord):
+    __slots__ = ("metric", "metrics", "tenors", "start_date", "end_date", "include_fx", "include_vix")
+    metric: str
+    metrics: List[str]
+    tenors: List[str]
+    start_date: date
+    end_date: date
+    include_fx: bool
+    include_vix: bool
+
+
+class BondBarsQuery(QueryRecord):
+    __slots__ = ("metric", "tenor", "series", "freq", "start_date", "end_date", "plot")
+    metric: str
+    tenor: Optional[str]
+    series: Optional[str]
+    freq: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+    plot: bool
+
+
+class BondReturnQuery(QueryRecord):
+    __slots__ = ("tenor", "start_date", "end_date")
+    tenor: str
+    start_date: date
+    end_date: date
+
+
+# -- econometrics ---------------------------------------------------------------
+
+class ArimaQuery(QueryRecord):
+    __slots__ = ("tenor", "order", "start_date", "end_date")
+    tenor: str
+    order: Tuple[int, ...]  # (p, d, q)
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class GarchQuery(ArimaQuery):
+    __slots__ = ()  # order is (p, q)
+
+
+class CointegrationQuery(QueryRecord):
+    __slots__ = ("variables", "start_date", "end_date")
+    variables: List[str]
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class RollingQuery(QueryRecord):
+    __slots__ = ("tenor", "predictors", "window", "start_date", "end_date")
+    tenor: str
+    predictors: Optional[List[str]]
+    window: int
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class StructuralBreakQuery(QueryRecord):
+    __slots__ = ("tenor", "break_date", "start_date", "end_date")
+    tenor: str
+    break_date: Optional[date]
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class AggregationQuery(QueryRecord):
+    __slots__ = ("tenor", "frequency", "start_date", "end_date")
+    tenor: str
+    frequency: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class RegressionQuery(QueryRecord):
+    __slots__ = ("tenor", "predictors", "start_date", "end_date")
+    tenor: str
+    predictors: Optional[List[str]]
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class GrangerQuery(QueryRecord):
+    __slots__ = ("x_var", "y_var", "start_date", "end_date")
+    x_var: str
+    y_var: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class VarQuery(QueryRecord):
+    __slots__ = ("vars", "start_date", "end_date")
+    vars: List[str]
+    start_date: Optional[date]
+    end_date: Optional[date]
+
+
+class EventStudyQuery(QueryRecord):
+    __slots__ = ("target", "event_date", "window_pre", "window_post", "estimation_window", "market", "method")
+    target: str
+    event_date: date
+    window_pre: int
+    window_post: int
+    estimation_window: int
+    market: Optional[str]
+    method: str
+
+
+# -- macro --------------------------------------------------------------------
+
+class MacroTableQuery(QueryRecord):
+    __slots__ = ("metric", "start_date", "end_date")
+    metric: str
+    start_date: date
+    end_date: date
+
+
+class MacroComparisonQuery(QueryRecord):
+    __slots__ = ("series", "start_date", "end_date")
+    series: List[str]
+    start_date: date
+    end_date: date
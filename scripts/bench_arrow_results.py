@@ -0,0 +1,110 @@
+"""Benchmark Python allocations for BondDB result conversion: tuples vs NumPy/Arrow.
+
+Pulls three years of two-tenor data the way the bot used to (fetchall() into
+tuples, list comprehensions, pd.to_datetime / pd.to_numeric) and through
+BondDB.fetch_numpy / fetch_series / fetch_arrow, reporting the memory blocks
+held by the result, peak traced memory (tracemalloc) and wall time per path.
+The result cache is disabled so every call really converts the result.
+
+Usage:
+    python scripts/bench_arrow_results.py            # synthetic 2x history (~4 years)
+    python scripts/bench_arrow_results.py --scale 4
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB, _HAS_PYARROW  # noqa: E402
+from query_cache import QueryCache  # noqa: E402
+from synthetic_bonds import write_synthetic_csv  # noqa: E402
+
+TENORS = ["05_year", "10_year"]
+ROWS_SQL = (
+    'SELECT obs_date, series, tenor, price, "yield" FROM ts '
+    "WHERE obs_date BETWEEN ? AND ? AND tenor IN (?, ?) ORDER BY obs_date, series"
+)
+DAILY_SQL = (
+    "SELECT obs_date, yield_mean FROM ts_cube "
+    "WHERE tenor = ? AND obs_date BETWEEN ? AND ? AND yield_count > 0 ORDER BY obs_date"
+)
+
+
+def legacy_pull(db, start, end):
+    rows = db.con.execute(ROWS_SQL, [start, end, *TENORS]).fetchall()
+    df = pd.DataFrame(rows, columns=["obs_date", "series", "tenor", "price", "yield"])
+    df["obs_date"] = pd.to_datetime(df["obs_date"])
+    for col in ("price", "yield"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    daily = {}
+    for tenor in TENORS:
+        res = db.con.execute(DAILY_SQL, [tenor, start, end]).fetchall()
+        dates = [r[0] for r in res]
+        vals = [r[1] for r in res]
+        daily[tenor] = pd.Series(vals, index=pd.to_datetime(dates))
+    return df, daily
+
+
+def numpy_pull(db, start, end):
+    cols = db.fetch_numpy(ROWS_SQL, [start, end, *TENORS])
+    df = pd.DataFrame(cols)
+    daily = {t: db.fetch_series(DAILY_SQL, [t, start, end]) for t in TENORS}
+    return df, daily
+
+
+def arrow_pull(db, start, end):
+    df = db.fetch_arrow(ROWS_SQL, [start, end, *TENORS]).to_pandas()
+    daily = {t: db.fetch_series(DAILY_SQL, [t, start, end]) for t in TENORS}
+    return df, daily
+
+
+def measure(fn, *args, repeat=5):
+    fn(*args)  # warm up
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn(*args)  # noqa: F841  (kept alive so its blocks are counted)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename") if s.count_diff > 0)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return blocks, peak, best * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = write_synthetic_csv(Path(tmp) / f"priceyield_x{args.scale}.csv", scale=args.scale)
+        db = BondDB(str(csv_path), snapshot=None)
+    db._query_cache = QueryCache("bench", ttl=0)
+    end = db.con.execute("SELECT MAX(obs_date) FROM ts").fetchone()[0]
+    start = (end - pd.DateOffset(years=3)).date()
+    n = db.con.execute(ROWS_SQL.replace('obs_date, series, tenor, price, "yield"', "COUNT(*)")
+                       .replace(" ORDER BY obs_date, series", ""), [start, end, *TENORS]).fetchone()[0]
+    print(f"3y two-tenor pull {start} .. {end}: {n:,} rows + 2 daily tenor series\n")
+    paths = [("fetchall + lists", legacy_pull), ("fetch_numpy", numpy_pull)]
+    if _HAS_PYARROW:
+        paths.append(("fetch_arrow", arrow_pull))
+    print(f"  {'path':<18} {'result blocks':>13} {'peak KiB':>10} {'time ms':>9}")
+    for name, fn in paths:
+        blocks, peak, ms = measure(fn, db, start, end, repeat=args.repeat)
+        print(f"  {name:<18} {blocks:>13,} {peak / 1024:>10,.0f} {ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
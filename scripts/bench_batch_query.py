@@ -0,0 +1,74 @@
+"""Benchmark a 250-date POINT panel: one /query per date vs a single /query/batch.
+
+Builds the panel a dashboard asks for (the last N business days with data, one
+tenor) three ways, in process through the ASGI app:
+
+    per-request   N x POST /query {"q": "yield 10 year <date>"}
+    batch (q)     1 x POST /query/batch {"queries": [...N questions...]}
+    batch (dates) 1 x POST /query/batch {"dates": [...], "tenors": ["10_year"]}
+
+The query result cache is disabled so every path really hits DuckDB.
+
+Usage:
+    python scripts/bench_batch_query.py
+    python scripts/bench_batch_query.py --dates 1000 --repeat 3
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import app_fastapi  # noqa: E402
+from query_cache import QueryCache  # noqa: E402
+
+
+async def run(args):
+    db = app_fastapi.get_db("20251215_priceyield.csv")
+    db._query_cache = QueryCache("bench", ttl=0)
+    last = db.con.execute("SELECT MAX(obs_date) FROM ts").fetchone()[0]
+    dates = [d.date().isoformat() for d in pd.bdate_range(end=last, periods=args.dates)]
+    questions = [f"yield 10 year {d}" for d in dates]
+
+    transport = httpx.ASGITransport(app=app_fastapi.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=600) as client:
+        async def per_request():
+            return [(await client.post("/query", json={"q": q})).json() for q in questions]
+
+        async def batch_questions():
+            return (await client.post("/query/batch", json={"queries": questions})).text
+
+        async def batch_dates():
+            return (await client.post("/query/batch", json={"dates": dates, "tenors": ["10_year"]})).text
+
+        print(f"{len(dates)}-date panel {dates[0]} .. {dates[-1]}, 10_year\n")
+        print(f"  {'path':<14} {'requests':>8} {'ms':>10} {'speedup':>8}")
+        base = None
+        for name, fn, n in [("per-request", per_request, len(dates)),
+                            ("batch (q)", batch_questions, 1),
+                            ("batch (dates)", batch_dates, 1)]:
+            await fn()  # warm up
+            best = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                await fn()
+                best = min(best, time.perf_counter() - t0)
+            base = base or best
+            print(f"  {name:<14} {n:>8,} {best * 1000:>10,.1f} {base / best:>7,.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dates", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
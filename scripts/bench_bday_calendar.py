@@ -0,0 +1,91 @@
+"""Benchmark bday_calendar against the per-date business-day checks it replaced.
+
+  scalar      one date at a time: the bot's old is_business_day (weekday test plus
+              a holiday set literal rebuilt on every call), BondMacroPlotter's
+              weekday + class-set check, and bday_calendar.is_bday (bitmap index)
+  array       a list comprehension of the old check vs is_bday(array)
+  horizon     T+1..T+5 dates: pd.bdate_range(start + BDay(1)) (weekends only)
+              vs next_bdays (weekends and holidays)
+  count       business days between many date pairs: np.busday_count per pair
+              (weekends only) vs one vectorized bday_count
+
+Usage:
+    python scripts/bench_bday_calendar.py
+    python scripts/bench_bday_calendar.py --days 100000
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bday_calendar import bday_count, is_bday, next_bdays  # noqa: E402
+from market_holidays import INDONESIA_HOLIDAYS  # noqa: E402
+
+_HOLIDAY_LIST = sorted(INDONESIA_HOLIDAYS)
+
+
+def old_is_business_day(d):
+    """The bot's former check: the holiday set was a literal inside the function."""
+    if d.weekday() == 5:
+        return False, "Saturday"
+    if d.weekday() == 6:
+        return False, "Sunday"
+    holidays = set(_HOLIDAY_LIST)
+    if d in holidays:
+        return False, "Indonesian public holiday"
+    return True, ""
+
+
+def old_plotter_check(d):
+    return d.weekday() < 5 and d not in INDONESIA_HOLIDAYS
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=20000, help="dates checked / date pairs counted")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    days = [date(2023, 1, 1) + timedelta(days=i % 1460) for i in range(args.days)]
+    arr = np.array(days, dtype="datetime64[D]")
+    assert [old_is_business_day(d)[0] for d in days] == is_bday(arr).tolist()
+
+    cases = [
+        ("scalar", "old is_business_day", lambda: [old_is_business_day(d) for d in days]),
+        ("scalar", "plotter set check", lambda: [old_plotter_check(d) for d in days]),
+        ("scalar", "is_bday(date)", lambda: [is_bday(d) for d in days]),
+        ("array", "list comprehension", lambda: np.array([old_is_business_day(d)[0] for d in days])),
+        ("array", "is_bday(array)", lambda: is_bday(arr)),
+        ("horizon", "pd.bdate_range x100",
+         lambda: [pd.bdate_range(start=pd.Timestamp(d) + pd.offsets.BDay(1), periods=5) for d in days[:100]]),
+        ("horizon", "next_bdays x100", lambda: [next_bdays(d, 5) for d in days[:100]]),
+        ("count", "np.busday_count loop", lambda: [np.busday_count(a, a + 30) for a in arr]),
+        ("count", "bday_count(array)", lambda: bday_count(arr, arr + 30)),
+    ]
+    print(f"{args.days:,} dates\n")
+    print(f"  {'case':<8} {'path':<22} {'ms':>10} {'speedup':>8}")
+    base = {}
+    for group, name, fn in cases:
+        t = best_of(fn, args.repeat)
+        base.setdefault(group, t)
+        print(f"  {group:<8} {name:<22} {t * 1000:>10,.2f} {base[group] / t:>7,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark BondDB query latency: materialized LOCF `ts` table vs the legacy correlated-subquery view.
+
+Runs the hot BondDB query shapes (POINT lookup, aggregate(), get_metric_series())
+on the bundled CSV and on synthetic 10x / 100x histories.
+
+Usage:
+    python scripts/bench_bond_locf.py            # 1x, 10x, 100x (legacy view timed up to 10x)
+    python scripts/bench_bond_locf.py --legacy-all
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB, get_metric_series  # noqa: E402
+from synthetic_bonds import write_synthetic_csv  # noqa: E402
+
+LEGACY_TS_VIEW = """
+    CREATE OR REPLACE VIEW ts AS
+    SELECT
+        tr.obs_date, tr.series, tr.tenor,
+        (SELECT r.price FROM ts_raw r
+          WHERE r.series = tr.series AND r.obs_date <= tr.obs_date AND r.price IS NOT NULL
+          ORDER BY r.obs_date DESC LIMIT 1) AS price,
+        (SELECT r."yield" FROM ts_raw r
+          WHERE r.series = tr.series AND r.obs_date <= tr.obs_date AND r."yield" IS NOT NULL
+          ORDER BY r.obs_date DESC LIMIT 1) AS "yield"
+    FROM (SELECT DISTINCT obs_date, series, tenor FROM ts_raw) tr
+    ORDER BY tr.series, tr.obs_date
+"""
+
+
+def _timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def run_queries(db, repeat):
+    point = lambda: db.con.execute(
+        'SELECT series, tenor, price, "yield" FROM ts WHERE obs_date = ? AND tenor = ?',
+        [date(2025, 6, 2).isoformat(), "10_year"],
+    ).fetchall()
+    agg = lambda: db.aggregate(date(2024, 1, 1), date(2024, 12, 31), "yield", "avg", None, "05_year")
+    series = lambda: get_metric_series(db, None, "10_year", "yield")
+    return {
+        "point": _timed(point, repeat),
+        "aggregate": _timed(agg, repeat),
+        "metric_series": _timed(series, repeat),
+    }
+
+
+def bench(csv_path, label, with_legacy, repeat):
+    t0 = time.perf_counter()
+    db = BondDB(str(csv_path))
+    load_ms = (time.perf_counter() - t0) * 1000.0
+    rows = db.con.execute("SELECT COUNT(*) FROM ts_raw").fetchone()[0]
+    new = run_queries(db, repeat)
+    print(f"\n{label}: {rows:,} rows (load + LOCF build {load_ms:,.1f} ms)")
+    legacy = None
+    if with_legacy:
+        db.con.execute("DROP TABLE ts")
+        db.con.execute(LEGACY_TS_VIEW)
+        legacy = run_queries(db, 1)
+    for name, ms in new.items():
+        old = f"{legacy[name]:>12,.1f} ms" if legacy else f"{'skipped':>15}"
+        speedup = f"{legacy[name] / ms:>8.1f}x" if legacy else ""
+        print(f"  {name:<14} table {ms:>9,.2f} ms | legacy view {old} {speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--legacy-all", action="store_true", help="also time the legacy view at 100x (very slow)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            if scale == 1:
+                csv_path = ROOT / "database" / "20251215_priceyield.csv"
+            else:
+                csv_path = write_synthetic_csv(Path(tmp) / f"priceyield_x{scale}.csv", scale=scale)
+            with_legacy = args.legacy_all or scale <= 10
+            bench(csv_path, f"{scale}x", with_legacy, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Cold-start benchmark: data loading from CSVs vs the market snapshot.
+
+Each mode runs in a fresh interpreter (like a newly started web/worker dyno) and
+loads what those processes load at startup: BondDB, AuctionDB and the macro frame.
+
+Usage:
+    python scripts/bench_cold_start.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from priceyield_20251223 import BondDB, AuctionDB
+from market_snapshot import read_frame
+t1 = time.perf_counter()
+mode = sys.argv[1]
+snap = "auto" if mode == "snapshot" else None
+BondDB("database/20251215_priceyield.csv", snapshot=snap)
+AuctionDB("database/auction_database.csv", snapshot=snap)
+if mode == "snapshot":
+    read_frame("macro")
+else:
+    from market_snapshot import read_csv_frame
+    read_csv_frame("macro")
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "load_ms": (t2 - t1) * 1000}))
+"""
+
+
+def run(mode, env, runs):
+    loads, totals = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD, mode], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        totals.append((time.perf_counter() - t0) * 1000)
+        loads.append(json.loads(out.stdout.strip().splitlines()[-1])["load_ms"])
+    return statistics.median(loads), statistics.median(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from market_snapshot import build_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap = Path(tmp) / "market.duckdb"
+        t0 = time.perf_counter()
+        build_snapshot(str(snap))
+        print(f"Snapshot build: {(time.perf_counter() - t0) * 1000:,.1f} ms ({snap.stat().st_size / 1024:,.0f} KiB)")
+
+        env = {**os.environ, "MARKET_SNAPSHOT_PATH": str(snap)}
+        print(f"{'mode':<10} {'data load (median)':>20} {'process total (median)':>24}")
+        for mode in ("csv", "snapshot"):
+            load_ms, total_ms = run(mode, env, args.runs)
+            print(f"{mode:<10} {load_ms:>17,.1f} ms {total_ms:>21,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark the load-time data-quality pass (BondDB._build_quality).
+
+Builds a synthetic history (synthetic_bonds.write_synthetic_parquet: N rows,
+10% missing values) into an in-memory BondDB and times
+  full         the whole ts_quality table, as at load
+  append       append_observations() of one new day for one series, which
+               rebuilds ts / ts_cube / ts_quality for that series only
+  append-full  the same append followed by a full ts_quality rebuild (what a
+               non-incremental pass would cost per append)
+and prints the event counts the pass found.
+
+Usage:
+    python scripts/bench_data_quality.py
+    python scripts/bench_data_quality.py --rows 5000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB  # noqa: E402
+from synthetic_bonds import write_synthetic_parquet  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = write_synthetic_parquet(Path(tmp) / "bonds", rows=args.rows, days=2500)
+        t0 = time.perf_counter()
+        db = BondDB(str(source), snapshot=None)
+        load = time.perf_counter() - t0
+
+        rows, n_series = db.con.execute("SELECT COUNT(*), COUNT(DISTINCT series) FROM ts_raw").fetchone()
+        series, tenor, last = db.con.execute(
+            "SELECT series, tenor, MAX(obs_date) FROM ts_raw GROUP BY ALL ORDER BY series LIMIT 1").fetchone()
+        print(f"{rows:,} rows, {n_series:,} series; BondDB load {load:.2f}s\n")
+
+        def full():
+            db._build_quality()
+
+        day = [last]
+
+        def append():
+            day[0] += timedelta(days=1)
+            db.append_observations([{"date": day[0], "series": series, "tenor": tenor, "price": 100.0, "yield": 6.5}])
+
+        def append_full():
+            append()
+            full()
+
+        print(f"  {'pass':<12} {'ms':>10}")
+        for name, fn in (("full", full), ("append", append), ("append-full", append_full)):
+            best = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - t0)
+            print(f"  {name:<12} {best * 1000:>10,.1f}")
+
+        print()
+        for kind, events, days in db.con.execute(
+                "SELECT kind, COUNT(*), SUM(n) FROM ts_quality GROUP BY kind ORDER BY kind").fetchall():
+            print(f"  {kind:<8} {events:>10,} events {days:>12,} days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the fit-once horizon engine against the per-date forecast loop.
+
+For "forecast <tenor> next N days" (method='all' on the bundled bond CSV):
+  per-date   the old loop, yield_forecast(series, T+k) for k = 1..N, which
+             refits ARIMA, ETS, VAR and Prophet for every horizon
+  path       yield_forecast_path(series, [T+1..T+N]), one fit per model
+Fit calls are counted by wrapping the model classes' fit methods; the two
+paths are checked to give the same numbers. Fits run inline and the fitted-model
+cache (model_cache) is cleared before each forecast, so every fit is timed.
+
+Usage:
+    python scripts/bench_forecast_horizons.py
+    python scripts/bench_forecast_horizons.py --tenor 5_year --days 10
+"""
+import argparse
+import logging
+import math
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from prophet import Prophet  # noqa: E402
+from statsmodels.tsa.api import VAR  # noqa: E402
+from statsmodels.tsa.arima.model import ARIMA  # noqa: E402
+from statsmodels.tsa.holtwinters import ExponentialSmoothing  # noqa: E402
+
+import forecast_pool  # noqa: E402
+import model_cache  # noqa: E402
+from bday_calendar import next_bdays  # noqa: E402
+from priceyield_20251223 import BondDB, get_yield_series, yield_forecast, yield_forecast_path  # noqa: E402
+
+FITS = Counter()
+
+
+def count_fits(cls, name):
+    fit = cls.fit
+
+    def counted(self, *args, **kwargs):
+        FITS[name] += 1
+        return fit(self, *args, **kwargs)
+
+    cls.fit = counted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=str(ROOT / "database" / "20251215_priceyield.csv"))
+    parser.add_argument("--tenor", default="10_year")
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    forecast_pool.FORECAST_WORKERS = 0  # fit in this process, where the fits are counted
+
+    for cls, name in ((ARIMA, "arima"), (ExponentialSmoothing, "ets"), (VAR, "var"), (Prophet, "prophet")):
+        count_fits(cls, name)
+
+    db = BondDB(args.csv, snapshot=None)
+    s = get_yield_series(db, None, args.tenor)
+    targets = [d.date() for d in next_bdays(s.index.max(), args.days)]
+    print(f"{args.tenor}: {len(s):,} obs, T+1..T+{args.days}\n")
+
+    def per_date():
+        out = []
+        for d in targets:
+            model_cache.clear()  # the old loop refitted for every horizon
+            out.append(yield_forecast(s, d, method="all"))
+        return out
+
+    def path():
+        model_cache.clear()
+        return yield_forecast_path(s, targets, method="all")
+
+    cases = (("per-date", per_date), ("path", path))
+    results = {}
+    print(f"  {'path':<10} {'ms':>10} {'speedup':>8}  fits per call")
+    base = None
+    for name, fn in cases:
+        best = float("inf")
+        for _ in range(args.repeat):
+            FITS.clear()
+            t0 = time.perf_counter()
+            results[name] = fn()
+            best = min(best, time.perf_counter() - t0)
+        base = base or best
+        fits = ", ".join(f"{m} {n}" for m, n in sorted(FITS.items()))
+        print(f"  {name:<10} {best * 1000:>10,.1f} {base / best:>7,.1f}x  {fits}")
+
+    for old, new in zip(results["per-date"], results["path"]):
+        for model, value in old.items():
+            assert (math.isclose(value, new[model], rel_tol=1e-9) if isinstance(value, float)
+                    else value == new[model]), model
+
+
+if __name__ == "__main__":
+    main()
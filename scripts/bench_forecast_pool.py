@@ -0,0 +1,89 @@
+"""Benchmark the parallel forecast ensemble (forecast_pool) against inline fits.
+
+For yield_forecast_path(method='all') on the bundled bond CSV:
+  models     each PATH_MODELS fit on its own; the ensemble's floor is the
+             slowest one, the sequential cost roughly their sum
+  inline     FORECAST_WORKERS=0, every model fitted one after another
+  pool(N)    the fits spread over N worker processes (warm pool; the first
+             call's spawn and imports are reported separately)
+The fitted-model cache is cleared before each call, so every run fits.
+Results are checked to match the inline run.
+
+Usage:
+    python scripts/bench_forecast_pool.py
+    python scripts/bench_forecast_pool.py --workers 2 4 --days 10
+"""
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import forecast_pool  # noqa: E402
+import model_cache  # noqa: E402
+from bday_calendar import next_bdays  # noqa: E402
+from priceyield_20251223 import BondDB, get_yield_series, yield_forecast_path  # noqa: E402
+from yield_forecast_models import PATH_MODELS  # noqa: E402
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=str(ROOT / "database" / "20251215_priceyield.csv"))
+    parser.add_argument("--tenor", default="10_year")
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[len(PATH_MODELS)])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    db = BondDB(args.csv, snapshot=None)
+    s = get_yield_series(db, None, args.tenor).tail(240)
+    targets = [d.date() for d in next_bdays(s.index.max(), args.days)]
+    print(f"{args.tenor}: {len(s):,} obs, T+1..T+{args.days}, {os.cpu_count()} CPUs\n")
+
+    print(f"  {'model':<10} {'ms':>10}")
+    model_ms = {m: best_of(lambda fn=fn: fn(s, targets), args.repeat) for m, fn in PATH_MODELS.items()}
+    for m, t in model_ms.items():
+        print(f"  {m:<10} {t * 1000:>10,.1f}")
+    print(f"  {'sum':<10} {sum(model_ms.values()) * 1000:>10,.1f}")
+    print(f"  {'max':<10} {max(model_ms.values()) * 1000:>10,.1f}\n")
+
+    def ensemble():
+        model_cache.clear()  # time the fits, not cache hits
+        return yield_forecast_path(s, targets)
+
+    forecast_pool.FORECAST_WORKERS = 0
+    inline = ensemble()
+    base = best_of(ensemble, args.repeat)
+    print(f"  {'ensemble':<10} {'ms':>10} {'speedup':>8}")
+    print(f"  {'inline':<10} {base * 1000:>10,.1f} {1.0:>7,.1f}x")
+    for n in args.workers:
+        forecast_pool.shutdown()
+        forecast_pool.FORECAST_WORKERS = n
+        t0 = time.perf_counter()
+        pooled = ensemble()
+        cold = time.perf_counter() - t0
+        t = best_of(ensemble, args.repeat)
+        print(f"  {f'pool({n})':<10} {t * 1000:>10,.1f} {base / t:>7,.1f}x  (first call {cold:.2f}s)")
+        for a, b in zip(inline, pooled):
+            assert all(math.isclose(a[k], b[k], rel_tol=1e-9) if isinstance(a[k], float) else a[k] == b[k]
+                       for k in a)
+    forecast_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
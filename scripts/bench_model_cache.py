@@ -0,0 +1,73 @@
+"""Benchmark the fitted-model cache (model_cache) on repeated forecast requests.
+
+Runs forecast_metric_next_days ("forecast <tenor> next N days") on the bundled
+bond CSV, inline (FORECAST_WORKERS=0) so only fitting vs cache reuse is timed:
+  cold     empty cache: ARIMA, ETS, VAR and Prophet are fitted
+  memory   the same request again: fits unpickled from the in-memory tier
+  disk     memory tier cleared, fits read from MODEL_CACHE_DIR (a temp dir),
+           as a new process or pool worker would
+Results are checked to match the cold run.
+
+Usage:
+    python scripts/bench_model_cache.py
+    python scripts/bench_model_cache.py --tenor 10_year --days 5
+"""
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import forecast_pool  # noqa: E402
+import model_cache  # noqa: E402
+from priceyield_20251223 import BondDB, forecast_metric_next_days  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=str(ROOT / "database" / "20251215_priceyield.csv"))
+    parser.add_argument("--tenor", default="05_year")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    forecast_pool.FORECAST_WORKERS = 0
+
+    db = BondDB(args.csv, snapshot=None)
+
+    def request():
+        return forecast_metric_next_days(db, args.tenor, days=args.days)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_cache.MODEL_CACHE_DIR = tmp
+        cases = (
+            ("cold", lambda: (model_cache.clear(), [p.unlink() for p in Path(tmp).glob("*.pkl")])),
+            ("memory", lambda: None),
+            ("disk", model_cache.clear),
+        )
+        want = None
+        print(f"forecast {args.tenor} next {args.days} days\n")
+        print(f"  {'cache':<8} {'ms':>10} {'speedup':>8}")
+        base = None
+        for name, reset in cases:
+            best = float("inf")
+            for _ in range(args.repeat):
+                reset()
+                t0 = time.perf_counter()
+                out = request()
+                best = min(best, time.perf_counter() - t0)
+            base = base or best
+            print(f"  {name:<8} {best * 1000:>10,.1f} {base / best:>7,.1f}x")
+            got = [f["models"] for f in out["forecasts"]]
+            want = want or got
+            assert got == want, name
+        size = sum(p.stat().st_size for p in Path(tmp).glob("*.pkl"))
+        print(f"\n  {len(list(Path(tmp).glob('*.pkl')))} fits on disk, {size / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark the vectorized Monte Carlo forecaster against the old per-path loop.
+
+Forecasts T+1..T+N for a synthetic FORECAST_WINDOW-observation yield series:
+  loop        the previous forecast_monte_carlo, one Python iteration per path
+              and one call per target date (as yield_forecast_path made them)
+  vectorized  monte_carlo_path: one (steps, sims) simulation to T+N with the
+              mean and p05..p95 bands for every date, with and without
+              antithetic variates
+and reports the T+N mean, its seed-to-seed spread and the 90% band.
+
+Usage:
+    python scripts/bench_monte_carlo.py
+    python scripts/bench_monte_carlo.py --horizon 10 --sims 100000 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import yield_forecast_models as models  # noqa: E402
+from bday_calendar import bday_range, next_bdays  # noqa: E402
+from priceyield_20251223 import FORECAST_WINDOW  # noqa: E402
+
+
+def loop_monte_carlo(series, forecast_date, sims=500, seed=42):
+    """forecast_monte_carlo before vectorization."""
+    np.random.seed(seed)
+    returns = series.pct_change().dropna()
+    mu, sigma, last_val = returns.mean(), returns.std(ddof=0), series.iloc[-1]
+    steps = max(models._bdays_between(series.index[-1], forecast_date), 1)
+    finals = []
+    for _ in range(sims):
+        shocks = np.random.normal(mu, sigma, steps)
+        finals.append(last_val * np.prod(1 + shocks))
+    return max(float(np.mean(finals)), 0.0)
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--horizon", type=int, default=5, help="business days ahead (T+1..T+N)")
+    parser.add_argument("--sims", type=int, nargs="+", default=[100_000, 1_000_000], help="vectorized path counts")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seeds", type=int, default=10, help="seeds for the spread of the T+N mean")
+    args = parser.parse_args()
+
+    idx = bday_range("2023-01-02", "2030-12-31")[:FORECAST_WINDOW]
+    rng = np.random.default_rng(0)
+    series = pd.Series(6.5 * np.cumprod(1 + rng.normal(0.0001, 0.004, len(idx))), index=idx)
+    targets = list(next_bdays(series.index[-1], args.horizon))
+    print(f"T+1..T+{args.horizon} on {len(series)} observations (best of {args.repeat})\n")
+    print(f"  {'method':<24} {'ms':>9} {'T+N mean':>9} {'spread':>9} {'p05':>8} {'p95':>8}")
+
+    ms, _ = timed(lambda: [loop_monte_carlo(series, d) for d in targets], args.repeat)
+    means = [loop_monte_carlo(series, targets[-1], seed=s) for s in range(args.seeds)]
+    print(f"  {'loop, 500':<24} {ms:>9,.1f} {np.mean(means):>9.4f} {np.std(means):>9.5f} {'-':>8} {'-':>8}")
+
+    for sims in args.sims:
+        for antithetic in (False, True):
+            label = f"vectorized, {sims:,}" + (" anti" if antithetic else "")
+            ms, path = timed(lambda: models.monte_carlo_path(series, targets, sims=sims, antithetic=antithetic),
+                             args.repeat)
+            means = [models.monte_carlo_path(series, targets[-1:], sims=sims, seed=s, antithetic=antithetic,
+                                             quantiles=())[0][0] for s in range(args.seeds)]
+            mean, bands = path[-1]
+            print(f"  {label:<24} {ms:>9,.1f} {mean:>9.4f} {np.std(means):>9.5f} "
+                  f"{bands['p05']:>8.4f} {bands['p95']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark BondDB's out-of-core mode: build and query a large history with bounded RSS.
+
+Generates a synthetic Parquet dataset (partitioned by tenor/year, see
+synthetic_bonds.write_synthetic_parquet), then in separate processes
+  build   BondDB(dataset, database=<file>, memory_limit=...) from scratch
+  query   reopen the file and run the bot's hot queries (POINT / RANGE rows,
+          aggregate, cube window, full tenor series)
+and reports wall time and peak RSS (ru_maxrss) of each process. Pass
+--in-memory to also build the same data in an in-memory BondDB for comparison
+(only sensible with a smaller --rows).
+
+Usage:
+    python scripts/bench_out_of_core.py                         # 50M rows, 512MB limit
+    python scripts/bench_out_of_core.py --rows 5000000 --in-memory
+    python scripts/bench_out_of_core.py --workdir /data/bench --keep
+"""
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic_bonds import write_synthetic_parquet  # noqa: E402
+
+
+def _rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def phase_build(dataset, database, memory_limit):
+    from priceyield_20251223 import BondDB
+    t0 = time.perf_counter()
+    db = BondDB(dataset, database=database, memory_limit=memory_limit)
+    seconds = time.perf_counter() - t0
+    rows = db.con.execute("SELECT COUNT(*) FROM ts").fetchone()[0]
+    db.close()
+    return {"seconds": seconds, "ts_rows": rows}
+
+
+def phase_query(dataset, database, memory_limit):
+    from priceyield_20251223 import BondDB
+    t0 = time.perf_counter()
+    db = BondDB(dataset, database=database, memory_limit=memory_limit)
+    open_ms = (time.perf_counter() - t0) * 1000.0
+    db._query_cache.ttl = 0  # measure the queries, not the result cache
+    hi = db.con.execute("SELECT MAX(obs_date) FROM ts").fetchone()[0]
+    month, year = hi - timedelta(days=30), hi - timedelta(days=365)
+    timings = {
+        "POINT rows (1 day)": _timed(lambda: db.slice_rows(hi, hi, ["10_year"])),
+        "RANGE rows (1 month)": _timed(lambda: db.slice_rows(month, hi, ["10_year"])),
+        "aggregate avg (1 year)": _timed(lambda: db.aggregate(year, hi, "yield", "avg", None, "10_year")),
+        "cube window (1 year)": _timed(lambda: db.cube_frame(["10_year"], year, hi)),
+        "tenor series (all)": _timed(lambda: db.tenor_series("10_year")),
+    }
+    db.close()
+    return {"open_ms": open_ms, "timings_ms": timings}
+
+
+def _run_phase(name, dataset, database, memory_limit):
+    cmd = [sys.executable, __file__, "--phase", name, "--dataset", str(dataset),
+           "--database", str(database), "--memory-limit", memory_limit]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _size_mib(path: Path) -> float:
+    files = path.rglob("*") if path.is_dir() else [path]
+    return sum(f.stat().st_size for f in files if f.is_file()) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--days", type=int, default=2500, help="business days of history")
+    parser.add_argument("--memory-limit", default="512MB")
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--keep", action="store_true", help="keep the generated dataset and database")
+    parser.add_argument("--in-memory", action="store_true", help="also build an in-memory BondDB")
+    parser.add_argument("--phase", choices=["build", "query"], help=argparse.SUPPRESS)
+    parser.add_argument("--dataset", help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        fn = phase_build if args.phase == "build" else phase_query
+        # the in-memory comparison gets no DuckDB limit: its tables must fit in RAM anyway
+        limit = None if args.database == ":memory:" else args.memory_limit
+        result = fn(args.dataset, args.database, limit)
+        result["peak_rss_mib"] = _rss_mib()
+        print(json.dumps(result))
+        return
+
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="bondooc-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    dataset, database = workdir / "dataset", workdir / "bonds.duckdb"
+    try:
+        if not dataset.exists():
+            t0 = time.perf_counter()
+            write_synthetic_parquet(dataset, args.rows, days=args.days, memory_limit=args.memory_limit)
+            print(f"generated {args.rows:,} rows in {time.perf_counter() - t0:,.0f} s")
+        print(f"dataset {_size_mib(dataset):,.0f} MiB Parquet, DuckDB memory_limit {args.memory_limit}\n")
+
+        build = _run_phase("build", dataset, database, args.memory_limit)
+        print(f"out-of-core build   {build['seconds']:>8,.1f} s   peak RSS {build['peak_rss_mib']:>7,.0f} MiB"
+              f"   ({build['ts_rows']:,} ts rows, file {_size_mib(database):,.0f} MiB)")
+        query = _run_phase("query", dataset, database, args.memory_limit)
+        print(f"reopen + queries    {query['open_ms'] / 1000:>8,.2f} s   peak RSS {query['peak_rss_mib']:>7,.0f} MiB")
+        for name, ms in query["timings_ms"].items():
+            print(f"    {name:<24} {ms:>9,.2f} ms")
+        if args.in_memory:
+            mem = _run_phase("build", dataset, ":memory:", args.memory_limit)
+            print(f"\nin-memory build     {mem['seconds']:>8,.1f} s   peak RSS {mem['peak_rss_mib']:>7,.0f} MiB")
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
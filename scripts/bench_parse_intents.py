@@ -0,0 +1,134 @@
+"""Benchmark parse throughput and per-object memory of parsed queries.
+
+Runs a synthetic corpus of bot questions (the mix a usage-log replay sees:
+points, ranges, aggregates, plots, auctions, tables) through
+
+    parse_intent              -> Intent (slotted dataclass)
+    parse_bond_plot_query     -> BondPlotQuery
+    parse_bond_table_query    -> BondTableQuery
+    parse_auction_table_query -> AuctionTableQuery
+
+and reports queries/s plus the tracemalloc bytes retained per parsed object,
+against the layouts they replaced: a plain (dict-backed) Intent dataclass and
+dict results with freshly built tenor strings.
+
+Usage:
+    python scripts/bench_parse_intents.py
+    python scripts/bench_parse_intents.py --queries 50000
+"""
+import argparse
+import copy
+import dataclasses
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import priceyield_20251223 as py  # noqa: E402
+import telegram_bot  # noqa: E402
+
+# The pre-slots Intent: same fields, ordinary instance __dict__.
+DictIntent = dataclasses.make_dataclass(
+    "DictIntent", [(f.name, f.type, f) for f in dataclasses.fields(py.Intent)])
+
+TEMPLATES = [
+    "yield {tenor} year {date}",
+    "price {series} {date}",
+    "average yield {tenor} year in {year}",
+    "max price {tenor} year Q{q} {year}",
+    "plot yield {tenor} year from {date} to {date2}",
+    "yield {tenor} and {tenor2} years {month} {year}",
+    "/kei tab yield {tenor} year {month} {year}",
+    "/kei plot yield and price {tenor} year from {month} {year} to {month2} {year}",
+    "/kei tab incoming and awarded bid from Q{q} {year} to Q4 {year}",
+]
+MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+
+
+def corpus(n, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        year = rng.randint(2019, 2025)
+        m = rng.randint(1, 11)
+        out.append(rng.choice(TEMPLATES).format(
+            tenor=rng.choice([5, 10, 15, 20]), tenor2=rng.choice([5, 10]),
+            series=f"FR{rng.randint(60, 110)}", q=rng.randint(1, 3), year=year,
+            date=f"{year}-{m:02d}-1{rng.randint(0, 9)}", date2=f"{year}-{m + 1:02d}-2{rng.randint(0, 8)}",
+            month=MONTHS[m - 1], month2=MONTHS[m]))
+    return out
+
+
+def parse_all(questions):
+    out = []
+    for q in questions:
+        if q.startswith("/kei "):
+            body = q[5:]
+            out.append(telegram_bot.parse_bond_plot_query(body)
+                       or telegram_bot.parse_bond_table_query(body)
+                       or telegram_bot.parse_auction_table_query(body))
+        else:
+            out.append(py.parse_intent(q))
+    return out
+
+
+def as_old(obj):
+    """Rebuild a parsed object in its pre-slots layout, with un-interned strings."""
+    def fresh(v):
+        if isinstance(v, str):
+            return "".join(list(v))  # a new str object, as str.format/upper() used to give
+        if isinstance(v, list):
+            return [fresh(x) for x in v]
+        if isinstance(v, (dict, telegram_bot.AuctionPeriod, telegram_bot.DatePeriod)):
+            return {k: fresh(x) for k, x in v.items()}
+        return v
+    if obj is None:
+        return None
+    if isinstance(obj, py.Intent):
+        return DictIntent(**{f.name: fresh(getattr(obj, f.name)) for f in dataclasses.fields(obj)})
+    return {k: fresh(v) for k, v in obj.items()}
+
+
+def retained(build):
+    tracemalloc.start()
+    objs = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objs, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    questions = corpus(args.queries)
+    parse_all(questions[:100])  # warm regex caches
+    best = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        parsed = parse_all(questions)
+        best = min(best, time.perf_counter() - t0)
+    print(f"{len(questions):,} questions parsed in {best * 1000:,.0f} ms "
+          f"({len(questions) / best:,.0f} queries/s)\n")
+
+    kinds = {}
+    for obj in parsed:
+        if obj is not None:
+            kinds.setdefault(type(obj).__name__, []).append(obj)
+    print(f"  {'object':<18} {'count':>7} {'old B/obj':>10} {'new B/obj':>10} {'saved':>7}")
+    for name, objs in sorted(kinds.items()):
+        old_objs, old = retained(lambda: [as_old(o) for o in objs])
+        new_objs, new = retained(lambda: copy.deepcopy(objs))
+        print(f"  {name:<18} {len(objs):>7,} {old / len(objs):>10,.0f} {new / len(objs):>10,.0f} "
+              f"{1 - new / old:>6.0%}")
+        del old_objs, new_objs
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark plot data preparation: per-series reindex/ffill vs BondDB's precomputed ts_cube.
+
+The legacy path is what generate_plot / _plot_range_to_png did before the cube:
+query ts for the window, reindex every series to daily, ffill, then average.
+The cube path reads the ready per-tenor daily vector.
+
+Usage:
+    python scripts/bench_plot_prep.py                 # 1x, 10x, 100x
+    python scripts/bench_plot_prep.py --scales 1 10
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB  # noqa: E402
+from synthetic_bonds import write_synthetic_csv  # noqa: E402
+
+
+def _timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def legacy_prep(db, start, end, metric, tenors):
+    placeholders = ",".join(["?"] * len(tenors))
+    df = db.con.execute(
+        f'SELECT obs_date, series, tenor, price, "yield" FROM ts '
+        f"WHERE obs_date BETWEEN ? AND ? AND tenor IN ({placeholders}) ORDER BY obs_date",
+        [start.isoformat(), end.isoformat(), *tenors],
+    ).fetchdf()
+    df["obs_date"] = pd.to_datetime(df["obs_date"])
+    all_dates = pd.date_range(start, end, freq="D")
+    filled = []
+    for (s, t), g in df.groupby(["series", "tenor"]):
+        g2 = g.set_index("obs_date").reindex(all_dates)
+        g2["series"] = s
+        g2["tenor"] = t
+        g2[["price", "yield"]] = g2[["price", "yield"]].ffill()
+        filled.append(g2.reset_index().rename(columns={"index": "obs_date"}))
+    filled = pd.concat(filled, ignore_index=True)
+    return filled.groupby(["obs_date", "tenor"])[metric].mean().reset_index()
+
+
+def cube_prep(db, start, end, metric, tenors):
+    cube = db.cube_frame(tenors, start, end, freq="D")
+    return cube[["obs_date", "tenor", f"{metric}_mean"]].rename(columns={f"{metric}_mean": metric})
+
+
+def bench(csv_path, label, repeat):
+    db = BondDB(str(csv_path), snapshot=None)
+    rows = db.con.execute("SELECT COUNT(*) FROM ts_raw").fetchone()[0]
+    t0 = time.perf_counter()
+    db._build_cube()
+    build_ms = (time.perf_counter() - t0) * 1000.0
+    lo, hi = db.con.execute("SELECT MIN(obs_date), MAX(obs_date) FROM ts").fetchone()
+    print(f"\n{label}: {rows:,} rows (cube build {build_ms:,.1f} ms)")
+    cases = [
+        ("1y, 1 tenor", date(hi.year - 1, hi.month, 1), hi, ["10_year"]),
+        ("1y, 2 tenors", date(hi.year - 1, hi.month, 1), hi, ["05_year", "10_year"]),
+        ("all, 2 tenors", lo, hi, ["05_year", "10_year"]),
+    ]
+    for name, start, end, tenors in cases:
+        old = _timed(lambda: legacy_prep(db, start, end, "yield", tenors), repeat)
+        new = _timed(lambda: cube_prep(db, start, end, "yield", tenors), repeat)
+        print(f"  {name:<14} per-series ffill {old:>9,.2f} ms | cube {new:>7,.2f} ms | {old / new:>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            if scale == 1:
+                csv_path = ROOT / "database" / "20251215_priceyield.csv"
+            else:
+                csv_path = write_synthetic_csv(Path(tmp) / f"priceyield_x{scale}.csv", scale=scale)
+            bench(csv_path, f"{scale}x", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
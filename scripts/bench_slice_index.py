@@ -0,0 +1,76 @@
+"""Benchmark POINT / RANGE row lookups: DuckDB SQL vs BondDB's per-tenor date index.
+
+The SQL path is what /query, /chat and /check ran before the index (a
+`WHERE obs_date BETWEEN ? AND ? AND tenor IN (...)` query on ts, result cache
+bypassed). The index path is BondDB.slice (two binary searches, array views)
+and BondDB.slice_rows (the same rows as tuples).
+
+Usage:
+    python scripts/bench_slice_index.py               # 1x, 10x, 100x
+    python scripts/bench_slice_index.py --scales 1 10
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB  # noqa: E402
+from synthetic_bonds import write_synthetic_csv  # noqa: E402
+
+SQL = ('SELECT series, tenor, obs_date, price, "yield" FROM ts '
+       "WHERE obs_date BETWEEN ? AND ? AND tenor IN (?) ORDER BY tenor, obs_date, series")
+
+
+def _timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6
+
+
+def bench(csv_path, label, repeat):
+    db = BondDB(str(csv_path), snapshot=None)
+    rows = db.con.execute("SELECT COUNT(*) FROM ts").fetchone()[0]
+    hi = db.con.execute("SELECT MAX(obs_date) FROM ts").fetchone()[0]
+    t0 = time.perf_counter()
+    db.slice("10_year")
+    build_ms = (time.perf_counter() - t0) * 1000.0
+    print(f"\n{label}: {rows:,} ts rows (10_year index build {build_ms:,.1f} ms)")
+    print(f"  {'lookup':<14} {'rows':>6} {'SQL us':>10} {'slice us':>10} {'slice_rows us':>14} {'speedup':>8}")
+    cases = [
+        ("POINT", hi, hi),
+        ("RANGE 1 month", date(hi.year, hi.month, 1), hi),
+        ("RANGE 1 year", date(hi.year - 1, hi.month, 1), hi),
+    ]
+    for name, start, end in cases:
+        n = len(db.slice_rows(start, end, ["10_year"]))
+        sql = _timed(lambda: db.con.execute(SQL, [start, end, "10_year"]).fetchall(), repeat)
+        view = _timed(lambda: db.slice("10_year", start, end), repeat)
+        tuples = _timed(lambda: db.slice_rows(start, end, ["10_year"]), repeat)
+        print(f"  {name:<14} {n:>6,} {sql:>10,.1f} {view:>10,.1f} {tuples:>14,.1f} {sql / view:>7,.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            if scale == 1:
+                csv_path = ROOT / "database" / "20251215_priceyield.csv"
+            else:
+                csv_path = write_synthetic_csv(Path(tmp) / f"priceyield_x{scale}.csv", scale=scale)
+            bench(csv_path, f"{scale}x", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark warm-started refits (yield_forecast_models.refit_model) on daily appends.
+
+Slides the FORECAST_WINDOW-observation window over a synthetic yield history one
+business day at a time, as the daily data append does, and times each model's
+fit for the new window:
+  cold   a full fit, as on a cache miss without an earlier window
+  warm   refit_model from the previous day's fit (a full fit every
+         FULL_REFIT_EVERY-th day, as scheduled)
+and reports the largest T+N forecast difference between the two.
+
+Usage:
+    python scripts/bench_warm_refit.py
+    python scripts/bench_warm_refit.py --days 20 --models arima ets
+"""
+import argparse
+import logging
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import yield_forecast_models as models  # noqa: E402
+from bday_calendar import bday_range, next_bdays  # noqa: E402
+from priceyield_20251223 import FORECAST_WINDOW  # noqa: E402
+
+
+def forecast(path_fn, fit, window, target):
+    value = path_fn(fit, window, target)[0]
+    return value[0] if isinstance(value, tuple) else value  # ARIMA: (forecast, conf_int)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=10, help="daily appends")
+    parser.add_argument("--horizon", type=int, default=5)
+    parser.add_argument("--models", nargs="+", default=sorted(models.UPDATE_MODELS))
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    n = FORECAST_WINDOW + args.days
+    idx = bday_range("2023-01-02", "2030-12-31")[:n]
+    history = pd.Series(6.5 + np.cumsum(np.random.default_rng(0).normal(0, 0.02, n)), index=idx)
+    print(f"{args.days} daily appends, window {FORECAST_WINDOW}, full refit every {models.FULL_REFIT_EVERY}\n")
+    print(f"  {'model':<8} {'cold ms':>9} {'warm ms':>9} {'speedup':>8} {'max |diff|':>11}")
+
+    for name in args.models:
+        fit_fn, path_fn = models.FITTED_MODELS[name]
+        prev = fit_fn(history.iloc[:FORECAST_WINDOW])
+        cold_t, warm_t, diff = [], [], 0.0
+        for day in range(1, args.days + 1):
+            window = history.iloc[day:FORECAST_WINDOW + day]
+            target = [next_bdays(window.index[-1], args.horizon)[-1]]
+            t0 = time.perf_counter()
+            cold = fit_fn(window)
+            cold_t.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            prev = models.refit_model(name, window, prev)
+            warm_t.append(time.perf_counter() - t0)
+            diff = max(diff, abs(forecast(path_fn, prev, window, target) - forecast(path_fn, cold, window, target)))
+        cold_ms, warm_ms = np.mean(cold_t) * 1000, np.mean(warm_t) * 1000
+        print(f"  {name:<8} {cold_ms:>9,.1f} {warm_ms:>9,.1f} {cold_ms / warm_ms:>7,.2f}x {diff:>11.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark fitting three years of daily Nelson-Siegel curves: per-date loop vs batched.
+
+The loop path is the straightforward one: group the curve points by date and
+run np.linalg.lstsq for each date. The batched path is yield_curve.fit_nelson_siegel,
+which accumulates every date's normal equations with np.bincount and solves them
+in one np.linalg.solve call. Runs on the bundled CSV (two bonds per date) and on
+a synthetic panel with --bonds bonds per business day, then times yield_at
+lookups against the cached fit.
+
+Usage:
+    python scripts/bench_yield_curve.py
+    python scripts/bench_yield_curve.py --bonds 40 --grid 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from priceyield_20251223 import BondDB  # noqa: E402
+from yield_curve import (DEFAULT_DECAY, YieldCurveStore, fit_nelson_siegel,  # noqa: E402
+                         fit_nelson_siegel_grid, ns_loadings, ns_yield)
+
+
+def _timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def loop_fit(points, decays):
+    out = {}
+    for day, g in points.groupby("obs_date", sort=True):
+        t, y = g["years"].to_numpy(), g["yield"].to_numpy()
+        k = min(len(t), 3)
+        best = None
+        for decay in decays:
+            slope, curvature = ns_loadings(t, decay)
+            X = np.column_stack([np.ones_like(t), slope, curvature])[:, :k]
+            beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+            sse = float(((X @ beta - y) ** 2).sum())
+            if best is None or sse < best[0]:
+                best = (sse, beta, decay)
+        out[day] = best
+    return out
+
+
+def batched_fit(points, decays):
+    dates, group = np.unique(points["obs_date"].to_numpy(), return_inverse=True)
+    years, yields = points["years"].to_numpy(), points["yield"].to_numpy()
+    if len(decays) == 1:
+        return fit_nelson_siegel(group, years, yields, len(dates), decays[0])
+    return fit_nelson_siegel_grid(group, years, yields, len(dates), decays)
+
+
+def synthetic_points(bonds, seed=11):
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2023-01-02", "2025-12-31")
+    level = 6.5 + np.cumsum(rng.normal(0, 0.02, len(days)))
+    beta = np.column_stack([level, np.full(len(days), -1.5), np.full(len(days), 1.0)])
+    group = np.repeat(np.arange(len(days)), bonds)
+    years = rng.uniform(0.25, 30, len(group))
+    yields = ns_yield(years, beta[group], DEFAULT_DECAY) + rng.normal(0, 0.02, len(group))
+    return pd.DataFrame({"obs_date": days[group], "years": years, "yield": yields})
+
+
+def bench(label, points, decays, repeat):
+    n_dates = points["obs_date"].nunique()
+    old = _timed(lambda: loop_fit(points, decays), repeat)
+    new = _timed(lambda: batched_fit(points, decays), repeat)
+    print(f"  {label:<28} {n_dates:>5} dates {len(points):>7,} pts | "
+          f"loop {old:>9,.1f} ms | batched {new:>7,.2f} ms | {old / new:>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bonds", type=int, default=20, help="bonds per day in the synthetic panel")
+    parser.add_argument("--grid", type=int, default=1, help="decays searched per date (1 = fixed decay)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    decays = [DEFAULT_DECAY] if args.grid == 1 else list(np.linspace(0.2, 2.0, args.grid))
+
+    db = BondDB(str(ROOT / "database" / "20251215_priceyield.csv"), snapshot=None)
+    store = YieldCurveStore(db)
+    bundled = store.points()
+    bundled = bundled[bundled["obs_date"] >= bundled["obs_date"].max() - pd.DateOffset(years=3)]
+    print(f"Nelson-Siegel fit, {len(decays)} decay(s) per date")
+    bench("bundled CSV", bundled, decays, args.repeat)
+    bench(f"synthetic, {args.bonds} bonds/day", synthetic_points(args.bonds), decays, args.repeat)
+
+    store.fit()
+    n = 20000
+    day = store.curve_date(bundled["obs_date"].iloc[-1].date())
+    t0 = time.perf_counter()
+    for _ in range(n):
+        store.yield_at(day, 7.0)
+    print(f"\nyield_at(date, 7y) on the cached fit: {(time.perf_counter() - t0) / n * 1e6:.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
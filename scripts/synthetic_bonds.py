@@ -0,0 +1,108 @@
+"""Synthetic bond price/yield data generator for benchmarks.
+
+Produces CSVs in the same layout as database/20251215_priceyield.csv
+(date DD/MM/YYYY, cusip, series, coupon, maturity_date, price, yield, tenor)
+scaled by a row multiplier relative to the bundled file, or, for out-of-core
+tests, a Parquet dataset of any size partitioned by tenor and year (generated
+inside DuckDB, so it never has to fit in memory).
+
+Usage:
+    python scripts/synthetic_bonds.py --scale 10 --out /tmp/priceyield_x10.csv
+    python scripts/synthetic_bonds.py --rows 50000000 --out /tmp/priceyield_50m   # Parquet
+"""
+import argparse
+import math
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+BASE_CSV = Path(__file__).resolve().parent.parent / "database" / "20251215_priceyield.csv"
+
+
+def synthetic_frame(scale: int = 1, seed: int = 7, null_rate: float = 0.1) -> pd.DataFrame:
+    """Return a synthetic price/yield frame with ~scale x the rows of the bundled CSV.
+
+    History length per series grows with `scale` (same series names, earlier dates),
+    which is the dimension that made the old correlated-subquery LOCF view quadratic.
+    """
+    base = pd.read_csv(BASE_CSV)
+    base["date"] = pd.to_datetime(base["date"], format="%d/%m/%Y")
+    rng = np.random.default_rng(seed)
+    span = (base["date"].max() - base["date"].min()) + pd.Timedelta(days=1)
+
+    frames = []
+    for k in range(scale):
+        chunk = base.copy()
+        chunk["date"] = chunk["date"] - k * span
+        # Perturb values so copies are not identical and sprinkle gaps for LOCF
+        chunk["price"] = chunk["price"] + rng.normal(0, 0.25, len(chunk))
+        chunk["yield"] = chunk["yield"] + rng.normal(0, 0.02, len(chunk))
+        gaps = rng.random(len(chunk)) < null_rate
+        chunk.loc[gaps, ["price", "yield"]] = np.nan
+        frames.append(chunk)
+
+    out = pd.concat(frames, ignore_index=True).sort_values(["date", "tenor"])
+    return out.reset_index(drop=True)
+
+
+def write_synthetic_csv(path, scale: int = 1, seed: int = 7) -> Path:
+    """Write a synthetic CSV with the bundled file's date format and return its path."""
+    path = Path(path)
+    df = synthetic_frame(scale=scale, seed=seed)
+    df["date"] = df["date"].dt.strftime("%d/%m/%Y")
+    df.to_csv(path, index=False)
+    return path
+
+
+def write_synthetic_parquet(path, rows: int, days: int = 2500, seed: float = 0.7,
+                            memory_limit: str = "512MB") -> Path:
+    """Write ~`rows` observations as Parquet under `path`/tenor=<t>/year=<y>/ and return `path`.
+
+    `days` business days from 2000-01-03 times ceil(rows / days) series, alternating
+    05_year / 10_year, with smooth price/yield paths and 10% missing values. The
+    columns match the CSV layout (dates typed as DATE).
+    """
+    path = Path(path)
+    n_series = max(2, math.ceil(rows / days))
+    con = duckdb.connect(config={"memory_limit": memory_limit})
+    try:
+        con.execute("SELECT setseed(?)", [seed])
+        con.execute(f"""
+            COPY (
+                WITH s AS (
+                    SELECT i, 'FR' || (1000 + i) AS series,
+                           CASE WHEN i % 2 = 0 THEN '05_year' ELSE '10_year' END AS tenor
+                    FROM range({n_series}) t(i)
+                ),
+                d AS (
+                    SELECT j, CAST(DATE '2000-01-03' + INTERVAL (j // 5 * 7 + j % 5) DAY AS DATE) AS date
+                    FROM range({days}) t(j)
+                )
+                SELECT d.date, 'ID' || s.series AS cusip, s.series, 6.0 + (s.i % 8) / 4.0 AS coupon,
+                       CAST(d.date + INTERVAL (CASE WHEN s.tenor = '05_year' THEN 5 ELSE 10 END) YEAR AS DATE)
+                           AS maturity_date,
+                       CASE WHEN random() < 0.1 THEN NULL ELSE 100 + 3 * sin((d.j + s.i) / 50.0) END AS price,
+                       CASE WHEN random() < 0.1 THEN NULL ELSE 6.5 + sin((d.j + s.i) / 70.0) END AS "yield",
+                       s.tenor, year(d.date) AS year
+                FROM d, s
+            ) TO '{path.as_posix()}' (FORMAT PARQUET, PARTITION_BY (tenor, year), OVERWRITE_OR_IGNORE)
+        """)
+    finally:
+        con.close()
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=None, help="write a Parquet dataset of this many rows instead")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+    if args.rows:
+        p = write_synthetic_parquet(args.out, rows=args.rows)
+    else:
+        p = write_synthetic_csv(args.out, scale=args.scale, seed=args.seed)
+    print(f"Wrote {p}")
@@ -1,7 +1,9 @@
 """Telegram Bot Integration for Bond Price & Yield Chatbot
 Handles incoming messages from Telegram and formats responses.
 """
+import asyncio
 import os
+import copy
 import io
 import base64
 import logging
@@ -24,6 +26,7 @@ import pandas as pd
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 try:
     import seaborn as sns
 except ImportError:
@@ -31,6 +34,30 @@ except ImportError:
 
 import priceyield_20251223 as priceyield_mod
 from priceyield_20251223 import BondDB, AuctionDB, parse_intent
+from query_records import (
+    AggregationQuery,
+    ArimaQuery,
+    AuctionPeriod,
+    AuctionTableQuery,
+    BondBarsQuery,
+    BondPlotQuery,
+    BondReturnQuery,
+    BondTableQuery,
+    CointegrationQuery,
+    DatePeriod,
+    EventStudyQuery,
+    GarchQuery,
+    GrangerQuery,
+    MacroComparisonQuery,
+    MacroTableQuery,
+    RegressionQuery,
+    RollingQuery,
+    StructuralBreakQuery,
+    VarQuery,
+)
+from data_reload import data_cache
+from market_data import get_market_store
+from bday_calendar import closed_reason
 from utils.economist_style import (
     ECONOMIST_COLORS,
     ECONOMIST_PALETTE,
@@ -111,8 +138,6 @@ except ImportError as e:
     metrics = MetricsStub()
     logger.warning(f"Could not import usage_store metrics - using stub: {e}")
 
-_db_cache: Dict[str, object] = {}
-
 
 def strip_markdown_emphasis(text: str) -> str:
     """Remove markdown bold/italic emphasis from text."""
@@ -129,136 +154,8 @@ def is_business_day(d: date) -> tuple[bool, str]:
     Returns:
         (is_business_day: bool, reason: str) where reason describes why it's not a business day
     """
-    # Check weekend (Saturday=5, Sunday=6)
-    if d.weekday() == 5:
-        return False, "Saturday"
-    if d.weekday() == 6:
-        return False, "Sunday"
-    
-    # Major Indonesian public holidays 2023-2026 (when bond markets are closed)
-    # Source: Bank Indonesia official holidays (SKB Tiga Menteri decrees)
-    indonesian_holidays = {
-        # 2023 - Official list from SKB Tiga Menteri (Government Decree)
-        # National Holidays (15 days)
-        date(2023, 1, 1),   # Tahun Baru 2023 Masehi (New Year)
-        date(2023, 1, 22),  # Tahun Baru Imlek 2574 Kongzili (Chinese New Year)
-        date(2023, 2, 18),  # Isra Mikraj Nabi Muhammad SAW
-        date(2023, 3, 22),  # Hari Suci Nyepi Tahun Baru Saka 1945
-        date(2023, 4, 7),   # Wafat Isa Almasih (Good Friday)
-        date(2023, 4, 22),  # Hari Raya Idul Fitri 1444 H
-        date(2023, 4, 23),  # Hari Raya Idul Fitri 1444 H
-        date(2023, 5, 1),   # Hari Buruh Internasional (Labor Day)
-        date(2023, 5, 18),  # Kenaikan Isa Almasih (Ascension Day)
-        date(2023, 6, 1),   # Hari Lahir Pancasila
-        date(2023, 6, 4),   # Hari Raya Waisak 2567 BE (Vesak Day)
-        date(2023, 6, 29),  # Hari Raya Idul Adha 1444 H
-        date(2023, 7, 19),  # Tahun Baru Islam 1445 H (Islamic New Year)
-        date(2023, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
-        date(2023, 9, 28),  # Maulid Nabi Muhammad SAW (Mawlid)
-        date(2023, 12, 25), # Hari Raya Natal (Christmas)
-        # Joint Leave Days - Cuti Bersama (8 days)
-        date(2023, 1, 23),  # Cuti Bersama Tahun Baru Imlek 2574 Kongzili
-        date(2023, 3, 23),  # Cuti Bersama Hari Suci Nyepi Tahun Baru Saka 1945
-        date(2023, 4, 21),  # Cuti Bersama Idul Fitri 1444 H
-        date(2023, 4, 24),  # Cuti Bersama Idul Fitri 1444 H
-        date(2023, 4, 25),  # Cuti Bersama Idul Fitri 1444 H
-        date(2023, 4, 26),  # Cuti Bersama Idul Fitri 1444 H
-        date(2023, 6, 2),   # Cuti Bersama Hari Raya Waisak 2567 BE
-        date(2023, 12, 26), # Cuti Bersama Hari Raya Natal
-        # 2024 - Official list from SKB Tiga Menteri (Government Decree)
-        # National Holidays (17 days)
-        date(2024, 1, 1),   # Tahun Baru 2024 Masehi (New Year)
-        date(2024, 2, 8),   # Isra Mikraj Nabi Muhammad SAW
-        date(2024, 2, 10),  # Tahun Baru Imlek 2575 Kongzili (Chinese New Year)
-        date(2024, 3, 11),  # Hari Suci Nyepi Tahun Baru Saka 1946
-        date(2024, 3, 29),  # Wafat Isa Almasih (Good Friday)
-        date(2024, 3, 31),  # Hari Paskah (Easter)
-        date(2024, 4, 10),  # Hari Raya Idul Fitri 1445H
-        date(2024, 4, 11),  # Hari Raya Idul Fitri 1445H
-        date(2024, 5, 1),   # Hari Buruh Internasional (Labor Day)
-        date(2024, 5, 9),   # Kenaikan Yesus Kristus (Ascension Day)
-        date(2024, 5, 23),  # Hari Raya Waisak 2568 BE (Vesak Day)
-        date(2024, 6, 1),   # Hari Lahir Pancasila
-        date(2024, 6, 17),  # Hari Raya Idul Adha 1445H
-        date(2024, 7, 7),   # Tahun Baru Islam 1446H (Islamic New Year)
-        date(2024, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
-        date(2024, 9, 16),  # Maulid Nabi Muhammad SAW (Mawlid)
-        date(2024, 12, 25), # Hari Raya Natal (Christmas)
-        # Joint Leave Days - Cuti Bersama (10 days)
-        date(2024, 2, 9),   # Cuti Bersama Tahun Baru Imlek 2575 Kongzili
-        date(2024, 3, 12),  # Cuti Bersama Hari Suci Nyepi Tahun Baru Saka 1946
-        date(2024, 4, 8),   # Cuti Bersama Idul Fitri 1445H
-        date(2024, 4, 9),   # Cuti Bersama Idul Fitri 1445H
-        date(2024, 4, 12),  # Cuti Bersama Idul Fitri 1445H
-        date(2024, 4, 15),  # Cuti Bersama Idul Fitri 1445H
-        date(2024, 5, 10),  # Cuti Bersama Kenaikan Yesus Kristus
-        date(2024, 5, 24),  # Cuti Bersama Hari Raya Waisak 2568 BE
-        date(2024, 6, 18),  # Cuti Bersama Idul Adha 1445H
-        date(2024, 12, 26), # Cuti Bersama Hari Raya Natal
-        # 2025 - Official list from SKB Tiga Menteri (Government Decree)
-        # National Holidays (17 days)
-        date(2025, 1, 1),   # Tahun Baru 2025 Masehi (New Year)
-        date(2025, 1, 27),  # Isra Mikraj Nabi Muhammad SAW
-        date(2025, 1, 29),  # Tahun Baru Imlek 2576 Kongzili (Chinese New Year)
-        date(2025, 3, 29),  # Hari Suci Nyepi (Tahun Baru Saka 1947)
-        date(2025, 3, 31),  # Idul Fitri 1446 Hijriah
-        date(2025, 4, 1),   # Idul Fitri 1446 Hijriah
-        date(2025, 4, 18),  # Wafat Yesus Kristus (Good Friday)
-        date(2025, 4, 20),  # Kebangkitan Yesus Kristus (Paskah/Easter)
-        date(2025, 5, 1),   # Hari Buruh Internasional (Labor Day)
-        date(2025, 5, 12),  # Hari Raya Waisak 2569 BE (Vesak Day)
-        date(2025, 5, 29),  # Kenaikan Yesus Kristus (Ascension Day)
-        date(2025, 6, 1),   # Hari Lahir Pancasila
-        date(2025, 6, 6),   # Idul Adha 1446 Hijriah
-        date(2025, 6, 27),  # 1 Muharam Tahun Baru Islam 1447 Hijriah
-        date(2025, 8, 17),  # Proklamasi Kemerdekaan (Independence Day)
-        date(2025, 9, 5),   # Maulid Nabi Muhammad SAW (Mawlid)
-        date(2025, 12, 25), # Kelahiran Yesus Kristus (Hari Natal/Christmas)
-        # Joint Leave Days - Cuti Bersama (10 days)
-        date(2025, 1, 28),  # Cuti Bersama Tahun Baru Imlek 2576 Kongzili
-        date(2025, 3, 28),  # Cuti Bersama Hari Suci Nyepi
-        date(2025, 4, 2),   # Cuti Bersama Idul Fitri 1446 Hijriah
-        date(2025, 4, 3),   # Cuti Bersama Idul Fitri 1446 Hijriah
-        date(2025, 4, 4),   # Cuti Bersama Idul Fitri 1446 Hijriah
-        date(2025, 4, 7),   # Cuti Bersama Idul Fitri 1446 Hijriah
-        date(2025, 5, 13),  # Cuti Bersama Hari Raya Waisak 2569 BE
-        date(2025, 5, 30),  # Cuti Bersama Kenaikan Yesus Kristus
-        date(2025, 6, 9),   # Cuti Bersama Idul Adha 1446 Hijriah
-        date(2025, 12, 26), # Cuti Bersama Kelahiran Yesus Kristus (Hari Natal)
-        # 2026 - Official list from SKB Tiga Menteri (Government Decree)
-        # National Holidays (17 days)
-        date(2026, 1, 1),   # Tahun Baru Masehi (New Year)
-        date(2026, 1, 16),  # Isra & Mi'raj Nabi Muhammad SAW
-        date(2026, 2, 17),  # Tahun Baru Imlek 2577 Kongzili (Chinese New Year)
-        date(2026, 3, 19),  # Hari Suci Nyepi
-        date(2026, 3, 21),  # Hari Raya Idul Fitri 1447 H
-        date(2026, 3, 22),  # Hari Raya Idul Fitri 1447 H
-        date(2026, 4, 3),   # Wafat Yesus Kristus (Good Friday)
-        date(2026, 4, 5),   # Paskah (Easter)
-        date(2026, 5, 1),   # Hari Buruh Internasional (Labor Day)
-        date(2026, 5, 14),  # Kenaikan Yesus Kristus (Ascension Day)
-        date(2026, 5, 27),  # Idul Adha 1447 H
-        date(2026, 5, 31),  # Hari Raya Waisak 2570 BE (Vesak Day)
-        date(2026, 6, 1),   # Hari Lahir Pancasila
-        date(2026, 6, 16),  # Tahun Baru Islam 1448 H (Islamic New Year)
-        date(2026, 8, 17),  # Hari Kemerdekaan RI (Independence Day)
-        date(2026, 8, 25),  # Maulid Nabi Muhammad SAW (Mawlid)
-        date(2026, 12, 25), # Hari Raya Natal (Christmas)
-        # Joint Leave Days - Cuti Bersama (8 days)
-        date(2026, 2, 16),  # Cuti Bersama Tahun Baru Imlek
-        date(2026, 3, 18),  # Cuti Bersama Hari Suci Nyepi
-        date(2026, 3, 20),  # Cuti Bersama Idul Fitri 1447 H
-        date(2026, 3, 23),  # Cuti Bersama Idul Fitri 1447 H
-        date(2026, 3, 24),  # Cuti Bersama Idul Fitri 1447 H
-        date(2026, 5, 15),  # Cuti Bersama Kenaikan Yesus Kristus
-        date(2026, 5, 28),  # Cuti Bersama Idul Adha 1447 H
-        date(2026, 12, 24), # Cuti Bersama Natal
-    }
-    
-    if d in indonesian_holidays:
-        return False, "Indonesian public holiday"
-    
-    return True, ""
+    reason = closed_reason(d)
+    return not reason, reason
 
 
 def strip_emoji_from_identity_response(text: str) -> str:
@@ -410,63 +307,22 @@ def is_user_authorized(user_id: int) -> bool:
 
 
 def get_db(csv_path: str = "database/20251215_priceyield.csv") -> BondDB:
-    """Get or create a cached BondDB instance."""
-    if csv_path not in _db_cache:
-        _db_cache[csv_path] = BondDB(csv_path)
-    return _db_cache[csv_path]
+    """Get or create a cached BondDB instance (hot-reloaded when the CSV changes)."""
+    key = os.path.abspath(csv_path)
+    ticks = os.environ.get("BOND_TICKS_PATH")
+    return data_cache.get(f"bond:{key}", lambda: BondDB(key), [key, ticks] if ticks else [key])
 
 def get_auction_db(csv_path: str = "database/auction_database.csv"):
-    """Get or create a cached AuctionDB instance."""
-    cache_key = f"auction_{csv_path}"
-    if cache_key not in _db_cache:
-        _db_cache[cache_key] = AuctionDB(csv_path)
-    return _db_cache[cache_key]
+    """Get or create a cached AuctionDB instance (hot-reloaded when the CSV changes)."""
+    key = os.path.abspath(csv_path)
+    return data_cache.get(f"auction:{key}", lambda: AuctionDB(key), [key])
 
 
 def get_historical_auction_data(year: int, quarter: int) -> Optional[Dict]:
     """Load historical auction data from database/auction_database.csv for a specific quarter."""
     try:
-        df = pd.read_csv('database/auction_database.csv')
-        
-        # Map quarter to months
-        quarter_months = {1: [1, 2, 3], 2: [4, 5, 6], 3: [7, 8, 9], 4: [10, 11, 12]}
-        months = quarter_months.get(quarter, [])
-        
-        # Filter for specific year and quarter
-        mask = (df['auction_year'] == year) & (df['auction_month'].isin(months))
-        quarter_data = df[mask]
-        
-        if quarter_data.empty:
-            return None
-        
-        # Calculate totals (incoming_trillions and awarded_trillions are already in trillions)
-        monthly_incoming = []
-        monthly_btc = []
-        total_awarded = 0.0
-        
-        for _, row in quarter_data.iterrows():
-            incoming_trillions = row['incoming_trillions'] if pd.notnull(row['incoming_trillions']) else 0.0
-            awarded_trillions = row['awarded_trillions'] if pd.notnull(row['awarded_trillions']) else 0.0
-            monthly_incoming.append({
-                'month': int(row['auction_month']),
-                'incoming': incoming_trillions,
-                'awarded': awarded_trillions,
-                'bid_to_cover': row['bid_to_cover'] if pd.notnull(row['bid_to_cover']) else 0.0
-            })
-            monthly_btc.append(row['bid_to_cover'] if pd.notnull(row['bid_to_cover']) else 0.0)
-            total_awarded += awarded_trillions
-        
-        total_incoming = sum(m['incoming'] for m in monthly_incoming)
-        avg_btc = sum(monthly_btc) / len(monthly_btc) if monthly_btc else 0
-        
-        return {
-            'year': year,
-            'quarter': quarter,
-            'monthly': monthly_incoming,
-            'total_incoming': total_incoming,
-            'total_awarded': total_awarded,
-            'avg_bid_to_cover': avg_btc
-        }
+        data = get_market_store().auction_rollups.quarters.get((int(year), int(quarter)))
+        return copy.deepcopy(data) if data else None
     except Exception as e:
         logger.error(f"Error loading historical auction data: {e}")
         return None
@@ -475,36 +331,8 @@ def get_historical_auction_data(year: int, quarter: int) -> Optional[Dict]:
 def get_historical_auction_month_data(year: int, month: int) -> Optional[Dict]:
     """Load historical auction data from database/auction_database.csv for a specific month."""
     try:
-        df = pd.read_csv('database/auction_database.csv')
-        mask = (df['auction_year'] == year) & (df['auction_month'] == month)
-        month_data = df[mask]
-        if month_data.empty:
-            return None
-        # Single month aggregate (incoming_trillions and awarded_trillions already in trillions)
-        incoming_vals = []
-        awarded_vals = []
-        btc_vals = []
-        for _, row in month_data.iterrows():
-            incoming_vals.append(row['incoming_trillions'] if pd.notnull(row['incoming_trillions']) else 0.0)
-            awarded_vals.append(row['awarded_trillions'] if pd.notnull(row['awarded_trillions']) else 0.0)
-            btc_vals.append(row['bid_to_cover'] if pd.notnull(row['bid_to_cover']) else 0.0)
-        total_incoming = sum(incoming_vals)
-        total_awarded = sum(awarded_vals)
-        avg_btc = sum(btc_vals) / len(btc_vals) if btc_vals else 0
-        return {
-            'type': 'month',
-            'year': year,
-            'month': int(month),
-            'monthly': [{
-                'month': int(month),
-                'incoming': total_incoming,
-                'awarded': total_awarded,
-                'bid_to_cover': avg_btc
-            }],
-            'total_incoming': total_incoming,
-            'total_awarded': total_awarded,
-            'avg_bid_to_cover': avg_btc,
-        }
+        data = get_market_store().auction_rollups.months.get((int(year), int(month)))
+        return copy.deepcopy(data) if data else None
     except Exception as e:
         logger.error(f"Error loading historical auction month data: {e}")
         return None
@@ -513,36 +341,8 @@ def get_historical_auction_month_data(year: int, month: int) -> Optional[Dict]:
 def get_historical_auction_year_data(year: int) -> Optional[Dict]:
     """Load historical auction data from database/auction_database.csv for a year (sum of months)."""
     try:
-        df = pd.read_csv('database/auction_database.csv')
-        year_df = df[df['auction_year'] == year]
-        if year_df.empty:
-            return None
-        monthly_vals = {}
-        btc_vals = []
-        for _, row in year_df.iterrows():
-            m = int(row['auction_month'])
-            monthly_vals.setdefault(m, {'incoming': 0.0, 'awarded': 0.0, 'btc_items': []})
-            monthly_vals[m]['incoming'] += row['incoming_trillions'] if pd.notnull(row['incoming_trillions']) else 0.0
-            monthly_vals[m]['awarded'] += row['awarded_trillions'] if pd.notnull(row['awarded_trillions']) else 0.0
-            btc = row['bid_to_cover'] if pd.notnull(row['bid_to_cover']) else 0.0
-            monthly_vals[m]['btc_items'].append(btc)
-            btc_vals.append(btc)
-        monthly = []
-        for m in sorted(monthly_vals.keys()):
-            items = monthly_vals[m]
-            avg_btc_m = sum(items['btc_items']) / len(items['btc_items']) if items['btc_items'] else 0
-            monthly.append({'month': m, 'incoming': items['incoming'], 'awarded': items['awarded'], 'bid_to_cover': avg_btc_m})
-        total_incoming = sum(x['incoming'] for x in monthly)
-        total_awarded = sum(x['awarded'] for x in monthly)
-        avg_btc = sum(btc_vals) / len(btc_vals) if btc_vals else 0
-        return {
-            'type': 'year',
-            'year': year,
-            'monthly': monthly,
-            'total_incoming': total_incoming,
-            'total_awarded': total_awarded,
-            'avg_bid_to_cover': avg_btc,
-        }
+        data = get_market_store().auction_rollups.years.get(int(year))
+        return copy.deepcopy(data) if data else None
     except Exception as e:
         logger.error(f"Error loading historical auction year data: {e}")
         return None
@@ -571,6 +371,42 @@ def _get_forecast_note(periods_data: List[Dict]) -> str:
     return ""
 
 
+def _forecast_period_result(period: Dict, forecast_rows: List[Dict]) -> Dict:
+    """Standardized period dict (see load_auction_period) from AuctionDB rows."""
+    kind = period['type']
+    monthly_data = []
+    total_incoming = 0.0
+    total_awarded = 0.0
+    btc_vals = []
+    for row in forecast_rows:
+        m = int(row['auction_month'])
+        inc = float(row['incoming_billions'])
+        awd = float(row['awarded_billions']) if row.get('awarded_billions') is not None else None
+        btc = float(row['bid_to_cover']) if row.get('bid_to_cover') is not None else 0.0
+        md = {'month': m, 'incoming': inc, 'bid_to_cover': btc}
+        if awd is not None:
+            md['awarded'] = awd
+            total_awarded += awd
+        monthly_data.append(md)
+        total_incoming += inc
+        btc_vals.append(btc)
+    avg_btc = sum(btc_vals) / len(btc_vals) if btc_vals else 0.0
+    result = {
+        'type': kind,
+        'year': int(period['year']),
+        'monthly': sorted(monthly_data, key=lambda x: x['month']),
+        'total_incoming': total_incoming,
+        'avg_bid_to_cover': avg_btc,
+    }
+    if total_awarded > 0.0:
+        result['total_awarded'] = total_awarded
+    if kind == 'month':
+        result['month'] = int(period['month'])
+    if kind == 'quarter':
+        result['quarter'] = int(period['quarter'])
+    return result
+
+
 def load_auction_period(period: Dict) -> Optional[Dict]:
     """Load auction period data, preferring forecast (AuctionDB) and falling back to historical train CSV.
     period: {'type': 'month'|'quarter'|'year', 'year': int, 'month'?: int, 'quarter'?: int}
@@ -602,50 +438,9 @@ def load_auction_period(period: Dict) -> Optional[Dict]:
             if historical:
                 return historical
 
-        auction_db = get_auction_db()
-
-        forecast_rows = []
-        for m in months:
-            intent_obj = type('obj', (object,), {
-                'start_date': date(year, m, 1),
-                'end_date': date(year, m, 28)
-            })()
-            rows = auction_db.query_forecast(intent_obj)
-            if rows:
-                forecast_rows.extend(rows)
-
+        forecast_rows = get_auction_db().get_periods([(year, m) for m in months])
         if forecast_rows:
-            monthly_data = []
-            total_incoming = 0.0
-            total_awarded = 0.0
-            btc_vals = []
-            for row in forecast_rows:
-                m = int(row['auction_month'])
-                inc = float(row['incoming_billions'])
-                awd = float(row['awarded_billions']) if row.get('awarded_billions') is not None else None
-                btc = float(row['bid_to_cover']) if row.get('bid_to_cover') is not None else 0.0
-                md = {'month': m, 'incoming': inc, 'bid_to_cover': btc}
-                if awd is not None:
-                    md['awarded'] = awd
-                    total_awarded += awd
-                monthly_data.append(md)
-                total_incoming += inc
-                btc_vals.append(btc)
-            avg_btc = sum(btc_vals) / len(btc_vals) if btc_vals else 0.0
-            result = {
-                'type': kind,
-                'year': year,
-                'monthly': sorted(monthly_data, key=lambda x: x['month']),
-                'total_incoming': total_incoming,
-                'avg_bid_to_cover': avg_btc,
-            }
-            if total_awarded > 0.0:
-                result['total_awarded'] = total_awarded
-            if kind == 'month':
-                result['month'] = months[0]
-            if kind == 'quarter':
-                result['quarter'] = int(period['quarter'])
-            return result
+            return _forecast_period_result(period, forecast_rows)
 
         # Fallback to historical
         if kind == 'month':
@@ -660,6 +455,42 @@ def load_auction_period(period: Dict) -> Optional[Dict]:
         return None
 
 
+def load_auction_periods(periods: List[Dict]) -> List[Optional[Dict]]:
+    """Batch load_auction_period: one result per period (None if no data).
+
+    Months are resolved together: historical ones from the precomputed auction
+    rollups, the rest with a single AuctionDB.get_periods call. Quarters and
+    years go through load_auction_period.
+    """
+    results: List[Optional[Dict]] = [None] * len(periods)
+    months = {i: (int(p['year']), int(p['month'])) for i, p in enumerate(periods) if p.get('type') == 'month'}
+    for i, p in enumerate(periods):
+        if i not in months:
+            results[i] = load_auction_period(p)
+    if not months:
+        return results
+    try:
+        this_year = date.today().year
+        wanted = {ym for ym in months.values() if ym[0] <= this_year}
+        rollups = get_market_store().auction_rollups.months
+        historical = {ym: rollups[ym] for ym in wanted if ym in rollups}
+        missing = sorted({ym for ym in months.values() if ym not in historical})
+        forecast = {}
+        if missing:
+            for row in get_auction_db().get_periods(missing):
+                forecast.setdefault((int(row['auction_year']), int(row['auction_month'])), []).append(row)
+        for i, (y, m) in months.items():
+            if (y, m) in historical:
+                results[i] = copy.deepcopy(historical[(y, m)])
+            elif (y, m) in forecast:
+                results[i] = _forecast_period_result(periods[i], forecast[(y, m)])
+    except Exception as e:
+        logger.error(f"Error loading auction periods: {e}")
+        for i in months:
+            results[i] = load_auction_period(periods[i])
+    return results
+
+
 def get_2026_demand_forecast(use_cache: bool = True) -> Optional[Dict]:
     """
     Load 2026 auction demand forecast from auction_database.csv.
@@ -671,13 +502,10 @@ def get_2026_demand_forecast(use_cache: bool = True) -> Optional[Dict]:
         Dictionary with monthly forecasts and totals, or None if error
     """
     try:
-        # Load the unified auction database (includes 2026 forecast)
-        df = pd.read_csv('database/auction_database.csv')
-        
-        # Filter for 2026 records only
-        df_2026 = df[df['auction_year'] == 2026].copy()
+        # Rows of the unified auction database for 2026 (the ensemble forecast)
+        rows_2026 = get_market_store().auction_rollups.incoming_by_year.get(2026, [])
         
-        if df_2026.empty:
+        if not rows_2026:
             logger.error("No 2026 forecast data found in auction_database.csv")
             return None
         
@@ -685,9 +513,7 @@ def get_2026_demand_forecast(use_cache: bool = True) -> Optional[Dict]:
         monthly_forecasts = []
         total_incoming_trillions = 0.0
         
-        for _, row in df_2026.iterrows():
-            month = int(row['auction_month'])
-            incoming_trillions = row['incoming_trillions']
+        for month, incoming_trillions in rows_2026:
             incoming_billions = incoming_trillions * 1000.0 if pd.notnull(incoming_trillions) else 0.0
             total_incoming_trillions += incoming_trillions if pd.notnull(incoming_trillions) else 0.0
             
@@ -698,7 +524,7 @@ def get_2026_demand_forecast(use_cache: bool = True) -> Optional[Dict]:
             })
         
         # Calculate average monthly
-        avg_monthly_billions = (total_incoming_trillions * 1000.0 / 12) if df_2026.shape[0] == 12 else 0.0
+        avg_monthly_billions = (total_incoming_trillions * 1000.0 / 12) if len(rows_2026) == 12 else 0.0
         
         # Construct metrics from individual model columns
         metrics = {
@@ -801,7 +627,7 @@ def format_auction_metrics_table(periods_data: List[Dict], metrics: List[str], g
 ```"""
 
 
-def parse_auction_table_query(q: str) -> Optional[Dict]:
+def parse_auction_table_query(q: str) -> Optional[AuctionTableQuery]:
     """Parse 'tab incoming/awarded bid ...' queries into metrics and periods.
     Also supports 'incoming bid in from ...' patterns without 'tab' keyword.
     Returns {'metrics': [..], 'periods': [period_dict,...]} or None.
@@ -850,48 +676,48 @@ def parse_auction_table_query(q: str) -> Optional[Dict]:
         m = re.match(r'^q(\d)\s+(\d{4})$', text)
         if m:
             qn, yr = map(int, m.groups())
-            return {'type': 'quarter', 'quarter': qn, 'year': yr}
+            return AuctionPeriod(type='quarter', quarter=qn, year=yr)
         m = re.match(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec|\d{1,2})\s+(\d{4})$', text)
         if m:
             mo, yr = m.groups()
             mo = months_map[mo] if mo in months_map else int(mo)
-            return {'type': 'month', 'month': mo, 'year': int(yr)}
+            return AuctionPeriod(type='month', month=mo, year=int(yr))
         m = re.match(r'^(\d{4})$', text)
         if m:
-            return {'type': 'year', 'year': int(m.group(1))}
+            return AuctionPeriod(type='year', year=int(m.group(1)))
         return None
 
-    def expand_quarter_range(start: Dict, end: Dict) -> List[Dict]:
+    def expand_quarter_range(start: AuctionPeriod, end: AuctionPeriod) -> List[AuctionPeriod]:
         """Expand a quarter range to include all quarters between start and end."""
         periods = []
         year = start['year']
         quarter = start['quarter']
         while (year < end['year']) or (year == end['year'] and quarter <= end['quarter']):
-            periods.append({'type': 'quarter', 'quarter': quarter, 'year': year})
+            periods.append(AuctionPeriod(type='quarter', quarter=quarter, year=year))
             quarter += 1
             if quarter > 4:
                 quarter = 1
                 year += 1
         return periods
 
-    def expand_month_range(start: Dict, end: Dict) -> List[Dict]:
+    def expand_month_range(start: AuctionPeriod, end: AuctionPeriod) -> List[AuctionPeriod]:
         """Expand a month range to include all months between start and end."""
         periods = []
         current = date(start['year'], start['month'], 1)
         end_date = date(end['year'], end['month'], 1)
         while current <= end_date:
-            periods.append({'type': 'month', 'month': current.month, 'year': current.year})
+            periods.append(AuctionPeriod(type='month', month=current.month, year=current.year))
             current += relativedelta(months=1)
         return periods
 
-    def expand_year_range(start: Dict, end: Dict) -> List[Dict]:
+    def expand_year_range(start: AuctionPeriod, end: AuctionPeriod) -> List[AuctionPeriod]:
         """Expand a year range to include all years between start and end."""
         periods = []
         for year in range(start['year'], end['year'] + 1):
-            periods.append({'type': 'year', 'year': year})
+            periods.append(AuctionPeriod(type='year', year=year))
         return periods
 
-    periods: List[Dict] = []
+    periods: List[AuctionPeriod] = []
     # "from X to Y" pattern
     from_match = re.search(r'from\s+(.+?)\s+to\s+(.+)$', q)
     if from_match:
@@ -908,7 +734,7 @@ def parse_auction_table_query(q: str) -> Optional[Dict]:
             else:
                 # Mixed types - just use endpoints
                 periods = [p1, p2]
-            return {'metrics': metrics, 'periods': periods}
+            return AuctionTableQuery(metrics=metrics, periods=periods)
     # "X to Y" pattern (without explicit 'from')
     to_match = re.search(r'(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))\s+to\s+(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))', q)
     if to_match:
@@ -927,7 +753,7 @@ def parse_auction_table_query(q: str) -> Optional[Dict]:
             else:
                 # Mixed types - just use endpoints
                 periods = [p1, p2]
-            return {'metrics': metrics, 'periods': periods}
+            return AuctionTableQuery(metrics=metrics, periods=periods)
     # in X and Y
     m_and = re.search(r'in\s+(.+?)\s+and\s+(.+)$', q)
     if m_and:
@@ -944,21 +770,21 @@ def parse_auction_table_query(q: str) -> Optional[Dict]:
             else:
                 # Mixed types or incompatible - just use both
                 periods = [p1, p2]
-            return {'metrics': metrics, 'periods': periods}
+            return AuctionTableQuery(metrics=metrics, periods=periods)
     # single in X
     m_in = re.search(r'in\s+(.+)$', q)
     if m_in:
         p1 = parse_one_period(m_in.group(1))
         if p1:
             periods = [p1]
-            return {'metrics': metrics, 'periods': periods}
+            return AuctionTableQuery(metrics=metrics, periods=periods)
     # fallback year-to-year without explicit 'in'
     m_years = re.findall(r'\b(\d{4})\b', q)
     if m_years and 'from' not in q and 'in' not in q:
         years = [int(y) for y in m_years][:3]
         if len(years) >= 2:
-            periods = [{'type': 'year', 'year': y} for y in years]
-            return {'metrics': metrics, 'periods': periods}
+            periods = [AuctionPeriod(type='year', year=y) for y in years]
+            return AuctionTableQuery(metrics=metrics, periods=periods)
     return None
 
 
@@ -1055,7 +881,7 @@ def format_auction_comparison_general(periods_data: List[Dict]) -> str:
     return "\n".join(lines)
 
 
-def parse_auction_compare_query(q: str) -> Optional[List[Dict]]:
+def parse_auction_compare_query(q: str) -> Optional[List[AuctionPeriod]]:
     """Parse flexible 'compare auction ... vs ...' queries.
     Supports: months (name/number), quarters, years, with 2+ periods (years up to 3).
     Returns list of period dicts or None.
@@ -1067,8 +893,8 @@ def parse_auction_compare_query(q: str) -> Optional[List[Dict]]:
     if m_q:
         q1, y1, q2, y2 = map(int, m_q.groups())
         return [
-            {'type': 'quarter', 'quarter': q1, 'year': y1},
-            {'type': 'quarter', 'quarter': q2, 'year': y2},
+            AuctionPeriod(type='quarter', quarter=q1, year=y1),
+            AuctionPeriod(type='quarter', quarter=q2, year=y2),
         ]
     # Months: names or numeric
     months_map = {
@@ -1091,15 +917,15 @@ def parse_auction_compare_query(q: str) -> Optional[List[Dict]]:
         def _to_month(x):
             return months_map[x] if x in months_map else int(x)
         return [
-            {'type': 'month', 'month': _to_month(a1), 'year': int(y1)},
-            {'type': 'month', 'month': _to_month(a2), 'year': int(y2)},
+            AuctionPeriod(type='month', month=_to_month(a1), year=int(y1)),
+            AuctionPeriod(type='month', month=_to_month(a2), year=int(y2)),
         ]
     # Years: allow 2 or 3
     m_y = re.findall(r'\b(\d{4})\b', q)
     if m_y and 'vs' in q:
         years = [int(y) for y in m_y][:3]
         if len(years) >= 2:
-            return [{'type': 'year', 'year': y} for y in years]
+            return [AuctionPeriod(type='year', year=y) for y in years]
     return None
 
 
@@ -1156,7 +982,7 @@ def format_auction_historical_multi_year(start_year: int, end_year: int, dual_mo
         dual_mode: If True, use "Kei x Kin" signature (for /both command)
     """
     try:
-        df = pd.read_csv('database/auction_database.csv')
+        df = get_market_store().auction_frame()
         df['date'] = pd.to_datetime(df['date'], errors='coerce')
         df['year'] = df['date'].dt.year
         
@@ -1223,7 +1049,7 @@ def format_auction_historical_multi_year(start_year: int, end_year: int, dual_mo
         return f"❌ Error loading auction data: {e}"
 
 
-def parse_bond_table_query(q: str) -> Optional[Dict]:
+def parse_bond_table_query(q: str) -> Optional[BondTableQuery]:
     """Parse '/kei tab' bond table queries for yield/price data.
     Supported patterns:
     - '/kei tab yield 5 year in jan 2025'
@@ -1234,7 +1060,7 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
     - '/kei tab yield and price 5 year in feb 2025'
     - 'compare yield 5 and 10 year 2024 vs 2025' (for /both)
     
-    Returns dict: {'metrics': ['yield'|'price'|both], 'tenors': ['05_year','10_year'], 
+    Returns BondTableQuery: {'metrics': ['yield'|'price'|both], 'tenors': ['05_year','10_year'], 
                    'start_date': date, 'end_date': date} or None
     """
     q = q.lower()
@@ -1346,12 +1172,12 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=start_res[0],
+                end_date=end_res[1],
+            )
 
     # "X to Y" pattern (without explicit 'from')
     to_match = re.search(r'(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))\s+to\s+(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))', q)
@@ -1361,12 +1187,12 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=start_res[0],
+                end_date=end_res[1],
+            )
     
     # "in X" pattern (single period)
     in_match = re.search(r'in\s+(.+)$', q)
@@ -1374,12 +1200,12 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
         period_spec = in_match.group(1).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=period_res[0],
+                end_date=period_res[1],
+            )
     
     # "date-range vs date-range" pattern (e.g., "1 sep 2025 to 7 sep 2025 vs 8 sep 2025 to 15 sep 2025")
     # This must come before simple "X vs Y" pattern to match more complex expressions first
@@ -1402,16 +1228,16 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
             period1_label = f"{period1_start_spec} to {period1_end_spec}"
             period2_label = f"{period2_start_spec} to {period2_end_spec}"
             periods = [
-                {'label': period1_label, 'start_date': period1_start_res[0], 'end_date': period1_end_res[0]},
-                {'label': period2_label, 'start_date': period2_start_res[0], 'end_date': period2_end_res[0]},
+                DatePeriod(label=period1_label, start_date=period1_start_res[0], end_date=period1_end_res[0]),
+                DatePeriod(label=period2_label, start_date=period2_start_res[0], end_date=period2_end_res[0]),
             ]
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': period1_start_res[0],
-                'end_date': period2_end_res[0],
-                'periods': periods,
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=period1_start_res[0],
+                end_date=period2_end_res[0],
+                periods=periods,
+            )
     
     # "X vs Y" pattern (e.g., "2024 vs 2025")
     # For 'compare' queries, capture each period separately
@@ -1423,16 +1249,16 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
             periods = [
-                {'label': start_spec, 'start_date': start_res[0], 'end_date': start_res[1]},
-                {'label': end_spec, 'start_date': end_res[0], 'end_date': end_res[1]},
+                DatePeriod(label=start_spec, start_date=start_res[0], end_date=start_res[1]),
+                DatePeriod(label=end_spec, start_date=end_res[0], end_date=end_res[1]),
             ]
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-                'periods': periods,
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=start_res[0],
+                end_date=end_res[1],
+                periods=periods,
+            )
     
     # Fallback: allow single period without explicit "in" (e.g., "/kei tab yield 5 year feb 2025")
     single_match = (
@@ -1444,20 +1270,20 @@ def parse_bond_table_query(q: str) -> Optional[Dict]:
         period_spec = single_match.group(0).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-            }
+            return BondTableQuery(
+                metrics=metrics,
+                tenors=tenors,
+                start_date=period_res[0],
+                end_date=period_res[1],
+            )
     
     return None
 
 
-def parse_bond_plot_query(q: str) -> Optional[Dict]:
+def parse_bond_plot_query(q: str) -> Optional[BondPlotQuery]:
     """Parse '/kin plot' bond plot queries.
     Same patterns as parse_bond_table_query but for plots.
-    Returns dict with 'metrics', 'tenors', 'start_date', 'end_date', 'include_fx', 'include_vix' or None.
+    Returns BondPlotQuery with 'metrics', 'tenors', 'start_date', 'end_date', 'include_fx', 'include_vix' or None.
     """
     q = q.lower()
     if 'plot' not in q:
@@ -1556,15 +1382,15 @@ def parse_bond_plot_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'metric': metric,
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-                'include_fx': include_fx,
-                'include_vix': include_vix,
-            }
+            return BondPlotQuery(
+                metric=metric,
+                metrics=metrics,
+                tenors=tenors,
+                start_date=start_res[0],
+                end_date=end_res[1],
+                include_fx=include_fx,
+                include_vix=include_vix,
+            )
 
     # "X to Y" pattern (without explicit 'from')
     to_match = re.search(r'(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))\s+to\s+(?:(q[1-4]\s+\d{4})|(\d{4})|((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}))', q_after_plot)
@@ -1574,15 +1400,15 @@ def parse_bond_plot_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'metric': metric,
-                'metrics': metrics,
-                'tenors': tenors,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-                'include_fx': include_fx,
-                'include_vix': include_vix,
-            }
+            return BondPlotQuery(
+                metric=metric,
+                metrics=metrics,
+                tenors=tenors,
+                start_date=start_res[0],
+                end_date=end_res[1],
+                include_fx=include_fx,
+                include_vix=include_vix,
+            )
     
     # "in X" pattern (single period)
     in_match = re.search(r'in\s+(.+)$', q_after_plot)
@@ -1590,19 +1416,61 @@ def parse_bond_plot_query(q: str) -> Optional[Dict]:
         period_spec = in_match.group(1).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'metric': metric,
-                'tenors': tenors,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-                'include_fx': include_fx,
-                'include_vix': include_vix,
-            }
+            return BondPlotQuery(
+                metric=metric,
+                tenors=tenors,
+                start_date=period_res[0],
+                end_date=period_res[1],
+                include_fx=include_fx,
+                include_vix=include_vix,
+            )
     
     return None
 
 
-def parse_bond_return_query(q: str) -> Optional[Dict]:
+def parse_bond_bars_query(q: str) -> Optional[BondBarsQuery]:
+    """Parse intraday bar requests for '/kei tab' tables and '/kei plot' charts.
+    Supported patterns:
+    - 'tab yield 10 year 1h bars 2026-01-05'
+    - 'tab price 5 year 15min ohlc from 2026-01-05 to 2026-01-06'
+    - 'plot yield fr108 5m bars'            (latest trading day with ticks)
+
+    Returns BondBarsQuery: {'metric', 'tenor', 'series', 'freq', 'start_date', 'end_date', 'plot'}
+    or None. start_date/end_date are None when no date was given.
+    """
+    q = q.lower()
+    if not re.search(r'\b(bars?|ohlc|candles?)\b', q):
+        return None
+    freq_match = re.search(r'\b(\d+\s*(?:m|min|mins|minute|minutes|h|hr|hour|hours|d|day))\b|\b(hourly|daily)\b', q)
+    if not freq_match:
+        return None
+    freq = (freq_match.group(1) or freq_match.group(2)).replace(' ', '')
+    freq = re.sub(r'(mins|minutes?)$', 'min', re.sub(r'(hr|hours?)$', 'h', freq))
+    try:
+        priceyield_mod.bar_minutes(freq)
+    except ValueError:
+        return None
+
+    metric = 'price' if 'price' in q and 'yield' not in q else 'yield'
+    series_match = re.search(r'\b(fr\d+)\b', q)
+    tenor_match = re.search(r'\b(\d+)\s+years?\b', q)
+    tenor = f"{int(tenor_match.group(1)):02d}_year" if tenor_match else None
+    if not series_match and not tenor:
+        return None
+
+    dates = [date.fromisoformat(d) for d in re.findall(r'\d{4}-\d{2}-\d{2}', q)]
+    return BondBarsQuery(
+        metric=metric,
+        tenor=tenor,
+        series=series_match.group(1).upper() if series_match else None,
+        freq=freq,
+        start_date=dates[0] if dates else None,
+        end_date=dates[-1] if dates else None,
+        plot=bool(re.search(r'\b(plot|chart)\b', q)),
+    )
+
+
+def parse_bond_return_query(q: str) -> Optional[BondReturnQuery]:
     """Parse bond return attribution queries.
     Supported patterns:
     - '/kei analyze indonesia 5 year bond returns'
@@ -1686,27 +1554,27 @@ def parse_bond_return_query(q: str) -> Optional[Dict]:
             from_res = parse_period_spec(from_spec)
             to_res = parse_period_spec(to_spec)
             if from_res and to_res:
-                return {
-                    'tenor': tenor,
-                    'start_date': from_res[0],
-                    'end_date': to_res[1],
-                }
+                return BondReturnQuery(
+                    tenor=tenor,
+                    start_date=from_res[0],
+                    end_date=to_res[1],
+                )
         elif in_spec:
             # "in X" pattern
             period_res = parse_period_spec(in_spec)
             if period_res:
-                return {
-                    'tenor': tenor,
-                    'start_date': period_res[0],
-                    'end_date': period_res[1],
-                }
+                return BondReturnQuery(
+                    tenor=tenor,
+                    start_date=period_res[0],
+                    end_date=period_res[1],
+                )
         else:
             # No date range specified - use default (2023-01-02 to 2025-12-31)
-            return {
-                'tenor': tenor,
-                'start_date': date(2023, 1, 2),
-                'end_date': date(2025, 12, 31),
-            }
+            return BondReturnQuery(
+                tenor=tenor,
+                start_date=date(2023, 1, 2),
+                end_date=date(2025, 12, 31),
+            )
     
     # Pattern 2: "bond return attribution YYYY to YYYY"
     attr_match = re.search(
@@ -1717,11 +1585,11 @@ def parse_bond_return_query(q: str) -> Optional[Dict]:
         start_year = int(attr_match.group(1))
         end_year = int(attr_match.group(2))
         # Default to 10-year tenor if not specified
-        return {
-            'tenor': '10_year',
-            'start_date': date(start_year, 1, 1),
-            'end_date': date(end_year, 12, 31),
-        }
+        return BondReturnQuery(
+            tenor='10_year',
+            start_date=date(start_year, 1, 1),
+            end_date=date(end_year, 12, 31),
+        )
     
     # Pattern 3: "what drove [5|10] year yields in YYYY"
     drove_match = re.search(r'what\s+drove\s+(5|10)\s+year\s+yields\s+in\s+(\d{4})', q)
@@ -1729,16 +1597,16 @@ def parse_bond_return_query(q: str) -> Optional[Dict]:
         tenor_num = drove_match.group(1)
         tenor = f'{tenor_num:0>2}_year'  # Pad to 2 digits: "05" or "10"
         year = int(drove_match.group(2))
-        return {
-            'tenor': tenor,
-            'start_date': date(year, 1, 1),
-            'end_date': date(year, 12, 31),
-        }
+        return BondReturnQuery(
+            tenor=tenor,
+            start_date=date(year, 1, 1),
+            end_date=date(year, 12, 31),
+        )
     
     return None
 
 
-def parse_arima_query(q: str) -> Optional[Dict]:
+def parse_arima_query(q: str) -> Optional[ArimaQuery]:
     """Parse ARIMA queries: '/kei arima 5 year' or '/kei arima 10 year p=1 d=1 q=1 from 2023 to 2025'."""
     q_lower = q.lower()
     if 'arima' not in q_lower:
@@ -1809,10 +1677,10 @@ def parse_arima_query(q: str) -> Optional[Dict]:
             if in_res:
                 start_date, end_date = in_res
     
-    return {'tenor': tenor, 'order': (p, d, q), 'start_date': start_date, 'end_date': end_date}
+    return ArimaQuery(tenor=tenor, order=(p, d, q), start_date=start_date, end_date=end_date)
 
 
-def parse_garch_query(q: str) -> Optional[Dict]:
+def parse_garch_query(q: str) -> Optional[GarchQuery]:
     """Parse GARCH queries: '/kei garch 5 year' or '/kei garch idrusd p=1 q=1 from 2023 to 2025'."""
     q_lower = q.lower()
     if 'garch' not in q_lower:
@@ -1886,10 +1754,10 @@ def parse_garch_query(q: str) -> Optional[Dict]:
             if in_res:
                 start_date, end_date = in_res
     
-    return {'tenor': tenor, 'order': (p, q), 'start_date': start_date, 'end_date': end_date}
+    return GarchQuery(tenor=tenor, order=(p, q), start_date=start_date, end_date=end_date)
 
 
-def parse_cointegration_query(q: str) -> Optional[Dict]:
+def parse_cointegration_query(q: str) -> Optional[CointegrationQuery]:
     """Parse cointegration queries: '/kei coint 5 year and 10 year from 2023 to 2025'."""
     q_lower = q.lower()
     if 'coint' not in q_lower and 'cointegr' not in q_lower:
@@ -1953,10 +1821,10 @@ def parse_cointegration_query(q: str) -> Optional[Dict]:
         if from_res and to_res:
             start_date, end_date = from_res[0], to_res[1]
     
-    return {'variables': [var1, var2], 'start_date': start_date, 'end_date': end_date}
+    return CointegrationQuery(variables=[var1, var2], start_date=start_date, end_date=end_date)
 
 
-def parse_rolling_query(q: str) -> Optional[Dict]:
+def parse_rolling_query(q: str) -> Optional[RollingQuery]:
     """Parse rolling regression queries: '/kei rolling 5 year with 10 year and vix window=90 from 2023 to 2025' or '/kei rolling usdidr with vix window=90 from 2023 to 2025'."""
     q_lower = q.lower()
     if 'rolling' not in q_lower:
@@ -2040,10 +1908,10 @@ def parse_rolling_query(q: str) -> Optional[Dict]:
         if from_res and to_res:
             start_date, end_date = from_res[0], to_res[1]
     
-    return {'tenor': tenor, 'predictors': predictors, 'window': window, 'start_date': start_date, 'end_date': end_date}
+    return RollingQuery(tenor=tenor, predictors=predictors, window=window, start_date=start_date, end_date=end_date)
 
 
-def parse_structural_break_query(q: str) -> Optional[Dict]:
+def parse_structural_break_query(q: str) -> Optional[StructuralBreakQuery]:
     """Parse structural break queries: '/kei chow 5 year' or '/kei chow idrusd in jan 2025'."""
     q_lower = q.lower()
     if 'chow' not in q_lower and 'break' not in q_lower and 'structural' not in q_lower:
@@ -2133,10 +2001,10 @@ def parse_structural_break_query(q: str) -> Optional[Dict]:
             if period_res:
                 start_date, end_date = period_res
     
-    return {'tenor': tenor, 'break_date': break_date, 'start_date': start_date, 'end_date': end_date}
+    return StructuralBreakQuery(tenor=tenor, break_date=break_date, start_date=start_date, end_date=end_date)
 
 
-def parse_aggregation_query(q: str) -> Optional[Dict]:
+def parse_aggregation_query(q: str) -> Optional[AggregationQuery]:
     """Parse aggregation queries: '/kei agg 5 year monthly' or '/kei aggregate 10 year quarterly from 2023 to 2025'."""
     q_lower = q.lower()
     if 'agg' not in q_lower:
@@ -2198,10 +2066,10 @@ def parse_aggregation_query(q: str) -> Optional[Dict]:
         if from_res and to_res:
             start_date, end_date = from_res[0], to_res[1]
     
-    return {'tenor': tenor, 'frequency': freq, 'start_date': start_date, 'end_date': end_date}
+    return AggregationQuery(tenor=tenor, frequency=freq, start_date=start_date, end_date=end_date)
 
 
-def parse_regression_query(q: str) -> Optional[Dict]:
+def parse_regression_query(q: str) -> Optional[RegressionQuery]:
     """Parse regression queries for AR(1) and multiple regression models.
     Supported patterns:
     - '/kei regres yield 5 year on 5 year at t-1 from 2023 to 2025' (AR1)
@@ -2334,12 +2202,12 @@ def parse_regression_query(q: str) -> Optional[Dict]:
         from_res = parse_period_spec(from_spec)
         to_res = parse_period_spec(to_spec)
         if from_res and to_res:
-            return {
-                'tenor': tenor,
-                'predictors': predictors if predictors else None,
-                'start_date': from_res[0],
-                'end_date': to_res[1],
-            }
+            return RegressionQuery(
+                tenor=tenor,
+                predictors=predictors if predictors else None,
+                start_date=from_res[0],
+                end_date=to_res[1],
+            )
     
     # Pattern 2: "in X"
     in_match = re.search(r'in\s+(q[1-4]\s+\d{4}|\w+\s+\d{4}|\d{4})', q_lower)
@@ -2347,23 +2215,23 @@ def parse_regression_query(q: str) -> Optional[Dict]:
         period_spec = in_match.group(1).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'tenor': tenor,
-                'predictors': predictors if predictors else None,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-            }
+            return RegressionQuery(
+                tenor=tenor,
+                predictors=predictors if predictors else None,
+                start_date=period_res[0],
+                end_date=period_res[1],
+            )
     
     # No date range - return tenor only (will use all available data)
-    return {
-        'tenor': tenor,
-        'predictors': predictors if predictors else None,
-        'start_date': None,
-        'end_date': None,
-    }
+    return RegressionQuery(
+        tenor=tenor,
+        predictors=predictors if predictors else None,
+        start_date=None,
+        end_date=None,
+    )
 
 
-def parse_granger_query(q: str) -> Optional[Dict]:
+def parse_granger_query(q: str) -> Optional[GrangerQuery]:
     """Parse Granger causality queries: 'granger X and Y from ...'."""
     q = q.lower()
     if 'granger' not in q:
@@ -2446,15 +2314,15 @@ def parse_granger_query(q: str) -> Optional[Dict]:
         if in_res:
             start_date, end_date = in_res
 
-    return {
-        'x_var': x_var,
-        'y_var': y_var,
-        'start_date': start_date,
-        'end_date': end_date,
-    }
+    return GrangerQuery(
+        x_var=x_var,
+        y_var=y_var,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
-def parse_var_query(q: str) -> Optional[Dict]:
+def parse_var_query(q: str) -> Optional[VarQuery]:
     """Parse VAR queries: 'var 5 and 10 year and vix in 2025'."""
     q = q.lower()
     if 'var' not in q:
@@ -2537,14 +2405,14 @@ def parse_var_query(q: str) -> Optional[Dict]:
         if in_res:
             start_date, end_date = in_res
 
-    return {
-        'vars': vars_norm,
-        'start_date': start_date,
-        'end_date': end_date,
-    }
+    return VarQuery(
+        vars=vars_norm,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
-def parse_event_study_query(q: str) -> Optional[Dict]:
+def parse_event_study_query(q: str) -> Optional[EventStudyQuery]:
     """Parse event study queries: 'event study 5 year on 2024-08-10 window -5 +5 estimation 60 with market vix method risk'"""
     q = q.lower()
     if 'event study' not in q:
@@ -2598,18 +2466,18 @@ def parse_event_study_query(q: str) -> Optional[Dict]:
     if method_match:
         method = method_match.group(1)
 
-    return {
-        'target': target_var,
-        'event_date': event_date.date(),
-        'window_pre': window_pre,
-        'window_post': window_post,
-        'estimation_window': est_window,
-        'market': market_var,
-        'method': method,
-    }
+    return EventStudyQuery(
+        target=target_var,
+        event_date=event_date.date(),
+        window_pre=window_pre,
+        window_post=window_post,
+        estimation_window=est_window,
+        market=market_var,
+        method=method,
+    )
 
 
-def parse_macro_table_query(q: str) -> Optional[Dict]:
+def parse_macro_table_query(q: str) -> Optional[MacroTableQuery]:
     """Parse '/kei tab' macroeconomic data queries for FX/VIX.
     Supported patterns:
     - '/kei tab idrusd from 2023 to 2025'
@@ -2617,7 +2485,7 @@ def parse_macro_table_query(q: str) -> Optional[Dict]:
     - '/kei tab fx from jan 2023 to dec 2025'
     - '/kei tab both from q1 2023 to q4 2025'
     
-    Returns dict: {'metric': 'idrusd'|'vix'|'both', 'start_date': date, 'end_date': date} or None
+    Returns MacroTableQuery: {'metric': 'idrusd'|'vix'|'both', 'start_date': date, 'end_date': date} or None
     """
     q = q.lower()
     if 'tab' not in q:
@@ -2695,11 +2563,11 @@ def parse_macro_table_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'metric': metric,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-            }
+            return MacroTableQuery(
+                metric=metric,
+                start_date=start_res[0],
+                end_date=end_res[1],
+            )
     
     # "in X" pattern (single period)
     in_match = re.search(r'in\s+(.+)$', q)
@@ -2707,16 +2575,16 @@ def parse_macro_table_query(q: str) -> Optional[Dict]:
         period_spec = in_match.group(1).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'metric': metric,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-            }
+            return MacroTableQuery(
+                metric=metric,
+                start_date=period_res[0],
+                end_date=period_res[1],
+            )
     
     return None
 
 
-def parse_macro_comparison_query(q: str) -> Optional[Dict]:
+def parse_macro_comparison_query(q: str) -> Optional[MacroComparisonQuery]:
     """Parse macro series comparison queries: '/kei tab idrusd and vix in jan 2024'
     
     Supported patterns:
@@ -2725,7 +2593,7 @@ def parse_macro_comparison_query(q: str) -> Optional[Dict]:
     - '/kei tab vix and idrusd in 2024'
     - '/kei tab idrusd and vix from q1 2023 to q4 2024'
     
-    Returns dict: {'series': ['idrusd', 'vix'], 'start_date': date, 'end_date': date} or None
+    Returns MacroComparisonQuery: {'series': ['idrusd', 'vix'], 'start_date': date, 'end_date': date} or None
     """
     q_lower = q.lower()
     if 'tab' not in q_lower or ' and ' not in q_lower:
@@ -2815,11 +2683,11 @@ def parse_macro_comparison_query(q: str) -> Optional[Dict]:
         start_res = parse_period_spec(start_spec)
         end_res = parse_period_spec(end_spec)
         if start_res and end_res:
-            return {
-                'series': series,
-                'start_date': start_res[0],
-                'end_date': end_res[1],
-            }
+            return MacroComparisonQuery(
+                series=series,
+                start_date=start_res[0],
+                end_date=end_res[1],
+            )
     
     # Try "in X" pattern
     in_match = re.search(r'in\s+(.+)$', q_clean)
@@ -2827,11 +2695,11 @@ def parse_macro_comparison_query(q: str) -> Optional[Dict]:
         period_spec = in_match.group(1).strip()
         period_res = parse_period_spec(period_spec)
         if period_res:
-            return {
-                'series': series,
-                'start_date': period_res[0],
-                'end_date': period_res[1],
-            }
+            return MacroComparisonQuery(
+                series=series,
+                start_date=period_res[0],
+                end_date=period_res[1],
+            )
     
     return None
 
@@ -2846,34 +2714,25 @@ def format_bond_metrics_table(db, start_date: date, end_date: date, metrics: Lis
     For multi-tenor: each tenor gets its own metric columns (with summary stats)
     For multi-metric: each metric gets its own columns per tenor
     """
-    # Query database for the period and tenors
-    params = [start_date.isoformat(), end_date.isoformat()]
-    placeholders = ','.join(['?'] * len(tenors))
-    query = f"""
-        SELECT obs_date, {', '.join(metrics)}, tenor
-        FROM ts
-        WHERE obs_date BETWEEN ? AND ? AND tenor IN ({placeholders})
-        ORDER BY obs_date, tenor
-    """
-    params.extend(tenors)
-    
+    # One row per series observation (as in `ts`), from BondDB's per-tenor index
     try:
-        rows = db.con.execute(query, params).fetchall()
+        frames = []
+        for tenor in tenors:
+            cols = db.slice(tenor, start_date, end_date)
+            frame = pd.DataFrame({'obs_date': pd.to_datetime(cols['obs_date']), 'tenor': tenor})
+            for m in metrics:
+                frame[m] = cols[m]
+            frames.append(frame)
+        df = pd.concat(frames, ignore_index=True)
     except Exception as e:
         logger.error(f"Error querying bond data: {e}")
         return f"❌ Error querying bond data: {e}"
     
-    if not rows:
+    if df.empty:
         return "❌ No bond data found for the specified period and tenors."
     
-    # Convert to DataFrame for easier manipulation
-    df = pd.DataFrame(rows, columns=['obs_date'] + metrics + ['tenor'])
-    df['obs_date'] = pd.to_datetime(df['obs_date'])
-    for m in metrics:
-        df[m] = pd.to_numeric(df[m], errors='coerce')
-    
     # Sort by date
-    df = df.sort_values('obs_date').reset_index(drop=True)
+    df = df.sort_values(['obs_date', 'tenor'], kind='mergesort').reset_index(drop=True)
     
     # Determine column layout
     if len(tenors) == 1 and len(metrics) == 1:
@@ -3087,6 +2946,43 @@ def format_bond_metrics_table(db, start_date: date, end_date: date, metrics: Lis
 ```"""
 
 
+def load_bond_bars(db, req: Dict) -> pd.DataFrame:
+    """Bars for a parse_bond_bars_query() request; without dates, the latest day with ticks."""
+    start, end = req['start_date'], req['end_date']
+    if start is None:
+        _, last = db.tick_coverage()
+        if last is None:
+            return pd.DataFrame()
+        start = end = last.date()
+    return db.bars(req['freq'], tenor=req['tenor'], series=req['series'], start=start, end=end, metric=req['metric'])
+
+
+def format_bond_bars_table(bars: pd.DataFrame, metric: str, max_rows: int = 40) -> str:
+    """Economist-style OHLC table of intraday bars, one block per series (latest `max_rows` bars each)."""
+    if bars.empty:
+        return "❌ No intraday data found for the specified period."
+    time_fmt = '%d %b %H:%M' if (bars['bar_start'] != bars['bar_start'].dt.normalize()).any() else '%d %b %Y'
+    header = f"{'Time':<12} | {'Open':>7} | {'High':>7} | {'Low':>7} | {'Close':>7} | {'Avg':>7} | {'Ticks':>5}"
+    width = len(header)
+    border = '─' * (width + 1)
+    blocks = []
+    for series, g in bars.groupby('series', sort=True):
+        title = f"{series} ({g['tenor'].iloc[0].replace('_', ' ')}) — {metric}"
+        lines = [f"│ {title:<{width}}│", f"├{border}┤", f"│ {header:<{width}}│"]
+        if len(g) > max_rows:
+            omitted = f"… {len(g) - max_rows} earlier bars omitted"
+            lines.append(f"│ {omitted:<{width}}│")
+            g = g.tail(max_rows)
+        for row in g.itertuples(index=False):
+            vals = " | ".join(f"{v:>7.3f}" if pd.notnull(v) else f"{'N/A':>7}"
+                              for v in (row.open, row.high, row.low, row.close, row.avg))
+            line = f"{row.bar_start.strftime(time_fmt):<12} | {vals} | {int(row.ticks):>5d}"
+            lines.append(f"│ {line:<{width}}│")
+        blocks.append("\n".join(lines))
+    body = f"\n├{border}┤\n".join(blocks)
+    return f"```\n┌{border}┐\n{body}\n└{border}┘\n```"
+
+
 def format_rows_for_telegram(rows, include_date=False, metric='yield', metrics=None, economist_style=False, summary_stats=None):
     """Format data rows for Telegram message (monospace style).
     - Supports single or multiple metrics (e.g., ['yield','price']).
@@ -3396,7 +3292,8 @@ def format_range_summary_text(rows, start_date=None, end_date=None, metric='yiel
     return "\n".join(lines)
 
 def format_models_economist_table(models: dict) -> str:
-    """Format per-model forecasts into an Economist-style monospace table, including average."""
+    """Format per-model forecasts into an Economist-style monospace table, including average
+    and, when present, the Monte Carlo 90% / 50% bands."""
     order = [
         "arima", "ets", "random_walk", "monte_carlo", "ma5", "var", "prophet", "average"
     ]
@@ -3429,6 +3326,11 @@ def format_models_economist_table(models: dict) -> str:
             table_rows.append(f"{display_name:<13} | {val:<13.4f}")
         else:
             table_rows.append(f"{display_name:<13} | {str(val):<13}")
+    # Monte Carlo quantile bands (yield_forecast_path's "bands"), below the average
+    bands = models.get("bands") or {}
+    for label, lo, hi in (("MC 90% band", "p05", "p95"), ("MC 50% band", "p25", "p75")):
+        if lo in bands and hi in bands:
+            table_rows.append(f"{label:<13} | {bands[lo]:.2f}-{bands[hi]:.2f}")
     
     if not table_rows:
         table_rows.append("(no model outputs)")
@@ -3570,12 +3472,16 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
         next_match = re.search(r"next\s+(\d+)\s+(observations?|obs|points|days)", q_lower)
         if next_match and ("forecast" in q_lower or "predict" in q_lower or "estimate" in q_lower):
             days = int(next_match.group(1))
+            if days > priceyield_mod.FORECAST_MAX_DAYS:
+                return f"Forecasts go at most {priceyield_mod.FORECAST_MAX_DAYS} business days ahead; please ask for fewer days."
             tenor = priceyield_mod.parse_tenor(question)
             series = priceyield_mod.parse_series(question)
             if tenor:
                 db = get_db()
                 metric = priceyield_mod.parse_metric(question)
-                res = priceyield_mod.forecast_metric_next_days(
+                # Fits run in worker processes; await them off the event loop
+                res = await asyncio.to_thread(
+                    priceyield_mod.forecast_metric_next_days,
                     db,
                     tenor,
                     metric=metric,
@@ -3663,11 +3569,7 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
                         current += relativedelta(months=1)
                     
                     # Load data for each month
-                    periods_data = []
-                    for p in periods:
-                        pdata = load_auction_period(p)
-                        if pdata:
-                            periods_data.append(pdata)
+                    periods_data = [d for d in load_auction_periods(periods) if d]
                     
                     if periods_data:
                         metrics_list = ['incoming', 'awarded']
@@ -3685,11 +3587,7 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
                     # This ensures consistency across all commands
                     try:
                         periods = [{'type': 'year', 'year': y} for y in range(y_start, y_end + 1)]
-                        periods_data = []
-                        for p in periods:
-                            pdata = load_auction_period(p)
-                            if pdata:
-                                periods_data.append(pdata)
+                        periods_data = [d for d in load_auction_periods(periods) if d]
                         
                         if periods_data:
                             # Use format_auction_metrics_table which uses AuctionDB (correct data)
@@ -3937,10 +3835,10 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
             if intent.series:
                 where += ' AND series = ?'
                 params.append(intent.series)
-            rows = db.con.execute(
+            rows = db.fetchall(
                 f'SELECT series, tenor, price, "yield" FROM ts WHERE {where} ORDER BY series',
                 params
-            ).fetchall()
+            )
             rows_list = [
                 dict(
                     series=r[0],
@@ -3973,10 +3871,10 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
                     params.extend(tenors_to_use)
                 if intent.series:
                     where += ' AND series = ?'; params.append(intent.series)
-                rows = db.con.execute(
+                rows = db.fetchall(
                     f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                     params
-                ).fetchall()
+                )
                 rows_list = [
                     dict(
                         series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -3997,7 +3895,7 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
                 if len(s) < 10:
                     return f"Not enough data to forecast {intent.tenor} yield."
                 try:
-                    forecast = priceyield_mod.yield_forecast(s, intent.point_date, method=method)
+                    forecast = await asyncio.to_thread(priceyield_mod.yield_forecast, s, intent.point_date, method=method)
                     tenor_txt = intent.tenor.replace('_', ' ')
                     scope = intent.series if intent.series else 'all series (averaged)'
                     return f"Forecast ({method.upper()}): {tenor_txt} yield at {intent.point_date} ({scope}): {forecast}"
@@ -4009,7 +3907,7 @@ async def try_compute_bond_summary(question: str) -> Optional[str]:
                 if len(s) < 10:
                     return f"Not enough data to forecast {intent.tenor} yield."
                 try:
-                    forecasts = priceyield_mod.yield_forecast(s, intent.point_date, method="all")
+                    forecasts = await asyncio.to_thread(priceyield_mod.yield_forecast, s, intent.point_date, method="all")
                     # Format as Economist-style table
                     table = format_models_economist_table(forecasts)
                     # Compose HL-CU summary
@@ -4055,17 +3953,15 @@ def format_bond_compare_periods(db, periods: List[Dict], metrics: List[str], ten
     """
     params.extend(tenors)
     try:
-        rows = db.con.execute(query, params).fetchall()
+        cols = db.fetch_numpy(query, params)
     except Exception as e:
         logger.error(f"Error querying bond data for comparison: {e}")
         return f"❌ Error querying bond data: {e}"
 
-    if not rows:
+    if not len(cols['obs_date']):
         return "❌ No bond data found for the specified periods and tenors."
 
-    df = pd.DataFrame(rows, columns=['obs_date', metric, 'tenor'])
-    df['obs_date'] = pd.to_datetime(df['obs_date'])
-    df[metric] = pd.to_numeric(df[metric], errors='coerce')
+    df = pd.DataFrame({'obs_date': pd.DatetimeIndex(cols['obs_date']), metric: cols[metric], 'tenor': cols['tenor']})
 
     def norm_tenor(t):
         label = str(t or '').replace('_', ' ').strip()
@@ -5165,22 +5061,11 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     d = intent.point_date
-    params = [d.isoformat()]
-    where = 'obs_date = ?'
     tenors_to_use = intent.tenors if getattr(intent, 'tenors', None) else ([intent.tenor] if getattr(intent, 'tenor', None) else None)
-    if tenors_to_use:
-        placeholders = ','.join(['?'] * len(tenors_to_use))
-        where += f' AND tenor IN ({placeholders})'
-        params.extend(tenors_to_use)
-    if intent.series:
-        where += ' AND series = ?'
-        params.append(intent.series)
 
     db = get_db()
-    rows = db.con.execute(
-        f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY tenor, series',
-        params
-    ).fetchall()
+    # Ordered by tenor, series (single date); served from BondDB's per-tenor date index
+    rows = db.slice_rows(d, d, tenors_to_use, intent.series)
 
     rows_list = [
         dict(
@@ -5363,26 +5248,15 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             db = get_db()
             
             # Get dependent variable (yield series)
-            y_result = db.con.execute(f"""
-                SELECT obs_date, AVG("yield") as avg_yield
-                FROM ts
-                WHERE tenor = '{tenor}'
-                  AND "yield" IS NOT NULL
-                GROUP BY obs_date
-                ORDER BY obs_date
-            """).fetchall()
+            y_series = db.tenor_series(tenor)
             
-            if not y_result:
+            if y_series.empty:
                 await update.message.reply_text(
                     f"❌ No yield data found for {tenor.replace('_', ' ')}.",
                     parse_mode=ParseMode.HTML
                 )
                 return
             
-            y_dates = [row[0] for row in y_result]
-            y_values = [row[1] for row in y_result]
-            y_series = pd.Series(y_values, index=pd.to_datetime(y_dates))
-            
             # Check if multiple regression (has predictors)
             if predictors and len(predictors) > 0:
                 # Multiple regression
@@ -5395,19 +5269,9 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     
                     if base_name.endswith('_year'):
                         # Bond yield predictor
-                        X_result = db.con.execute(f"""
-                            SELECT obs_date, AVG("yield") as avg_yield
-                            FROM ts
-                            WHERE tenor = '{base_name}'
-                              AND "yield" IS NOT NULL
-                            GROUP BY obs_date
-                            ORDER BY obs_date
-                        """).fetchall()
+                        X_series = db.tenor_series(base_name)
                         
-                        if X_result:
-                            X_dates = [row[0] for row in X_result]
-                            X_values = [row[1] for row in X_result]
-                            X_series = pd.Series(X_values, index=pd.to_datetime(X_dates))
+                        if not X_series.empty:
                             if is_lagged:
                                 X_series = X_series.shift(1)
                             X_dict[predictor] = X_series
@@ -5415,8 +5279,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     elif base_name == 'idrusd':
                         # IDR/USD exchange rate
                         try:
-                            fx_df = pd.read_csv('database/20260102_daily01.csv')
-                            fx_df['date'] = pd.to_datetime(fx_df['date'], format='%Y/%m/%d')
+                            fx_df = get_market_store().macro_slice()
                             fx_series = pd.Series(fx_df['idrusd'].values, index=fx_df['date'])
                             if is_lagged:
                                 fx_series = fx_series.shift(1)
@@ -5427,8 +5290,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     elif base_name == 'vix':
                         # VIX volatility index
                         try:
-                            vix_df = pd.read_csv('database/20260102_daily01.csv')
-                            vix_df['date'] = pd.to_datetime(vix_df['date'], format='%Y/%m/%d')
+                            vix_df = get_market_store().macro_slice()
                             vix_series = pd.Series(vix_df['vix_index'].values, index=vix_df['date'])
                             if is_lagged:
                                 vix_series = vix_series.shift(1)
@@ -5481,30 +5343,19 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             @lru_cache(maxsize=16)
             def load_series(name: str) -> Optional[pd.Series]:
                 if name.endswith('_year'):
-                    res = db.con.execute(f"""
-                        SELECT obs_date, AVG("yield") as avg_yield
-                        FROM ts
-                        WHERE tenor = '{name}'
-                          AND "yield" IS NOT NULL
-                        GROUP BY obs_date
-                        ORDER BY obs_date
-                    """).fetchall()
-                    if not res:
+                    res = db.tenor_series(name)
+                    if res.empty:
                         return None
-                    dates = [r[0] for r in res]
-                    vals = [r[1] for r in res]
-                    return pd.Series(vals, index=pd.to_datetime(dates))
+                    return res
                 if name == 'idrusd':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     except Exception:
                         return None
                 if name == 'vix':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                     except Exception:
                         return None
@@ -5556,30 +5407,19 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             @lru_cache(maxsize=16)
             def load_series(name: str) -> Optional[pd.Series]:
                 if name.endswith('_year'):
-                    res = db.con.execute(f"""
-                        SELECT obs_date, AVG("yield") as avg_yield
-                        FROM ts
-                        WHERE tenor = '{name}'
-                          AND "yield" IS NOT NULL
-                        GROUP BY obs_date
-                        ORDER BY obs_date
-                    """).fetchall()
-                    if not res:
+                    res = db.tenor_series(name)
+                    if res.empty:
                         return None
-                    dates = [r[0] for r in res]
-                    vals = [r[1] for r in res]
-                    return pd.Series(vals, index=pd.to_datetime(dates))
+                    return res
                 if name == 'idrusd':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     except Exception:
                         return None
                 if name == 'vix':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                     except Exception:
                         return None
@@ -5633,30 +5473,19 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             @lru_cache(maxsize=16)
             def load_series(name: str) -> Optional[pd.Series]:
                 if name.endswith('_year'):
-                    res = db.con.execute(f"""
-                        SELECT obs_date, AVG("yield") as avg_yield
-                        FROM ts
-                        WHERE tenor = '{name}'
-                          AND "yield" IS NOT NULL
-                        GROUP BY obs_date
-                        ORDER BY obs_date
-                    """).fetchall()
-                    if not res:
+                    res = db.tenor_series(name)
+                    if res.empty:
                         return None
-                    dates = [r[0] for r in res]
-                    vals = [r[1] for r in res]
-                    return pd.Series(vals, index=pd.to_datetime(dates))
+                    return res
                 if name == 'idrusd':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     except Exception:
                         return None
                 if name == 'vix':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         return pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                     except Exception:
                         return None
@@ -5714,37 +5543,25 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Load data based on tenor type
             if tenor == 'idrusd':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load IDRUSD data: {e}", parse_mode=ParseMode.HTML)
                     return
             elif tenor == 'vix':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load VIX data: {e}", parse_mode=ParseMode.HTML)
                     return
             else:
                 # Bond yield data
-                res = db.con.execute(f"""
-                    SELECT obs_date, AVG("yield") as avg_yield
-                    FROM ts
-                    WHERE tenor = '{tenor}' AND "yield" IS NOT NULL
-                    GROUP BY obs_date
-                    ORDER BY obs_date
-                """).fetchall()
+                series = db.tenor_series(tenor)
                 
-                if not res:
+                if series.empty:
                     await update.message.reply_text(f"❌ No yield data found for {tenor.replace('_', ' ')}.", parse_mode=ParseMode.HTML)
                     return
-                    
-                dates = [r[0] for r in res]
-                vals = [r[1] for r in res]
-                series = pd.Series(vals, index=pd.to_datetime(dates))
             
             if len(series) < 60:
                 await update.message.reply_text("❌ Insufficient data for ARIMA (need ≥60 observations).", parse_mode=ParseMode.HTML)
@@ -5785,37 +5602,25 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Load data based on tenor type
             if tenor == 'idrusd':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load IDRUSD data: {e}", parse_mode=ParseMode.HTML)
                     return
             elif tenor == 'vix':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load VIX data: {e}", parse_mode=ParseMode.HTML)
                     return
             else:
                 # Bond yield data
-                res = db.con.execute(f"""
-                    SELECT obs_date, AVG("yield") as avg_yield
-                    FROM ts
-                    WHERE tenor = '{tenor}' AND "yield" IS NOT NULL
-                    GROUP BY obs_date
-                    ORDER BY obs_date
-                """).fetchall()
+                series = db.tenor_series(tenor)
                 
-                if not res:
+                if series.empty:
                     await update.message.reply_text(f"❌ No yield data found for {tenor.replace('_', ' ')}.", parse_mode=ParseMode.HTML)
                     return
-                    
-                dates = [r[0] for r in res]
-                vals = [r[1] for r in res]
-                series = pd.Series(vals, index=pd.to_datetime(dates))
             
             if len(series) < 60:
                 await update.message.reply_text("❌ Insufficient data for GARCH (need ≥60 observations).", parse_mode=ParseMode.HTML)
@@ -5855,8 +5660,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             if rolling_req['tenor'] in ['usdidr', 'idrusd', 'indogb', 'gbpidr']:
                 # Load from macro data CSV
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     if rolling_req['tenor'] in ['usdidr', 'idrusd']:
                         y_series = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     elif rolling_req['tenor'] in ['indogb', 'gbpidr']:
@@ -5866,55 +5670,34 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     return
             else:
                 # Load from ts table (bond yields)
-                res = db.con.execute(f"""
-                    SELECT obs_date, AVG("yield") as avg_yield
-                    FROM ts
-                    WHERE tenor = '{rolling_req['tenor']}' AND "yield" IS NOT NULL
-                    GROUP BY obs_date
-                    ORDER BY obs_date
-                """).fetchall()
+                y_series = db.tenor_series(rolling_req['tenor'])
                 
-                if not res:
+                if y_series.empty:
                     await update.message.reply_text(f"❌ No data for {rolling_req['tenor']}.", parse_mode=ParseMode.HTML)
                     return
-                
-                dates = [r[0] for r in res]
-                vals = [r[1] for r in res]
-                y_series = pd.Series(vals, index=pd.to_datetime(dates))
             
             # Load predictors
             X_dict = {}
             for pred in rolling_req['predictors']:
                 if pred.endswith('_year'):
-                    res_x = db.con.execute(f"""
-                        SELECT obs_date, AVG("yield") as avg_yield
-                        FROM ts
-                        WHERE tenor = '{pred}' AND "yield" IS NOT NULL
-                        GROUP BY obs_date
-                        ORDER BY obs_date
-                    """).fetchall()
-                    if res_x:
-                        dates_x = [r[0] for r in res_x]
-                        vals_x = [r[1] for r in res_x]
-                        X_dict[pred] = pd.Series(vals_x, index=pd.to_datetime(dates_x))
+                    res_x = db.tenor_series(pred)
+                    if not res_x.empty:
+                        X_dict[pred] = res_x
                 elif pred in ['usdidr', 'idrusd']:
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         X_dict['usdidr'] = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     except:
                         pass
                 elif pred in ['indogb', 'gbpidr']:
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         X_dict['indogb'] = pd.Series(df_macro['indogb'].values, index=df_macro['date'])
                     except:
                         pass
                 elif pred == 'vix':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         X_dict['vix'] = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                     except:
                         pass
@@ -5958,45 +5741,32 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Load data based on tenor type
             if tenor == 'idrusd':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load IDRUSD data: {e}", parse_mode=ParseMode.HTML)
                     return
             elif tenor == 'indogb':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['indogb'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load INDOGB data: {e}", parse_mode=ParseMode.HTML)
                     return
             elif tenor == 'vix':
                 try:
-                    df_macro = pd.read_csv('database/20260102_daily01.csv')
-                    df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                    df_macro = get_market_store().macro_slice()
                     series = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                 except Exception as e:
                     await update.message.reply_text(f"❌ Could not load VIX data: {e}", parse_mode=ParseMode.HTML)
                     return
             else:
                 # Bond yield data
-                res = db.con.execute(f"""
-                    SELECT obs_date, AVG("yield") as avg_yield
-                    FROM ts
-                    WHERE tenor = '{tenor}' AND "yield" IS NOT NULL
-                    GROUP BY obs_date
-                    ORDER BY obs_date
-                """).fetchall()
+                series = db.tenor_series(tenor)
                 
-                if not res or len(res) < 100:
+                if len(series) < 100:
                     await update.message.reply_text("❌ Insufficient data for structural break test (need ≥100).", parse_mode=ParseMode.HTML)
                     return
-                
-                dates = [r[0] for r in res]
-                vals = [r[1] for r in res]
-                series = pd.Series(vals, index=pd.to_datetime(dates))
             
             # Check data length
             if len(series) < 100:
@@ -6034,22 +5804,12 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             from regression_analysis import aggregate_frequency, format_aggregation
             db = get_db()
             
-            res = db.con.execute(f"""
-                SELECT obs_date, AVG("yield") as avg_yield
-                FROM ts
-                WHERE tenor = '{agg_req['tenor']}' AND "yield" IS NOT NULL
-                GROUP BY obs_date
-                ORDER BY obs_date
-            """).fetchall()
+            series = db.tenor_series(agg_req['tenor'])
             
-            if not res or len(res) < 10:
+            if len(series) < 10:
                 await update.message.reply_text("❌ Insufficient data for aggregation (need ≥10 observations).", parse_mode=ParseMode.HTML)
                 return
             
-            dates = [r[0] for r in res]
-            vals = [r[1] for r in res]
-            series = pd.Series(vals, index=pd.to_datetime(dates))
-            
             agg_res = aggregate_frequency(series, 
                                          freq=agg_req['frequency'],
                                          start_date=agg_req['start_date'], 
@@ -6084,28 +5844,18 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             series_dict = {}
             for var in coint_req['variables']:
                 if var.endswith('_year'):
-                    res = db.con.execute(f"""
-                        SELECT obs_date, AVG("yield") as avg_yield
-                        FROM ts
-                        WHERE tenor = '{var}' AND "yield" IS NOT NULL
-                        GROUP BY obs_date
-                        ORDER BY obs_date
-                    """).fetchall()
-                    if res:
-                        dates = [r[0] for r in res]
-                        vals = [r[1] for r in res]
-                        series_dict[var] = pd.Series(vals, index=pd.to_datetime(dates))
+                    res = db.tenor_series(var)
+                    if not res.empty:
+                        series_dict[var] = res
                 elif var == 'idrusd':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         series_dict['idrusd'] = pd.Series(df_macro['idrusd'].values, index=df_macro['date'])
                     except:
                         pass
                 elif var == 'vix':
                     try:
-                        df_macro = pd.read_csv('database/20260102_daily01.csv')
-                        df_macro['date'] = pd.to_datetime(df_macro['date'], format='%Y/%m/%d')
+                        df_macro = get_market_store().macro_slice()
                         series_dict['vix'] = pd.Series(df_macro['vix_index'].values, index=df_macro['date'])
                     except:
                         pass
@@ -6135,6 +5885,37 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Detect 'tab' bond metric queries (yield/price data across periods)
     lower_q = question.lower()
+
+    # Intraday bars (tables or plots), resampled from ticks inside DuckDB
+    bars_req = parse_bond_bars_query(lower_q)
+    if bars_req:
+        try:
+            await context.bot.send_chat_action(chat_id=update.message.chat_id, action="typing")
+        except Exception:
+            pass
+        try:
+            bars = load_bond_bars(get_db(), bars_req)
+            if bars.empty:
+                await update.message.reply_text("❌ No intraday data found (set BOND_TICKS_PATH or append ticks).")
+                metrics.log_query(user_id, username, question, "bond_bars", time.time() - start_time, False, "no_data", "kei")
+                return
+            subject = bars_req['series'] or bars_req['tenor'].replace('_', ' ')
+            first, last = bars['bar_start'].min(), bars['bar_start'].max()
+            hook = f"{bars_req['metric'].capitalize()} | {subject} | {bars_req['freq']} bars | {first:%d %b %Y %H:%M} to {last:%d %b %Y %H:%M}"
+            if bars_req['plot']:
+                png = generate_bars_plot(bars, bars_req['metric'], f"{bars_req['metric'].capitalize()} {subject} — {bars_req['freq']} bars\n{first:%d %b %Y %H:%M} to {last:%d %b %Y %H:%M}")
+                await update.message.reply_photo(photo=io.BytesIO(png))
+                await update.message.reply_text(f"<blockquote>{hook}</blockquote>\n\n<blockquote>~ Kei</blockquote>", parse_mode=ParseMode.HTML)
+            else:
+                table_text = format_bond_bars_table(bars, bars_req['metric'])
+                full_response = f"📊 INDOGB — Intraday Bars\n\n<blockquote>{hook}</blockquote>\n\n" + table_text + "\n\n<blockquote>~ Kei</blockquote>"
+                await update.message.reply_text(convert_markdown_code_fences_to_html(full_response), parse_mode=ParseMode.HTML)
+            metrics.log_query(user_id, username, question, "bond_bars", time.time() - start_time, True, "success", "kei")
+        except Exception as e:
+            logger.error(f"Error processing intraday bars query: {e}")
+            await update.message.reply_text(f"❌ Error building intraday bars: {e}")
+            metrics.log_query(user_id, username, question, "bond_bars", time.time() - start_time, False, str(e), "kei")
+        return
     
     # First, check for macro data table queries (FX/VIX)
     macro_tab_req = parse_macro_table_query(lower_q)
@@ -6255,8 +6036,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         periods = []
         skipped_periods = []
         month_names = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        for p in tab_req['periods']:
-            pdata = load_auction_period(p)
+        for p, pdata in zip(tab_req['periods'], load_auction_periods(tab_req['periods'])):
             if not pdata:
                 # Skip missing periods and collect labels
                 label = (
@@ -6390,8 +6170,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
             # Otherwise: load each period and format general comparison
             loaded = []
-            for p in periods:
-                pdata = load_auction_period(p)
+            for p, pdata in zip(periods, load_auction_periods(periods)):
                 if not pdata:
                     label = (
                         f"Q{p['quarter']} {p['year']}" if p['type'] == 'quarter' else (
@@ -6454,8 +6233,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 periods_data = []
                 missing_labels = []
                 month_names = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                for p in periods:
-                    pdata = load_auction_period(p)
+                for p, pdata in zip(periods, load_auction_periods(periods)):
                     if pdata:
                         periods_data.append(pdata)
                     else:
@@ -6504,8 +6282,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                         year += 1
                 periods_data = []
                 missing_labels = []
-                for p in periods:
-                    pdata = load_auction_period(p)
+                for p, pdata in zip(periods, load_auction_periods(periods)):
                     if pdata:
                         periods_data.append(pdata)
                     else:
@@ -6539,8 +6316,7 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     periods = [{'type': 'year', 'year': y} for y in range(y_start, y_end + 1)]
                     periods_data = []
                     missing_labels = []
-                    for p in periods:
-                        pdata = load_auction_period(p)
+                    for p, pdata in zip(periods, load_auction_periods(periods)):
                         if pdata:
                             periods_data.append(pdata)
                         else:
@@ -6648,10 +6424,10 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     if intent.series:
                         where += ' AND series = ?'
                         params.append(intent.series)
-                    rows = db.con.execute(
+                    rows = db.fetchall(
                         f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                         params
-                    ).fetchall()
+                    )
                     rows_list = [
                         dict(
                             series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -6714,10 +6490,10 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                         if intent.series:
                             where += ' AND series = ?'
                             params.append(intent.series)
-                        rows = db.con.execute(
+                        rows = db.fetchall(
                             f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                             params
-                        ).fetchall()
+                        )
                         rows_list = [
                             dict(
                                 series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -6835,10 +6611,10 @@ async def kei_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                         if intent.series:
                             where += ' AND series = ?'
                             params.append(intent.series)
-                        rows = db.con.execute(
+                        rows = db.fetchall(
                             f'SELECT series, tenor, price, "yield" FROM ts WHERE {where} ORDER BY series',
                             params
-                        ).fetchall()
+                        )
                         rows_list = [
                             dict(
                                 series=r[0],
@@ -7057,10 +6833,10 @@ async def kin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 where = f'obs_date BETWEEN ? AND ? AND tenor IN ({placeholders})'
                 params.extend(bond_plot_req['tenors'])
                 
-                rows = db.con.execute(
+                rows = db.fetchall(
                     f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                     params
-                ).fetchall()
+                )
                 if rows:
                     rows_list = [
                         dict(
@@ -7213,10 +6989,10 @@ async def kin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     if intent.series:
                         where += ' AND series = ?'
                         params.append(intent.series)
-                    rows = db.con.execute(
+                    rows = db.fetchall(
                         f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                         params
-                    ).fetchall()
+                    )
                     rows_list = [
                         dict(
                             series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -7379,8 +7155,7 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     skipped = []
                     month_names = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
                     
-                    for p in periods:
-                        pdata = load_auction_period(p)
+                    for p, pdata in zip(periods, load_auction_periods(periods)):
                         if not pdata:
                             label = (
                                 f"Q{p['quarter']} {p['year']}" if p['type'] == 'quarter' else (
@@ -7475,8 +7250,7 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 ]
                 periods_data = []
                 skipped = []
-                for p in periods:
-                    pdata = load_auction_period(p)
+                for p, pdata in zip(periods, load_auction_periods(periods)):
                     if pdata:
                         periods_data.append(pdata)
                     else:
@@ -7587,8 +7361,7 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 skipped_periods = []
                 month_names = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
                 
-                for p in periods:
-                    pdata = load_auction_period(p)
+                for p, pdata in zip(periods, load_auction_periods(periods)):
                     if not pdata:
                         skipped_periods.append(f"{month_names[p['month']]} {p['year']}")
                         continue
@@ -7670,8 +7443,7 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 skipped_periods = []
                 month_names = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
                 
-                for p in periods:
-                    pdata = load_auction_period(p)
+                for p, pdata in zip(periods, load_auction_periods(periods)):
                     if not pdata:
                         skipped_periods.append(f"{month_names[p['month']]} {p['year']}")
                         continue
@@ -7740,8 +7512,7 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     periods_data = []
                     skipped_periods = []
                     
-                    for p in periods:
-                        pdata = load_auction_period(p)
+                    for p, pdata in zip(periods, load_auction_periods(periods)):
                         if not pdata:
                             skipped_periods.append(f"{int(p['year'])}")
                             continue
@@ -8258,10 +8029,10 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 where = f'obs_date BETWEEN ? AND ? AND tenor IN ({placeholders})'
                 params.extend(bond_plot_req['tenors'])
 
-                rows = db.con.execute(
+                rows = db.fetchall(
                     f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                     params
-                ).fetchall()
+                )
                 rows_list = [
                     dict(
                         series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -8411,10 +8182,10 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     where = f'obs_date BETWEEN ? AND ? AND tenor IN ({placeholders})'
                     params.extend(bond_plot_req['tenors'])
                     
-                    rows = db.con.execute(
+                    rows = db.fetchall(
                         f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                         params
-                    ).fetchall()
+                    )
                     rows_list = [
                         dict(
                             series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -8517,10 +8288,10 @@ async def both_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     if intent.series:
                         where += ' AND series = ?'
                         params.append(intent.series)
-                    rows = db.con.execute(
+                    rows = db.fetchall(
                         f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                         params
-                    ).fetchall()
+                    )
                     rows_list = [
                         dict(
                             series=r[0], tenor=r[1], date=r[2].isoformat(),
@@ -8727,10 +8498,10 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 where += ' AND series = ?'
                 params.append(intent.series)
             
-            rows = db.con.execute(
+            rows = db.fetchall(
                 f'SELECT series, tenor, price, "yield" FROM ts WHERE {where} ORDER BY series',
                 params
-            ).fetchall()
+            )
             
             rows_list = [
                 dict(
@@ -8791,10 +8562,10 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     params.append(intent.series)
                 
                 # Fetch without a hard limit so data_points reflects the full window
-                rows = db.con.execute(
+                rows = db.fetchall(
                     f'SELECT series, tenor, obs_date, price, "yield" FROM ts WHERE {where} ORDER BY obs_date ASC, series',
                     params
-                ).fetchall()
+                )
                 
                 rows_list = [
                     dict(
@@ -8952,24 +8723,14 @@ def generate_plot(db, start_date, end_date, metric='yield', tenor=None, tenors=N
     except:
         has_seaborn = False
     
-    params = [start_date.isoformat(), end_date.isoformat()]
-    q = 'SELECT obs_date, series, tenor, price, "yield" FROM ts WHERE obs_date BETWEEN ? AND ?'
-    
-    # Handle multi-tenor or single tenor
-    if tenors and len(tenors) > 1:
-        # Multi-tenor query
-        placeholders = ','.join(['?'] * len(tenors))
-        q += f' AND tenor IN ({placeholders})'
-        params.extend(tenors)
-    elif tenor:
-        # Single tenor (backward compatibility)
-        q += ' AND tenor = ?'
-        params.append(tenor)
+    # Determine if multi-tenor plot
+    is_multi_tenor = tenors and len(tenors) > 1
     
-    q += ' ORDER BY obs_date'
-    df = db.con.execute(q, params).fetchdf()
+    # Daily per-tenor averages across series, already forward-filled in BondDB's cube
+    plot_tenors = tenors if is_multi_tenor else ([tenor] if tenor else None)
+    cube = db.cube_frame(plot_tenors, start_date, end_date, freq='D')
     
-    if df.empty:
+    if cube.empty or not cube['observed'].any():
         plt.figure(figsize=(4, 2))
         plt.text(0.5, 0.5, 'No data', ha='center', va='center')
         buf = io.BytesIO()
@@ -8979,38 +8740,14 @@ def generate_plot(db, start_date, end_date, metric='yield', tenor=None, tenors=N
         buf.seek(0)
         return buf.read()
     
-    df['obs_date'] = pd.to_datetime(df['obs_date'])
-    
-    # Determine if multi-tenor plot
-    is_multi_tenor = tenors and len(tenors) > 1
-    
-    # Fill missing dates and aggregate
-    all_dates = pd.date_range(start_date, end_date, freq='D')
-    
     if is_multi_tenor:
-        # Multi-tenor: group by tenor and date, keep separate lines
-        filled = []
-        for (s, t), g in df.groupby(['series', 'tenor']):
-            g2 = g.set_index('obs_date').reindex(all_dates)
-            g2['series'] = s
-            g2['tenor'] = t
-            g2[['price', 'yield']] = g2[['price', 'yield']].ffill()
-            filled.append(g2.reset_index().rename(columns={'index': 'obs_date'}))
-        filled = pd.concat(filled, ignore_index=True)
-        # Group by tenor and date (average across series if multiple)
-        daily = filled.groupby(['obs_date', 'tenor'])[metric].mean().reset_index()
+        # Multi-tenor: one line per tenor
+        daily = cube[['obs_date', 'tenor', f'{metric}_mean']].rename(columns={f'{metric}_mean': metric})
         # Format tenor labels nicely for display
         daily['tenor_label'] = daily['tenor'].str.replace('_', ' ')
     else:
-        # Single tenor: original aggregation logic
-        filled = []
-        for s, g in df.groupby('series'):
-            g2 = g.set_index('obs_date').reindex(all_dates)
-            g2['series'] = s
-            g2[['price', 'yield']] = g2[['price', 'yield']].ffill()
-            filled.append(g2.reset_index().rename(columns={'index': 'obs_date'}))
-        filled = pd.concat(filled, ignore_index=True)
-        daily = filled.groupby('obs_date')[metric].mean().reset_index()
+        # Single tenor (or all tenors averaged when none given)
+        daily = db.cube_average(cube, metric)
     
     # Format display
     def format_date(d):
@@ -9131,6 +8868,27 @@ def generate_plot(db, start_date, end_date, metric='yield', tenor=None, tenors=N
 
 
 
+def generate_bars_plot(bars: pd.DataFrame, metric: str, title: str) -> bytes:
+    """PNG of intraday bars: close line with the high-low range shaded, per series."""
+    fig = Figure(figsize=(12, 7))
+    ax = fig.subplots()
+    apply_economist_style(fig, ax)
+    for i, (series, g) in enumerate(bars.groupby('series', sort=True)):
+        color = ECONOMIST_PALETTE[i % len(ECONOMIST_PALETTE)]
+        ax.fill_between(g['bar_start'], g['low'], g['high'], color=color, alpha=0.15, linewidth=0)
+        ax.plot(g['bar_start'], g['close'], linewidth=2, color=color, label=series)
+    if bars['series'].nunique() > 1:
+        ax.legend(frameon=False, fontsize=11, loc='best')
+    ax.set_title(title, fontsize=13, pad=14, loc='left', color=ECONOMIST_COLORS['black'])
+    ax.set_xlabel('')
+    ax.set_ylabel('Yield (%)' if metric == 'yield' else metric.capitalize(), fontsize=12)
+    fig.autofmt_xdate()
+    add_economist_caption(fig)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150, facecolor='white')
+    return buf.getvalue()
+
+
 async def activity_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /activity command - show bot usage statistics for authorized users only."""
     user_id = update.message.from_user.id
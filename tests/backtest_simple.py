@@ -9,6 +9,7 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+from market_snapshot import read_frame
 from yield_forecast_models import (
     forecast_arima, forecast_ets, forecast_prophet,
     forecast_random_walk, forecast_monte_carlo, forecast_ma5, forecast_var
@@ -16,8 +17,7 @@ from yield_forecast_models import (
 from datetime import timedelta
 
 # Load data
-df = pd.read_csv('database/20251215_priceyield.csv')
-df['date'] = pd.to_datetime(df['date'], format='%d/%m/%Y')
+df = read_frame('bond', 'database/20251215_priceyield.csv')
 
 # Aggregate by tenor
 for tenor in ['05_year', '10_year']:
@@ -8,14 +8,14 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+from market_snapshot import read_frame
 from yield_forecast_models import (
     forecast_arima, forecast_ets, forecast_prophet,
     forecast_random_walk, forecast_monte_carlo, forecast_ma5, forecast_var
 )
 
 # Load data
-df = pd.read_csv('database/20251215_priceyield.csv')
-df['date'] = pd.to_datetime(df['date'], format='%d/%m/%Y')
+df = read_frame('bond', 'database/20251215_priceyield.csv')
 
 print("╔════════════════════════════════════════════════════════════════════╗")
 print("║          YIELD FORECAST BACKTEST RESULTS                          ║")
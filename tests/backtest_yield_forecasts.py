@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import sqlite3
 from datetime import datetime, timedelta
+from market_snapshot import read_frame
 from yield_forecast_models import (
     forecast_arima, forecast_ets, forecast_prophet,
     forecast_random_walk, forecast_monte_carlo,
@@ -24,8 +25,7 @@ class YieldForecastBacktester:
             tenor: Tenor to backtest ('05_year' or '10_year')
         """
         self.tenor = tenor
-        self.df = pd.read_csv(db_path)
-        self.df['date'] = pd.to_datetime(self.df['date'], format='%d/%m/%Y')
+        self.df = read_frame('bond', db_path)
         
         # Filter to single tenor, aggregate across series
         tenor_data = self.df[self.df['tenor'] == tenor].groupby('date')['yield'].mean()
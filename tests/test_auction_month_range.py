@@ -158,6 +158,19 @@ def test_month_range_across_year_boundary():
     print(f"\nFormatted table:\n{table}")
 
 
+def test_batch_month_lookup_matches_per_period_loader():
+    """load_auction_periods resolves a 16-year month range in one pass with identical results."""
+    from telegram_bot import get_auction_db, load_auction_periods
+
+    periods = [{'type': 'month', 'month': m, 'year': y} for y in range(2010, 2026) for m in range(1, 13)]
+    periods += [{'type': 'quarter', 'quarter': 2, 'year': 2023}, {'type': 'month', 'month': 1, 'year': 2099}]
+    assert load_auction_periods(periods) == [load_auction_period(p) for p in periods]
+
+    rows = get_auction_db().get_periods([(2024, 12), (2025, 1), (2099, 1)])
+    assert [(r['auction_year'], r['auction_month']) for r in rows] == [(2024, 12), (2025, 1)]
+    assert rows[0]['date'] == date(2024, 12, 31) and rows[0]['bi_rate'] is None
+
+
 if __name__ == '__main__':
     test_month_range_dec2024_to_jan2025()
     test_month_range_across_year_boundary()
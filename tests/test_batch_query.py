@@ -0,0 +1,64 @@
+"""Tests for the /query/batch endpoint and BondDB.lookup_points."""
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import app_fastapi
+
+QUESTIONS = [
+    "yield 10 year 2024-06-03",
+    "price fr101 2024-06-04",
+    "yield 05 year 2024-06-08",  # weekend: no rows
+    "average yield 10 year in 2024",  # not a POINT query
+    "yield 10 year 2024-06-03",
+]
+
+
+def _post(path, body):
+    async def run():
+        transport = httpx.ASGITransport(app=app_fastapi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+            if isinstance(body, list):
+                return [await client.post(path, json=b) for b in body]
+            return await client.post(path, json=body)
+    return asyncio.run(run())
+
+
+def test_batch_questions_match_single_queries():
+    resp = _post("/query/batch", {"queries": QUESTIONS})
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(len(QUESTIONS)))
+    assert "POINT" in lines[3]["error"] and "rows" not in lines[3]
+
+    singles = _post("/query", [{"q": q} for i, q in enumerate(QUESTIONS) if i != 3])
+    for line, single in zip([lines[i] for i in (0, 1, 2, 4)], singles):
+        result = single.json()["result"]
+        assert line["rows"] == result["rows"] and line["count"] == result["count"]
+        assert line["point_date"] == single.json()["intent"]["point_date"]
+    assert lines[2]["count"] == 0 and lines[0]["count"] > 0
+
+
+def test_batch_panel_of_dates_tenors_series():
+    dates = [d.date().isoformat() for d in pd.bdate_range("2024-01-01", "2024-12-31")]
+    resp = _post("/query/batch", {"dates": dates, "tenors": ["10 year", "05_year"], "stream": False})
+    results = resp.json()["results"]
+    assert resp.json()["count"] == len(results) == 2 * len(dates)
+    assert [r["tenor"] for r in results[:2]] == ["10_year", "05_year"]
+    db = app_fastapi.get_db("20251215_priceyield.csv")
+    for r in results[::37]:
+        want = [row[:2] + row[3:] for row in db.slice_rows(r["point_date"], r["point_date"], [r["tenor"]])]
+        assert [(x["series"], x["tenor"], x["price"], x["yield"]) for x in r["rows"]] == want
+
+    one = _post("/query/batch", {"dates": dates[:3], "series": ["fr100"], "stream": False}).json()["results"]
+    assert all(row["series"] == "FR100" for r in one for row in r["rows"])
+    assert _post("/query/batch", {"dates": ["2024-01-02"], "tenors": ["ten"]}).status_code == 400
+    assert _post("/query/batch", {}).status_code == 400
@@ -0,0 +1,52 @@
+"""Tests for the shared business-day calendar (bday_calendar)."""
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from bday_calendar import BDAY, bday_count, bday_range, closed_reason, is_bday, next_bdays
+from market_holidays import INDONESIA_HOLIDAYS
+from priceyield_20251223 import BondDB
+from yield_forecast_models import _bdays_between, _ensure_business_freq
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def test_calendar_matches_per_date_checks():
+    days = [date(2022, 12, 1) + timedelta(days=i) for i in range(4 * 366)]
+    want = np.array([d.weekday() < 5 and d not in INDONESIA_HOLIDAYS for d in days])
+    assert (is_bday(days) == want).all()
+    assert (is_bday(pd.DatetimeIndex(days)) == want).all() and [is_bday(d) for d in days] == want.tolist()
+    assert is_bday(pd.Timestamp("2024-04-10")) is False and is_bday("2024-04-16") is True
+    assert closed_reason(date(2024, 4, 13)) == "Saturday" and closed_reason(date(2024, 4, 16)) == ""
+    assert closed_reason(date(2024, 4, 10)) == "Indonesian public holiday"
+
+    # Eid 2024: Apr 8-12 and 15 closed, so the next business day after Apr 5 is Apr 16
+    assert list(next_bdays(date(2024, 4, 5), 2).date) == [date(2024, 4, 16), date(2024, 4, 17)]
+    assert list(next_bdays(date(2024, 4, 13), 1).date) == [date(2024, 4, 16)]
+    assert bday_count(date(2024, 4, 5), date(2024, 4, 17)) == 2
+    starts = np.array(days[:100], dtype="datetime64[D]")
+    counts = bday_count(starts, starts + 30)
+    assert counts.tolist() == [int(want[i:i + 30].sum()) for i in range(100)]
+    assert list(bday_range("2024-04-05", "2024-04-17").date) == [date(2024, 4, 5), date(2024, 4, 16), date(2024, 4, 17)]
+    assert pd.Timestamp("2024-04-05") + BDAY == pd.Timestamp("2024-04-16")
+
+
+def test_tables_and_forecast_inputs_use_the_calendar():
+    db = BondDB(BOND_CSV, snapshot=None)
+    cube = db.cube_frame(["10_year"], freq="B")
+    assert not cube["obs_date"].dt.date.isin(INDONESIA_HOLIDAYS).any()
+    assert len(cube) == len(bday_range(cube["obs_date"].min(), cube["obs_date"].max()))
+
+    s = db.fetch_series("SELECT obs_date, \"yield\" FROM ts WHERE series = 'FR100' ORDER BY obs_date")
+    grid = _ensure_business_freq(s)
+    assert grid.index.freq == BDAY and grid.notna().all()
+    assert (grid.index == bday_range(s.index.min(), s.index.max())).all()
+    assert grid.loc["2024-04-16"] == s.loc["2024-04-16"]  # first day after Eid
+    assert _bdays_between(grid.index[-1], "2025-01-03") == 2  # Jan 1 is a holiday
@@ -0,0 +1,101 @@
+"""Tests for incremental BondDB.append_observations()."""
+import os
+import shutil
+import sys
+from datetime import date
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+ROWS = [
+    # replaces an existing observation and carries a gap forward
+    {"date": "2026-01-02", "series": "FR108", "tenor": "10_year", "price": 101.0, "yield": 6.3},
+    {"date": "2026-01-05", "series": "fr108", "tenor": "10_year", "price": None, "yield": None},
+    # back-dated row in the middle of a series' history
+    {"date": "2025-06-14", "series": "FR104", "tenor": "05_year", "price": 99.5, "yield": 6.7},
+    # brand-new series
+    {"date": "2026-01-05", "series": "FR200", "tenor": "05_year", "price": 100.0, "yield": 6.0,
+     "maturity_date": "2031-04-05"},
+]
+
+
+def _ts(db):
+    return db.con.execute("SELECT * FROM ts ORDER BY series, tenor, obs_date").fetchall()
+
+
+def test_append_matches_full_rebuild(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    db = BondDB(csv, snapshot=None)
+    result = db.append_observations(ROWS, persist=True)
+
+    assert result.rows == 4 and result.replaced == 1
+    assert result.series == ["FR104", "FR108", "FR200"]
+    assert result.start_date == date(2025, 6, 14) and result.end_date == date(2026, 1, 5)
+    assert db.data_version == 1
+
+    # the persisted CSV rebuilds to exactly the incrementally-updated table
+    assert _ts(BondDB(csv, snapshot=None)) == _ts(db)
+    assert db.con.execute(
+        "SELECT price, \"yield\" FROM ts WHERE series = 'FR108' AND obs_date = DATE '2026-01-05'"
+    ).fetchone() == (101.0, 6.3)
+
+    with open(csv, "rb") as fh:
+        data = fh.read()
+    assert b"\n" not in data.replace(b"\r\n", b"") and not data.endswith(b"\r\n")
+    assert b"05/01/2026,YM8024957,FR108,6.5,15/04/2036,,,10_year" in data
+
+
+def test_append_invalidates_only_overlapping_cached_aggregates(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    db = BondDB(csv, snapshot=None)
+    early = (date(2024, 1, 1), date(2024, 3, 31), "yield", "avg", None, "10_year")
+    late = (date(2025, 12, 1), date(2026, 1, 31), "yield", "avg", None, "10_year")
+    other_tenor = (date(2025, 12, 1), date(2026, 1, 31), "yield", "avg", None, "05_year")
+    before = {k: db.aggregate(*k) for k in (early, late, other_tenor)}
+
+    seen = []
+    db.on_append(seen.append)
+    db.append_observations([{"date": date(2026, 1, 5), "series": "FR103", "tenor": "10_year",
+                             "price": 90.0, "yield": 9.0}])
+    assert len(seen) == 1 and seen[0].touches(*late[:2], tenor="10_year")
+    hits = db._query_cache.hits
+    assert db.aggregate(*early) == before[early]
+    assert db.aggregate(*other_tenor) == before[other_tenor]
+    assert db._query_cache.hits == hits + 2
+    assert db.aggregate(*late) != before[late]
+    assert db._query_cache.hits == hits + 2
+
+
+def test_append_static_dates_parse_before_any_write(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    db = BondDB(csv, snapshot=None)
+    late = (date(2025, 12, 1), date(2026, 1, 31), "yield", "avg", None, "10_year")
+    before = db.aggregate(*late)
+    row = {"date": "05/01/2026", "series": "FR300", "tenor": "10_year", "price": 95.0, "yield": 9.0,
+           "coupon": 7.0, "maturity_date": "not a date"}
+
+    # an unparseable maturity rejects the whole append: no rows, no version bump, cache intact
+    try:
+        db.append_observations([row])
+        assert False, "expected ValueError"
+    except ValueError as e:
+        assert "maturity_date" in str(e)
+    assert db.data_version == 0
+    assert db.con.execute("SELECT COUNT(*) FROM ts_raw WHERE series = 'FR300'").fetchone()[0] == 0
+    assert db.aggregate(*late) == before
+
+    # DD/MM/YYYY, the CSV's own layout, is accepted for both dates
+    db.append_observations([{**row, "maturity_date": "15/08/2031"}])
+    assert db.data_version == 1
+    assert db.con.execute(
+        "SELECT coupon, maturity_date FROM bond_static WHERE series = 'FR300'"
+    ).fetchone() == (7.0, date(2031, 8, 15))
+    assert db.aggregate(*late) != before
@@ -0,0 +1,123 @@
+"""Tests for BondDB's precomputed per-tenor daily cube (ts_cube)."""
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from bday_calendar import bday_range
+from priceyield_20251223 import BondDB, get_metric_series
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def _reference_daily(db, tenor, metric):
+    """Per-tenor average across series per observed date, forward-filled to calendar days."""
+    col = '"yield"' if metric == "yield" else metric
+    df = db.con.execute(
+        f"SELECT obs_date, AVG({col}) AS v FROM ts WHERE tenor = ? GROUP BY obs_date ORDER BY obs_date", [tenor]
+    ).fetchdf()
+    s = pd.Series(df["v"].to_numpy(), index=pd.to_datetime(df["obs_date"]))
+    return s.reindex(pd.date_range(s.index.min(), s.index.max(), freq="D")).ffill()
+
+
+def test_cube_matches_groupby_and_ffill():
+    db = BondDB(BOND_CSV, snapshot=None)
+    for tenor in ("05_year", "10_year"):
+        for metric in ("price", "yield"):
+            want = _reference_daily(db, tenor, metric)
+            got = db.cube_frame([tenor], freq="D")
+            np.testing.assert_allclose(got[f"{metric}_mean"].to_numpy(), want.to_numpy())
+            assert (got["obs_date"].to_numpy() == want.index.to_numpy()).all()
+
+            bdays = db.cube_frame([tenor], freq="B")
+            assert (bdays["obs_date"].dt.dayofweek < 5).all()
+            assert len(bdays) == len(bday_range(want.index.min(), want.index.max()))
+
+            # observed-day vector used by forecasts equals the old GROUP BY result
+            series = get_metric_series(db, None, tenor, metric)
+            obs = _reference_daily(db, tenor, metric).dropna()
+            obs = obs[obs.index.isin(db.cube_frame([tenor], freq="obs")["obs_date"])]
+            np.testing.assert_allclose(series.to_numpy(), obs.to_numpy())
+
+
+def test_cube_window_and_append_refresh(tmp_path):
+    csv = tmp_path / "bonds.csv"
+    csv.write_bytes(open(BOND_CSV, "rb").read())
+    db = BondDB(str(csv), snapshot=None)
+
+    window = db.cube_frame(["10_year"], date(2025, 1, 4), date(2025, 1, 5))
+    assert len(window) == 2 and not window["observed"].any()
+    assert window["yield_count"].eq(0).all() and window["yield_mean"].notna().all()
+
+    last = db.cube_frame(["10_year"])["obs_date"].max()
+    db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year",
+                             "price": 99.0, "yield": 6.5}])
+    tail = db.cube_frame(["10_year"], last)
+    assert tail["obs_date"].max() == pd.Timestamp(2026, 1, 7)
+    assert tail.iloc[-1]["yield_mean"] == 6.5 and tail.iloc[-1]["observed"]
+    # gap days carry the previous observation forward
+    assert tail.iloc[1:-1]["yield_mean"].eq(tail.iloc[0]["yield_mean"]).all()
+    # other tenors untouched
+    assert db.cube_frame(["05_year"])["obs_date"].max() == last
+
+
+def _legacy_plot_daily(db, start, end, metric):
+    """All-tenor plot line before the cube: ffill every series over the calendar, then average rows."""
+    df = db.con.execute(
+        'SELECT obs_date, series, tenor, price, "yield" FROM ts WHERE obs_date BETWEEN ? AND ? ORDER BY obs_date',
+        [start.isoformat(), end.isoformat()],
+    ).fetchdf()
+    df["obs_date"] = pd.to_datetime(df["obs_date"])
+    all_dates = pd.date_range(start, end, freq="D")
+    filled = []
+    for _, g in df.groupby("series"):
+        g2 = g.set_index("obs_date").reindex(all_dates)
+        g2[["price", "yield"]] = g2[["price", "yield"]].ffill()
+        filled.append(g2)
+    return pd.concat(filled).groupby(level=0)[metric].mean()
+
+
+def test_cube_average_matches_legacy_plot(tmp_path):
+    csv = tmp_path / "uneven.csv"
+    rows = ["date,cusip,series,coupon,maturity_date,price,yield,tenor"]
+    # two 05_year series and one 10_year series that skips 5 Jan
+    for day, p1, y1, p2, y2 in [("02", 99.0, 6.10, 101.0, 6.30), ("03", 99.2, 6.08, 101.5, 6.25),
+                                ("04", 99.4, 6.06, 101.2, 6.28), ("05", 99.1, 6.11, 101.4, 6.26),
+                                ("08", 99.3, 6.07, 101.1, 6.29)]:
+        rows.append(f"{day}/01/2024,X1,FR1,6.0,15/08/2029,{p1},{y1},05_year")
+        rows.append(f"{day}/01/2024,X2,FR2,6.5,15/02/2029,{p2},{y2},05_year")
+    for day, p, y in [("02", 104.0, 6.60), ("03", 104.5, 6.55), ("04", 104.2, 6.58), ("08", 104.1, 6.59)]:
+        rows.append(f"{day}/01/2024,X3,FR3,7.0,15/02/2034,{p},{y},10_year")
+    csv.write_text("\n".join(rows) + "\n")
+
+    cases = [(BondDB(str(csv), snapshot=None), date(2024, 1, 2), date(2024, 1, 8)),
+             (BondDB(BOND_CSV, snapshot=None), date(2024, 3, 4), date(2024, 6, 28))]
+    for db, start, end in cases:
+        cube = db.cube_frame(None, start, end, freq="D")
+        for metric in ("price", "yield"):
+            want = _legacy_plot_daily(db, start, end, metric)
+            got = BondDB.cube_average(cube, metric).set_index("obs_date")[metric]
+            assert (got.index == want.index).all()
+            np.testing.assert_allclose(got.to_numpy(), want.to_numpy())
+
+
+def test_numpy_accessors_match_fetchall():
+    db = BondDB(BOND_CSV, snapshot=None)
+    sql = 'SELECT obs_date, series, price, "yield" FROM ts WHERE tenor = ? ORDER BY obs_date, series'
+    rows = db.con.execute(sql, ["05_year"]).fetchall()
+    cols = db.fetch_numpy(sql, ["05_year"])
+    assert cols["obs_date"].dtype.kind == "M" and cols["yield"].dtype == np.float64
+    assert not cols["yield"].flags.writeable
+    assert list(pd.DatetimeIndex(cols["obs_date"]).date) == [r[0] for r in rows]
+    np.testing.assert_allclose(cols["price"], [np.nan if r[2] is None else r[2] for r in rows])
+
+    s = get_metric_series(db, "FR104", "05_year", "price")
+    assert isinstance(s.index, pd.DatetimeIndex) and s.notna().all()
+    s.iloc[0] = 0.0  # callers get a writable copy
+    assert get_metric_series(db, "FR104", "05_year", "price").iloc[0] != 0.0
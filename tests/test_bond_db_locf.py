@@ -0,0 +1,61 @@
+"""Parity tests: materialized LOCF `ts` table vs the legacy correlated-subquery view."""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+
+LEGACY_TS_VIEW = """
+    CREATE VIEW ts_legacy AS
+    SELECT
+        tr.obs_date, tr.series, tr.tenor,
+        (SELECT r.price FROM ts_raw r
+          WHERE r.series = tr.series AND r.obs_date <= tr.obs_date AND r.price IS NOT NULL
+          ORDER BY r.obs_date DESC LIMIT 1) AS price,
+        (SELECT r."yield" FROM ts_raw r
+          WHERE r.series = tr.series AND r.obs_date <= tr.obs_date AND r."yield" IS NOT NULL
+          ORDER BY r.obs_date DESC LIMIT 1) AS "yield"
+    FROM (SELECT DISTINCT obs_date, series, tenor FROM ts_raw) tr
+"""
+
+
+def _assert_parity(db):
+    db.con.execute(LEGACY_TS_VIEW)
+    cols = 'obs_date, series, tenor, price, "yield"'
+    n_new = db.con.execute("SELECT COUNT(*) FROM ts").fetchone()[0]
+    n_old = db.con.execute("SELECT COUNT(*) FROM ts_legacy").fetchone()[0]
+    assert n_new == n_old
+    only_new = db.con.execute(f"SELECT {cols} FROM ts EXCEPT ALL SELECT {cols} FROM ts_legacy").fetchall()
+    only_old = db.con.execute(f"SELECT {cols} FROM ts_legacy EXCEPT ALL SELECT {cols} FROM ts").fetchall()
+    assert only_new == []
+    assert only_old == []
+
+
+def test_ts_matches_legacy_view_on_bundled_csv():
+    db = BondDB('database/20251215_priceyield.csv')
+    _assert_parity(db)
+
+
+def test_ts_matches_legacy_view_with_gaps(tmp_path):
+    csv = tmp_path / "gaps.csv"
+    csv.write_text(
+        "date,cusip,series,coupon,maturity_date,price,yield,tenor\n"
+        "02/01/2024,X1,FR1,6.0,15/08/2029,,,05_year\n"        # leading gap stays NULL
+        "03/01/2024,X1,FR1,6.0,15/08/2029,99.5,6.10,05_year\n"
+        "04/01/2024,X1,FR1,6.0,15/08/2029,,6.12,05_year\n"    # price carried forward
+        "05/01/2024,X1,FR1,6.0,15/08/2029,,,05_year\n"        # both carried forward
+        "03/01/2024,X2,fr2,6.5,15/02/2034,101.0,6.40,10_year\n"
+        "08/01/2024,X2,fr2,6.5,15/02/2034,,,10_year\n"
+    )
+    db = BondDB(str(csv))
+    _assert_parity(db)
+
+    rows = db.con.execute(
+        "SELECT obs_date, price, \"yield\" FROM ts WHERE series = 'FR1' ORDER BY obs_date"
+    ).fetchall()
+    assert [(r[1], r[2]) for r in rows] == [(None, None), (99.5, 6.10), (99.5, 6.12), (99.5, 6.12)]
+    # Upper-cased series names carry forward as well
+    assert db.con.execute("SELECT price FROM ts WHERE series = 'FR2' AND obs_date = '2024-01-08'").fetchone()[0] == 101.0
@@ -0,0 +1,84 @@
+"""Tests for BondDB intraday ticks and the cached OHLC/VWAP bar tables."""
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB, bar_minutes
+from telegram_bot import format_bond_bars_table, load_bond_bars, parse_bond_bars_query
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def _ticks(start, n, seed):
+    rng = np.random.default_rng(seed)
+    ts = pd.Timestamp(start) + pd.to_timedelta(np.sort(rng.choice(2 * 24 * 3600, n, replace=False)), unit="s")
+    series = rng.choice(["FR104", "FR108"], n)
+    return pd.DataFrame({
+        "timestamp": ts, "series": series,
+        "tenor": np.where(series == "FR104", "05_year", "10_year"),
+        "price": 100 + rng.normal(0, 0.5, n).cumsum() / 10,
+        "yield": 6.5 + rng.normal(0, 0.02, n).cumsum() / 10,
+        "volume": np.where(rng.random(n) < 0.2, np.nan, rng.integers(1, 50, n)),
+    })
+
+
+def _reference(ticks, freq, series):
+    g = ticks[ticks["series"] == series].set_index("timestamp").sort_index()
+    ohlc = g["yield"].resample(freq).ohlc().dropna()
+    w = g["volume"].fillna(1)
+    vwap = (g["yield"] * w).resample(freq).sum() / w.resample(freq).sum()
+    return ohlc, vwap.loc[ohlc.index]
+
+
+def test_bars_match_pandas_resample_and_refresh_on_append(tmp_path):
+    ticks = _ticks("2026-01-05", 4000, 1)
+    path = tmp_path / "ticks.csv"
+    ticks.iloc[:3000].to_csv(path, index=False)
+    db = BondDB(BOND_CSV, snapshot=None, ticks=str(path))
+    for freq in ("1min", "15min", "1h", "1d"):
+        db.bars(freq)  # build the cached table before the append
+    db.append_ticks(ticks.iloc[3000:])
+
+    for freq in ("1min", "15min", "1h", "1d"):
+        for series in ("FR104", "FR108"):
+            ohlc, vwap = _reference(ticks, freq, series)
+            got = db.bars(freq, series=series, metric="yield")
+            assert (got["bar_start"].to_numpy() == ohlc.index.to_numpy()).all()
+            for col in ("open", "high", "low", "close"):
+                np.testing.assert_allclose(got[col].to_numpy(), ohlc[col].to_numpy())
+            np.testing.assert_allclose(got["avg"].to_numpy(), vwap.to_numpy())
+    assert db.bars("1h")["ticks"].sum() == len(ticks)
+    # a date-only end includes that whole day
+    day = db.bars("1h", tenor="10_year", start=date(2026, 1, 5), end=date(2026, 1, 5))
+    assert len(day) and (day["bar_start"].dt.date == date(2026, 1, 5)).all()
+
+
+def test_bar_parsing_and_telegram_table(tmp_path):
+    assert bar_minutes("1h") == 60 and bar_minutes("daily") == 1440 and bar_minutes(15) == 15
+    with pytest.raises(ValueError):
+        bar_minutes("7min")
+
+    req = parse_bond_bars_query("tab yield 10 year 15min bars 2026-01-05")
+    assert req == {"metric": "yield", "tenor": "10_year", "series": None, "freq": "15min",
+                   "start_date": date(2026, 1, 5), "end_date": date(2026, 1, 5), "plot": False}
+    assert parse_bond_bars_query("plot price fr104 5m ohlc")["plot"]
+    assert parse_bond_bars_query("tab yield 10 year from 2023 to 2024") is None
+
+    path = tmp_path / "ticks.parquet"
+    _ticks("2026-01-05", 500, 2).to_parquet(path)
+    db = BondDB(BOND_CSV, snapshot=None, ticks=str(path))
+    bars = load_bond_bars(db, parse_bond_bars_query("tab yield 10 year 1h bars"))
+    assert len(bars) and (bars["bar_start"].dt.date == date(2026, 1, 6)).all()  # latest tick day
+    table = format_bond_bars_table(bars, "yield")
+    assert "FR108 (10 year)" in table and "Close" in table
+
+    empty = BondDB(BOND_CSV, snapshot=None)
+    assert empty.tick_coverage() == (None, None) and load_bond_bars(empty, req).empty
@@ -0,0 +1,70 @@
+"""Tests for BondDB's out-of-core (file-backed) mode and Parquet sources."""
+import os
+import sys
+from datetime import date
+
+import duckdb
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+TABLES = ("ts_raw", "ts", "ts_cube", "bond_static")
+
+
+def _table(db, name):
+    return db.con.execute(f"SELECT * FROM {name} ORDER BY ALL").fetchall()
+
+
+def test_file_backed_tables_match_and_are_reused(tmp_path):
+    mem = BondDB(BOND_CSV, snapshot=None)
+    path = str(tmp_path / "bonds.duckdb")
+    db = BondDB(BOND_CSV, database=path, memory_limit="128MB")
+    assert db.out_of_core and not mem.out_of_core
+    for name in TABLES:
+        assert _table(db, name) == _table(mem, name)
+    start, end = date(2024, 5, 1), date(2024, 6, 30)
+    assert db.slice_rows(start, end) == mem.slice_rows(start, end)
+    assert db.aggregate(start, end, "yield", "avg", None, "10_year") == \
+        mem.aggregate(start, end, "yield", "avg", None, "10_year")
+
+    # appended rows stay in the file; reopening does not reload the CSV
+    db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year",
+                             "price": 99.0, "yield": 6.5}])
+    # recomputed ts rows keep the file's (tenor, obs_date, series) layout
+    db.append_observations([{"date": d, "series": s, "tenor": "10_year", "price": 99.0, "yield": 6.5}
+                            for s in ("FR108", "FR200") for d in ("2026-01-08", "2026-01-09")])
+    rows = db.con.execute(
+        "SELECT tenor, obs_date, series FROM ts WHERE obs_date >= '2026-01-08' ORDER BY rowid"
+    ).fetchall()
+    assert len(rows) == 4 and rows == sorted(rows)
+    db.close()
+    again = BondDB(BOND_CSV, database=path)
+    assert again.slice_rows(date(2026, 1, 7), date(2026, 1, 7)) == [
+        ("FR108", "10_year", date(2026, 1, 7), 99.0, 6.5)]
+
+
+def test_partitioned_parquet_source_and_bond_db_dir(tmp_path, monkeypatch):
+    dataset = tmp_path / "dataset"
+    con = duckdb.connect()
+    con.execute(f"""
+        COPY (SELECT *, right(CAST(date AS VARCHAR), 4) AS year FROM read_csv_auto('{BOND_CSV}', header=True))
+        TO '{dataset.as_posix()}' (FORMAT PARQUET, PARTITION_BY (tenor, year))
+    """)
+    con.close()
+    mem = BondDB(BOND_CSV, snapshot=None)
+
+    monkeypatch.setenv("BOND_DB_DIR", str(tmp_path / "dbs"))
+    db = BondDB(str(dataset))
+    assert db.database.startswith(str(tmp_path / "dbs"))
+    for name in TABLES:
+        assert _table(db, name) == _table(mem, name)
+    try:
+        db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year"}], persist=True)
+    except ValueError as e:
+        assert "CSV" in str(e)
+    else:
+        raise AssertionError("persist=True must be rejected for Parquet sources")
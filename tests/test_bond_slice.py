@@ -0,0 +1,46 @@
+"""Tests for BondDB's per-tenor date index (slice / slice_rows)."""
+import os
+import sys
+from datetime import date
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+ROWS_SQL = ('SELECT series, tenor, obs_date, price, "yield" FROM ts '
+            "WHERE obs_date BETWEEN ? AND ? ORDER BY tenor, obs_date, series")
+
+
+def test_slice_matches_sql_ranges():
+    db = BondDB(BOND_CSV, snapshot=None)
+    for start, end in [(date(2024, 6, 3), date(2024, 6, 3)), (date(2024, 6, 8), date(2024, 6, 9)),
+                       (date(2023, 12, 15), date(2024, 1, 15)), (date(2020, 1, 1), date(2030, 1, 1))]:
+        assert db.slice_rows(start, end) == db.con.execute(ROWS_SQL, [start, end]).fetchall()
+    assert db.slice_rows(date(2024, 6, 3), date(2024, 6, 7), ["05_year"], "fr101") == [
+        r for r in db.con.execute(ROWS_SQL, [date(2024, 6, 3), date(2024, 6, 7)]).fetchall() if r[1] == "05_year"
+    ]
+
+    full = db.slice("10_year")
+    part = db.slice("10_year", "2024-01-01", "2024-12-31")
+    assert np.shares_memory(full["yield"], part["yield"]) and not part["yield"].flags.writeable
+    assert (part["obs_date"] >= np.datetime64("2024-01-01")).all() and len(part["obs_date"]) == 261
+    assert len(db.slice("99_year")["obs_date"]) == 0
+
+
+def test_append_refreshes_only_touched_tenor(tmp_path):
+    csv = tmp_path / "bonds.csv"
+    csv.write_bytes(open(BOND_CSV, "rb").read())
+    db = BondDB(str(csv), snapshot=None)
+    five, ten = db.slice("05_year"), db.slice("10_year")
+    db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year",
+                             "price": 99.0, "yield": 6.5}])
+    # the untouched tenor keeps its index, the appended one is rebuilt
+    assert "10_year" not in db._slices
+    assert np.shares_memory(db.slice("05_year")["yield"], five["yield"])
+    assert db.slice_rows(date(2026, 1, 7), date(2026, 1, 7)) == [("FR108", "10_year", date(2026, 1, 7), 99.0, 6.5)]
+    assert len(db.slice("10_year")["obs_date"]) == len(ten["obs_date"]) + 1
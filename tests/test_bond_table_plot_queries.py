@@ -272,5 +272,27 @@ class TestQuarterParsing:
         assert result['end_date'].year == 2025
 
 
+class TestFormatBondMetricsTable:
+
+    def test_rows_are_per_series_observations(self):
+        """Count/Min/Max summarize every series' rows in ts, not per-date averages."""
+        import os
+        from priceyield_20251223 import BondDB
+        from telegram_bot import format_bond_metrics_table
+        db = BondDB(os.path.join(os.path.dirname(os.path.dirname(__file__)), "database", "20251215_priceyield.csv"),
+                    snapshot=None)
+        # a second 05_year series on two days of the window
+        db.append_observations([
+            {"date": "2025-02-03", "series": "FR300", "tenor": "05_year", "price": 90.0, "yield": 9.9},
+            {"date": "2025-02-04", "series": "FR300", "tenor": "05_year", "price": 90.0, "yield": 9.8},
+        ])
+        start, end = date(2025, 2, 1), date(2025, 2, 4)
+        table = format_bond_metrics_table(db, start, end, ["yield"], ["05_year"])
+        days = db.con.execute("SELECT COUNT(DISTINCT obs_date) FROM ts WHERE tenor = '05_year' "
+                              "AND obs_date BETWEEN ? AND ?", [start, end]).fetchone()[0]
+        assert f"Count        | {days + 2:>12d}" in table
+        assert f"Max          | {9.9:>12.2f}" in table
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""Concurrent access to BondDB and the FastAPI endpoints."""
+import asyncio
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import app_fastapi
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def test_threads_get_own_cursor_and_read_during_append(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    db = BondDB(csv, snapshot=None)
+    total = db.con.execute("SELECT COUNT(*) FROM ts WHERE tenor = '10_year'").fetchone()[0]
+    cursors = set()
+    lock = threading.Lock()
+
+    def reader(i):
+        with lock:
+            cursors.add(id(db.con))
+        n = db.con.execute("SELECT COUNT(*) FROM ts WHERE tenor = '10_year'").fetchone()[0]
+        db.aggregate(date(2024, 1, 1), date(2024, 12, 31), "yield", "avg", None, "10_year")
+        return n
+
+    def writer():
+        return db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year",
+                                        "price": 99.0, "yield": 6.5}])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(reader, i) for i in range(32)]
+        futures.append(pool.submit(writer))
+        results = [f.result() for f in futures]
+
+    # readers see either the old or the new table, never a partial one
+    assert all(n >= total for n in results[:-1])
+    assert results[-1].rows == 1
+    assert len(cursors) > 1
+    assert db.con.execute(
+        "SELECT \"yield\" FROM ts WHERE series = 'FR108' AND obs_date = DATE '2026-01-07'"
+    ).fetchone() == (6.5,)
+
+
+def test_concurrent_query_and_plot_requests():
+    queries = [
+        "average yield 10 year in 2024",
+        "yield 10 year 2024-06-03",
+        "average yield 05 year in Q1 2025",
+        "max price 10 year in 2025",
+    ]
+
+    async def run():
+        transport = httpx.ASGITransport(app=app_fastapi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+            sequential = [(await client.post("/query", json={"q": q})).json() for q in queries]
+            calls = [client.post("/query", json={"q": q}) for q in queries * 10]
+            calls += [client.post("/plot", json={"q": "yield 10 year 2023"})
+                      for _ in range(10)]
+            responses = await asyncio.gather(*calls)
+        return sequential, responses
+
+    sequential, responses = asyncio.run(run())
+    assert all(r.status_code == 200 for r in responses)
+    for i, r in enumerate(responses[:40]):
+        assert r.json() == sequential[i % len(queries)]
+    plots = responses[40:]
+    assert all(r.headers["content-type"] == "image/png" for r in plots)
+    assert len({r.content for r in plots}) == 1
+
+
+def test_append_endpoint_does_not_block_the_event_loop(tmp_path, monkeypatch):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv"), csv)
+    db = BondDB(csv, snapshot=None)
+    append = db.append_observations
+    finished = []
+
+    def slow_append(*args, **kwargs):
+        time.sleep(1.0)
+        finished.append("append")
+        return append(*args, **kwargs)
+
+    monkeypatch.setattr(db, "append_observations", slow_append)
+    monkeypatch.setattr(app_fastapi, "get_db", lambda csv: db)
+    monkeypatch.setenv("ADMIN_API_TOKEN", "secret")
+    row = {"date": "2026-01-07", "series": "FR108", "tenor": "10_year", "price": 100.0, "yield": 6.5}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app_fastapi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+            async def health():
+                await asyncio.sleep(0.2)  # while the append is running
+                r = await client.get("/health")
+                finished.append("health")
+                return r
+            return await asyncio.gather(
+                client.post("/admin/bond/append", json={"rows": [row]}, headers={"X-Admin-Token": "secret"}),
+                health(),
+            )
+
+    appended, health = asyncio.run(run())
+    assert appended.status_code == 200 and health.status_code == 200
+    assert finished == ["health", "append"]
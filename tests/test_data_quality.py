@@ -0,0 +1,73 @@
+"""Tests for the load-time data-quality table (BondDB ts_quality) and GET /quality."""
+import asyncio
+import os
+import shutil
+import sys
+from datetime import date
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import app_fastapi
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def _get(url):
+    async def run():
+        transport = httpx.ASGITransport(app=app_fastapi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+            return await client.get(url)
+    return asyncio.run(run())
+
+
+def _quality(db, series=None):
+    where = "WHERE series = ?" if series else ""
+    return db.con.execute(f"SELECT * FROM ts_quality {where} ORDER BY ALL", [series] if series else []).fetchall()
+
+
+def test_quality_flags_exactly_the_imputed_points():
+    db = BondDB(BOND_CSV, snapshot=None)
+    ts = db.con.execute("SELECT * FROM ts ORDER BY series, tenor, obs_date").fetchdf()
+    flagged = db.flag_quality(ts)
+    raw_missing = db.con.execute("""
+        SELECT price IS NULL OR "yield" IS NULL FROM ts_raw ORDER BY series, tenor, obs_date
+    """).fetchdf().iloc[:, 0].to_numpy()
+    assert flagged["imputed"].sum() > 0 and (flagged["imputed"].to_numpy() == raw_missing).all()
+
+    gaps = db.quality_events(["gap"], series="fr100")
+    assert (gaps["start_date"].astype(str) + ".." + gaps["end_date"].astype(str)).tolist()[3] == "2024-05-17..2024-05-28"
+    assert gaps["n"].tolist()[3] == 6  # business days, the weekend and 2024-05-23/24 holidays excluded
+    # Eid placeholder rows (no prices) are holiday runs, not gaps
+    eid = db.quality_events(["holiday"], date(2024, 4, 8), date(2024, 4, 12), series="FR100")
+    assert eid[["n", "value"]].values.tolist() == [[5, 0.0]]
+
+    body = _get("/quality?series=FR100&kind=outlier").json()
+    (summary,) = body["summary"]
+    assert summary["bdays"] == 240 and summary["gap_days"] == 10 and summary["first_date"] == "2024-01-02"
+    assert summary["outlier_events"] == len(body["events"]) and {e["kind"] for e in body["events"]} == {"outlier"}
+    assert _get("/quality?kind=typo").status_code == 400
+
+
+def test_append_recomputes_only_affected_series(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    db = BondDB(csv, snapshot=None)
+    before = {s: _quality(db, s) for s in ("FR100", "FR104")}
+
+    rows = [{"date": d, "series": "FR108", "tenor": "10_year", "price": 101.0, "yield": 6.3}
+            for d in ("2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08")]
+    rows.append({"date": "2026-01-12", "series": "FR108", "tenor": "10_year", "price": None, "yield": None})
+    db.append_observations(rows, persist=True)
+
+    assert _quality(db, "FR100") == before["FR100"] and _quality(db, "FR104") == before["FR104"]
+    stale = db.quality_events(["stale"], series="FR108")
+    assert stale.astype({"start_date": str})[["start_date", "n", "value"]].values.tolist() == [["2026-01-05", 4, 6.3]]
+    gaps = db.quality_events(["gap"], series="FR108").astype({"start_date": str, "end_date": str})
+    assert gaps[["start_date", "end_date", "n"]].values.tolist() == [["2026-01-09", "2026-01-12", 2]]
+    # the incremental table equals a full build from the persisted source
+    assert _quality(BondDB(csv, snapshot=None)) == _quality(db)
@@ -0,0 +1,63 @@
+"""Tests for the hot-reloading database cache."""
+import os
+import shutil
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from data_reload import ReloadingCache
+from priceyield_20251223 import BondDB
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def _count(db, series):
+    return db.con.execute("SELECT COUNT(*) FROM ts WHERE series = ?", [series]).fetchone()[0]
+
+
+def test_reload_swaps_instance_and_keeps_old_usable(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    cache = ReloadingCache(interval=0)
+    old = cache.get("bond", lambda: BondDB(csv, snapshot=None), [csv])
+    assert cache.get("bond", lambda: None, [csv]) is old
+    assert cache.check() == []
+    v1 = cache.data_version
+
+    with open(csv, "a") as fh:
+        fh.write("\r\n02/02/2026,BY0,FR999,6.0,15/08/2031,100.0,6.0,05_year\r\n")
+    os.utime(csv, ns=(os.stat(csv).st_atime_ns, os.stat(csv).st_mtime_ns + 1_000_000_000))
+    seen = []
+    cache.on_reload("bond", seen.append)
+    assert cache.check() == ["bond"]
+
+    new = cache.get("bond", lambda: None, [csv])
+    assert new is not old and seen == [new]
+    assert _count(new, "FR999") == 1
+    assert _count(old, "FR999") == 0  # in-flight holders still see the previous data
+    assert cache.data_version > v1
+    status = cache.status()
+    assert status["entries"]["bond"]["version"] == 2
+    assert status["last_reload"] is not None
+
+
+def test_failed_reload_keeps_previous_instance(tmp_path):
+    csv = str(tmp_path / "bonds.csv")
+    shutil.copy2(BOND_CSV, csv)
+    cache = ReloadingCache(interval=0)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ValueError("broken CSV")
+        return BondDB(csv, snapshot=None)
+
+    db = cache.get("bond", loader, [csv])
+    os.utime(csv, ns=(0, 0))
+    assert cache.check() == []
+    assert cache.get("bond", loader, [csv]) is db
+    # same broken file is not retried on every poll
+    assert cache.check() == [] and len(calls) == 2
@@ -0,0 +1,71 @@
+"""Tests for the fit-once horizon engine (yield_forecast_path)."""
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import forecast_pool
+import model_cache
+import priceyield_20251223 as priceyield
+import yield_forecast_models
+from bday_calendar import bday_range, next_bdays
+
+
+def _series(n=80):
+    """A short yield series (< 90 obs, so method='all' skips Prophet)."""
+    idx = bday_range("2025-06-02", "2025-12-31")[-n:]
+    rng = np.random.default_rng(7)
+    return pd.Series(6.3 + np.cumsum(rng.normal(0, 0.02, n)), index=idx)
+
+
+def _same(a, b):
+    assert a.keys() == b.keys()
+    for k in a:
+        if isinstance(a[k], float):
+            assert math.isclose(a[k], b[k], rel_tol=1e-9), k
+        else:
+            assert a[k] == b[k], k
+
+
+def test_path_matches_per_date_forecasts():
+    s = _series()
+    targets = [d.date() for d in next_bdays(s.index[-1], 5)]
+    path = priceyield.yield_forecast_path(s, targets, method="all")
+    assert len(path) == 5
+    for target, res in zip(targets, path):
+        want = {"prophet": "skipped: need >=90 obs", "gru": "skipped: need >=150 obs"}
+        for m in ("arima", "ets", "random_walk", "monte_carlo", "ma5", "var"):
+            val = priceyield.yield_forecast(s, target, method=m)
+            want[m] = val[0] if isinstance(val, tuple) else val
+        want["average"] = priceyield._ensemble_average([want[m] for m in ("arima", "ets", "random_walk", "monte_carlo", "ma5", "var")])
+        assert set(res.pop("bands")) == {"p05", "p25", "p50", "p75", "p95"}
+        _same({k: want[k] for k in res}, res)
+    assert {k: v for k, v in priceyield.yield_forecast(s, targets[3], method="all").items() if k != "bands"} == path[3]
+    arima = priceyield.yield_forecast_path(s, targets, method="arima")
+    assert arima[2] == priceyield.yield_forecast(s, targets[2], method="arima")
+
+
+def test_next_days_fits_each_model_once(monkeypatch):
+    fits = []
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 0)  # count fits in this process
+    model_cache.clear()
+    fit_arima, arima_path = yield_forecast_models.FITTED_MODELS["arima"]
+
+    def counting_fit(*args, **kwargs):
+        fits.append(1)
+        return fit_arima(*args, **kwargs)
+
+    monkeypatch.setitem(yield_forecast_models.FITTED_MODELS, "arima", (counting_fit, arima_path))
+    monkeypatch.setattr(priceyield, "get_metric_series", lambda *a, **k: _series())
+    out = priceyield.forecast_metric_next_days(None, "10_year", metric="yield", days=5)
+    assert len(fits) == 1
+    assert [f["label"] for f in out["forecasts"]] == ["T+1", "T+2", "T+3", "T+4", "T+5"]
+    assert [f["date"] for f in out["forecasts"]] == list(next_bdays(_series().index[-1], 5).date)
+    assert all(f["average"] == f["models"]["average"] is not None for f in out["forecasts"])
+    assert len(out["last_obs"]) == 5
@@ -0,0 +1,93 @@
+"""Tests for the parallel forecast ensemble (forecast_pool)."""
+import asyncio
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import forecast_pool
+import model_cache
+import priceyield_20251223 as priceyield
+from bday_calendar import bday_range, next_bdays
+
+
+def test_timed_out_model_is_reported_and_its_worker_killed(monkeypatch):
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 2)
+    t0 = time.perf_counter()
+    results = list(forecast_pool.run_models(
+        {"slow": (time.sleep, (60,), {}), "fast": (math.sqrt, (4.0,), {}), "bad": (math.sqrt, (-1.0,), {})},
+        timeout={"slow": 2},
+    ))
+    assert time.perf_counter() - t0 < 30
+    done = dict(results)
+    assert [name for name, _ in results][-1] == "slow"  # completion order
+    assert done["fast"] == 2.0 and isinstance(done["bad"], ValueError)
+    assert isinstance(done["slow"], TimeoutError) and "after 2s" in str(done["slow"])
+    assert forecast_pool._pool is None  # killed; the next call starts a fresh pool
+    assert dict(forecast_pool.run_models({"again": (math.sqrt, (9.0,), {})})) == {"again": 3.0}
+    forecast_pool.shutdown()
+
+
+def test_parallel_ensemble_matches_inline_and_runs_off_the_event_loop(monkeypatch):
+    idx = bday_range("2025-06-02", "2025-12-31")[-80:]
+    s = pd.Series(6.3 + np.cumsum(np.random.default_rng(3).normal(0, 0.02, 80)), index=idx)
+    targets = [d.date() for d in next_bdays(idx[-1], 3)]
+
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", None)
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 0)
+    model_cache.clear()
+    inline = priceyield.yield_forecast_path(s, targets)
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 2)
+    model_cache.clear()  # fit in the pool, not from cache
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        res = await asyncio.to_thread(priceyield.yield_forecast_path, s, targets)
+        ticker.cancel()
+        return res, ticks
+
+    pooled, ticks = asyncio.run(run())
+    assert ticks > 1
+    for a, b in zip(inline, pooled):
+        assert a.keys() == b.keys()
+        assert all(math.isclose(a[k], b[k], rel_tol=1e-9) if isinstance(a[k], float) else a[k] == b[k] for k in a)
+
+    model_cache.clear()
+    res = priceyield.yield_forecast(s, targets[0], timeout={"arima": 0})
+    assert res["arima"] == "arima timed out after 0s" and isinstance(res["ets"], float)
+    assert res["average"] is not None
+    forecast_pool.shutdown()
+
+
+def test_timeout_leaves_other_callers_fits_running(monkeypatch):
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 2)
+    forecast_pool.shutdown()
+    list(forecast_pool.run_models({"a": (time.sleep, (0.5,), {}), "b": (time.sleep, (0.5,), {})}))  # both workers up
+    pool = forecast_pool._pool
+    other = forecast_pool.run_models({"other": (time.sleep, (5,), {})}, timeout=30)  # another caller's fit
+    timed_out = dict(forecast_pool.run_models({"slow": (time.sleep, (60,), {})}, timeout=1))
+    assert isinstance(timed_out["slow"], TimeoutError)
+    assert forecast_pool._pool is None  # retired: no new work goes to it
+    workers = list(pool._processes.values())
+
+    assert dict(other) == {"other": None}  # finished in the retired pool, not BrokenProcessPool
+    deadline = time.monotonic() + 15
+    while any(p.is_alive() for p in workers) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not any(p.is_alive() for p in workers)  # then the stuck worker is terminated
+    forecast_pool.shutdown()
@@ -0,0 +1,86 @@
+"""Tests for the shared in-process market data store."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import market_data
+from market_data import MarketDataStore, get_market_store, reset_market_store
+from market_snapshot import read_csv_frame
+
+
+def test_bond_slice_matches_mask_filter():
+    store = MarketDataStore()
+    df = read_csv_frame("bond")
+    for tenor in ("05_year", "10_year"):
+        got = store.bond_slice(tenor, "2024-01-01", "2024-06-30")
+        want = df[
+            (df["tenor"] == tenor)
+            & (df["date"] >= pd.Timestamp("2024-01-01"))
+            & (df["date"] <= pd.Timestamp("2024-06-30"))
+        ].sort_values("date")
+        pd.testing.assert_frame_equal(got.reset_index(drop=True), want.reset_index(drop=True))
+        assert got["date"].is_monotonic_increasing
+
+    assert store.bond_slice("30_year").empty
+    assert store.bond_slice("05_year", "2030-01-01").empty
+    assert len(store.bond_slice()) == len(df)
+
+
+def test_macro_slice_bounds_inclusive_and_shares_memory():
+    store = MarketDataStore()
+    full = store.macro_slice()
+    first, last = full["date"].iloc[0], full["date"].iloc[-1]
+    assert store.macro_slice(first, first)["date"].tolist() == [first]
+    assert store.macro_slice(last.date(), None)["date"].iloc[-1] == last
+
+    view = store.macro_slice("2024-01-01", "2024-12-31")
+    assert np.shares_memory(view["idrusd"].to_numpy(), store._macro["idrusd"].to_numpy())
+    # writes on a slice never leak into the store (copy-on-write)
+    before = store._macro["idrusd"].copy()
+    view.loc[view.index[0], "idrusd"] = -1.0
+    pd.testing.assert_series_equal(store._macro["idrusd"], before)
+
+    s = store.macro_series("vix_index", "2024-01-01", "2024-12-31")
+    assert s.index.min() >= pd.Timestamp("2024-01-01") and s.index.max() <= pd.Timestamp("2024-12-31")
+
+
+def test_store_singleton_and_reset():
+    reset_market_store()
+    try:
+        a = get_market_store()
+        assert get_market_store() is a
+        custom = MarketDataStore()
+        reset_market_store(custom)
+        assert market_data.get_market_store() is custom
+    finally:
+        reset_market_store()
+
+
+def test_auction_rollups_match_row_filters():
+    store = MarketDataStore()
+    df = store.auction_frame().fillna({"incoming_trillions": 0.0, "awarded_trillions": 0.0, "bid_to_cover": 0.0})
+    rollups = store.auction_rollups
+    assert store.auction_rollups is rollups
+
+    for year in (2010, 2024):
+        ydf = df[df["auction_year"] == year]
+        y = rollups.years[year]
+        assert [m["month"] for m in y["monthly"]] == sorted(ydf["auction_month"].astype(int))
+        np.testing.assert_allclose(y["total_incoming"], ydf["incoming_trillions"].sum())
+        np.testing.assert_allclose(y["avg_bid_to_cover"], ydf["bid_to_cover"].mean())
+
+        qdf = ydf[ydf["auction_month"].isin([4, 5, 6])]
+        q = rollups.quarters[(year, 2)]
+        np.testing.assert_allclose(q["total_awarded"], qdf["awarded_trillions"].sum())
+        assert len(q["monthly"]) == len(qdf)
+
+        mdf = ydf[ydf["auction_month"] == 3]
+        assert rollups.months[(year, 3)]["total_incoming"] == mdf["incoming_trillions"].sum()
+
+    assert (2099, 1) not in rollups.months and 2099 not in rollups.years
@@ -0,0 +1,87 @@
+"""Tests for the on-disk market snapshot (build, staleness check, CSV fallback)."""
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import market_snapshot
+import priceyield_20251223
+from priceyield_20251223 import AuctionDB, BondDB
+
+
+def _build(tmp_path):
+    sources = {}
+    for kind, src in market_snapshot.SOURCES.items():
+        dst = tmp_path / src.name
+        shutil.copy2(src, dst)
+        sources[kind] = str(dst)
+    snap = market_snapshot.build_snapshot(str(tmp_path / "market.duckdb"), sources=sources)
+    return snap, sources
+
+
+def test_snapshot_matches_csv_load(tmp_path):
+    snap, sources = _build(tmp_path)
+    for kind, csv in sources.items():
+        assert market_snapshot.snapshot_for(kind, csv, str(snap)) == snap
+        pd.testing.assert_frame_equal(
+            market_snapshot.read_frame(kind, csv, str(snap)),
+            market_snapshot.read_csv_frame(kind, csv),
+        )
+
+    from_snap = BondDB(sources["bond"], snapshot=str(snap))
+    from_csv = BondDB(sources["bond"], snapshot=None)
+    from_csv.con.execute(f"ATTACH '{snap}' AS s (READ_ONLY)")
+    assert from_csv.con.execute("SELECT * FROM ts EXCEPT ALL SELECT * FROM s.ts").fetchall() == []
+    assert from_snap.con.execute("SELECT COUNT(*) FROM ts_cube").fetchone() == from_csv.con.execute("SELECT COUNT(*) FROM ts_cube").fetchone()
+    assert from_snap.con.execute("SELECT COUNT(*) FROM ts").fetchone() == from_csv.con.execute("SELECT COUNT(*) FROM ts").fetchone()
+
+
+def test_stale_snapshot_falls_back_to_csv(tmp_path):
+    snap, sources = _build(tmp_path)
+    bond_csv = sources["bond"]
+
+    # mtime-only change (e.g. fresh checkout): hash still matches
+    os.utime(bond_csv, (0, 0))
+    assert market_snapshot.snapshot_for("bond", bond_csv, str(snap)) == snap
+
+    # content change: snapshot is stale and BondDB reads the CSV instead
+    with open(bond_csv, "a") as fh:
+        fh.write("\r\n02/02/2026,BY0,FR999,6.0,15/08/2031,100.0,6.0,05_year\r\n")
+    assert market_snapshot.snapshot_for("bond", bond_csv, str(snap)) is None
+    db = BondDB(bond_csv, snapshot=str(snap))
+    assert db.con.execute("SELECT COUNT(*) FROM ts WHERE series = 'FR999'").fetchone()[0] == 1
+
+
+def test_missing_snapshot_reads_csv(tmp_path):
+    missing = str(tmp_path / "nope.duckdb")
+    assert market_snapshot.snapshot_for("macro", snapshot=missing) is None
+    df = market_snapshot.read_frame("macro", snapshot=missing)
+    assert list(df.columns[:3]) == ["date", "idrusd", "vix_index"]
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+
+
+def test_snapshot_is_queried_in_place_until_first_append(tmp_path, monkeypatch):
+    snap, sources = _build(tmp_path)
+    db = BondDB(sources["bond"], snapshot=str(snap))
+    views = {r[0] for r in db.con.execute("SELECT view_name FROM duckdb_views() WHERE NOT internal").fetchall()}
+    assert {"ts_raw", "ts", "ts_cube", "bond_static"} <= views
+    rows = db.con.execute("SELECT COUNT(*) FROM ts_raw").fetchone()[0]
+
+    db.append_observations([{"date": "2026-01-05", "series": "FR300", "tenor": "10_year", "price": 95.0,
+                             "yield": 7.0, "maturity_date": "15/08/2031"}])
+    tables = {r[0] for r in db.con.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+    assert {"ts_raw", "ts", "ts_cube", "bond_static"} <= tables
+    assert db.con.execute("SELECT COUNT(*) FROM ts_raw").fetchone()[0] == rows + 1
+
+    # a snapshot that passes the staleness check but cannot be opened: AuctionDB reads the CSV
+    bad = tmp_path / "corrupt.duckdb"
+    bad.write_bytes(b"not a duckdb file" * 100)
+    monkeypatch.setattr(priceyield_20251223.market_snapshot, "snapshot_for", lambda *a, **k: bad)
+    auctions = AuctionDB(sources["auction"])
+    assert auctions.con.execute("SELECT COUNT(*) FROM raw_auction").fetchone()[0] == len(
+        market_snapshot.read_csv_frame("auction", sources["auction"]))
@@ -0,0 +1,88 @@
+"""Tests for the fitted-model cache (model_cache) behind the forecast ensemble."""
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import forecast_pool
+import model_cache
+import priceyield_20251223 as priceyield
+import yield_forecast_models
+from bday_calendar import bday_range, next_bdays
+
+
+def _series(n=80, seed=11):
+    idx = bday_range("2025-06-02", "2025-12-31")[-n:]
+    return pd.Series(6.1 + np.cumsum(np.random.default_rng(seed).normal(0, 0.02, n)), index=idx)
+
+
+def _count_fits(monkeypatch):
+    fits = []
+    for name, (fit_fn, path_fn) in list(yield_forecast_models.FITTED_MODELS.items()):
+        def counting(*args, _fit=fit_fn, _name=name, **kwargs):
+            fits.append(_name)
+            return _fit(*args, **kwargs)
+        monkeypatch.setitem(yield_forecast_models.FITTED_MODELS, name, (counting, path_fn))
+    return fits
+
+
+def _same(a, b):
+    assert a.keys() == b.keys()
+    assert all(math.isclose(a[k], b[k], rel_tol=1e-12) if isinstance(a[k], float) else a[k] == b[k] for k in a)
+
+
+def test_repeated_requests_skip_fitting_until_the_data_changes(monkeypatch):
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 0)
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", None)
+    model_cache.clear()
+    fits = _count_fits(monkeypatch)
+    s = _series()
+    monkeypatch.setattr(priceyield, "get_metric_series", lambda *a, **k: s)
+
+    first = priceyield.forecast_metric_next_days(None, "5_year", days=3)
+    assert sorted(fits) == ["arima", "ets", "var"]
+    again = priceyield.forecast_metric_next_days(None, "5_year", days=5)
+    assert sorted(fits) == ["arima", "ets", "var"]  # cache hits, even for a longer horizon
+    for a, b in zip(first["forecasts"], again["forecasts"]):
+        _same(a["models"], b["models"])
+
+    # a new observation is a new fingerprint: VAR refits, ARIMA / ETS warm-start from the cached fits
+    s = pd.concat([s, pd.Series([s.iloc[-1] + 0.01], index=next_bdays(s.index[-1], 1))])
+    priceyield.forecast_metric_next_days(None, "5_year", days=3)
+    assert sorted(fits) == ["arima", "ets", "var", "var"]
+    assert model_cache.series_fingerprint(s) != model_cache.series_fingerprint(s.iloc[:-1])
+    assert model_cache.model_key("arima", "x", {"order": (1, 1, 1)}) != model_cache.model_key("arima", "x")
+
+
+def test_disk_tier_is_shared_across_processes(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", str(tmp_path))
+    model_cache.clear()
+    s = _series(seed=12)
+    targets = [d.date() for d in next_bdays(s.index[-1], 3)]
+
+    # fitted in worker processes, written to disk by this process
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 2)
+    pooled = priceyield.yield_forecast_path(s, targets)
+    forecast_pool.shutdown()
+    assert len(list(tmp_path.glob("*.pkl"))) == 3
+
+    # a fresh process (empty memory tier) reads the fits back instead of refitting
+    model_cache.clear()
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 0)
+    fits = _count_fits(monkeypatch)
+    for a, b in zip(pooled, priceyield.yield_forecast_path(s, targets)):
+        _same(a, b)
+    assert fits == []
+
+    # an unreadable file is a miss for that model only
+    model_cache.clear()
+    key = model_cache.model_key("ets", model_cache.series_fingerprint(s), {})
+    (tmp_path / f"{key}.pkl").write_bytes(b"not a pickle")
+    priceyield.yield_forecast_path(s, targets)
+    assert fits == ["ets"]
@@ -0,0 +1,75 @@
+"""Tests for the vectorized Monte Carlo forecaster and its quantile bands."""
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import telegram_bot
+import yield_forecast_models as yfm
+from bday_calendar import bday_range, next_bdays
+
+
+def _series(n=120):
+    idx = bday_range("2025-01-02", "2025-12-31")[-n:]
+    rng = np.random.default_rng(3)
+    return pd.Series(6.3 * np.cumprod(1 + rng.normal(0.0002, 0.004, n)), index=idx)
+
+
+def test_bands_cover_every_horizon_and_match_numpy():
+    s = _series()
+    sim = yfm.simulate_monte_carlo(s, 5, sims=20_000, seed=1)
+    assert sim["mean"].shape == (5,)
+    assert list(sim["bands"]) == ["p05", "p25", "p50", "p75", "p95"]
+    bands = np.vstack(list(sim["bands"].values()))
+    assert (np.diff(bands, axis=0) >= 0).all()                # quantiles ordered at every step
+    assert (np.diff(bands[-1] - bands[0]) > 0).all()         # the 90% band widens with the horizon
+
+    # same draws as the reference loop over np.quantile
+    r = s.pct_change().dropna()
+    z = np.random.default_rng(1).standard_normal((5, 20_000))
+    paths = s.iloc[-1] * np.cumprod(1 + r.mean() + r.std(ddof=0) * z, axis=0)
+    np.testing.assert_allclose(sim["mean"], paths.mean(axis=1))
+    np.testing.assert_allclose(bands, np.quantile(paths, yfm.MC_QUANTILES, axis=1))
+
+    # antithetic pairs cancel the noise in the shocks: the mean is closer to the drift-only path
+    drift = s.iloc[-1] * (1 + r.mean()) ** np.arange(1, 6)
+    anti = yfm.simulate_monte_carlo(s, 5, sims=20_000, seed=1, antithetic=True, quantiles=())
+    assert anti["bands"] == {}
+    assert np.abs(anti["mean"] - drift).max() < 1e-3 * s.iloc[-1]
+
+
+def test_path_means_match_single_dates_and_feed_table():
+    s = _series()
+    targets = [d.date() for d in next_bdays(s.index[-1], 4)]
+    path = yfm.monte_carlo_path(s, targets, sims=5_000)
+    for target, (mean, bands) in zip(targets, path):
+        assert mean == yfm.forecast_monte_carlo(s, target, sims=5_000)
+        assert bands["p05"] < bands["p50"] < bands["p95"]
+
+    mean, bands = path[-1]
+    table = telegram_bot.format_models_economist_table({"monte_carlo": mean, "average": mean, "bands": bands})
+    assert f"{'MC 90% band':<13} | {bands['p05']:.2f}-{bands['p95']:.2f}" in table
+    assert "MC 50% band" in table
+
+
+def test_long_horizons_use_bounded_memory_and_are_capped():
+    s = _series()
+    sims, steps = 50_000, 200
+    tracemalloc.start()
+    try:
+        sim = yfm.simulate_monte_carlo(s, [1, 100, steps], sims=sims)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert list(sim["steps"]) == [1, 100, steps] and sim["bands"]["p95"].shape == (3,)
+    assert peak < 10 * sims * 8  # a few (sims,) vectors, not a (steps, sims) array
+
+    with pytest.raises(ValueError, match="FORECAST_MC_MAX_STEPS"):
+        yfm.simulate_monte_carlo(s, yfm.MC_MAX_STEPS + 1, sims=100)
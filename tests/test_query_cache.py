@@ -0,0 +1,66 @@
+"""Tests for the query result cache."""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+from query_cache import QueryCache, cache_stats, make_key, result_bytes
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def test_key_normalization_lru_bytes_and_ttl():
+    assert make_key("SELECT  *\n FROM ts WHERE x = ?", [1]) == make_key("SELECT * FROM ts WHERE x = ?", (1,))
+
+    row = [(i, float(i)) for i in range(100)]
+    size = result_bytes(row)
+    cache = QueryCache("test", max_bytes=int(size * 2.5), max_entries=100, ttl=60)
+    calls = []
+    for sql in ("a", "b", "a", "c"):
+        cache.get_or_compute(sql, None, lambda: calls.append(1) or list(row))
+    # "b" was least recently used when "c" pushed the cache over its byte budget
+    assert len(calls) == 3 and len(cache) == 2 and cache.nbytes <= cache.max_bytes
+    assert cache.get(make_key("b"))[0] is False and cache.get(make_key("a"))[0] is True
+
+    cached = cache.get_or_compute("a", None, lambda: None)
+    cached.clear()  # callers get their own list
+    assert len(cache.get(make_key("a"))[1]) == 100
+
+    short = QueryCache("test", ttl=0.05)
+    short.get_or_compute("q", None, lambda: 1)
+    time.sleep(0.06)
+    assert short.get(make_key("q")) == (False, None)
+    assert cache_stats()["test"]["hits"] >= 3
+
+
+def test_result_bytes_counts_object_arrays():
+    names = np.array([f"FR{i:04d}" * 10 for i in range(100)], dtype=object)
+    assert result_bytes(names) >= names.nbytes + sum(sys.getsizeof(v) for v in names)
+    floats = np.zeros(100)
+    assert result_bytes(floats) == floats.nbytes
+    # fetch_numpy-style column dicts are sized through the same path
+    assert result_bytes({"series": names}) > result_bytes(names) > result_bytes({"price": floats})
+
+
+def test_bond_queries_hit_cache_until_append():
+    db = BondDB(BOND_CSV, snapshot=None)
+    sql = 'SELECT series, tenor, price, "yield" FROM ts WHERE obs_date = ? AND tenor = ? ORDER BY series'
+    first = db.fetchall(sql, ["2024-06-03", "10_year"])
+    assert db.fetchall(" ".join(sql.split()), ["2024-06-03", "10_year"]) == first
+    frame = db.cube_frame(["10_year"], freq="obs")
+    again = db.cube_frame(["10_year"], freq="obs")
+    pd.testing.assert_frame_equal(frame, again)
+    assert db._query_cache.hits == 2 and db._query_cache.misses == 2
+
+    db.append_observations([{"date": "2026-01-07", "series": "FR108", "tenor": "10_year",
+                             "price": 99.0, "yield": 6.5}])
+    # unscoped SQL is dropped on any append; the cube result for 10_year is stale too
+    assert len(db._query_cache) == 0
+    assert db.cube_frame(["10_year"], freq="obs")["obs_date"].max() == pd.Timestamp(2026, 1, 7)
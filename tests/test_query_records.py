@@ -0,0 +1,48 @@
+"""Tests for the slotted Intent and the QueryRecord parser results."""
+import os
+import sys
+from datetime import date
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import parse_intent
+from query_records import AuctionPeriod, AuctionTableQuery, BondTableQuery
+from telegram_bot import parse_auction_table_query, parse_bond_table_query
+
+
+def test_intents_are_slotted_and_share_interned_strings():
+    a = parse_intent("yield 10 year 2024-06-03")
+    b = parse_intent("average yield 10 year in 2024")
+    assert not hasattr(a, "__dict__")
+    assert a.tenor == "10_year" and a.tenor is b.tenor and a.metric is b.metric
+    c = parse_intent("price fr100 2024-06-03")
+    assert c.series is parse_intent("price FR100 2024-06-04").series
+
+    t1 = parse_bond_table_query("tab yield 5 and 10 years jan 2024")
+    t2 = parse_bond_table_query("tab yield 10 year feb 2024")
+    assert isinstance(t1, BondTableQuery) and t1["tenors"][1] is t2["tenors"][0]
+
+
+def test_records_read_like_the_dicts_they_replace():
+    req = parse_auction_table_query("tab incoming bid from Q2 2025 to Q3 2025")
+    assert isinstance(req, AuctionTableQuery)
+    assert req == {"metrics": ["incoming"], "periods": [
+        {"type": "quarter", "quarter": 2, "year": 2025},
+        {"type": "quarter", "quarter": 3, "year": 2025},
+    ]}
+    period = req["periods"][0]
+    assert "month" not in period and period.get("month") is None and len(period) == 3
+    assert list(period) == ["type", "quarter", "year"] and dict(period)["quarter"] == 2
+    with pytest.raises(KeyError):
+        period["month"]
+    with pytest.raises(KeyError):
+        period["__class__"]
+    with pytest.raises(AttributeError):
+        AuctionPeriod(type="month", day=1)
+    assert not hasattr(period, "__dict__")
+    assert repr(period) == "AuctionPeriod(type='quarter', quarter=2, year=2025)"
+    assert BondTableQuery(tenors=["05_year"], start_date=date(2024, 1, 1))["tenors"] == ["05_year"]
@@ -0,0 +1,65 @@
+"""Tests for warm-started refits of the forecast models when new observations arrive."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import forecast_pool
+import model_cache
+import priceyield_20251223 as priceyield
+import yield_forecast_models
+from bday_calendar import bday_range, next_bdays
+
+
+def _history(n=300, seed=5):
+    idx = bday_range("2024-06-03", "2026-12-31")[:n]
+    return pd.Series(6.4 + np.cumsum(np.random.default_rng(seed).normal(0, 0.02, n)), index=idx)
+
+
+def _cached(model, window):
+    return model_cache.get(model_cache.model_key(model, model_cache.series_fingerprint(window), {}))
+
+
+def test_daily_appends_warm_start_with_a_scheduled_full_refit(monkeypatch):
+    monkeypatch.setattr(forecast_pool, "FORECAST_WORKERS", 0)
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", None)
+    model_cache.clear()
+    history = _history()
+    chain = []
+    for day in range(6):  # days 0..5: one new observation per day
+        s = history.iloc[:250 + day]
+        window = s.tail(priceyield.FORECAST_WINDOW)
+        targets = [d.date() for d in next_bdays(s.index[-1], 3)]
+        warm = priceyield.yield_forecast_path(s, targets, method="arima")
+        chain.append(getattr(_cached("arima", window), "warm_updates", 0))
+        cold = yield_forecast_models.forecast_arima_path(window, targets)
+        assert np.allclose([v for v, _ in warm], [v for v, _ in cold], atol=5e-3)
+    # a full fit, FULL_REFIT_EVERY - 1 warm updates, then a full fit again
+    assert yield_forecast_models.FULL_REFIT_EVERY == 5 and chain == [0, 1, 2, 3, 4, 0]
+
+    # ETS warm-starts the same way
+    prev = yield_forecast_models.fit_ets(history.iloc[:260])
+    upd = yield_forecast_models.refit_model("ets", history.iloc[1:261], prev)
+    full = yield_forecast_models.fit_ets(history.iloc[1:261])
+    assert upd.warm_updates == 1 and abs(upd.forecast(3).iloc[-1] - full.forecast(3).iloc[-1]) < 5e-3
+
+
+def test_refit_model_falls_back_to_a_full_fit(monkeypatch):
+    s = _history(120)
+    prev = yield_forecast_models.fit_ets(s.iloc[:-1], seasonal="add")
+    assert len(yield_forecast_models._ets_start_params(prev)) == 5 + 12  # alpha, beta, gamma, level, trend + seasons
+    assert yield_forecast_models.refit_model("ets", s, prev, seasonal="add").warm_updates == 1
+
+    # a failing update (here: ARIMA given an ETS fit) is replaced by a full fit
+    fit = yield_forecast_models.refit_model("arima", s, prev)
+    assert not hasattr(fit, "warm_updates") and fit.model.order == (1, 1, 1)
+    # VAR has no warm update; FULL_REFIT_EVERY=1 turns warm updates off
+    assert not hasattr(yield_forecast_models.refit_model("var", s, yield_forecast_models.fit_var(s.iloc[:-1])),
+                       "warm_updates")
+    monkeypatch.setattr(yield_forecast_models, "FULL_REFIT_EVERY", 1)
+    assert not hasattr(yield_forecast_models.refit_model("ets", s, prev, seasonal="add"), "warm_updates")
@@ -0,0 +1,62 @@
+"""Tests for the per-date yield curve store (yield_curve.py)."""
+import os
+import sys
+from datetime import date
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from priceyield_20251223 import BondDB
+from yield_curve import YieldCurveStore, curve_store, fit_nelson_siegel, ns_yield
+
+BOND_CSV = os.path.join(ROOT_DIR, "database", "20251215_priceyield.csv")
+
+
+def test_batched_nelson_siegel_matches_per_date_lstsq():
+    rng = np.random.default_rng(3)
+    n, per_day = 50, 8
+    group = np.repeat(np.arange(n), per_day)
+    years = rng.uniform(0.5, 20, n * per_day)
+    beta = np.column_stack([rng.normal(6.5, 0.3, n), rng.normal(-1.5, 0.3, n), rng.normal(1, 0.5, n)])
+    yields = ns_yield(years, beta[group], 0.7) + rng.normal(0, 0.01, n * per_day)
+    got, rmse, counts = fit_nelson_siegel(group, years, yields, n, 0.7)
+    for i in (0, 17, 49):
+        m = group == i
+        X = np.column_stack([np.ones(m.sum()), *[ns_yield(years[m], e, 0.7) for e in np.eye(3)[1:]]])
+        want = np.linalg.lstsq(X, yields[m], rcond=None)[0]
+        np.testing.assert_allclose(got[i], want, rtol=1e-6, atol=1e-8)
+    assert (counts == per_day).all() and (rmse < 0.05).all()
+
+
+def test_curves_pass_through_observed_bonds(tmp_path):
+    csv = tmp_path / "bonds.csv"
+    csv.write_bytes(open(BOND_CSV, "rb").read())
+    db = BondDB(str(csv), snapshot=None)
+    store = curve_store(db)
+    assert curve_store(db) is store
+
+    pts = store.points(date(2025, 6, 2), date(2025, 6, 2))
+    assert len(pts) == 2 and pts["coupon"].notna().all()
+    for method in ("linear", "cubic", "nelson_siegel"):
+        np.testing.assert_allclose(store.curve(date(2025, 6, 2), pts["years"], method), pts["yield"], atol=1e-6)
+    # weekends read Friday's curve; nothing before the first observation
+    assert store.curve_date("2025-06-08") == date(2025, 6, 6)
+    assert store.yield_at("2025-06-08", 7) == store.yield_at("2025-06-06", 7)
+    assert store.yield_at("2020-01-01", 7) is None
+
+    # a new series with its maturity joins the next curve
+    db.append_observations([
+        {"date": "2026-01-05", "series": "FR108", "tenor": "10_year", "price": 99.0, "yield": 6.4},
+        {"date": "2026-01-05", "series": "FR109", "tenor": "05_year", "price": 99.0, "yield": 5.5},
+        {"date": "2026-01-05", "series": "FR110", "tenor": "10_year", "price": 99.0, "yield": 6.9,
+         "coupon": 6.75, "maturity_date": "2041-01-15"},
+    ])
+    params = store.params_frame().iloc[-1]
+    assert params["points"] == 3 and params["rmse"] < 1e-6
+    assert abs(store.yield_at("2026-01-05", 15.03, "cubic") - 6.9) < 1e-6
+
+    grid = YieldCurveStore(db, decay_grid=[0.3, 0.7308, 1.5]).params_frame()
+    assert set(grid["decay"].unique()) <= {0.3, 0.7308, 1.5}
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Dict, List, Any
 
 from utils import usage_store
+from query_cache import cache_stats
 
 class BotMetrics:
     """Track bot activity and performance metrics."""
@@ -138,7 +139,8 @@ class BotMetrics:
             "personas": dict(personas),
             "recent_queries": recent_queries,
             "recent_errors": recent_errors,
-            "errors_total": len(self.errors)
+            "errors_total": len(self.errors),
+            "query_cache": cache_stats()
         }
     
     def get_user_stats(self, user_id: int) -> Dict[str, Any]:
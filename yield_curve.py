@@ -0,0 +1,256 @@
+"""Per-date yield curves fitted across all bond series in a BondDB.
+
+BondDB stores observations by discrete tenor bucket (05_year / 10_year). Each
+bond also has a maturity_date (kept in the `bond_static` table), so on any
+observed date its yield is a point (years to maturity, yield) on that day's
+curve. YieldCurveStore fits those points per date with one of:
+
+    linear          piecewise-linear through the points, flat beyond the ends
+    cubic           natural cubic spline (scipy) through the points, flat beyond
+                    the ends; linear when a date has fewer than 3 points
+    nelson_siegel   y(t) = b0 + b1 * (1 - e^-lt) / lt + b2 * ((1 - e^-lt) / lt - e^-lt)
+
+Nelson-Siegel betas for the whole history are solved in one batch: with the
+decay l fixed the model is linear in the betas, so the per-date 3x3 normal
+equations are accumulated with np.bincount and solved together by
+np.linalg.solve. Dates with fewer than 3 points fit only b0 (1 point) or
+b0 + b1 (2 points). An optional decay grid picks the best l per date, again
+vectorized over dates.
+
+Fitted parameters are cached per method in arrays indexed by date, so
+`yield_at(date, 7)` is a dict lookup plus a closed-form evaluation. The cache
+is dropped when rows are appended to the BondDB.
+
+Usage:
+    store = curve_store(db)
+    store.yield_at("2025-06-02", 7)                       # Nelson-Siegel
+    store.curve("2025-06-02", [1, 2, 5, 10], method="cubic")
+    store.params_frame()                                  # b0, b1, b2, decay, rmse per date
+"""
+import threading
+import weakref
+from datetime import date
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.interpolate import CubicSpline
+    _HAS_SCIPY = True
+except ImportError:  # pragma: no cover - scipy ships with statsmodels
+    _HAS_SCIPY = False
+
+METHODS = ("linear", "cubic", "nelson_siegel")
+# Diebold & Li (2006): 0.0609 per month, loading on b2 peaks around 30 months
+DEFAULT_DECAY = 0.0609 * 12
+
+POINTS_SQL = """
+    SELECT t.obs_date, t.series, t.tenor, s.coupon,
+           datediff('day', t.obs_date, s.maturity_date) / 365.25 AS years,
+           t."yield"
+    FROM ts t
+    JOIN bond_static s ON s.series = t.series AND s.tenor = t.tenor
+    WHERE t."yield" IS NOT NULL AND s.maturity_date > t.obs_date
+      AND t.obs_date BETWEEN COALESCE(?, DATE '0001-01-01') AND COALESCE(?, DATE '9999-12-31')
+    ORDER BY t.obs_date, years
+"""
+
+
+def ns_loadings(years, decay):
+    """Nelson-Siegel slope and curvature loadings for maturities `years` (arrays broadcast)."""
+    x = np.asarray(decay, dtype=float) * np.asarray(years, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(x > 1e-10, -np.expm1(-x) / x, 1.0)
+    return slope, slope - np.exp(-x)
+
+
+def ns_yield(years, beta, decay):
+    """Evaluate Nelson-Siegel curves; `beta` is (..., 3) and broadcasts against `years`."""
+    beta = np.asarray(beta, dtype=float)
+    slope, curvature = ns_loadings(years, decay)
+    return beta[..., 0] + beta[..., 1] * slope + beta[..., 2] * curvature
+
+
+def fit_nelson_siegel(group, years, yields, n_groups: int, decay=DEFAULT_DECAY, ridge: float = 1e-10):
+    """Least-squares Nelson-Siegel betas for every group (date) at once.
+
+    group: int array, the date index 0..n_groups-1 of each point.
+    decay: scalar or per-group array of decays.
+    Returns (beta (n_groups, 3), rmse (n_groups,), counts (n_groups,)); groups
+    without points get NaN.
+    """
+    group = np.asarray(group, dtype=np.intp)
+    years = np.asarray(years, dtype=float)
+    yields = np.asarray(yields, dtype=float)
+    decay = np.asarray(decay, dtype=float)
+    slope, curvature = ns_loadings(years, decay[group] if decay.ndim else decay)
+    X = np.stack([np.ones_like(years), slope, curvature], axis=1)
+
+    xtx = np.empty((n_groups, 3, 3))
+    xty = np.empty((n_groups, 3))
+    for i in range(3):
+        xty[:, i] = np.bincount(group, X[:, i] * yields, minlength=n_groups)
+        for j in range(i, 3):
+            xtx[:, i, j] = xtx[:, j, i] = np.bincount(group, X[:, i] * X[:, j], minlength=n_groups)
+    counts = np.bincount(group, minlength=n_groups)
+
+    # fit only as many factors as a date has points: b0, then b1, then b2
+    active = np.arange(3) < np.minimum(counts, 3)[:, None]
+    xtx = np.where(active[:, :, None] & active[:, None, :], xtx, 0.0)
+    xtx += np.eye(3) * np.where(active, ridge, 1.0)[:, :, None]
+    xty = np.where(active, xty, 0.0)
+    beta = np.linalg.solve(xtx, xty[..., None])[..., 0]
+
+    resid = yields - (X * beta[group]).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rmse = np.sqrt(np.bincount(group, resid * resid, minlength=n_groups) / counts)
+    beta[counts == 0] = np.nan
+    return beta, rmse, counts
+
+
+def fit_nelson_siegel_grid(group, years, yields, n_groups: int, decays: Sequence[float]):
+    """Like fit_nelson_siegel, choosing per group the decay in `decays` with the lowest RMSE."""
+    fits = [fit_nelson_siegel(group, years, yields, n_groups, d) for d in decays]
+    rmse = np.stack([f[1] for f in fits])
+    best = np.nanargmin(np.where(np.isnan(rmse), np.inf, rmse), axis=0)
+    idx = np.arange(n_groups)
+    beta = np.stack([f[0] for f in fits])[best, idx]
+    return beta, rmse[best, idx], fits[0][2], np.asarray(decays, dtype=float)[best]
+
+
+class CurveFit:
+    """Fitted curves for one method: per-date parameters in arrays, looked up by date."""
+
+    def __init__(self, method: str, dates: np.ndarray, offsets: np.ndarray,
+                 years: np.ndarray, yields: np.ndarray):
+        self.method = method
+        self.dates = dates  # datetime64[D], ascending
+        self.offsets = offsets  # points of date i are years[offsets[i]:offsets[i + 1]]
+        self.years = years
+        self.yields = yields
+        self.beta: Optional[np.ndarray] = None
+        self.decay: Optional[np.ndarray] = None
+        self.rmse: Optional[np.ndarray] = None
+        self.splines: Dict[int, object] = {}
+        self._row = {d: i for i, d in enumerate(dates.astype(object))}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def row(self, on) -> Optional[int]:
+        """Row of the curve for `on`: that date's, else the latest fitted date before it."""
+        day = on if type(on) is date else pd.Timestamp(on).date()
+        i = self._row.get(day)
+        if i is None:
+            i = int(np.searchsorted(self.dates, np.datetime64(day, "D"), side="right")) - 1
+        return i if i >= 0 else None
+
+    def evaluate(self, i: int, years) -> np.ndarray:
+        t = np.asarray(years, dtype=float)
+        if self.method == "nelson_siegel":
+            return ns_yield(t, self.beta[i], self.decay[i])
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        knots, values = self.years[lo:hi], self.yields[lo:hi]
+        spline = self.splines.get(i)
+        if spline is not None:
+            return spline(np.clip(t, knots[0], knots[-1]))
+        return np.interp(t, knots, values)
+
+
+class YieldCurveStore:
+    """Fits and caches per-date yield curves for a BondDB; see the module docstring."""
+
+    def __init__(self, db, decay: float = DEFAULT_DECAY, decay_grid: Optional[Sequence[float]] = None):
+        self._db = weakref.ref(db)  # curve_store() keys on db, so don't keep it alive
+        self.decay = decay
+        self.decay_grid = decay_grid
+        self._fits: Dict[str, CurveFit] = {}
+        self._lock = threading.Lock()
+        db.on_append(lambda result: self.clear())
+
+    @property
+    def db(self):
+        return self._db()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fits.clear()
+
+    def points(self, start=None, end=None) -> pd.DataFrame:
+        """Curve inputs: obs_date, series, tenor, coupon, years (to maturity), yield."""
+        return pd.DataFrame(self.db.fetch_numpy(POINTS_SQL, [start, end]))
+
+    def fit(self, method: str = "nelson_siegel") -> CurveFit:
+        """Fitted curves for every date with points (cached until the next append)."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown curve method {method!r}; expected one of {', '.join(METHODS)}")
+        with self._lock:
+            fit = self._fits.get(method)
+        if fit is not None:
+            return fit
+        fit = self._fit(method)
+        with self._lock:
+            self._fits[method] = fit
+        return fit
+
+    def _fit(self, method: str) -> CurveFit:
+        pts = self.db.fetch_numpy(POINTS_SQL, [None, None])
+        obs = pts["obs_date"].astype("datetime64[D]")
+        dates, group = np.unique(obs, return_inverse=True)
+        offsets = np.append(np.searchsorted(obs, dates), len(obs))
+        fit = CurveFit(method, dates, offsets, pts["years"], pts["yield"])
+        n = len(dates)
+        if method == "nelson_siegel":
+            if self.decay_grid:
+                fit.beta, fit.rmse, _, fit.decay = fit_nelson_siegel_grid(
+                    group, fit.years, fit.yields, n, self.decay_grid)
+            else:
+                fit.beta, fit.rmse, _ = fit_nelson_siegel(group, fit.years, fit.yields, n, self.decay)
+                fit.decay = np.full(n, float(self.decay))
+        elif method == "cubic" and _HAS_SCIPY:
+            for i in np.flatnonzero(np.diff(offsets) >= 3):
+                lo, hi = offsets[i], offsets[i + 1]
+                knots, values = fit.years[lo:hi], fit.yields[lo:hi]
+                if np.all(np.diff(knots) > 0):
+                    fit.splines[int(i)] = CubicSpline(knots, values, bc_type="natural")
+        return fit
+
+    def curve(self, on, years, method: str = "nelson_siegel") -> Optional[np.ndarray]:
+        """Yields at `years` (array-like) on the curve for `on`; None before the first curve."""
+        fit = self.fit(method)
+        i = fit.row(on)
+        return None if i is None else fit.evaluate(i, years)
+
+    def yield_at(self, on, years: float, method: str = "nelson_siegel") -> Optional[float]:
+        """Yield at `years` to maturity on date `on` (latest curve on or before it)."""
+        out = self.curve(on, years, method)
+        return None if out is None else float(out)
+
+    def curve_date(self, on, method: str = "nelson_siegel") -> Optional[date]:
+        """The date of the curve `yield_at(on, ...)` reads."""
+        fit = self.fit(method)
+        i = fit.row(on)
+        return None if i is None else pd.Timestamp(fit.dates[i]).date()
+
+    def params_frame(self) -> pd.DataFrame:
+        """Nelson-Siegel parameters per date: obs_date, b0, b1, b2, decay, rmse, points."""
+        fit = self.fit("nelson_siegel")
+        return pd.DataFrame({
+            "obs_date": pd.DatetimeIndex(fit.dates),
+            "b0": fit.beta[:, 0], "b1": fit.beta[:, 1], "b2": fit.beta[:, 2],
+            "decay": fit.decay, "rmse": fit.rmse, "points": np.diff(fit.offsets),
+        })
+
+
+_stores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_stores_lock = threading.Lock()
+
+
+def curve_store(db) -> YieldCurveStore:
+    """The YieldCurveStore attached to `db` (created on first use)."""
+    with _stores_lock:
+        store = _stores.get(db)
+        if store is None:
+            store = _stores[db] = YieldCurveStore(db)
+        return store
@@ -1,18 +1,26 @@
 """
 Yield Forecast Models: ARIMA, ETS, Prophet, GRU
+
+forecast_<model>(series, forecast_date) fits and forecasts one target date;
+forecast_<model>_path(series, forecast_dates) fits once and reads every target
+date off the same fitted model (see PATH_MODELS). monte_carlo_path runs one
+vectorized simulation to the furthest date and returns the mean and quantile
+bands for every date on the way.
 """
+import os
+import pickle
+
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from prophet import Prophet
 
-# --- Helper: business-day step count ---
+from bday_calendar import bday_count, to_bdays
+
+# --- Helper: business-day step count (Indonesian market calendar) ---
 def _bdays_between(last_date, target_date):
-    last = pd.to_datetime(last_date).date()
-    target = pd.to_datetime(target_date).date()
-    steps = np.busday_count(last, target)
-    return steps
+    return bday_count(last_date, target_date)
 
 # --- Helper: ensure business-day frequency with LOCF ---
 def _ensure_business_freq(series: pd.Series) -> pd.Series:
@@ -20,9 +28,9 @@ def _ensure_business_freq(series: pd.Series) -> pd.Series:
     # Ensure datetime index
     if not isinstance(s.index, pd.DatetimeIndex):
         s.index = pd.to_datetime(s.index)
-    # Regularize to business-day frequency, forward-fill gaps
+    # Regularize to the market's business days (holidays dropped), forward-fill gaps
     try:
-        s = s.asfreq('B', method='pad')
+        s = to_bdays(s)
     except Exception:
         # Fallback: leave as-is if frequency cannot be enforced
         pass
@@ -104,8 +112,8 @@ def forecast_random_walk(series, forecast_date):
     drift = changes.mean()
     last_val = series.iloc[-1]
     
-    # Steps to forecast date
-    steps = max((pd.to_datetime(forecast_date) - series.index[-1]).days, 1)
+    # Steps to forecast date (business days, like the daily changes drift is measured on)
+    steps = max(_bdays_between(series.index[-1], forecast_date), 1)
     
     # Apply drift: forecast = last_value * (1 + drift)^steps
     forecast = last_val * ((1 + drift) ** steps)
@@ -114,47 +122,112 @@ def forecast_random_walk(series, forecast_date):
     return float(max(forecast, 0.0))
 
 # --- Monte Carlo (random walk with historical drift + volatility) ---
-def forecast_monte_carlo(series, forecast_date, sims=500, seed=42):
+# All paths advance together: one (sims,) vector of path levels is multiplied by
+# a row of gross returns 1 + N(mu, sigma) per business day, and summarized (mean
+# and quantile bands) only at the requested horizons, so memory stays O(sims)
+# however far out the target is. Rows are drawn in step order from one
+# generator, so the first k steps do not depend on how far the simulation runs:
+# a path to T+5 gives the same T+1..T+4 values as separate runs to each date
+# (same seed). Run time grows with sims * steps, hence the step cap.
+MC_SIMS = int(os.environ.get("FORECAST_MC_SIMS", "100000"))
+# Longest horizon simulated, in business days (about a year)
+MC_MAX_STEPS = int(os.environ.get("FORECAST_MC_MAX_STEPS", "260"))
+# Quantiles reported as bands for every horizon ("p05" ... "p95")
+MC_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+def _band_label(q):
+    return f"p{round(q * 100):02d}"
+
+def simulate_monte_carlo(series, steps, sims=MC_SIMS, seed=42, antithetic=False, quantiles=MC_QUANTILES):
+    """Simulate `sims` drift + volatility paths and summarize them at each horizon.
+
+    `steps` is a horizon in business days (summaries for every step 1..steps) or
+    a sequence of horizons. Drift and volatility are the mean and std of ALL
+    historical returns. With antithetic=True half the draws are the negated
+    other half (same mean, less sampling noise). Returns {"steps": array(h),
+    "mean": array(h), "bands": {"p05": array(h), ...}} for the sorted distinct
+    horizons, one band per entry of `quantiles` (linear interpolation, like
+    np.quantile). Raises ValueError past MC_MAX_STEPS.
+    """
+    if np.ndim(steps) == 0:
+        horizons = np.arange(1, max(int(steps), 1) + 1)
+    else:
+        horizons = np.unique(np.maximum(np.asarray(steps, dtype=int), 1))
+    if horizons[-1] > MC_MAX_STEPS:
+        raise ValueError(f"Monte Carlo horizon of {horizons[-1]} business days exceeds "
+                         f"FORECAST_MC_MAX_STEPS={MC_MAX_STEPS}")
+    last_val = float(series.iloc[-1])
+    returns = series.pct_change().dropna() if len(series) >= 2 else series.iloc[:0]
+    if returns.empty:
+        flat = np.full(len(horizons), last_val)
+        return {"steps": horizons, "mean": flat, "bands": {_band_label(q): flat.copy() for q in quantiles}}
+    mu = float(returns.mean())
+    sigma = float(returns.std(ddof=0))
+
+    rng = np.random.default_rng(seed)
+    half = (sims + 1) // 2
+    level = np.full(sims, last_val)
+    gross = np.empty(sims)
+    if quantiles:
+        pos = np.asarray(quantiles, dtype=float) * (sims - 1)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo + 1, sims - 1)
+        frac = pos - lo
+    means, bands = [], []
+    wanted = iter(horizons)
+    target = next(wanted)
+    for step in range(1, horizons[-1] + 1):
+        if antithetic:
+            rng.standard_normal(half, out=gross[:half])
+            np.negative(gross[:sims - half], out=gross[half:])
+        else:
+            rng.standard_normal(sims, out=gross)
+        # Path = last_value * running product of (1 + each shock), in place
+        gross *= sigma
+        gross += 1.0 + mu
+        level *= gross
+        if step == target:
+            means.append(level.mean())
+            if quantiles:
+                ordered = np.sort(level)  # one sort serves every quantile
+                bands.append(ordered[lo] + (ordered[hi] - ordered[lo]) * frac)
+            target = next(wanted, None)
+
+    out = {"steps": horizons, "mean": np.array(means), "bands": {}}
+    if quantiles:
+        values = np.array(bands)
+        out["bands"] = {_band_label(q): values[:, i] for i, q in enumerate(quantiles)}
+    return out
+
+def forecast_monte_carlo(series, forecast_date, sims=MC_SIMS, seed=42, antithetic=False):
     """Monte Carlo simulation using ALL historical returns for drift and volatility.
     
     Method:
     1. Calculate drift from ALL observations (long-term trend)
     2. Calculate volatility from ALL observations (risk measure)
-    3. Run 500 simulations of random walks with both drift and stochastic shocks
+    3. Simulate `sims` random walks with both drift and stochastic shocks
     4. Return mean of final values
     """
-    import random
-    np.random.seed(seed)
-    random.seed(seed)
-    
-    if len(series) < 2:
-        return float(series.iloc[-1])
-    
-    # Calculate returns from ALL observations
-    returns = series.pct_change().dropna()
-    if returns.empty:
-        return float(series.iloc[-1])
-    
-    # Drift and volatility from ALL observations
-    mu = returns.mean()      # Average return (long-term trend)
-    sigma = returns.std(ddof=0)  # Volatility (uncertainty)
-    last_val = series.iloc[-1]
-    
-    # Calculate steps to forecast date
-    steps = max((pd.to_datetime(forecast_date) - series.index[-1]).days, 1)
-    
-    # Run simulations using ALL historical information
-    finals = []
-    for _ in range(sims):
-        # Random shocks with drift included
-        shocks = np.random.normal(mu, sigma, steps)
-        # Path = last_value * product(1 + each_shock)
-        path = last_val * np.prod(1 + shocks)
-        finals.append(path)
-    
+    steps = max(_bdays_between(series.index[-1], forecast_date), 1) if len(series) >= 2 else 1
+    sim = simulate_monte_carlo(series, [steps], sims=sims, seed=seed, antithetic=antithetic, quantiles=())
     # Return mean forecast, clamped to avoid negative yields
-    mean_forecast = float(np.mean(finals))
-    return max(mean_forecast, 0.0)
+    return max(float(sim["mean"][-1]), 0.0)
+
+def monte_carlo_path(series, forecast_dates, sims=MC_SIMS, seed=42, antithetic=False, quantiles=MC_QUANTILES):
+    """[(mean, {"p05": ..., "p95": ...}), ...] per target date, from one simulation to the furthest date.
+
+    Each mean equals forecast_monte_carlo(series, date) for the same sims/seed.
+    """
+    steps = _horizon_steps(series, forecast_dates) if len(series) >= 2 else [1] * len(forecast_dates)
+    if not steps:
+        return []
+    sim = simulate_monte_carlo(series, steps, sims=sims, seed=seed, antithetic=antithetic, quantiles=quantiles)
+    row = {k: i for i, k in enumerate(sim["steps"])}
+    return [
+        (max(float(sim["mean"][row[k]]), 0.0),
+         {label: max(float(band[row[k]]), 0.0) for label, band in sim["bands"].items()})
+        for k in steps
+    ]
 
 # --- 5-day Moving Average ---
 def forecast_ma5(series, forecast_date):
@@ -180,6 +253,169 @@ def forecast_var(series, forecast_date, lags=1):
     fc = fit.forecast(df.values[-fit.k_ar:], steps=steps)
     return float(fc[-1][0])
 
+# --- Horizon paths: fit once, forecast every target date ---
+# Each path model is split into fit_<model>(series, **kwargs) -> fitted object and
+# <model>_path(fitted, series, forecast_dates) -> one forecast per date, so a fit
+# can be cached (model_cache) and reused for any set of horizons.
+def _horizon_steps(series, forecast_dates):
+    """Business-day step count (>= 1) from the last observation to each target date."""
+    last_date = pd.to_datetime(series.index[-1])
+    return [max(_bdays_between(last_date, pd.to_datetime(d)), 1) for d in forecast_dates]
+
+def fit_arima(series, order=(1,1,1)):
+    return ARIMA(_ensure_business_freq(series), order=order).fit()
+
+def arima_path(fit, series, forecast_dates):
+    """[(forecast, conf_int), ...] per target date, like forecast_arima."""
+    series = _ensure_business_freq(series)
+    steps = _horizon_steps(series, forecast_dates)
+    try:
+        pred = fit.get_forecast(steps=max(steps))
+        mean, conf = pred.predicted_mean, pred.conf_int()
+        return [(float(mean.iloc[k - 1]), tuple(conf.iloc[k - 1])) for k in steps]
+    except Exception:
+        try:
+            fc = np.asarray(fit.forecast(steps=max(steps)), dtype=float).ravel()
+            return [(float(fc[k - 1]), (np.nan, np.nan)) for k in steps]
+        except Exception:
+            return [(float(series.iloc[-1]), (np.nan, np.nan)) for _ in steps]
+
+def fit_ets(series, seasonal=None):
+    return ExponentialSmoothing(_ensure_business_freq(series), trend='add', seasonal=seasonal,
+                                seasonal_periods=12).fit()
+
+def ets_path(fit, series, forecast_dates):
+    steps = _horizon_steps(_ensure_business_freq(series), forecast_dates)
+    fc = fit.forecast(max(steps))
+    return [float(fc.iloc[k - 1]) for k in steps]
+
+def fit_prophet(series):
+    m = Prophet()
+    m.fit(pd.DataFrame({'ds': series.index, 'y': series.values}))
+    return m
+
+def prophet_path(fit, series, forecast_dates):
+    forecast = fit.predict(pd.DataFrame({'ds': list(forecast_dates)}))
+    return [float(max(yhat, 0.0)) for yhat in forecast['yhat']]
+
+def fit_var(series, lags=1):
+    """Fitted VAR on (y, y_lag), or None when there are too few rows to fit."""
+    from statsmodels.tsa.api import VAR
+    df = pd.DataFrame({"y": _ensure_business_freq(series)})
+    df["y_lag"] = df["y"].shift(1)
+    df = df.dropna()
+    if len(df) < 10:
+        return None
+    return VAR(df).fit(maxlags=lags)
+
+def var_path(fit, series, forecast_dates):
+    series = _ensure_business_freq(series)
+    if fit is None:
+        return [float(series.iloc[-1]) for _ in forecast_dates]
+    steps = _horizon_steps(series, forecast_dates)
+    fc = fit.forecast(fit.endog[-fit.k_ar:], steps=max(steps))
+    return [float(fc[k - 1][0]) for k in steps]
+
+# Models whose fit is worth sharing across horizons (and caching). The others
+# (random_walk, monte_carlo, ma5) only compute summary statistics and stay per-date.
+FITTED_MODELS = {
+    "arima": (fit_arima, arima_path),
+    "ets": (fit_ets, ets_path),
+    "prophet": (fit_prophet, prophet_path),
+    "var": (fit_var, var_path),
+}
+
+def forecast_arima_path(series, forecast_dates, order=(1,1,1)):
+    return arima_path(fit_arima(series, order=order), series, forecast_dates)
+
+def forecast_ets_path(series, forecast_dates, seasonal=None):
+    return ets_path(fit_ets(series, seasonal=seasonal), series, forecast_dates)
+
+def forecast_prophet_path(series, forecast_dates):
+    return prophet_path(fit_prophet(series), series, forecast_dates)
+
+def forecast_var_path(series, forecast_dates, lags=1):
+    return var_path(fit_var(series, lags=lags), series, forecast_dates)
+
+PATH_MODELS = {
+    "arima": forecast_arima_path,
+    "ets": forecast_ets_path,
+    "prophet": forecast_prophet_path,
+    "var": forecast_var_path,
+}
+
+# --- Warm updates: refit on a new window starting from the previous window's solution ---
+# When the series gains a day, the fit for the previous window is a near-optimal
+# starting point. ARIMA keeps its parameters and only re-runs the Kalman filter
+# over the new window (statsmodels apply, the append/extend path: its cold fit
+# converges in a couple of iterations, so a warm-started optimizer saves nothing
+# there). ETS restarts its optimizer at the old smoothing parameters and initial
+# states without the brute-force grid search; Prophet from its old MAP estimate
+# (Prophet's documented warm start). Every FULL_REFIT_EVERY-th update is a full
+# cold fit instead, so parameters are re-estimated on a schedule.
+FULL_REFIT_EVERY = int(os.environ.get("FORECAST_FULL_REFIT_EVERY", "5"))
+
+def update_arima(prev, series, order=(1,1,1)):
+    return prev.apply(_ensure_business_freq(series))
+
+def _ets_start_params(prev):
+    """prev's parameters in ExponentialSmoothing.fit start_params order."""
+    p, mod = prev.params, prev.model
+    start = [p["smoothing_level"]]
+    if mod.has_trend:
+        start.append(p["smoothing_trend"])
+    if mod.has_seasonal:
+        start.append(p["smoothing_seasonal"])
+    start.append(p["initial_level"])
+    if mod.has_trend:
+        start.append(p["initial_trend"])
+    if mod.damped_trend:
+        start.append(p["damping_trend"])
+    if mod.has_seasonal:
+        start.extend(p["initial_seasons"])
+    return np.asarray(start, dtype=float)
+
+def update_ets(prev, series, seasonal=None):
+    return ExponentialSmoothing(_ensure_business_freq(series), trend='add', seasonal=seasonal,
+                                seasonal_periods=12).fit(start_params=_ets_start_params(prev), use_brute=False)
+
+def update_prophet(prev, series):
+    init = {name: prev.params[name][0][0] for name in ("k", "m", "sigma_obs")}
+    init.update({name: prev.params[name][0] for name in ("delta", "beta")})
+    m = Prophet()
+    m.fit(pd.DataFrame({'ds': series.index, 'y': series.values}), init=init)
+    return m
+
+UPDATE_MODELS = {
+    "arima": update_arima,
+    "ets": update_ets,
+    "prophet": update_prophet,
+}
+
+def refit_model(model, series, prev=None, **kwargs):
+    """Fit `model` on `series`: a warm update of `prev` (the fit of an earlier window
+    of the same series) unless the schedule calls for a full fit."""
+    fit_fn = FITTED_MODELS[model][0]
+    update = UPDATE_MODELS.get(model)
+    n = getattr(prev, "warm_updates", 0) + 1
+    if prev is None or update is None or n >= FULL_REFIT_EVERY:
+        return fit_fn(series, **kwargs)
+    try:
+        fit = update(prev, series, **kwargs)
+    except Exception:
+        return fit_fn(series, **kwargs)
+    fit.warm_updates = n  # updates chained since the last full fit
+    return fit
+
+def fit_and_forecast(model, series, forecast_dates, prev=None, **kwargs):
+    """(pickled fit, path) for a FITTED_MODELS model; run in forecast_pool workers.
+
+    With `prev` the fit is a warm update (refit_model). The fit comes back
+    pickled so the caller can cache it as-is.
+    """
+    fit = refit_model(model, series, prev, **kwargs)
+    return pickle.dumps(fit, protocol=pickle.HIGHEST_PROTOCOL), FITTED_MODELS[model][1](fit, series, forecast_dates)
+
 # --- GRU (only deep learning model) ---
 def forecast_gru(series, forecast_date, epochs=20):
     # Set random seed for reproducibility